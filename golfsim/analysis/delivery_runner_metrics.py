@@ -228,17 +228,28 @@ def _calculate_actual_active_hours(activity_log: List[Dict[str, Any]], max_servi
     # Find service_opened timestamp
     service_start = None
     service_end = None
-    
-    for activity in activity_log:
-        activity_type = activity.get('activity_type', '')
-        timestamp = activity.get('timestamp_s', 0)
-        
-        if activity_type == 'service_opened':
-            service_start = timestamp
-        
-        # Track the last activity timestamp
-        if timestamp > (service_end or 0):
-            service_end = timestamp
+
+    from ..simulation.activity_log import ActivityLog, ActivityType
+
+    if isinstance(activity_log, ActivityLog):
+        # Typed log: read the timestamp/type columns instead of rendering records
+        cols = activity_log.arrays()
+        opened = cols["timestamp_s"][cols["type"] == ActivityType.SERVICE_OPENED.code]
+        if opened.size:
+            service_start = float(opened[-1])
+        if cols["timestamp_s"].max() > 0:
+            service_end = float(cols["timestamp_s"].max())
+    else:
+        for activity in activity_log:
+            activity_type = activity.get('activity_type', '')
+            timestamp = activity.get('timestamp_s', 0)
+
+            if activity_type == 'service_opened':
+                service_start = timestamp
+
+            # Track the last activity timestamp
+            if timestamp > (service_end or 0):
+                service_end = timestamp
     
     if service_start is None or service_end is None:
         return max_service_hours
@@ -330,6 +341,9 @@ def _calculate_queue_metrics(delivery_stats: List[Dict[str, Any]], activity_log:
         
         for activity in activity_log:
             if 'queue_status' in activity.get('activity_type', ''):
+                if activity.get('orders_in_queue') is not None:
+                    queue_depths.append(int(activity['orders_in_queue']))
+                    continue
                 description = activity.get('description', '')
                 # Extract queue depth from description like "3 orders waiting"
                 if 'orders waiting' in description:
@@ -0,0 +1,85 @@
+"""
+Monotone search over runner counts for staffing sweeps.
+
+Service quality is monotone in the number of runners: if N runners meet the
+targets for a (variant, orders level) then N+1 do too, and if N+1 fail so does N.
+``MonotoneRunnerSearch`` exploits that to find the smallest compliant runner
+count with logarithmically many probes: it gallops upward from the smallest
+value (1, 2, 4, ... positions) until a probe meets targets, then binary-searches
+the gap. Sweeps drive one search per (variant, orders) and run each round's
+probes together, so parallel executors stay busy.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+
+class MonotoneRunnerSearch:
+    """Galloping + binary search for the minimal runner count meeting targets.
+
+    Usage::
+
+        search = MonotoneRunnerSearch([1, 2, 3, 4])
+        while (n := search.next_probe()) is not None:
+            search.record(n, meets_targets(simulate(n)))
+        search.minimal_runners  # None when even the largest value fails
+    """
+
+    def __init__(self, runner_values: Sequence[int]):
+        self.values: List[int] = sorted(set(int(v) for v in runner_values))
+        if not self.values:
+            raise ValueError("runner_values must not be empty")
+        # Largest position known to fail and smallest known to pass (sentinels outside the range)
+        self._fail_idx = -1
+        self._pass_idx = len(self.values)
+        self._step = 1
+        self.outcomes: Dict[int, bool] = {}
+
+    @property
+    def done(self) -> bool:
+        return self._pass_idx - self._fail_idx <= 1
+
+    @property
+    def minimal_runners(self) -> Optional[int]:
+        """Smallest runner count that meets targets, or None if none does (valid once done)."""
+        return self.values[self._pass_idx] if self._pass_idx < len(self.values) else None
+
+    def next_probe(self) -> Optional[int]:
+        """Runner count to simulate next, or None once the answer is known."""
+        if self.done:
+            return None
+        if self._pass_idx == len(self.values):
+            # Galloping phase: no passing value seen yet
+            idx = min(self._fail_idx + self._step, len(self.values) - 1)
+        else:
+            idx = (self._fail_idx + self._pass_idx) // 2
+        return self.values[idx]
+
+    def record(self, runners: int, meets: bool) -> None:
+        """Record whether a simulated runner count met targets."""
+        idx = self.values.index(int(runners))
+        self.outcomes[int(runners)] = bool(meets)
+        if meets:
+            self._pass_idx = min(self._pass_idx, idx)
+        else:
+            if idx > self._fail_idx:
+                self._fail_idx = idx
+                self._step *= 2
+        # Inconsistent (non-monotone) noisy outcomes: trust the latest failure
+        if self._pass_idx <= self._fail_idx:
+            self._pass_idx = len(self.values)
+            for v in self.values[self._fail_idx + 1 :]:
+                if self.outcomes.get(v):
+                    self._pass_idx = self.values.index(v)
+                    break
+
+    def unprobed(self) -> List[int]:
+        """Runner counts not simulated (fill these in for a full frontier report)."""
+        return [v for v in self.values if v not in self.outcomes]
+
+    def implied_outcomes(self) -> Dict[int, bool]:
+        """Pass/fail for every runner count, inferred by monotonicity once done."""
+        if not self.done:
+            raise RuntimeError("Search has not finished")
+        return {v: i >= self._pass_idx for i, v in enumerate(self.values)}
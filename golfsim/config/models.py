@@ -81,6 +81,14 @@ class SimulationConfig:
     minutes_for_delivery_order_failure: int = 60
     # Optional: defer initial order arrivals past service open to avoid unrealistic spikes
     delivery_opening_ramp_minutes: int = 0
+    # Multi-order trips: a runner takes up to N ready orders placed within the time
+    # and hole windows of the dispatched order (1 = one order per trip)
+    delivery_batch_max_orders: int = 1
+    delivery_batch_hole_window: int = 2
+    delivery_batch_time_window_min: int = 10
+    # Intercept-hole choice: weight of runner lateness vs earliness (minutes) relative to the golfer
+    delivery_intercept_lateness_weight: float = 3.0
+    delivery_intercept_earliness_weight: float = 1.0
 
     # From CLI args, not in JSON config usually
     first_tee: str = "09:00"
@@ -95,7 +103,19 @@ class SimulationConfig:
     skip_executive_summary: bool = False
     # When true, only write files needed by the map app manifest (coordinates.csv, simulation_metrics.json, results.json)
     minimal_outputs: bool = False
+    # Also write coordinates.bin (golfsim.io.track_binary) next to each coordinates.csv
+    binary_tracks: bool = False
     coordinates_only_for_first_run: bool = False
+    # Runs are numbered run_{offset+1}..run_{offset+num_runs}; lets callers append runs to an output dir
+    run_index_offset: int = 0
+    # Sweep run store (golfsim.io.run_store) each run appends its metrics and deliveries to
+    run_store_path: Optional[str] = None
+    # Share order streams across runner counts and blocked-hole variants (per run index)
+    common_random_numbers: bool = False
+    # Dispatch policy name (golfsim.simulation.dispatch_policies.DISPATCH_POLICIES)
+    dispatch_policy: str = "fifo"
+    # Holes where golfers do not place delivery orders (merged with --block-* CLI flags)
+    blocked_holes: List[int] = field(default_factory=list)
 
 
     @staticmethod
@@ -295,6 +315,11 @@ class SimulationConfig:
             delivery_total_orders=int(data.get("delivery_total_orders", 10)),
             minutes_for_delivery_order_failure=int(data.get("minutes_for_delivery_order_failure", 60)),
             delivery_opening_ramp_minutes=int(data.get("delivery_opening_ramp_minutes", 0)),
+            delivery_batch_max_orders=int(data.get("delivery_batch_max_orders", 1)),
+            delivery_batch_hole_window=int(data.get("delivery_batch_hole_window", 2)),
+            delivery_batch_time_window_min=int(data.get("delivery_batch_time_window_min", 10)),
+            delivery_intercept_lateness_weight=float(data.get("delivery_intercept_lateness_weight", 3.0)),
+            delivery_intercept_earliness_weight=float(data.get("delivery_intercept_earliness_weight", 1.0)),
             first_tee=getattr(args, "first_tee", "09:00"),
             groups_interval_min=getattr(args, "groups_interval_min", 15.0),
             sla_minutes=getattr(args, "sla_minutes", 30),
@@ -306,7 +331,12 @@ class SimulationConfig:
             no_heatmap=getattr(args, "no_heatmap", False),
             skip_executive_summary=getattr(args, "skip_executive_summary", False),
             minimal_outputs=bool(getattr(args, "minimal_outputs", False)),
+            binary_tracks=bool(getattr(args, "binary_tracks", False)),
             coordinates_only_for_first_run=bool(getattr(args, "coordinates_only_for_first_run", False)),
+            run_index_offset=int(getattr(args, "run_index_offset", 0) or 0),
+            run_store_path=getattr(args, "run_store", None),
+            common_random_numbers=bool(getattr(args, "common_random_numbers", False)),
+            dispatch_policy=str(getattr(args, "dispatch_policy", None) or data.get("dispatch_policy", "fifo")),
         )
 
         # Override with CLI arguments where provided
@@ -323,6 +353,16 @@ class SimulationConfig:
             cfg.delivery_prep_time_sec = int(args.prep_time) * 60
         if hasattr(args, 'revenue_per_order') and args.revenue_per_order is not None:
             cfg.delivery_avg_order_usd = float(args.revenue_per_order)
+        if getattr(args, 'batch_max_orders', None) is not None:
+            cfg.delivery_batch_max_orders = int(args.batch_max_orders)
+        if getattr(args, 'batch_hole_window', None) is not None:
+            cfg.delivery_batch_hole_window = int(args.batch_hole_window)
+        if getattr(args, 'batch_time_window_min', None) is not None:
+            cfg.delivery_batch_time_window_min = int(args.batch_time_window_min)
+        if getattr(args, 'intercept_lateness_weight', None) is not None:
+            cfg.delivery_intercept_lateness_weight = float(args.intercept_lateness_weight)
+        if getattr(args, 'intercept_earliness_weight', None) is not None:
+            cfg.delivery_intercept_earliness_weight = float(args.intercept_earliness_weight)
             
         return cfg
 
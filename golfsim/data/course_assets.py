@@ -0,0 +1,344 @@
+"""
+Process-wide course asset registry.
+
+Routing, prediction and order placement all need the same per-course inputs:
+the runner cart graph (``pkl/cart_graph.pkl``), the ordered per-minute loop
+points (``holes_connected.geojson``) and the geofenced hole polygons
+(``holes_geofenced.geojson``). Reading these from disk on every order dominated
+the wall clock of a run, so they are loaded here once per process and shared.
+
+Entries are keyed by the resolved source path and invalidated automatically when
+the file's modification time or size changes. Objects handed out by the registry
+are shared between callers and must be treated as read-only (cart graphs are
+frozen to enforce this).
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+import networkx as nx
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+
+LonLat = Tuple[float, float]
+
+# (kind, resolved primary path) -> (file signatures, loaded value)
+_ASSET_CACHE: Dict[Tuple[str, str], Tuple[Tuple[Any, ...], Any]] = {}
+_ASSET_LOCK = threading.RLock()
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None when it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (int(st.st_mtime_ns), int(st.st_size))
+
+
+def _cached_asset(kind: str, paths: Sequence[Path], loader: Callable[[], Any]) -> Any:
+    """Return a cached asset, reloading when any of its source files changed.
+
+    The first path is the primary source and must exist; the remaining paths are
+    optional inputs (e.g. label fallbacks) that only participate in invalidation.
+    Returns None when the primary source is missing.
+    """
+    primary = paths[0]
+    key = (kind, str(primary.resolve()))
+    signature = tuple(_file_signature(p) for p in paths)
+    if signature[0] is None:
+        with _ASSET_LOCK:
+            _ASSET_CACHE.pop(key, None)
+        return None
+
+    with _ASSET_LOCK:
+        hit = _ASSET_CACHE.get(key)
+        if hit is not None and hit[0] == signature:
+            return hit[1]
+
+    value = loader()
+    with _ASSET_LOCK:
+        _ASSET_CACHE[key] = (signature, value)
+    logger.debug("Loaded course asset %s from %s", kind, primary)
+    return value
+
+
+def clear_course_asset_cache() -> None:
+    """Drop every cached course asset (mainly for tests and long-lived workers)."""
+    with _ASSET_LOCK:
+        _ASSET_CACHE.clear()
+        _REGISTRY.clear()
+
+
+def _read_cart_graph(path: Path) -> nx.Graph:
+    from ..routing.distance_matrix import load_distance_matrix_for
+
+    with path.open("rb") as f:
+        G = pickle.load(f)
+    # Shared between every caller in the process; prevent accidental mutation
+    G = nx.freeze(G)
+    # Attach the precomputed all-pairs matrix when the builder wrote one
+    load_distance_matrix_for(G, path)
+    return G
+
+
+def _read_loop_nodes(path: Path, holes_path: Path):
+    """Load the cached parse for this source content when present, else parse and cache it.
+
+    The cache lives outside the repo (see ``loop_nodes_cache_dir``); nothing is
+    written next to the course files.
+    """
+    from ..routing.node_holes import file_sha1
+    from .loop_nodes import LoopNodes, loop_nodes_path
+
+    source_sha1, polygons_sha1 = file_sha1(path), file_sha1(holes_path)
+    cached = loop_nodes_path(source_sha1, polygons_sha1)
+    if cached.exists():
+        try:
+            nodes = LoopNodes.load(cached)
+            if nodes.matches(source_sha1, polygons_sha1):
+                return nodes
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Ignoring unreadable loop-nodes cache %s: %s", cached, e)
+    nodes = LoopNodes.parse(path, holes_path)
+    try:
+        nodes.save(loop_nodes_path(nodes.source_sha1, nodes.polygons_sha1))
+    except OSError as e:
+        logger.debug("Could not write loop-nodes cache for %s: %s", path, e)
+    return nodes
+
+
+def load_loop_nodes(path: Union[str, Path]):
+    """Return the parsed ``LoopNodes`` for a loop GeoJSON, or None if it is missing.
+
+    Points without a hole property are labeled from the sibling
+    ``holes_geofenced.geojson``. Parsing happens once per process and, across
+    processes, once per source content via a user cache directory outside the
+    repo (see ``golfsim.data.loop_nodes``).
+
+    Raises:
+        ValueError: If the file is not a GeoJSON Feature or FeatureCollection
+    """
+    path = Path(path)
+    holes_path = path.parent / "holes_geofenced.geojson"
+    return _cached_asset("loop_nodes", [path, holes_path], lambda: _read_loop_nodes(path, holes_path))
+
+
+def _read_loop_points(path: Path) -> Tuple[LonLat, ...]:
+    """Loop points of a holes_connected file ordered by node_id/idx.
+
+    Raises:
+        SystemExit: If the file is invalid or contains no valid points
+    """
+    try:
+        nodes = load_loop_nodes(path)
+    except Exception as e:  # noqa: BLE001
+        raise SystemExit(f"Failed reading {path.name}: {e}")
+    order = nodes.by_node_id() if nodes is not None else ()
+    if not len(order):
+        raise SystemExit(f"{path.name} contains no Point features with integer 'node_id' or 'idx'")
+    return tuple(nodes.lonlat(order))
+
+
+def _read_connected_points(path: Path) -> Tuple[Tuple[LonLat, ...], Tuple[Optional[int], ...]]:
+    """Loop points in file order with embedded hole labels or polygon fallback."""
+    nodes = load_loop_nodes(path)
+    return tuple(nodes.lonlat()), tuple(nodes.hole_labels())
+
+
+def _read_hole_polygons(path: Path):
+    """Load geofenced hole polygons as a GeoDataFrame with a 'hole' column.
+
+    Prefers pyogrio when available, falls back to the default engine, and finally
+    to manual JSON parsing to avoid crashes on some environments.
+    """
+    import geopandas as gpd
+
+    try:
+        return gpd.read_file(path, engine="pyogrio")
+    except Exception:
+        pass
+    try:
+        return gpd.read_file(path)
+    except Exception:
+        pass
+    try:
+        from shapely.geometry import shape
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        features = data.get("features", []) if isinstance(data, dict) else []
+        geoms = []
+        holes = []
+        for feat in features:
+            if not isinstance(feat, dict):
+                continue
+            props = feat.get("properties", {}) or {}
+            geom = feat.get("geometry")
+            try:
+                hole_num = int(props.get("hole", props.get("ref")))
+            except Exception:
+                hole_num = None
+            if geom is None or hole_num is None:
+                continue
+            try:
+                geoms.append(shape(geom))
+                holes.append(hole_num)
+            except Exception:
+                continue
+        if geoms:
+            return gpd.GeoDataFrame({"hole": holes, "geometry": geoms}, crs="EPSG:4326")
+    except Exception:
+        pass
+    return None
+
+
+@dataclass(frozen=True)
+class CourseAssets:
+    """Shared, lazily loaded read-only assets for one course directory."""
+
+    course_dir: Path
+
+    @property
+    def generated_dir(self) -> Path:
+        return self.course_dir / "geojson" / "generated"
+
+    def cart_graph(self, filename: str = "cart_graph.pkl") -> Optional[nx.Graph]:
+        """Return the frozen cart graph from ``pkl/<filename>``, or None if missing.
+
+        When a ``<stem>_distances.npz`` sidecar matching the graph exists it is
+        attached, so routing uses precomputed shortest paths transparently.
+        """
+        from ..routing.distance_matrix import distance_matrix_path
+
+        path = self.course_dir / "pkl" / filename
+        return _cached_asset(
+            f"cart_graph:{filename}",
+            [path, distance_matrix_path(path)],
+            lambda: _read_cart_graph(path),
+        )
+
+    def holes_connected_path(self) -> Optional[Path]:
+        """Return holes_connected_updated.geojson if present, else holes_connected.geojson."""
+        for name in ("holes_connected_updated.geojson", "holes_connected.geojson"):
+            path = self.generated_dir / name
+            if path.exists():
+                return path
+        return None
+
+    def loop_nodes(self):
+        """Return the parsed ``LoopNodes`` of ``holes_connected_path()``.
+
+        Raises:
+            FileNotFoundError: If neither holes_connected file is found
+        """
+        path = self.holes_connected_path()
+        nodes = load_loop_nodes(path) if path is not None else None
+        if nodes is None:
+            raise FileNotFoundError("Neither holes_connected.geojson nor holes_connected_updated.geojson found")
+        return nodes
+
+    def loop_points(self) -> Tuple[LonLat, ...]:
+        """Return golfer loop points ordered by node id.
+
+        Raises:
+            FileNotFoundError: If neither holes_connected file is found
+            SystemExit: If the file is invalid or contains no valid points
+        """
+        path = self.holes_connected_path()
+        if path is None:
+            raise FileNotFoundError("Neither holes_connected.geojson nor holes_connected_updated.geojson found")
+        points = _cached_asset("loop_points", [path], lambda: _read_loop_points(path))
+        if points is None:
+            raise FileNotFoundError(f"{path} disappeared while loading")
+        return points
+
+    def connected_points(self) -> Tuple[Tuple[LonLat, ...], Tuple[Optional[int], ...]]:
+        """Return (coords, hole_numbers) from holes_connected.geojson in file order.
+
+        Hole numbers come from point properties, falling back to the geofenced
+        polygons. Returns empty tuples when the file is missing.
+        """
+        path = self.generated_dir / "holes_connected.geojson"
+        holes_path = self.generated_dir / "holes_geofenced.geojson"
+        result = _cached_asset("connected_points", [path, holes_path], lambda: _read_connected_points(path))
+        return result if result is not None else ((), ())
+
+    def hole_polygons(self):
+        """Return the holes_geofenced.geojson GeoDataFrame, or None if unavailable."""
+        path = self.generated_dir / "holes_geofenced.geojson"
+        return _cached_asset("hole_polygons", [path], lambda: _read_hole_polygons(path))
+
+    def node_holes(self):
+        """Return the cart graph's ``NodeHoleIndex`` (node id -> containing hole).
+
+        Uses the ``pkl/cart_graph_node_holes.npz`` sidecar when it matches the
+        graph and ``holes_geofenced.geojson``, otherwise labels the nodes by
+        polygon containment. Resolve it once and call ``hole_for_node`` for
+        per-order lookups.
+        """
+        from ..routing.node_holes import NodeHoleIndex, node_holes_path
+
+        graph_path = self.course_dir / "pkl" / "cart_graph.pkl"
+        holes_path = self.generated_dir / "holes_geofenced.geojson"
+        index = _cached_asset(
+            "node_holes",
+            [graph_path, holes_path, node_holes_path(graph_path)],
+            lambda: self._load_node_holes(graph_path, holes_path),
+        )
+        return index if index is not None else NodeHoleIndex.empty()
+
+    def _load_node_holes(self, graph_path: Path, holes_path: Path):
+        from ..routing.node_holes import NodeHoleIndex, file_sha1, node_holes_path
+
+        G = self.cart_graph()
+        if G is None:
+            return NodeHoleIndex.empty()
+        polygons_sha1 = file_sha1(holes_path)
+        sidecar = node_holes_path(graph_path)
+        if sidecar.exists():
+            try:
+                index = NodeHoleIndex.load(sidecar)
+                if index.matches(G, polygons_sha1):
+                    return index
+                logger.warning("Node-hole index %s is stale; rebuild the cart network", sidecar.name)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Failed to load node-hole index %s: %s", sidecar, e)
+        holes_gdf = self.hole_polygons()
+        if holes_gdf is None:
+            return NodeHoleIndex.empty()
+        return NodeHoleIndex.build(G, zip(holes_gdf["hole"], holes_gdf.geometry), polygons_sha1=polygons_sha1)
+
+    def hole_for_node(self, node: Any) -> Optional[int]:
+        """Hole containing a cart graph node, or None."""
+        return self.node_holes().hole_for_node(node)
+
+    def node_hole_labels(self) -> Dict[Any, int]:
+        """Return a mapping of cart graph node -> containing hole number.
+
+        Nodes outside every hole polygon are omitted.
+        """
+        return self.node_holes().labels()
+
+
+_REGISTRY: Dict[str, CourseAssets] = {}
+
+
+def get_course_assets(course_dir: Union[str, Path]) -> CourseAssets:
+    """Return the process-wide CourseAssets handle for a course directory."""
+    resolved = Path(course_dir).resolve()
+    key = str(resolved)
+    with _ASSET_LOCK:
+        assets = _REGISTRY.get(key)
+        if assets is None:
+            assets = CourseAssets(course_dir=resolved)
+            _REGISTRY[key] = assets
+    return assets
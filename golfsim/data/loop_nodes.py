@@ -0,0 +1,230 @@
+"""
+Canonical parse of the golfer loop points (``holes_connected.geojson``).
+
+Track generation, order pacing, crossings and the beverage cart all read the
+same per-minute loop points, and each used to re-read and re-sort the GeoJSON
+with its own parser. ``LoopNodes`` is the one parsed form: the Point features in
+file order as flat arrays (lon/lat, hole label, node id and the ordering
+properties), from which each caller derives the ordering it needs.
+
+Parsed nodes are cached per process through
+``golfsim.data.course_assets.load_loop_nodes`` and, across processes, as .npz
+files in a user cache directory outside the repo (``$GOLFSIM_CACHE_DIR``, else
+``$XDG_CACHE_HOME/golfsim`` or ``~/.cache/golfsim``). Cache files are named by
+the content hashes of the source and of ``holes_geofenced.geojson`` (used to
+label points without a hole property), so an edited file never reads a stale
+parse, and are written atomically so concurrent workers never see a partial file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+# Format version stored in the .npz; bump when the layout changes
+LOOP_NODES_FORMAT_VERSION = 1
+# Sentinel for absent hole labels and node id / idx properties. Not -1: some
+# files label off-course points with hole -1, which callers must see as-is.
+MISSING = int(np.iinfo(np.int16).min)
+
+_ARRAYS = ("lon", "lat", "hole", "node_id", "idx", "sequence")
+
+
+def loop_nodes_cache_dir() -> Path:
+    """Directory holding parsed loop-node caches (never inside ``courses/``)."""
+    root = os.environ.get("GOLFSIM_CACHE_DIR")
+    if not root:
+        root = str(Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "golfsim")
+    return Path(root) / "loop_nodes"
+
+
+def loop_nodes_path(source_sha1: str, polygons_sha1: str = "") -> Path:
+    """Return the cache .npz path for a loop GeoJSON and hole polygons with the given content hashes."""
+    return loop_nodes_cache_dir() / f"{source_sha1}_{polygons_sha1 or 'nopolygons'}.npz"
+
+
+def _coerce_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return MISSING
+
+
+@dataclass(frozen=True, eq=False)
+class LoopNodes:
+    """Loop Point features in file order; arrays are shared and read-only.
+
+    ``hole`` is the point's hole property (``hole_number``/``hole``/``hole_num``/
+    ``current_hole``) or, when absent, the geofenced polygon containing it.
+    ``node_id`` is the ``node_id`` property, falling back to ``idx``.
+    """
+
+    lon: np.ndarray
+    lat: np.ndarray
+    hole: np.ndarray
+    node_id: np.ndarray
+    idx: np.ndarray
+    sequence: np.ndarray
+    source_sha1: str = ""
+    polygons_sha1: str = ""
+
+    def __post_init__(self) -> None:
+        for name in _ARRAYS:
+            getattr(self, name).flags.writeable = False
+
+    @classmethod
+    def parse(cls, path: Union[str, Path], holes_path: Optional[Union[str, Path]] = None) -> "LoopNodes":
+        """Parse Point features from a loop GeoJSON.
+
+        Points without a hole property are labeled from ``holes_path`` when it
+        exists.
+
+        Raises:
+            ValueError: If the file is not a GeoJSON Feature or FeatureCollection
+        """
+        from ..routing.hole_locator import NO_HOLE, HoleLocator
+        from ..routing.node_holes import file_sha1
+
+        path = Path(path)
+        raw = path.read_bytes()
+        data = json.loads(raw.decode("utf-8"))
+        if isinstance(data, dict) and data.get("type") == "FeatureCollection":
+            features = data.get("features") or []
+        elif isinstance(data, dict) and data.get("type") == "Feature":
+            features = [data]
+        else:
+            raise ValueError("Unsupported GeoJSON structure: expected FeatureCollection or Feature")
+
+        rows: List[Tuple[float, float, int, int, int, float]] = []
+        for feat in features:
+            if not isinstance(feat, dict):
+                continue
+            geom = feat.get("geometry") or {}
+            if not isinstance(geom, dict) or geom.get("type") != "Point":
+                continue
+            coords = geom.get("coordinates")
+            if not isinstance(coords, (list, tuple)) or len(coords) < 2:
+                continue
+            props = feat.get("properties") or {}
+            hole = _coerce_int(
+                props.get("hole_number") or props.get("hole") or props.get("hole_num") or props.get("current_hole")
+            )
+            idx = _coerce_int(props.get("idx"))
+            node_id = _coerce_int(props["node_id"]) if "node_id" in props else idx
+            try:
+                sequence = float(props.get("sequence_position"))
+            except (TypeError, ValueError):
+                sequence = np.nan
+            rows.append((float(coords[0]), float(coords[1]), hole, node_id, idx, sequence))
+
+        cols = list(zip(*rows)) if rows else [()] * len(_ARRAYS)
+        lon = np.asarray(cols[0], dtype=np.float64)
+        lat = np.asarray(cols[1], dtype=np.float64)
+        hole = np.asarray(cols[2], dtype=np.int16)
+        missing = np.flatnonzero(hole == MISSING)
+        if missing.size and holes_path is not None and Path(holes_path).exists():
+            try:
+                located = HoleLocator.from_geojson(holes_path).locate(lon[missing], lat[missing])
+                hole[missing] = np.where(located == NO_HOLE, MISSING, located)
+            except Exception as e:  # noqa: BLE001
+                logger.debug("Hole polygon labeling failed for %s: %s", holes_path, e)
+        return cls(
+            lon=lon,
+            lat=lat,
+            hole=hole,
+            node_id=np.asarray(cols[3], dtype=np.int32),
+            idx=np.asarray(cols[4], dtype=np.int32),
+            sequence=np.asarray(cols[5], dtype=np.float64),
+            source_sha1=hashlib.sha1(raw).hexdigest(),
+            polygons_sha1=file_sha1(holes_path) if holes_path is not None else "",
+        )
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write to ``path`` through a temporary file and ``os.replace``, so readers never see a partial file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    version=np.int32(LOOP_NODES_FORMAT_VERSION),
+                    source_sha1=np.asarray(self.source_sha1),
+                    polygons_sha1=np.asarray(self.polygons_sha1),
+                    **{name: getattr(self, name) for name in _ARRAYS},
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LoopNodes":
+        with np.load(Path(path), allow_pickle=False) as data:
+            version = int(data["version"])
+            if version != LOOP_NODES_FORMAT_VERSION:
+                raise ValueError(f"Unsupported loop-nodes version {version} in {path}")
+            return cls(
+                source_sha1=str(data["source_sha1"]),
+                polygons_sha1=str(data["polygons_sha1"]),
+                **{name: np.array(data[name]) for name in _ARRAYS},
+            )
+
+    def matches(self, source_sha1: str, polygons_sha1: str) -> bool:
+        """True when parsed from the same source and hole polygons files."""
+        return self.source_sha1 == source_sha1 and self.polygons_sha1 == polygons_sha1
+
+    def __len__(self) -> int:
+        return int(self.lon.size)
+
+    def by_node_id(self, max_node_id: Optional[int] = None) -> np.ndarray:
+        """Indices of points with a node id, sorted by id (the last point wins on duplicates)."""
+        keep = self.node_id >= 0
+        if max_node_id is not None:
+            keep &= self.node_id <= max_node_id
+        rows = np.flatnonzero(keep)
+        ids = self.node_id[rows]
+        # np.unique keeps the first occurrence, so scan from the end for last-wins
+        _, first_from_end = np.unique(ids[::-1], return_index=True)
+        return rows[::-1][first_from_end]
+
+    def path_order(self) -> np.ndarray:
+        """Indices ordered by ``idx``, then ``sequence_position``, then ``node_id``, then file order.
+
+        A point is ranked by the first of those properties it has, and points
+        ranked by an earlier property come first.
+        """
+        has_idx = self.idx != MISSING
+        has_seq = ~has_idx & ~np.isnan(self.sequence)
+        has_node = ~has_idx & ~has_seq & (self.node_id != MISSING)
+        tier = np.full(len(self), 3, dtype=np.int8)
+        tier[has_node] = 2
+        tier[has_seq] = 1
+        tier[has_idx] = 0
+        value = np.arange(len(self), dtype=np.float64)
+        value[has_idx] = self.idx[has_idx]
+        value[has_seq] = self.sequence[has_seq]
+        value[has_node] = self.node_id[has_node]
+        return np.lexsort((value, tier))
+
+    def lonlat(self, order: Optional[np.ndarray] = None) -> List[Tuple[float, float]]:
+        """(lon, lat) tuples, in file order or the given index order."""
+        lon, lat = (self.lon, self.lat) if order is None else (self.lon[order], self.lat[order])
+        return list(zip(lon.tolist(), lat.tolist()))
+
+    def hole_labels(self, order: Optional[np.ndarray] = None) -> List[Optional[int]]:
+        """Hole per point (None when unlabeled), in file order or the given index order."""
+        hole = self.hole if order is None else self.hole[order]
+        return [None if h == MISSING else h for h in hole.tolist()]
@@ -0,0 +1,220 @@
+"""
+Columnar coordinates.csv writer.
+
+``results.write_unified_coordinates_csv`` normalizes one point dict at a time
+(about twenty key probes and coercions per point) and formats each row through
+``csv.DictWriter``. ``CoordinateColumns`` holds a stream as columns instead, so
+the same normalization runs once per column, and
+``write_coordinate_columns_csv`` orders, deduplicates and writes every stream
+with NumPy sorts and ``csv.writer.writerows``. The output is byte-identical to
+the per-point writer (same columns, same value formatting), so the map apps
+read it unchanged.
+"""
+
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from golfsim.logging import get_logger
+
+from .results import COORDINATE_CSV_FIELDS, normalize_coordinate_type
+from .track_binary import write_tracks
+
+logger = get_logger(__name__)
+
+# Rows formatted per writerows() call
+_WRITE_CHUNK_ROWS = 65536
+
+# Optional CSV field -> (point keys in priority order, coercion applied to present values)
+_OPTIONAL_FIELDS: Dict[str, tuple] = {
+    "color": (("color",), str),
+    "fill_color": (("fill_color",), str),
+    "border_color": (("border_color",), str),
+    "visibility_status": (("visibility_status", "visibility_color"), str),
+    "time_since_last_sighting_min": (("time_since_last_sighting_min",), float),
+    "pulsing": (("pulsing",), bool),
+    "total_orders": (("total_orders",), None),
+    "total_revenue": (("total_revenue",), None),
+    "avg_per_order": (("avg_per_order",), None),
+    "revenue_per_hour": (("revenue_per_hour",), None),
+    "avg_order_time_min": (("avg_order_time_min",), None),
+    "order_id": (("order_id",), str),
+    "is_delivery_event": (("is_delivery_event",), bool),
+}
+
+
+def _first_present(points: Sequence[Dict[str, Any]], keys: Sequence[str], present: Optional[set] = None) -> List[Any]:
+    """Per point, the value of the first key that is present and not None.
+
+    ``present`` (keys used by any point) lets absent keys skip the per-point probe.
+    """
+    values: Optional[List[Any]] = None
+    for key in keys:
+        if present is not None and key not in present:
+            continue
+        if values is None:
+            values = [p.get(key) for p in points]
+        elif None in values:
+            values = [p.get(key) if v is None else v for v, p in zip(values, points)]
+    return [None] * len(points) if values is None else values
+
+
+def _coerce(values: List[Any], fn: Optional[Callable[[Any], Any]]) -> List[Any]:
+    if fn is None:
+        return values
+    return [None if v is None else fn(v) for v in values]
+
+
+def _float_column(values: List[Any], default: float, lenient: bool = False) -> np.ndarray:
+    values = [default if v is None else v for v in values]
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        if not lenient:
+            raise
+    out = np.empty(len(values), dtype=np.float64)
+    for i, v in enumerate(values):
+        try:
+            out[i] = float(v)
+        except Exception:
+            out[i] = default
+    return out
+
+
+@dataclass
+class CoordinateColumns:
+    """One coordinate stream as columns, already normalized to the CSV schema.
+
+    ``ids`` and ``types`` may be a single string for the whole stream.
+    ``holes`` holds the hole number or "clubhouse" per point. ``extras`` maps
+    optional CSV fields (see ``COORDINATE_CSV_FIELDS``) to per-point values,
+    with None where a point has no value.
+    """
+
+    ids: Union[str, Sequence[str]]
+    latitude: np.ndarray
+    longitude: np.ndarray
+    timestamp: np.ndarray
+    types: Union[str, Sequence[str]]
+    holes: Sequence[Any]
+    extras: Dict[str, Sequence[Any]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(len(self.timestamp))
+
+    @classmethod
+    def from_points(cls, points: Sequence[Dict[str, Any]], stream_id: str) -> "CoordinateColumns":
+        """Normalize point dicts column by column, as ``normalize_coordinate_entry`` does per point.
+
+        Points without a truthy 'id' take ``stream_id``.
+        """
+        points = list(points)
+        present = set().union(*points)
+        default_id = "" if stream_id is None else str(stream_id)
+        ids = [str(v) if v else default_id for v in (p.get("id") for p in points)]
+        type_cache: Dict[Any, str] = {}
+        types = []
+        for raw in _first_present(points, ("type",), present):
+            raw = "" if raw is None else raw
+            norm = type_cache.get(raw)
+            if norm is None:
+                norm = type_cache[raw] = normalize_coordinate_type(raw)
+            types.append(norm)
+        holes = ["clubhouse" if h is None or h == "" else h for h in _first_present(points, ("current_hole", "hole"), present)]
+        extras = {}
+        for name, (keys, fn) in _OPTIONAL_FIELDS.items():
+            if present.isdisjoint(keys):
+                continue
+            values = _first_present(points, keys, present)
+            if any(v is not None for v in values):
+                extras[name] = _coerce(values, fn)
+        return cls(
+            ids=ids,
+            latitude=_float_column(_first_present(points, ("latitude", "lat"), present), 0.0),
+            longitude=_float_column(_first_present(points, ("longitude", "lon"), present), 0.0),
+            timestamp=_float_column(_first_present(points, ("timestamp", "timestamp_s"), present), 0.0, lenient=True),
+            types=types,
+            holes=holes,
+            extras=extras,
+        )
+
+
+def _broadcast(value: Union[str, Sequence[Any]], n: int) -> List[Any]:
+    return [value] * n if isinstance(value, str) else list(value)
+
+
+def write_coordinate_columns_csv(
+    streams: Mapping[str, Union[CoordinateColumns, Iterable[Dict[str, Any]]]],
+    save_path: Union[str, Path],
+    tracks_path: Optional[Union[str, Path]] = None,
+) -> Path:
+    """Write streams to the unified coordinates.csv format in bulk.
+
+    Accepts ``CoordinateColumns`` or lists of point dicts (converted with
+    ``CoordinateColumns.from_points``). Rows are ordered by (id, timestamp) and
+    the first row for a repeated (id, timestamp) is kept, with ties going to
+    the earlier stream, exactly as ``write_unified_coordinates_csv`` does.
+
+    When ``tracks_path`` is given, the same rows are also written there in the
+    binary track format (see ``golfsim.io.track_binary``).
+    """
+    save_path = Path(save_path)
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+
+    columns = [
+        s if isinstance(s, CoordinateColumns) else CoordinateColumns.from_points(s or [], stream_id)
+        for stream_id, s in streams.items()
+    ]
+    columns = [c for c in columns if len(c)]
+
+    with save_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(COORDINATE_CSV_FIELDS)
+        if not columns:
+            if tracks_path is not None:
+                write_tracks({name: [] for name in COORDINATE_CSV_FIELDS}, tracks_path)
+            logger.info("Saved unified coordinates CSV: %s", save_path)
+            return save_path
+
+        ids = np.asarray([i for c in columns for i in _broadcast(c.ids, len(c))], dtype=str)
+        timestamp = np.concatenate([np.asarray(c.timestamp, dtype=np.float64) for c in columns])
+        # Stable sort on (id, timestamp); concatenation order breaks ties
+        id_codes = np.unique(ids, return_inverse=True)[1]
+        order = np.lexsort((timestamp, id_codes))
+        keep = np.ones(order.size, dtype=bool)
+        keep[1:] = (id_codes[order][1:] != id_codes[order][:-1]) | (timestamp[order][1:] != timestamp[order][:-1])
+        order = order[keep]
+
+        def _column(name: str) -> np.ndarray:
+            if name == "id":
+                return ids
+            if name == "timestamp":
+                return timestamp
+            if name in ("latitude", "longitude"):
+                return np.concatenate([np.asarray(getattr(c, name), dtype=np.float64) for c in columns])
+            if name == "type":
+                parts = [_broadcast(c.types, len(c)) for c in columns]
+            elif name == "hole":
+                parts = [list(c.holes) for c in columns]
+            else:
+                parts = [list(c.extras.get(name, [None] * len(c))) for c in columns]
+            out = np.empty(len(ids), dtype=object)
+            out[:] = [v for part in parts for v in part]
+            return out
+
+        ordered = [_column(name)[order] for name in COORDINATE_CSV_FIELDS]
+        # Only one chunk of rows is ever held as Python objects
+        for start in range(0, order.size, _WRITE_CHUNK_ROWS):
+            writer.writerows(zip(*(col[start:start + _WRITE_CHUNK_ROWS].tolist() for col in ordered)))
+
+    if tracks_path is not None:
+        write_tracks(dict(zip(COORDINATE_CSV_FIELDS, ordered)), tracks_path)
+        logger.info("Saved binary coordinate tracks: %s", tracks_path)
+
+    logger.info("Saved unified coordinates CSV: %s", save_path)
+    return save_path
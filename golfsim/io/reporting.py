@@ -7,7 +7,7 @@ Handles writing simulation outputs, logs, and metric reports.
 from __future__ import annotations
 import csv
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from golfsim.utils import seconds_to_clock_str
 
 def _calculate_actual_active_hours(activity_log: List[Dict[str, Any]], max_service_hours: float) -> float:
@@ -229,8 +229,12 @@ def generate_simulation_metrics_json(
     avg_bev_order_value: float = 12.0,
     variant_key: Optional[str] = None,
     blocked_holes: Optional[List[int]] = None
-) -> None:
-    """Generate standardized metrics JSON file for map animation display."""
+) -> Dict[str, Any]:
+    """Generate standardized metrics JSON file for map animation display.
+
+    Returns:
+        The metrics payload written to save_path
+    """
     save_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Start with variant metadata at the top level
@@ -361,6 +365,7 @@ def generate_simulation_metrics_json(
     with save_path.open("w", encoding="utf-8") as f:
         import json
         json.dump(metrics, f, indent=2)
+    return metrics
 
 def build_runner_action_segments(activity_logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Build contiguous runner action segments from activity logs.
@@ -370,19 +375,39 @@ def build_runner_action_segments(activity_logs: List[Dict[str, Any]]) -> List[Di
     - return_drive: returning → (runner_returned | returned_to_clubhouse | returned)
     - waiting_at_clubhouse: all remaining time within [service_opened, service_closed]
 
-    Any incomplete drive/return segments are closed at service end.
+    Any incomplete drive/return segments are closed at service end. A typed
+    ``ActivityLog`` is grouped by runner code directly; plain dict logs fall
+    back to matching activity tags.
     """
     if not activity_logs:
         return []
 
+    from golfsim.simulation.activity_log import ActivityLog
+
+    if isinstance(activity_logs, ActivityLog):
+        windows = _runner_windows_from_typed_log(activity_logs)
+    else:
+        windows = _runner_windows_from_dicts(activity_logs)
+
+    segments_all: List[Dict[str, Any]] = []
+    for runner_id, service_open_s, service_close_s, drives, returns in windows:
+        segments_all.extend(_partition_runner_window(runner_id, service_open_s, service_close_s, drives, returns))
+
+    segments_all.sort(key=lambda d: (str(d.get("runner_id")), int(d.get("start_timestamp_s", 0)), str(d.get("action_type"))))
+    return segments_all
+
+
+# (runner_id, service_open_s, service_close_s, [(drive_start, drive_end)], [(return_start, return_end)])
+_RunnerWindow = Tuple[str, Optional[int], Optional[int], List[Tuple[int, int]], List[Tuple[int, int]]]
+
+
+def _runner_windows_from_dicts(activity_logs: List[Dict[str, Any]]) -> List[_RunnerWindow]:
+    """Per-runner service window and drive/return intervals from dict log entries."""
     by_runner: Dict[str, List[Dict[str, Any]]] = {}
     for a in activity_logs:
         rid = a.get("runner_id") or "runner_1"
         by_runner.setdefault(str(rid), []).append(a)
 
-    drive_like: List[Dict[str, Any]] = []
-    return_like: List[Dict[str, Any]] = []
-
     def _is_delivery_end(tag: str) -> bool:
         t = tag.lower()
         return (
@@ -392,17 +417,7 @@ def build_runner_action_segments(activity_logs: List[Dict[str, Any]]) -> List[Di
             or ("delivery_failed" in t or ("failed" in t and "delivery" in t))
         )
 
-    def _is_return_end(tag: str) -> bool:
-        t = tag.lower()
-        return (
-            "runner_returned" in t
-            or "returned_to_clubhouse" in t
-            or ("returned" in t and "runner" in t)
-            or "return_complete" in t
-        )
-
-    segments_all: List[Dict[str, Any]] = []
-
+    windows: List[_RunnerWindow] = []
     for runner_id, entries in by_runner.items():
         entries_sorted = sorted(entries, key=lambda x: int(x.get("timestamp_s", 0)))
 
@@ -410,6 +425,8 @@ def build_runner_action_segments(activity_logs: List[Dict[str, Any]]) -> List[Di
         service_close_s: Optional[int] = None
         delivery_start_s: Optional[int] = None
         return_start_s: Optional[int] = None
+        drives: List[Tuple[int, int]] = []
+        returns: List[Tuple[int, int]] = []
 
         for e in entries_sorted:
             ts = int(e.get("timestamp_s", 0))
@@ -425,119 +442,181 @@ def build_runner_action_segments(activity_logs: List[Dict[str, Any]]) -> List[Di
             if "delivery_start" in tag_l and delivery_start_s is None:
                 delivery_start_s = ts
             elif delivery_start_s is not None and _is_delivery_end(tag):
-                drive_like.append({
-                    "runner_id": runner_id,
-                    "action_type": "delivery_drive",
-                    "start_timestamp_s": int(delivery_start_s),
-                    "end_timestamp_s": int(ts),
-                })
+                drives.append((int(delivery_start_s), ts))
                 delivery_start_s = None
 
             if "returning" in tag_l and return_start_s is None:
                 return_start_s = ts
             else:
                 if return_start_s is not None and ts > return_start_s and not tag_l.startswith("returning"):
-                    return_like.append({
-                        "runner_id": runner_id,
-                        "action_type": "return_drive",
-                        "start_timestamp_s": int(return_start_s),
-                        "end_timestamp_s": int(ts),
-                    })
+                    returns.append((int(return_start_s), ts))
                     return_start_s = None
 
+        if entries_sorted:
+            timestamps = [int(e.get("timestamp_s", 0)) for e in entries_sorted]
+            if service_open_s is None:
+                service_open_s = min(timestamps)
+            if service_close_s is None:
+                service_close_s = max(timestamps)
+        if delivery_start_s is not None:
+            drives.append((int(delivery_start_s), -1))
+        if return_start_s is not None:
+            returns.append((int(return_start_s), -1))
+        windows.append((runner_id, service_open_s, service_close_s, drives, returns))
+    return windows
+
+
+def _runner_windows_from_typed_log(log: Any) -> List[_RunnerWindow]:
+    """Same as ``_runner_windows_from_dicts`` for an ``ActivityLog``, grouped with NumPy."""
+    import numpy as np
+    from golfsim.simulation.activity_log import NONE, ActivityType
+
+    cols = log.arrays()
+    ts_all = cols["timestamp_s"].astype(np.int64)
+    runner_all = cols["runner"]
+    # Entries without a runner belong to the default runner, as in the dict path
+    labels = list(log.runners.values)
+    if "runner_1" not in labels:
+        labels.append("runner_1")
+    runner_all = np.where(runner_all == NONE, labels.index("runner_1"), runner_all)
+
+    # Stable: within a runner, equal timestamps keep log order
+    order = np.lexsort((ts_all, runner_all))
+    runner_sorted = runner_all[order]
+    bounds = np.flatnonzero(np.diff(runner_sorted)) + 1
+    starts = np.concatenate([[0], bounds])
+    ends = np.concatenate([bounds, [len(order)]])
+
+    opened, closed = ActivityType.SERVICE_OPENED.code, ActivityType.SERVICE_CLOSED.code
+    d_start, d_end = ActivityType.DELIVERY_START.code, ActivityType.DELIVERY_COMPLETE.code
+    returning = ActivityType.RETURNING.code
+
+    windows: List[_RunnerWindow] = []
+    for lo, hi in zip(starts, ends):
+        idx = order[lo:hi]
+        ts = ts_all[idx]
+        kind = cols["type"][idx]
+        runner_id = str(labels[runner_sorted[lo]])
+
+        # Service window: first opening, last close at/after it; else first/last event
+        open_pos = np.flatnonzero(kind == opened)
+        service_open_s = int(ts[open_pos[0]]) if open_pos.size else None
+        service_close_s = None
+        if open_pos.size:
+            close_pos = np.flatnonzero((kind == closed) & (np.arange(len(kind)) > open_pos[0]) & (ts >= ts[open_pos[0]]))
+            if close_pos.size:
+                service_close_s = int(ts[close_pos[-1]])
         if service_open_s is None:
-            try:
-                service_open_s = int(min(int(e.get("timestamp_s", 0)) for e in entries_sorted)) if entries_sorted else None
-            except Exception:
-                service_open_s = None
+            service_open_s = int(ts.min())
         if service_close_s is None:
-            try:
-                service_close_s = int(max(int(e.get("timestamp_s", 0)) for e in entries_sorted)) if entries_sorted else None
-            except Exception:
-                service_close_s = None
-
-        if service_close_s is not None:
-            if delivery_start_s is not None and service_close_s > delivery_start_s:
-                drive_like.append({
-                    "runner_id": runner_id,
-                    "action_type": "delivery_drive",
-                    "start_timestamp_s": int(delivery_start_s),
-                    "end_timestamp_s": int(service_close_s),
-                })
-            if return_start_s is not None and service_close_s > return_start_s:
-                return_like.append({
-                    "runner_id": runner_id,
-                    "action_type": "return_drive",
-                    "start_timestamp_s": int(return_start_s),
-                    "end_timestamp_s": int(service_close_s),
-                })
-
-        if service_open_s is None or service_close_s is None or service_close_s <= service_open_s:
-            continue
-
-        combined: List[Dict[str, Any]] = []
-        for seg in drive_like + return_like:
-            s = max(int(seg["start_timestamp_s"]), int(service_open_s))
-            e = min(int(seg["end_timestamp_s"]), int(service_close_s))
+            service_close_s = int(ts.max())
+
+        # Drives: first start of each run of starts pairs with the next completion
+        drive_pos = np.flatnonzero((kind == d_start) | (kind == d_end))
+        drive_kind = kind[drive_pos]
+        run_heads = np.ones(len(drive_pos), dtype=bool)
+        run_heads[1:] = drive_kind[1:] != drive_kind[:-1]
+        drive_pos, drive_kind = drive_pos[run_heads], drive_kind[run_heads]
+        if drive_kind.size and drive_kind[0] == d_end:
+            drive_pos = drive_pos[1:]
+        drive_ts = ts[drive_pos].tolist()
+        drives = [(drive_ts[i], drive_ts[i + 1] if i + 1 < len(drive_ts) else -1) for i in range(0, len(drive_ts), 2)]
+
+        # Returns: close at the first later-timestamped non-returning event
+        returns: List[Tuple[int, int]] = []
+        other_pos = np.flatnonzero(kind != returning)
+        return_pos = np.flatnonzero(kind == returning)
+        k = 0
+        while k < return_pos.size:
+            r = int(return_pos[k])
+            later = np.searchsorted(ts, ts[r], side="right")
+            j = np.searchsorted(other_pos, later)
+            if j >= other_pos.size:
+                returns.append((int(ts[r]), -1))
+                break
+            close = int(other_pos[j])
+            returns.append((int(ts[r]), int(ts[close])))
+            k = int(np.searchsorted(return_pos, close, side="right"))
+        windows.append((runner_id, service_open_s, service_close_s, drives, returns))
+    return windows
+
+
+def _partition_runner_window(
+    runner_id: str,
+    service_open_s: Optional[int],
+    service_close_s: Optional[int],
+    drives: List[Tuple[int, int]],
+    returns: List[Tuple[int, int]],
+) -> List[Dict[str, Any]]:
+    """Cover [service_open_s, service_close_s] with drive, return and waiting segments.
+
+    Intervals ending at -1 were still open and are closed at service end.
+    """
+    if service_open_s is None or service_close_s is None or service_close_s <= service_open_s:
+        return []
+
+    combined: List[Dict[str, Any]] = []
+    for action_type, intervals in (("delivery_drive", drives), ("return_drive", returns)):
+        for start, end in intervals:
+            if end < 0:
+                if service_close_s <= start:
+                    continue
+                end = service_close_s
+            s = max(int(start), int(service_open_s))
+            e = min(int(end), int(service_close_s))
             if e > s:
-                combined.append({**seg, "start_timestamp_s": s, "end_timestamp_s": e})
-
-        combined.sort(key=lambda d: (int(d.get("start_timestamp_s", 0)), int(d.get("end_timestamp_s", 0))))
-
-        cursor = int(service_open_s)
-        full_segments: List[Dict[str, Any]] = []
-        for seg in combined:
-            s = int(seg["start_timestamp_s"])
-            e = int(seg["end_timestamp_s"])
-            if s > cursor:
-                full_segments.append({
-                    "runner_id": runner_id,
-                    "action_type": "waiting_at_clubhouse",
-                    "start_timestamp_s": int(cursor),
-                    "end_timestamp_s": int(s),
-                })
-                cursor = s
-            if e > cursor:
-                seg2 = dict(seg)
-                seg2["start_timestamp_s"] = int(cursor)
-                full_segments.append(seg2)
-                cursor = e
-
-        if cursor < int(service_close_s):
+                combined.append({"runner_id": runner_id, "action_type": action_type, "start_timestamp_s": s, "end_timestamp_s": e})
+
+    combined.sort(key=lambda d: (int(d.get("start_timestamp_s", 0)), int(d.get("end_timestamp_s", 0))))
+
+    cursor = int(service_open_s)
+    full_segments: List[Dict[str, Any]] = []
+    for seg in combined:
+        s = int(seg["start_timestamp_s"])
+        e = int(seg["end_timestamp_s"])
+        if s > cursor:
             full_segments.append({
                 "runner_id": runner_id,
                 "action_type": "waiting_at_clubhouse",
                 "start_timestamp_s": int(cursor),
-                "end_timestamp_s": int(service_close_s),
+                "end_timestamp_s": int(s),
             })
-
-        if full_segments:
-            full_segments.sort(key=lambda d: (int(d.get("start_timestamp_s", 0)), int(d.get("end_timestamp_s", 0))))
-            coalesced: List[Dict[str, Any]] = []
-            for seg in full_segments:
-                if not coalesced:
-                    coalesced.append(dict(seg))
-                    continue
-                prev = coalesced[-1]
-                same_type = str(prev.get("action_type")) == str(seg.get("action_type"))
-                if same_type and int(seg.get("start_timestamp_s", 0)) <= int(prev.get("end_timestamp_s", 0)):
-                    prev["end_timestamp_s"] = int(max(int(prev.get("end_timestamp_s", 0)), int(seg.get("end_timestamp_s", 0))))
-                elif same_type and int(seg.get("start_timestamp_s", 0)) == int(prev.get("end_timestamp_s", 0)) + 0:
-                    prev["end_timestamp_s"] = int(seg.get("end_timestamp_s", 0))
-                else:
-                    coalesced.append(dict(seg))
-        else:
-            coalesced = full_segments
-
-        for s in coalesced:
-            s["start_timestamp"] = seconds_to_clock_str(int(s["start_timestamp_s"]))
-            s["end_timestamp"] = seconds_to_clock_str(int(s["end_timestamp_s"]))
-            s["duration_s"] = int(max(0, int(s["end_timestamp_s"]) - int(s["start_timestamp_s"])) )
-
-        segments_all.extend(coalesced)
-
-    segments_all.sort(key=lambda d: (str(d.get("runner_id")), int(d.get("start_timestamp_s", 0)), str(d.get("action_type"))))
-    return segments_all
+            cursor = s
+        if e > cursor:
+            seg2 = dict(seg)
+            seg2["start_timestamp_s"] = int(cursor)
+            full_segments.append(seg2)
+            cursor = e
+
+    if cursor < int(service_close_s):
+        full_segments.append({
+            "runner_id": runner_id,
+            "action_type": "waiting_at_clubhouse",
+            "start_timestamp_s": int(cursor),
+            "end_timestamp_s": int(service_close_s),
+        })
+
+    if full_segments:
+        full_segments.sort(key=lambda d: (int(d.get("start_timestamp_s", 0)), int(d.get("end_timestamp_s", 0))))
+        coalesced: List[Dict[str, Any]] = []
+        for seg in full_segments:
+            if not coalesced:
+                coalesced.append(dict(seg))
+                continue
+            prev = coalesced[-1]
+            same_type = str(prev.get("action_type")) == str(seg.get("action_type"))
+            if same_type and int(seg.get("start_timestamp_s", 0)) <= int(prev.get("end_timestamp_s", 0)):
+                prev["end_timestamp_s"] = int(max(int(prev.get("end_timestamp_s", 0)), int(seg.get("end_timestamp_s", 0))))
+            else:
+                coalesced.append(dict(seg))
+    else:
+        coalesced = full_segments
+
+    for s in coalesced:
+        s["start_timestamp"] = seconds_to_clock_str(int(s["start_timestamp_s"]))
+        s["end_timestamp"] = seconds_to_clock_str(int(s["end_timestamp_s"]))
+        s["duration_s"] = int(max(0, int(s["end_timestamp_s"]) - int(s["start_timestamp_s"])) )
+    return coalesced
 
 
 def write_runner_action_log(activity_logs: List[Dict[str, Any]], save_path: Path) -> None:
@@ -6,15 +6,18 @@ Handles final packaging and exporting of simulation results for consumers like t
 
 from __future__ import annotations
 
+import heapq
 import json
 import shutil
+from collections.abc import Sequence as SequenceABC
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pandas as pd
 
 from golfsim.logging import get_logger
+from golfsim.io.track_binary import tracks_path_for
 
 
 logger = get_logger(__name__)
@@ -184,6 +187,30 @@ def save_results_bundle(results: Dict[str, Any], output_dir: str | Path) -> Dict
     return artifacts
 
 
+# coordinates.csv columns read by the map apps: base fields plus visibility
+# tracking fields, running totals, and delivery flags
+COORDINATE_CSV_FIELDS = [
+    "id", "latitude", "longitude", "timestamp", "type", "hole", "color",
+    "fill_color", "border_color",
+    "visibility_status", "time_since_last_sighting_min", "pulsing",
+    "total_orders", "total_revenue", "avg_per_order", "revenue_per_hour",
+    "avg_order_time_min",
+    "order_id", "is_delivery_event",
+]
+
+
+def normalize_coordinate_type(raw: Any) -> str:
+    """Map a point's raw type to runner/bevcart/golfer, passing other types through."""
+    raw_type = str(raw).lower()
+    if "runner" in raw_type:
+        return "runner"
+    if "bev" in raw_type or "beverage" in raw_type:
+        return "bevcart"
+    if "golf" in raw_type:
+        return "golfer"
+    return raw_type or "unknown"
+
+
 def normalize_coordinate_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize a coordinate entry to unified schema fields.
 
@@ -196,15 +223,7 @@ def normalize_coordinate_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
                 return entry[k]
         return default
 
-    raw_type = str(_get_first("type", default="")).lower()
-    if "runner" in raw_type:
-        norm_type = "runner"
-    elif "bev" in raw_type or "beverage" in raw_type:
-        norm_type = "bevcart"
-    elif "golf" in raw_type:
-        norm_type = "golfer"
-    else:
-        norm_type = raw_type or "unknown"
+    norm_type = normalize_coordinate_type(_get_first("type", default=""))
 
     hole_val = _get_first("current_hole", "hole")
     if hole_val is None or hole_val == "":
@@ -292,63 +311,82 @@ def normalize_coordinate_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     return base_entry
 
 
-def write_unified_coordinates_csv(points_by_id: Dict[str, List[Dict[str, Any]]], save_path: str | Path) -> Path:
+def _coordinate_row_key(entry: Dict[str, Any], stream_id: str) -> Tuple[str, float]:
+    """(id, timestamp) of an entry as ``normalize_coordinate_entry`` would emit them."""
+    raw_id = entry.get("id") or stream_id
+    if raw_id is None:
+        raw_id = ""
+    ts_raw = entry.get("timestamp")
+    if ts_raw is None:
+        ts_raw = entry.get("timestamp_s", 0)
+    try:
+        ts_val = float(ts_raw)
+    except Exception:
+        ts_val = 0.0
+    return str(raw_id), ts_val
+
+
+def _keyed_stream(stream_no: int, stream_id: str, points: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, float, int, int, Dict[str, Any]]]:
+    """Yield ``(id, timestamp, stream_no, position, entry)`` for one stream in key order.
+
+    ``stream_no`` and ``position`` break ties, so merged tuples never compare the
+    entries themselves. Sequences that are not already ordered are sorted
+    (stably, so the first of equal keys stays first); other iterables must
+    already be ordered.
+    """
+    if isinstance(points, SequenceABC):
+        keys = (_coordinate_row_key(p, stream_id) for p in points)
+        prev = next(keys, None)
+        for key in keys:
+            if key < prev:
+                points = sorted(points, key=lambda p: _coordinate_row_key(p, stream_id))
+                break
+            prev = key
+    last_key: Optional[Tuple[str, float]] = None
+    for position, p in enumerate(points):
+        key = _coordinate_row_key(p, stream_id)
+        if last_key is not None and key <= last_key:
+            if key == last_key:
+                # Only the first row for an (id, timestamp) is written
+                continue
+            raise ValueError(f"Coordinate stream {stream_id!r} is not ordered by timestamp")
+        last_key = key
+        yield key[0], key[1], stream_no, position, (p if p.get("id") else {**p, "id": stream_id})
+
+
+def write_unified_coordinates_csv(points_by_id: Dict[str, Iterable[Dict[str, Any]]], save_path: str | Path) -> Path:
     """Write a single CSV combining one or more streams into the unified format.
 
     Columns: id,latitude,longitude,timestamp,type,hole,visibility_status,time_since_last_sighting_min,pulsing
     Each input point can contain latitude/lat, longitude/lon, timestamp/timestamp_s, current_hole/hole, type, id.
     The provided key is used as 'id' if the entry lacks an explicit id.
     Enhanced with visibility tracking fields for golfer points.
+
+    Rows are ordered by (id, timestamp), keeping the first row for a repeated
+    (id, timestamp). Streams are k-way merged and written as they are
+    normalized, so memory grows with the number of streams rather than the
+    number of points; streams may be generators when already time-ordered.
     """
     save_path = Path(save_path)
     save_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Base fieldnames plus visibility tracking fields, running totals, and delivery flags
-    fieldnames = [
-        "id", "latitude", "longitude", "timestamp", "type", "hole", "color",
-        "fill_color", "border_color",
-        "visibility_status", "time_since_last_sighting_min", "pulsing",
-        "total_orders", "total_revenue", "avg_per_order", "revenue_per_hour",
-        "avg_order_time_min",
-        "order_id", "is_delivery_event",
-    ]
-    
     # Use csv module to avoid pandas dependency here
     import csv as _csv
     with save_path.open("w", newline="", encoding="utf-8") as f:
-        writer = _csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer = _csv.DictWriter(f, fieldnames=COORDINATE_CSV_FIELDS, extrasaction='ignore')
         writer.writeheader()
-        # Collect, normalize, and deduplicate rows per (id, timestamp)
-        collected_rows = []
-        for stream_id, points in points_by_id.items():
-            for p in points or []:
-                entry = dict(p)
-                if "id" not in entry or not entry.get("id"):
-                    entry["id"] = stream_id
-                row = normalize_coordinate_entry(entry)
-                collected_rows.append(row)
-
-        # Sort by id, timestamp then drop duplicates keeping first occurrence
-        try:
-            collected_rows.sort(key=lambda r: (str(r.get("id", "")), float(r.get("timestamp", 0.0))))
-        except Exception:
-            pass
-
-        seen_keys = set()
-        unique_rows = []
-        for r in collected_rows:
-            try:
-                ts_key = float(r.get("timestamp", 0.0))
-            except Exception:
-                ts_key = 0.0
-            key = (str(r.get("id", "")), ts_key)
-            if key in seen_keys:
+        # Ties on (id, timestamp) go to the earlier stream, as a stable global sort would
+        streams = [
+            _keyed_stream(stream_no, stream_id, points or [])
+            for stream_no, (stream_id, points) in enumerate(points_by_id.items())
+        ]
+        last_key: Optional[Tuple[str, float]] = None
+        for row_id, ts, _stream_no, _position, entry in heapq.merge(*streams):
+            # Equal (id, timestamp) keys are adjacent after the merge; keep the first
+            if (row_id, ts) == last_key:
                 continue
-            seen_keys.add(key)
-            unique_rows.append(r)
-
-        for r in unique_rows:
-            writer.writerow(r)
+            last_key = (row_id, ts)
+            writer.writerow(normalize_coordinate_entry(entry))
 
     logger.info("Saved unified coordinates CSV: %s", save_path)
     return save_path
@@ -509,13 +547,19 @@ def copy_to_public_coordinates(
         
         if source_coords.exists():
             shutil.copy2(source_coords, public_coords_dir / "coordinates.csv")
+        source_tracks = tracks_path_for(source_coords)
+        if source_tracks.exists():
+            shutil.copy2(source_tracks, public_coords_dir / source_tracks.name)
 
         if source_metrics.exists():
             shutil.copy2(source_metrics, public_coords_dir / "simulation_metrics.json")
             
         coord_count = sum(1 for line in source_coords.open("r", encoding="utf-8")) - 1 if source_coords.exists() else 0
+        entry = {"id": "coordinates", "name": f"{mode.title()} Simulation", "filename": "coordinates.csv", "description": description or f"{coord_count} coordinate points"}
+        if source_tracks.exists():
+            entry["tracksFilename"] = source_tracks.name
         manifest_data = {
-            "simulations": [{"id": "coordinates", "name": f"{mode.title()} Simulation", "filename": "coordinates.csv", "description": description or f"{coord_count} coordinate points"}],
+            "simulations": [entry],
             "defaultSimulation": "coordinates"
         }
         
@@ -538,6 +582,10 @@ def sync_run_outputs_to_public(run_dir: Path, description: Optional[str] = None)
         if src_coords.exists():
             shutil.copy2(src_coords, coords_dir / "coordinates.csv")
             shutil.copy2(src_coords, public_root / "coordinates.csv")
+        src_tracks = tracks_path_for(src_coords)
+        if src_tracks.exists():
+            shutil.copy2(src_tracks, coords_dir / src_tracks.name)
+            shutil.copy2(src_tracks, public_root / src_tracks.name)
 
         src_metrics = run_dir / "simulation_metrics.json"
         if src_metrics.exists():
@@ -545,8 +593,11 @@ def sync_run_outputs_to_public(run_dir: Path, description: Optional[str] = None)
             shutil.copy2(src_metrics, public_root / "simulation_metrics.json")
         
         coord_count = sum(1 for _ in src_coords.open("r")) - 1 if src_coords.exists() else 0
+        entry = {"id": "coordinates", "name": "Simulation", "filename": "coordinates.csv", "description": description or f"{coord_count} coordinate points"}
+        if src_tracks.exists():
+            entry["tracksFilename"] = src_tracks.name
         manifest_data = {
-            "simulations": [{"id": "coordinates", "name": "Simulation", "filename": "coordinates.csv", "description": description or f"{coord_count} coordinate points"}],
+            "simulations": [entry],
             "defaultSimulation": "coordinates"
         }
         with (coords_dir / "manifest.json").open("w") as f: json.dump(manifest_data, f, indent=2)
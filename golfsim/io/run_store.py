@@ -0,0 +1,278 @@
+"""
+Sweep-wide run-result store.
+
+Optimizer sweeps produce thousands of run directories. Aggregation used to glob
+``delivery_runner_metrics_run_*.json`` and reparse every ``results.json`` just
+to get ``delivery_stats``, again on every re-aggregation. Instead each run can
+append one row to ``runs`` plus its orders and delivery stats to a single SQLite
+file per sweep (``<sweep root>/runs.sqlite``), which aggregation, heatmaps,
+asset sync and analysis scripts query with ordinary predicates.
+
+Several simulation processes may append concurrently: connections are
+short-lived, use WAL journaling and wait on locks.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from golfsim.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+RUN_STORE_FILENAME = "runs.sqlite"
+# Seconds a writer waits for another process holding the lock
+_LOCK_TIMEOUT_S = 120.0
+
+# Per-run scalar metrics, named as in delivery_runner_metrics_run_*.json
+RUN_METRIC_COLUMNS = (
+    "revenue_per_round",
+    "orders_per_runner_hour",
+    "on_time_rate",
+    "delivery_cycle_time_p90",
+    "delivery_cycle_time_avg",
+    "failed_rate",
+    "second_runner_break_even_orders",
+    "queue_wait_avg",
+    "runner_utilization_driving_pct",
+    "runner_utilization_prep_pct",
+    "runner_utilization_idle_pct",
+    "distance_per_delivery_avg",
+    "runner_drive_minutes",
+    "total_revenue",
+    "total_orders",
+    "successful_orders",
+    "failed_orders",
+    "pending_orders",
+    "active_runner_hours",
+)
+_COUNT_COLUMNS = ("total_orders", "successful_orders", "failed_orders", "pending_orders")
+DELIVERY_COLUMNS = (
+    "order_id",
+    "golfer_group_id",
+    "hole_num",
+    "placed_hole_num",
+    "order_time_s",
+    "queue_delay_s",
+    "prep_time_s",
+    "delivery_time_s",
+    "return_time_s",
+    "total_drive_time_s",
+    "delivery_distance_m",
+    "total_completion_time_s",
+    "delivered_at_time_s",
+    "runner_id",
+)
+ORDER_COLUMNS = ("order_id", "golfer_group_id", "hole_num", "status", "order_time_s")
+# Columns of runs usable as query predicates
+RUN_KEY_COLUMNS = ("run_dir", "group_dir", "run_idx", "orders", "runners", "variant_key")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_dir TEXT NOT NULL UNIQUE,
+    group_dir TEXT NOT NULL,
+    run_idx INTEGER NOT NULL,
+    orders INTEGER,
+    runners INTEGER,
+    variant_key TEXT,
+    blocked_holes TEXT,
+    {", ".join(f"{c} REAL" for c in RUN_METRIC_COLUMNS)},
+    simulation_metrics TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_group ON runs (group_dir);
+CREATE INDEX IF NOT EXISTS runs_combo ON runs (orders, runners, variant_key);
+CREATE TABLE IF NOT EXISTS deliveries (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    {", ".join(f"{c} {'TEXT' if c in ('order_id', 'runner_id') else 'REAL'}" for c in DELIVERY_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS deliveries_run ON deliveries (run_id);
+CREATE TABLE IF NOT EXISTS orders (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    {", ".join(f"{c} {'TEXT' if c in ('order_id', 'status') else 'REAL'}" for c in ORDER_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS orders_run ON orders (run_id);
+"""
+
+
+def _path_key(path: Union[str, Path]) -> str:
+    return str(Path(path).resolve())
+
+
+def _scalar(value: Any) -> Any:
+    """Coerce a JSON-ish value to something SQLite stores (non-scalars become None)."""
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _restore_ints(row: Dict[str, Any], columns: Iterable[str]) -> Dict[str, Any]:
+    """REAL columns that hold whole numbers (ids, hole numbers, counts) come back as int."""
+    for c in columns:
+        v = row.get(c)
+        if isinstance(v, float) and v.is_integer():
+            row[c] = int(v)
+    return row
+
+
+class RunStore:
+    """Append-only SQLite store of per-run metrics, orders and delivery stats for one sweep."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    @classmethod
+    def for_sweep(cls, root: Union[str, Path]) -> "RunStore":
+        """Store at ``<root>/runs.sqlite``."""
+        return cls(Path(root) / RUN_STORE_FILENAME)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=_LOCK_TIMEOUT_S)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def append_run(
+        self,
+        run_dir: Union[str, Path],
+        *,
+        run_idx: int,
+        orders: Optional[int],
+        runners: Optional[int],
+        variant_key: Optional[str],
+        blocked_holes: Optional[Sequence[int]],
+        metrics: Any,
+        sim_result: Dict[str, Any],
+        simulation_metrics: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record one run; an existing row for the same run directory is replaced.
+
+        Args:
+            run_dir: The run's output directory (its parent is the group directory)
+            metrics: DeliveryRunnerMetrics (or a dict with the same field names)
+            sim_result: The results.json payload (orders and delivery_stats are stored)
+            simulation_metrics: Optional simulation_metrics.json payload for the map app
+        """
+        data = asdict(metrics) if is_dataclass(metrics) else dict(metrics or {})
+        run_key = _path_key(run_dir)
+        values = {
+            "run_dir": run_key,
+            "group_dir": _path_key(Path(run_dir).parent),
+            "run_idx": int(run_idx),
+            "orders": orders,
+            "runners": runners,
+            "variant_key": variant_key,
+            "blocked_holes": json.dumps(list(blocked_holes or [])),
+            **{c: _scalar(data.get(c)) for c in RUN_METRIC_COLUMNS},
+            "simulation_metrics": json.dumps(simulation_metrics) if simulation_metrics is not None else None,
+        }
+        deliveries = [
+            tuple(_scalar(s.get(c)) for c in DELIVERY_COLUMNS)
+            for s in (sim_result.get("delivery_stats") or [])
+            if isinstance(s, dict)
+        ]
+        order_rows = [
+            tuple(_scalar(o.get(c)) for c in ORDER_COLUMNS)
+            for o in (sim_result.get("orders") or [])
+            if isinstance(o, dict)
+        ]
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" for _ in values)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM runs WHERE run_dir = ?", (run_key,))
+            run_id = conn.execute(f"INSERT INTO runs ({columns}) VALUES ({placeholders})", tuple(values.values())).lastrowid
+            conn.executemany(
+                f"INSERT INTO deliveries (run_id, {', '.join(DELIVERY_COLUMNS)}) VALUES (?, {', '.join('?' for _ in DELIVERY_COLUMNS)})",
+                [(run_id, *row) for row in deliveries],
+            )
+            conn.executemany(
+                f"INSERT INTO orders (run_id, {', '.join(ORDER_COLUMNS)}) VALUES (?, {', '.join('?' for _ in ORDER_COLUMNS)})",
+                [(run_id, *row) for row in order_rows],
+            )
+        logger.debug("Stored %s (%d deliveries) in %s", run_key, len(deliveries), self.path)
+
+    def query_runs(
+        self,
+        *,
+        run_dirs: Optional[Iterable[Union[str, Path]]] = None,
+        group_dirs: Optional[Iterable[Union[str, Path]]] = None,
+        **predicates: Any,
+    ) -> List[Dict[str, Any]]:
+        """Return run rows ordered by group and run index.
+
+        Args:
+            run_dirs: Restrict to these run directories
+            group_dirs: Restrict to runs inside these group directories
+            **predicates: Equality filters on orders, runners, variant_key or run_idx
+
+        Raises:
+            ValueError: For an unknown predicate column
+        """
+        if not self.exists():
+            return []
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in predicates.items():
+            if column not in RUN_KEY_COLUMNS:
+                raise ValueError(f"Unknown run predicate: {column}")
+            clauses.append(f"{column} = ?")
+            params.append(value)
+        for column, paths in (("run_dir", run_dirs), ("group_dir", group_dirs)):
+            if paths is None:
+                continue
+            keys = [_path_key(p) for p in paths]
+            if not keys:
+                return []
+            clauses.append(f"{column} IN ({', '.join('?' for _ in keys)})")
+            params.extend(keys)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"SELECT * FROM runs{where} ORDER BY group_dir, run_idx", params).fetchall()
+        out: List[Dict[str, Any]] = []
+        for r in rows:
+            row = _restore_ints(dict(r), _COUNT_COLUMNS)
+            row["blocked_holes"] = json.loads(row["blocked_holes"] or "[]")
+            raw_sm = row.get("simulation_metrics")
+            row["simulation_metrics"] = json.loads(raw_sm) if raw_sm else None
+            out.append(row)
+        return out
+
+    def _child_rows(self, table: str, columns: Sequence[str], run_ids: Iterable[int]) -> Dict[int, List[Dict[str, Any]]]:
+        ids = [int(i) for i in run_ids]
+        out: Dict[int, List[Dict[str, Any]]] = {i: [] for i in ids}
+        if not ids or not self.exists():
+            return out
+        int_columns = [c for c in columns if c not in ("order_id", "runner_id", "status")]
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT run_id, {', '.join(columns)} FROM {table} WHERE run_id IN ({', '.join('?' for _ in ids)}) ORDER BY rowid",
+                ids,
+            ).fetchall()
+        for r in rows:
+            row = dict(r)
+            run_id = row.pop("run_id")
+            out[run_id].append(_restore_ints({k: v for k, v in row.items() if v is not None}, int_columns))
+        return out
+
+    def delivery_stats(self, run_ids: Iterable[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Stored delivery_stats rows per run id (NULL fields omitted, as in results.json)."""
+        return self._child_rows("deliveries", DELIVERY_COLUMNS, run_ids)
+
+    def orders(self, run_ids: Iterable[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Stored order rows per run id."""
+        return self._child_rows("orders", ORDER_COLUMNS, run_ids)
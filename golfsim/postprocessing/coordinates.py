@@ -48,6 +48,9 @@ def generate_runner_coordinates_from_events(
     """
     runner_coords = []
 
+    # The clubhouse snaps to the same node for every order; look it up once
+    clubhouse_node = nearest_node(cart_graph, clubhouse_coords[0], clubhouse_coords[1])
+
     # Helper: normalize node IDs to match the cart_graph's node key type
     def _coerce_node_id(value: Any, target_type: type) -> Any:
         try:
@@ -364,7 +367,6 @@ def generate_runner_coordinates_from_events(
                 golfer_location = golfer_coords_df.loc[closest_idx]
                 delivery_target = (float(golfer_location['longitude']), float(golfer_location['latitude']))
                 try:
-                    clubhouse_node = nearest_node(cart_graph, clubhouse_coords[0], clubhouse_coords[1])
                     delivery_node = nearest_node(cart_graph, delivery_target[0], delivery_target[1])
                     if clubhouse_node is not None and delivery_node is not None:
                         # Strictly use weighted shortest path on cart_graph
@@ -426,7 +428,6 @@ def generate_runner_coordinates_from_events(
             delivery_target = (float(golfer_location['longitude']), float(golfer_location['latitude']))
             # Generate delivery path coordinates via shortest path
             try:
-                clubhouse_node = nearest_node(cart_graph, clubhouse_coords[0], clubhouse_coords[1])
                 delivery_node = nearest_node(cart_graph, delivery_target[0], delivery_target[1])
                 if clubhouse_node is not None and delivery_node is not None:
                     delivery_path_nodes = nx.dijkstra_path(cart_graph, clubhouse_node, delivery_node, weight=_edge_weight)
@@ -0,0 +1,196 @@
+"""
+Precomputed all-pairs shortest paths for the runner cart graph.
+
+The runner graph has only a few hundred nodes, so a dense distance/predecessor
+matrix turns every route query into an O(1) length lookup plus O(path)
+reconstruction instead of a Dijkstra search. Matrices are persisted next to the
+graph pickle (``pkl/cart_graph.pkl`` -> ``pkl/cart_graph_distances.npz``) by
+``scripts/routing/build_cart_network_from_holes_connected.py`` and attached to
+the graph when it is loaded through ``golfsim.data.course_assets``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import networkx as nx
+import numpy as np
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+# Format version stored in the .npz; bump when the layout changes
+MATRIX_FORMAT_VERSION = 1
+NO_PREDECESSOR = -1
+
+_MATRIX_BY_GRAPH: "weakref.WeakKeyDictionary[nx.Graph, CartPathDistanceMatrix]" = weakref.WeakKeyDictionary()
+
+
+def distance_matrix_path(graph_pkl_path: Union[str, Path]) -> Path:
+    """Return the sidecar .npz path for a graph pickle (cart_graph.pkl -> cart_graph_distances.npz)."""
+    p = Path(graph_pkl_path)
+    return p.with_name(f"{p.stem}_distances.npz")
+
+
+def graph_fingerprint(G: nx.Graph) -> str:
+    """Stable hash of node ids and edge lengths, used to detect stale matrices."""
+    h = hashlib.sha1()
+    for node in G.nodes():
+        h.update(repr(node).encode("utf-8"))
+        h.update(b";")
+    edges = sorted(
+        (repr(min(u, v, key=repr)), repr(max(u, v, key=repr)), round(float(d.get("length", 0.0)), 6))
+        for u, v, d in G.edges(data=True)
+    )
+    for u, v, length in edges:
+        h.update(f"{u}-{v}:{length!r}|".encode("utf-8"))
+    return h.hexdigest()
+
+
+@dataclass
+class CartPathDistanceMatrix:
+    """Dense shortest-path lengths (metres) and predecessors indexed by graph node order."""
+
+    nodes: List[Any]
+    dist_m: np.ndarray
+    predecessors: np.ndarray
+    fingerprint: str = ""
+    index: Dict[Any, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.index:
+            self.index = {node: i for i, node in enumerate(self.nodes)}
+
+    @classmethod
+    def build(cls, G: nx.Graph) -> "CartPathDistanceMatrix":
+        """Compute all-pairs shortest paths with one Dijkstra per source node."""
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        n = len(nodes)
+        dist_m = np.full((n, n), np.inf, dtype=np.float64)
+        predecessors = np.full((n, n), NO_PREDECESSOR, dtype=np.int32)
+        for src in nodes:
+            i = index[src]
+            preds, dists = nx.dijkstra_predecessor_and_distance(G, src, weight="length")
+            for node, d in dists.items():
+                dist_m[i, index[node]] = float(d)
+            for node, plist in preds.items():
+                if plist:
+                    predecessors[i, index[node]] = index[plist[0]]
+        return cls(nodes=nodes, dist_m=dist_m, predecessors=predecessors, fingerprint=graph_fingerprint(G), index=index)
+
+    def save(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            np.savez_compressed(
+                f,
+                version=np.int32(MATRIX_FORMAT_VERSION),
+                nodes=np.asarray(self.nodes),
+                dist_m=self.dist_m,
+                predecessors=self.predecessors,
+                fingerprint=np.asarray(self.fingerprint),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CartPathDistanceMatrix":
+        with np.load(Path(path), allow_pickle=False) as data:
+            version = int(data["version"])
+            if version != MATRIX_FORMAT_VERSION:
+                raise ValueError(f"Unsupported distance matrix version {version} in {path}")
+            nodes = [n.item() for n in data["nodes"]]
+            return cls(
+                nodes=nodes,
+                dist_m=np.array(data["dist_m"], dtype=np.float64),
+                predecessors=np.array(data["predecessors"], dtype=np.int32),
+                fingerprint=str(data["fingerprint"]),
+            )
+
+    def matches(self, G: nx.Graph) -> bool:
+        """True when this matrix was built from a graph identical to G."""
+        return len(self.nodes) == G.number_of_nodes() and self.fingerprint == graph_fingerprint(G)
+
+    def length_m(self, src, dst) -> float:
+        """Shortest path length in metres (inf when unreachable)."""
+        return float(self.dist_m[self.index[src], self.index[dst]])
+
+    def path_indices(self, src, dst) -> List[int]:
+        """Shortest path as matrix/graph-order indices.
+
+        Raises:
+            nx.NodeNotFound: If src or dst is not a graph node
+            nx.NetworkXNoPath: If dst is unreachable from src
+        """
+        for node in (src, dst):
+            if node not in self.index:
+                raise nx.NodeNotFound(f"Node {node} not found in graph")
+        i = self.index[src]
+        j = self.index[dst]
+        if i == j:
+            return [i]
+        if not np.isfinite(self.dist_m[i, j]):
+            raise nx.NetworkXNoPath(f"No path between {src} and {dst}.")
+        row = self.predecessors[i]
+        out = [j]
+        k = j
+        while k != i:
+            k = int(row[k])
+            if k == NO_PREDECESSOR or len(out) > len(self.nodes):
+                raise nx.NetworkXNoPath(f"No path between {src} and {dst}.")
+            out.append(k)
+        out.reverse()
+        return out
+
+    def path(self, src, dst) -> List[Any]:
+        """Shortest path as graph node ids."""
+        return [self.nodes[k] for k in self.path_indices(src, dst)]
+
+
+def attach_distance_matrix(G: nx.Graph, matrix: CartPathDistanceMatrix) -> None:
+    """Associate a matrix with a graph object so routing can use it transparently."""
+    _MATRIX_BY_GRAPH[G] = matrix
+
+
+def get_distance_matrix(G: nx.Graph) -> Optional[CartPathDistanceMatrix]:
+    """Return the matrix attached to G, if any."""
+    try:
+        return _MATRIX_BY_GRAPH.get(G)
+    except TypeError:
+        return None
+
+
+def load_distance_matrix_for(G: nx.Graph, graph_pkl_path: Union[str, Path]) -> Optional[CartPathDistanceMatrix]:
+    """Load and attach the sidecar matrix for a graph pickle when present and current."""
+    path = distance_matrix_path(graph_pkl_path)
+    if not path.exists():
+        return None
+    try:
+        matrix = CartPathDistanceMatrix.load(path)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Failed to load distance matrix %s: %s", path, e)
+        return None
+    if not matrix.matches(G):
+        logger.warning("Distance matrix %s is stale for %s; rebuild the cart network", path.name, Path(graph_pkl_path).name)
+        return None
+    attach_distance_matrix(G, matrix)
+    return matrix
+
+
+def shortest_path_nodes(G: nx.Graph, src, dst) -> List[Any]:
+    """Shortest path by 'length', using the attached matrix when available."""
+    matrix = get_distance_matrix(G)
+    if matrix is not None:
+        return matrix.path(src, dst)
+    return nx.shortest_path(G, src, dst, weight="length")
+
+
+def build_and_save_distance_matrix(G: nx.Graph, graph_pkl_path: Union[str, Path]) -> Path:
+    """Builder step: compute the matrix for G and write it next to its pickle."""
+    matrix = CartPathDistanceMatrix.build(G)
+    return matrix.save(distance_matrix_path(graph_pkl_path))
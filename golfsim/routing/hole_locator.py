@@ -0,0 +1,103 @@
+"""
+Vectorised point-in-hole lookup over the geofenced hole polygons.
+
+Labeling loop points, crossings and graph nodes with the hole they fall in used
+to test each point against every hole polygon in turn (pure-Python ray casting
+or one shapely ``contains`` per pair). ``HoleLocator`` indexes the polygon parts
+in a shapely ``STRtree`` and prepares them once, so ``locate`` answers a whole
+batch of points with one bounding-box query plus prepared containment tests on
+the few candidates.
+
+Polygons keep their file order: a point inside several holes gets the first
+one, as the sequential scans did.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import shapely
+from shapely.geometry import MultiPolygon, Polygon, shape
+
+NO_HOLE = -1
+
+
+class HoleLocator:
+    """Hole number for (lon, lat) points; ``NO_HOLE`` outside every polygon."""
+
+    def __init__(self, polygons: Iterable[Tuple[int, Any]]) -> None:
+        parts: List[Any] = []
+        holes: List[int] = []
+        for hole, geom in polygons:
+            if geom is None or geom.is_empty:
+                continue
+            for part in (geom.geoms if isinstance(geom, MultiPolygon) else [geom]):
+                parts.append(part)
+                holes.append(int(hole))
+        self._parts = np.asarray(parts, dtype=object)
+        self._holes = np.asarray(holes, dtype=np.int16)
+        shapely.prepare(self._parts)
+        self._tree = shapely.STRtree(self._parts)
+
+    @classmethod
+    def from_features(cls, holes: Sequence[Dict[str, Any]]) -> "HoleLocator":
+        """Build from ``crossings.load_holes_geojson`` records ({"hole", "polygons": rings})."""
+        polygons = []
+        for h in holes:
+            for rings in h.get("polygons") or []:
+                if rings:
+                    polygons.append((int(h["hole"]), Polygon(rings[0], rings[1:])))
+        return cls(polygons)
+
+    @classmethod
+    def from_geodataframe(cls, holes_gdf) -> "HoleLocator":
+        """Build from a GeoDataFrame with 'hole' and 'geometry' columns."""
+        return cls(zip(holes_gdf["hole"], holes_gdf.geometry))
+
+    @classmethod
+    def from_geojson(cls, path: Union[str, Path]) -> "HoleLocator":
+        """Build from a holes GeoJSON (``properties.hole``, falling back to ``ref``)."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        polygons = []
+        for feat in (data.get("features", []) if isinstance(data, dict) else []):
+            if not isinstance(feat, dict) or not feat.get("geometry"):
+                continue
+            props = feat.get("properties") or {}
+            try:
+                hole = int(props.get("hole", props.get("ref")))
+            except (TypeError, ValueError):
+                continue
+            geom = shape(feat["geometry"])
+            if isinstance(geom, (Polygon, MultiPolygon)):
+                polygons.append((hole, geom))
+        return cls(polygons)
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def locate(self, lons: Any, lats: Any) -> np.ndarray:
+        """Hole per point as an int16 array (``NO_HOLE`` where none contains it)."""
+        x = np.asarray(lons, dtype=np.float64).ravel()
+        y = np.asarray(lats, dtype=np.float64).ravel()
+        out = np.full(x.size, NO_HOLE, dtype=np.int16)
+        if not x.size or not len(self._parts):
+            return out
+        # Bounding-box candidates, then exact containment on prepared polygons
+        point_idx, part_idx = self._tree.query(shapely.points(x, y))
+        inside = shapely.contains_xy(self._parts[part_idx], x[point_idx], y[point_idx])
+        point_idx, part_idx = point_idx[inside], part_idx[inside]
+        # First polygon in file order wins for points inside several holes
+        order = np.lexsort((part_idx, point_idx))
+        point_idx, part_idx = point_idx[order], part_idx[order]
+        first = np.ones(point_idx.size, dtype=bool)
+        first[1:] = point_idx[1:] != point_idx[:-1]
+        out[point_idx[first]] = self._holes[part_idx[first]]
+        return out
+
+    def locate_point(self, lon: float, lat: float) -> Optional[int]:
+        """Hole containing one point, or None."""
+        hole = int(self.locate([lon], [lat])[0])
+        return None if hole == NO_HOLE else hole
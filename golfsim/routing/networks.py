@@ -4,18 +4,15 @@ Routing utilities for runner shortest paths on cart-path graph.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import networkx as nx
-from shapely.geometry import Point
-import geopandas as gpd
-import pandas as pd
-
-_gdf_cache: Dict[int, gpd.GeoDataFrame] = {}
 
+from .distance_matrix import shortest_path_nodes
+from .node_index import get_node_index
 
 def nearest_node(G: nx.Graph, lon: float, lat: float):
-    """Return nearest node by euclidean distance using node 'x'/'y'.
+    """Return the node nearest to (lon, lat) using the graph's spatial index.
 
     Deterministic fallback behavior:
     - If no nodes have valid 'x' and 'y' attributes, return None
@@ -23,38 +20,24 @@ def nearest_node(G: nx.Graph, lon: float, lat: float):
     """
     if G is None or G.number_of_nodes() == 0:
         return None
-
-    graph_id = id(G)
-
-    if graph_id not in _gdf_cache:
-        node_list = [
-            (node, data.get("x"), data.get("y"))
-            for node, data in G.nodes(data=True)
-            if data.get("x") is not None and data.get("y") is not None
-        ]
-        if not node_list:
-            return None
-
-        df = pd.DataFrame(node_list, columns=['node', 'x', 'y'])
-        # Use node ID as index for easy lookup later with idxmin()
-        gdf = gpd.GeoDataFrame(
-            df.drop(columns=['node']),
-            geometry=gpd.points_from_xy(df.x, df.y),
-            index=df.node
-        )
-        _gdf_cache[graph_id] = gdf
-
-    gdf = _gdf_cache[graph_id]
-    if gdf.empty:
+    index = get_node_index(G)
+    if index is None:
         return None
-        
-    target = Point(lon, lat)
+    return index.nearest(lon, lat)
 
-    # Calculate distances from the target to all nodes in a vectorized way
-    distances = gdf.distance(target)
 
-    # Find the index (node ID) of the minimum distance
-    return distances.idxmin()
+def nearest_nodes(G: nx.Graph, lons: Sequence[float], lats: Sequence[float]) -> List:
+    """Batch form of nearest_node: snap many points in one vectorised query.
+
+    Returns a list aligned with the inputs, or all None when the graph has no
+    nodes with coordinates.
+    """
+    if G is None or G.number_of_nodes() == 0:
+        return [None] * len(lons)
+    index = get_node_index(G)
+    if index is None:
+        return [None] * len(lons)
+    return index.nearest_nodes(lons, lats)
 
 
 def shortest_path_on_cartpaths(
@@ -130,8 +113,8 @@ def try_backwards_routing(
         if waypoint_node and waypoint_node != src_node and waypoint_node != dst_node:
             # Try: clubhouse -> hole 18 area -> destination
             try:
-                path1 = nx.shortest_path(G, src_node, waypoint_node, weight="length")
-                path2 = nx.shortest_path(G, waypoint_node, dst_node, weight="length")
+                path1 = shortest_path_nodes(G, src_node, waypoint_node)
+                path2 = shortest_path_nodes(G, waypoint_node, dst_node)
 
                 # Combine paths, avoiding duplicate waypoint node
                 combined_path = path1 + path2[1:]
@@ -151,7 +134,7 @@ def try_backwards_routing(
                 # Only return if this creates a meaningfully different route
                 if (
                     len(combined_path)
-                    < len(nx.shortest_path(G, src_node, dst_node, weight="length")) * 0.9
+                    < len(shortest_path_nodes(G, src_node, dst_node)) * 0.9
                 ):
                     return combined_path
 
@@ -170,8 +153,8 @@ def try_backwards_routing(
             waypoint = nearest_node(G, waypoint_coords[0], waypoint_coords[1])
             if waypoint and waypoint != src_node and waypoint != dst_node:
                 try:
-                    path1 = nx.shortest_path(G, src_node, waypoint, weight="length")
-                    path2 = nx.shortest_path(G, waypoint, dst_node, weight="length")
+                    path1 = shortest_path_nodes(G, src_node, waypoint)
+                    path2 = shortest_path_nodes(G, waypoint, dst_node)
                     combined_path = path1 + path2[1:]
 
                     # DEBUG: Check for routing loops and fail hard if detected
@@ -188,7 +171,7 @@ def try_backwards_routing(
 
                     if (
                         len(combined_path)
-                        < len(nx.shortest_path(G, src_node, dst_node, weight="length")) * 0.85
+                        < len(shortest_path_nodes(G, src_node, dst_node)) * 0.85
                     ):
                         return combined_path
 
@@ -0,0 +1,129 @@
+"""
+Precomputed cart-graph node -> hole lookup.
+
+Placing an order resolves the golfer's node to the hole it lies in. Doing that
+with polygon containment per order meant loading the geofenced holes through
+geopandas and scanning every polygon. ``NodeHoleIndex`` stores the answer for
+every node in a dense array indexed by node id, so a lookup is one array read.
+The index is persisted next to the graph pickle (``pkl/cart_graph.pkl`` ->
+``pkl/cart_graph_node_holes.npz``) by
+``scripts/routing/build_cart_network_from_holes_connected.py`` and loaded, or
+rebuilt when stale, through ``golfsim.data.course_assets``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+import networkx as nx
+import numpy as np
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+# Format version stored in the .npz; bump when the layout changes
+NODE_HOLES_FORMAT_VERSION = 1
+NO_HOLE = -1
+
+
+def node_holes_path(graph_pkl_path: Union[str, Path]) -> Path:
+    """Return the sidecar .npz path for a graph pickle (cart_graph.pkl -> cart_graph_node_holes.npz)."""
+    p = Path(graph_pkl_path)
+    return p.with_name(f"{p.stem}_node_holes.npz")
+
+
+def node_positions_fingerprint(G: nx.Graph) -> str:
+    """Stable hash of node ids and coordinates, used to detect stale indexes."""
+    h = hashlib.sha1()
+    for node, data in G.nodes(data=True):
+        h.update(f"{node!r}:{data.get('x')!r},{data.get('y')!r}|".encode("utf-8"))
+    return h.hexdigest()
+
+
+def file_sha1(path: Union[str, Path]) -> str:
+    """Content hash of the hole polygons file ("" when it does not exist)."""
+    p = Path(path)
+    if not p.exists():
+        return ""
+    return hashlib.sha1(p.read_bytes()).hexdigest()
+
+
+@dataclass
+class NodeHoleIndex:
+    """Hole number per integer cart-graph node id (``NO_HOLE`` outside every hole)."""
+
+    holes: np.ndarray
+    graph_fingerprint: str = ""
+    polygons_sha1: str = ""
+
+    @classmethod
+    def empty(cls) -> "NodeHoleIndex":
+        return cls(holes=np.zeros(0, dtype=np.int16))
+
+    @classmethod
+    def build(cls, G: nx.Graph, polygons: Iterable[Tuple[int, Any]], polygons_sha1: str = "") -> "NodeHoleIndex":
+        """Label each node with the first polygon (in file order) that contains it.
+
+        Nodes without x/y or with non-integer ids are left unlabeled.
+        """
+        from .hole_locator import HoleLocator
+
+        int_nodes = [n for n in G.nodes() if isinstance(n, (int, np.integer)) and n >= 0]
+        holes = np.full(max(int_nodes, default=-1) + 1, NO_HOLE, dtype=np.int16)
+        placed = [n for n in int_nodes if "x" in G.nodes[n] and "y" in G.nodes[n]]
+        if placed:
+            xs = [G.nodes[n]["x"] for n in placed]
+            ys = [G.nodes[n]["y"] for n in placed]
+            holes[np.asarray(placed, dtype=np.int64)] = HoleLocator(polygons).locate(xs, ys)
+        return cls(holes=holes, graph_fingerprint=node_positions_fingerprint(G), polygons_sha1=polygons_sha1)
+
+    def save(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            np.savez_compressed(
+                f,
+                version=np.int32(NODE_HOLES_FORMAT_VERSION),
+                holes=self.holes,
+                graph_fingerprint=np.asarray(self.graph_fingerprint),
+                polygons_sha1=np.asarray(self.polygons_sha1),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "NodeHoleIndex":
+        with np.load(Path(path), allow_pickle=False) as data:
+            version = int(data["version"])
+            if version != NODE_HOLES_FORMAT_VERSION:
+                raise ValueError(f"Unsupported node-hole index version {version} in {path}")
+            return cls(
+                holes=np.array(data["holes"], dtype=np.int16),
+                graph_fingerprint=str(data["graph_fingerprint"]),
+                polygons_sha1=str(data["polygons_sha1"]),
+            )
+
+    def matches(self, G: nx.Graph, polygons_sha1: str) -> bool:
+        """True when built from the same node positions and hole polygons file."""
+        return self.polygons_sha1 == polygons_sha1 and self.graph_fingerprint == node_positions_fingerprint(G)
+
+    def hole_for_node(self, node: Any) -> Optional[int]:
+        """Hole containing ``node``, or None when it is outside every hole or unknown."""
+        if not isinstance(node, (int, np.integer)) or not 0 <= node < self.holes.size:
+            return None
+        hole = int(self.holes[node])
+        return None if hole == NO_HOLE else hole
+
+    def labels(self) -> Dict[int, int]:
+        """``{node: hole}`` for every labeled node."""
+        nodes = np.flatnonzero(self.holes != NO_HOLE)
+        return {int(n): int(self.holes[n]) for n in nodes}
+
+
+def build_and_save_node_holes(G: nx.Graph, graph_pkl_path: Union[str, Path], holes_gdf, holes_path: Union[str, Path]) -> Path:
+    """Builder step: label G's nodes with the holes in ``holes_gdf`` and write the sidecar."""
+    index = NodeHoleIndex.build(G, zip(holes_gdf["hole"], holes_gdf.geometry), polygons_sha1=file_sha1(holes_path))
+    return index.save(node_holes_path(graph_pkl_path))
@@ -0,0 +1,110 @@
+"""
+Spatial nearest-node index for cart-path graphs.
+
+Node coordinates are projected to local metres (equirectangular about the
+graph's mean latitude) and indexed with scipy's ``cKDTree`` when scipy is
+available, falling back to a vectorised numpy scan otherwise. The index is
+attached to frozen graph objects (weakly), so it lives exactly as long as the
+graph and is rebuilt automatically for a freshly loaded pickle.
+"""
+
+from __future__ import annotations
+
+import math
+import weakref
+from typing import Any, List, Optional, Sequence
+
+import networkx as nx
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree  # type: ignore
+except Exception:  # pragma: no cover - scipy is optional
+    cKDTree = None  # type: ignore
+
+EARTH_RADIUS_M = 6371000.0
+# Rows per block in the numpy fallback to bound the (points x nodes) temporary
+_SCAN_BLOCK = 1024
+
+_INDEX_BY_GRAPH: "weakref.WeakKeyDictionary[nx.Graph, NodeIndex]" = weakref.WeakKeyDictionary()
+
+
+class NodeIndex:
+    """Nearest-node lookups over the nodes of a graph that carry 'x'/'y' (lon/lat)."""
+
+    def __init__(self, nodes: Sequence[Any], lons: Sequence[float], lats: Sequence[float]):
+        self.nodes: List[Any] = list(nodes)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self._lat0_rad = math.radians(float(self.lats.mean())) if len(self.lats) else 0.0
+        self._xy = self._project(self.lons, self.lats)
+        self._tree = cKDTree(self._xy) if (cKDTree is not None and len(self.nodes)) else None
+
+    @classmethod
+    def from_graph(cls, G: nx.Graph) -> "NodeIndex":
+        nodes: List[Any] = []
+        lons: List[float] = []
+        lats: List[float] = []
+        for node, data in G.nodes(data=True):
+            x = data.get("x")
+            y = data.get("y")
+            if x is None or y is None:
+                continue
+            nodes.append(node)
+            lons.append(float(x))
+            lats.append(float(y))
+        return cls(nodes, lons, lats)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def _project(self, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+        """Project lon/lat degrees to local x/y metres."""
+        x = np.radians(lons) * math.cos(self._lat0_rad) * EARTH_RADIUS_M
+        y = np.radians(lats) * EARTH_RADIUS_M
+        return np.column_stack([x, y])
+
+    def nearest_indices(self, lons: Sequence[float], lats: Sequence[float]) -> np.ndarray:
+        """Return positions into ``self.nodes`` of the nearest node for each point."""
+        if not self.nodes:
+            raise ValueError("Node index is empty")
+        pts = self._project(
+            np.atleast_1d(np.asarray(lons, dtype=np.float64)),
+            np.atleast_1d(np.asarray(lats, dtype=np.float64)),
+        )
+        if self._tree is not None:
+            _, idx = self._tree.query(pts, k=1)
+            return np.asarray(idx, dtype=np.intp)
+        out = np.empty(len(pts), dtype=np.intp)
+        for start in range(0, len(pts), _SCAN_BLOCK):
+            block = pts[start : start + _SCAN_BLOCK]
+            d2 = ((block[:, None, :] - self._xy[None, :, :]) ** 2).sum(axis=2)
+            out[start : start + len(block)] = d2.argmin(axis=1)
+        return out
+
+    def nearest_nodes(self, lons: Sequence[float], lats: Sequence[float]) -> List[Any]:
+        """Return the nearest graph node id for each (lon, lat) pair."""
+        return [self.nodes[i] for i in self.nearest_indices(lons, lats)]
+
+    def nearest(self, lon: float, lat: float) -> Any:
+        """Return the nearest graph node id to a single point."""
+        return self.nodes[int(self.nearest_indices([lon], [lat])[0])]
+
+
+def get_node_index(G: nx.Graph) -> Optional[NodeIndex]:
+    """Return the spatial index for G, or None when no node carries coordinates.
+
+    Frozen graphs (everything loaded through ``golfsim.data.course_assets``) keep
+    their index for the graph's lifetime. Mutable graphs can change under us, so
+    they get a fresh index per call; freeze a graph to opt into caching.
+    """
+    if G is None:
+        return None
+    if not nx.is_frozen(G):
+        index = NodeIndex.from_graph(G)
+        return index if len(index) else None
+    index = _INDEX_BY_GRAPH.get(G)
+    if index is None:
+        index = NodeIndex.from_graph(G)
+        _INDEX_BY_GRAPH[G] = index
+    return index if len(index) else None
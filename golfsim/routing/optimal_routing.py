@@ -11,7 +11,8 @@ from typing import Dict, List, Tuple
 import networkx as nx
 import numpy as np
 
-from .networks import nearest_node
+from .distance_matrix import get_distance_matrix
+from .networks import nearest_node, nearest_nodes
 
 
 def get_node_coordinates(graph: nx.Graph, node_id: int) -> Tuple[float, float]:
@@ -143,9 +144,10 @@ def find_optimal_route(
         return {"success": False, "error": "Cart path graph is empty or invalid"}
 
     try:
-        # Find nearest nodes to start and end coordinates
-        start_node = nearest_node(graph, start_coords[0], start_coords[1])
-        end_node = nearest_node(graph, end_coords[0], end_coords[1])
+        # Find nearest nodes to start and end coordinates in one index query
+        start_node, end_node = nearest_nodes(
+            graph, [start_coords[0], end_coords[0]], [start_coords[1], end_coords[1]]
+        )
 
         if start_node is None or end_node is None:
             return {
@@ -158,21 +160,31 @@ def find_optimal_route(
         dy = (end_coords[1] - start_coords[1]) * 111139  # meters per degree latitude
         straight_line_distance = np.sqrt(dx**2 + dy**2)
 
+        # Precomputed all-pairs matrix (attached by the course asset loader)
+        matrix = get_distance_matrix(graph)
+
         if start_node == end_node:
+            start_id = matrix.index[start_node] if matrix is not None else list(graph.nodes()).index(start_node)
             return {
                 "success": True,
                 "path": [start_node],
-                "path_ids": [list(graph.nodes()).index(start_node)],
+                "path_ids": [start_id],
                 "metrics": {"length_m": 0.0, "time_s": 0.0, "time_min": 0.0, "num_segments": 0},
                 "efficiency": 100.0,
                 "straight_line_distance": 0.0,
             }
 
-        # Find shortest path using NetworkX
-        path = nx.shortest_path(graph, start_node, end_node, weight="length")
-
-        # Convert to node IDs for compatibility
-        path_ids = [list(graph.nodes()).index(node) for node in path]
+        if matrix is not None:
+            # Index-based node IDs are the matrix indices (graph node order)
+            path_ids = matrix.path_indices(start_node, end_node)
+            path = [matrix.nodes[i] for i in path_ids]
+        else:
+            # Find shortest path using NetworkX
+            path = nx.shortest_path(graph, start_node, end_node, weight="length")
+
+            # Convert to node IDs for compatibility
+            node_list = list(graph.nodes())
+            path_ids = [node_list.index(node) for node in path]
 
         # Calculate comprehensive path metrics
         metrics = calculate_path_metrics(graph, path, speed_mps)
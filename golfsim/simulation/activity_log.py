@@ -0,0 +1,196 @@
+"""
+Typed, append-only activity log for the delivery services.
+
+Every simulated event used to build an f-string description, a clock string and
+a dict, and downstream reports recovered runners and event kinds by substring
+matching. ``ActivityLog`` instead stores one row per event in flat typed
+columns (activity type code, timestamp, interned runner/order/location codes,
+hole number, queue depth). Descriptions are kept as a format template plus its
+arguments and only rendered when a record is read.
+
+The log is a read-only sequence of the same dicts the services used to append,
+so ``results.json`` and the existing report/metrics code keep working; hot
+consumers use ``arrays()`` for vectorised grouping instead.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+class ActivityType(str, Enum):
+    """Activity kinds the delivery services log (values are the logged strings)."""
+
+    SERVICE_OPENED = "service_opened"
+    SERVICE_CLOSED = "service_closed"
+    ORDER_RECEIVED = "order_received"
+    ORDER_PLACED = "order_placed"
+    ORDER_QUEUED = "order_queued"
+    ORDER_READY = "order_ready"
+    ORDER_ASSIGNED = "order_assigned"
+    ORDER_FAILED_TIMEOUT = "order_failed_timeout"
+    PROCESSING_START = "processing_start"
+    PREP_START = "prep_start"
+    PREP_COMPLETE = "prep_complete"
+    PICKUP_ORDER = "pickup_order"
+    DELIVERY_START = "delivery_start"
+    DELIVERY_COMPLETE = "delivery_complete"
+    RETURNING = "returning"
+    ARRIVED_CLUBHOUSE = "arrived_clubhouse"
+    QUEUE_STATUS = "queue_status"
+    IDLE = "idle"
+
+    @property
+    def code(self) -> int:
+        return _TYPE_CODES[self]
+
+
+_TYPES: Tuple[ActivityType, ...] = tuple(ActivityType)
+# str-valued members hash like their values, so plain strings look up too
+_TYPE_CODES: Dict[Any, int] = {t: i for i, t in enumerate(_TYPES)}
+# Sentinel for absent runner/order/hole/queue values
+NONE = -1
+
+
+class _Interner:
+    """Stable small-int codes for repeated strings (runner labels, order ids, ...)."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def code(self, value: Any) -> int:
+        if value is None:
+            return NONE
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def value(self, code: int) -> Any:
+        return None if code == NONE else self.values[code]
+
+
+def clock_str(timestamp_s: float) -> str:
+    """HH:MM for a simulation time (t=0 is 07:00), as the services have always logged it."""
+    current_time_min = timestamp_s / 60
+    return f"{int(current_time_min // 60) + 7:02d}:{int(current_time_min % 60):02d}"
+
+
+class ActivityLog(Sequence):
+    """Columnar activity log (see module docstring)."""
+
+    def __init__(self) -> None:
+        self._type = array("B")
+        self._time = array("d")
+        # 1 where the logged time was an int, so records give back what the caller passed
+        self._time_is_int = array("B")
+        self._runner = array("i")
+        self._order = array("i")
+        self._hole = array("i")
+        self._queue = array("i")
+        self._location = array("i")
+        self._template = array("i")
+        self._args: List[Tuple[Any, ...]] = []
+        self.runners = _Interner()
+        self.orders = _Interner()
+        self.locations = _Interner()
+        self.templates = _Interner()
+
+    def append(
+        self,
+        activity_type: Any,
+        timestamp_s: float,
+        description: str,
+        args: Tuple[Any, ...] = (),
+        *,
+        runner_id: Optional[str] = None,
+        order_id: Optional[str] = None,
+        hole: Optional[int] = None,
+        orders_in_queue: Optional[int] = None,
+        location: Optional[str] = None,
+    ) -> None:
+        """Record one event; ``description.format(*args)`` is deferred until read.
+
+        Raises:
+            KeyError: If ``activity_type`` is not an ActivityType (or its value)
+        """
+        self._type.append(_TYPE_CODES[activity_type])
+        self._time.append(timestamp_s)
+        self._time_is_int.append(isinstance(timestamp_s, (int, np.integer)))
+        self._runner.append(self.runners.code(runner_id))
+        self._order.append(self.orders.code(order_id))
+        self._hole.append(NONE if hole is None else int(hole))
+        self._queue.append(NONE if orders_in_queue is None else int(orders_in_queue))
+        self._location.append(self.locations.code(location))
+        self._template.append(self.templates.code(description))
+        self._args.append(args)
+
+    def __len__(self) -> int:
+        return len(self._type)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ActivityLog index out of range")
+        return self._record(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self._record(i)
+
+    def activity_type(self, index: int) -> ActivityType:
+        return _TYPES[self._type[index]]
+
+    def description(self, index: int) -> str:
+        template = self.templates.values[self._template[index]]
+        args = self._args[index]
+        return template.format(*args) if args else template
+
+    def _record(self, i: int) -> Dict[str, Any]:
+        timestamp_s = int(self._time[i]) if self._time_is_int[i] else self._time[i]
+        entry: Dict[str, Any] = {
+            "timestamp_s": timestamp_s,
+            "time_str": clock_str(timestamp_s),
+            "activity_type": _TYPES[self._type[i]].value,
+            "description": self.description(i),
+            "order_id": self.orders.value(self._order[i]),
+            "location": self.locations.value(self._location[i]),
+        }
+        if self._queue[i] != NONE:
+            entry["orders_in_queue"] = self._queue[i]
+        if self._runner[i] != NONE:
+            entry["runner_id"] = self.runners.value(self._runner[i])
+        if self._hole[i] != NONE:
+            entry["hole"] = self._hole[i]
+        return entry
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """The log as the list of dicts written to ``results.json``."""
+        return list(self)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """NumPy copies of the typed columns.
+
+        ``type`` holds ``ActivityType.code`` values; ``runner``/``order`` index
+        ``runners.values``/``orders.values``; absent values are ``NONE`` (-1).
+        """
+        # Copies: a live buffer export would stop the arrays from growing
+        return {
+            "type": np.array(self._type, dtype=np.uint8),
+            "timestamp_s": np.array(self._time, dtype=np.float64),
+            "runner": np.array(self._runner, dtype=np.int32),
+            "order": np.array(self._order, dtype=np.int32),
+            "hole": np.array(self._hole, dtype=np.int32),
+        }
@@ -0,0 +1,250 @@
+"""
+In-process batch execution of delivery-runner simulations.
+
+Sweeps (staffing optimizers, sensitivity grids) run many small simulations that
+differ only in runner count, order volume, blocked holes and seed. Running each
+one through ``scripts/sim/run_new.py`` pays interpreter start-up, heavy imports
+and course loading per combination, then round-trips results through
+``results.json``/``simulation_metrics.json``. ``run_batch`` instead warms the
+shared course assets once and returns metrics objects directly.
+
+For process pools, ``init_sweep_worker`` loads the course assets once per worker
+process and ``run_sweep_combo`` executes one ``SweepCombo`` descriptor, writing
+the same run directories as ``run_new.py`` and returning compact per-run metrics.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..analysis.delivery_runner_metrics import DeliveryRunnerMetrics
+from ..analysis.metrics_integration import reset_metrics_flag
+from ..config.models import SimulationConfig
+from ..data.course_assets import get_course_assets
+from ..logging import get_logger, init_logging
+from .delivery_prediction import get_prediction_engine
+from .delivery_stats import DeliveryStatsTable
+from .orchestration import (
+    delivery_runner_metrics_for_run,
+    run_delivery_runner_simulation,
+    simulate_delivery_runner_run,
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BatchRunResult:
+    """Outcome of one simulation run executed by run_batch."""
+
+    config_index: int
+    run_idx: int
+    num_runners: int
+    total_orders_requested: int
+    random_seed: Optional[int]
+    blocked_holes: List[int]
+    variant_key: str
+    metrics: DeliveryRunnerMetrics
+    # Columnar; iterates as the run's delivery_stats dicts
+    delivery_stats: DeliveryStatsTable = field(default_factory=DeliveryStatsTable)
+    # Full results.json-equivalent payload, only kept when requested
+    sim_result: Optional[Dict[str, Any]] = None
+
+
+def warm_course_assets(course_dir: str, clubhouse: Optional[tuple] = None) -> None:
+    """Load the per-course assets every run needs into the process-wide caches."""
+    assets = get_course_assets(course_dir)
+    assets.cart_graph()
+    assets.loop_points()
+    assets.node_holes()
+    if clubhouse:
+        try:
+            get_prediction_engine(course_dir, clubhouse)
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Prediction engine warm-up failed for %s: %s", course_dir, e)
+
+
+def run_batch(
+    configs: Iterable[SimulationConfig],
+    *,
+    args: Optional[argparse.Namespace] = None,
+    keep_results: bool = False,
+) -> List[BatchRunResult]:
+    """Execute many simulation configurations in this process.
+
+    Each config is run ``config.num_runs`` times exactly as
+    ``run_delivery_runner_simulation`` would, but nothing is written to disk.
+    Course assets are loaded once per distinct course directory.
+
+    Args:
+        configs: Simulation configurations (runners, orders, blocked holes, seed, ...)
+        args: Optional CLI namespace applied to every config (same meaning as in
+            ``run_delivery_runner_simulation``)
+        keep_results: Also return each run's full result payload
+
+    Returns:
+        One BatchRunResult per executed run, in config then run order
+    """
+    results: List[BatchRunResult] = []
+    warmed: set = set()
+    for config_index, config in enumerate(configs):
+        course_key = (str(config.course_dir), tuple(config.clubhouse) if config.clubhouse else None)
+        if course_key not in warmed:
+            warm_course_assets(config.course_dir, config.clubhouse)
+            warmed.add(course_key)
+
+        first_run_idx = int(getattr(config, "run_index_offset", 0) or 0) + 1
+        for run_idx in range(first_run_idx, first_run_idx + int(config.num_runs)):
+            sim_result, _, _ = simulate_delivery_runner_run(config, args, run_idx)
+            metadata = sim_result.get("metadata", {})
+            num_runners = int(config.num_runners)
+            metrics = delivery_runner_metrics_for_run(config, sim_result, f"batch_{config_index:03d}_run_{run_idx:02d}")
+            total_orders = getattr(args, "delivery_total_orders", None)
+            results.append(
+                BatchRunResult(
+                    config_index=config_index,
+                    run_idx=run_idx,
+                    num_runners=num_runners,
+                    total_orders_requested=int(total_orders if total_orders is not None else config.delivery_total_orders),
+                    random_seed=config.random_seed,
+                    blocked_holes=list(metadata.get("blocked_holes", [])),
+                    variant_key=str(metadata.get("variant_key", "none")),
+                    metrics=metrics,
+                    delivery_stats=DeliveryStatsTable.from_records(sim_result.get("delivery_stats", []) or []),
+                    sim_result=sim_result if keep_results else None,
+                )
+            )
+            logger.debug(
+                "Batch config %d run %d: %d/%d delivered",
+                config_index,
+                run_idx,
+                metrics.successful_orders,
+                metrics.total_orders,
+            )
+    return results
+
+
+# delivery_stats fields sweep aggregation needs (per-hole times, histograms, peaks)
+COMPACT_DELIVERY_STAT_KEYS = ("hole_num", "delivery_time_s", "total_completion_time_s", "order_time_s")
+
+
+@dataclass(frozen=True)
+class SweepCombo:
+    """One sweep cell: the settings ``run_new.py`` would receive on its command line."""
+
+    num_runners: int
+    total_orders: int
+    num_runs: int
+    output_dir: str
+    blocked_holes: Tuple[int, ...] = ()
+    minimal_outputs: bool = True
+    runner_speed: Optional[float] = None
+    prep_time: Optional[int] = None
+    random_seed: Optional[int] = None
+    # Append runs after existing run_* directories (adaptive replication rounds)
+    run_index_offset: int = 0
+    # Sweep run store the runs append to (golfsim.io.run_store)
+    run_store: Optional[str] = None
+    common_random_numbers: bool = False
+    dispatch_policy: str = "fifo"
+    intercept_lateness_weight: Optional[float] = None
+    intercept_earliness_weight: Optional[float] = None
+
+    def to_args(self, course_dir: str, tee_scenario: str, log_level: str = "INFO") -> argparse.Namespace:
+        """Namespace equivalent to run_new.py parsing this combo's flags."""
+        return argparse.Namespace(
+            course_dir=str(course_dir),
+            tee_scenario=tee_scenario,
+            log_level=log_level,
+            num_runs=int(self.num_runs),
+            run_index_offset=int(self.run_index_offset),
+            output_dir=str(self.output_dir),
+            num_carts=0,
+            num_runners=int(self.num_runners),
+            groups_count=0,
+            first_tee="09:00",
+            delivery_total_orders=int(self.total_orders),
+            block_holes=list(self.blocked_holes) or None,
+            runner_speed=self.runner_speed,
+            prep_time=self.prep_time,
+            golfer_total_minutes=None,
+            random_seed=self.random_seed,
+            minimal_outputs=bool(self.minimal_outputs),
+            coordinates_only_for_first_run=True,
+            run_store=self.run_store,
+            common_random_numbers=bool(self.common_random_numbers),
+            dispatch_policy=self.dispatch_policy,
+            intercept_lateness_weight=self.intercept_lateness_weight,
+            intercept_earliness_weight=self.intercept_earliness_weight,
+            # run_new.py implies these for minimal outputs
+            no_heatmap=bool(self.minimal_outputs),
+            no_export_geojson=bool(self.minimal_outputs),
+        )
+
+
+def compact_run_metrics(run_idx: int, metrics: DeliveryRunnerMetrics, delivery_stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Small, picklable per-run summary (metrics JSON fields plus trimmed delivery stats)."""
+    return {
+        "run_idx": int(run_idx),
+        "metrics": asdict(metrics),
+        "delivery_stats": [{k: s.get(k) for k in COMPACT_DELIVERY_STAT_KEYS} for s in delivery_stats],
+    }
+
+
+# Per-process settings installed by init_sweep_worker
+_SWEEP_WORKER: Dict[str, Any] = {}
+
+
+def init_sweep_worker(course_dir: str, tee_scenario: str, log_level: str = "INFO") -> None:
+    """Process pool initializer: load course assets once for every combo this worker runs.
+
+    Warms the cart graph (with its distance matrix and node index), loop points,
+    node -> hole labels and the prediction engine's travel-time vector.
+    """
+    init_logging(log_level)
+    # Forked workers inherit the parent's RNG state; reseed like a fresh process
+    random.seed()
+    np.random.seed()
+    base = SweepCombo(num_runners=1, total_orders=0, num_runs=1, output_dir="").to_args(course_dir, tee_scenario, log_level)
+    config = SimulationConfig.from_args(base)
+    warm_course_assets(config.course_dir, config.clubhouse)
+    try:
+        engine = get_prediction_engine(config.course_dir, config.clubhouse)
+        if engine is not None:
+            engine.travel_times_s(config.delivery_runner_speed_mps)
+    except Exception as e:  # noqa: BLE001
+        logger.debug("Prediction engine warm-up failed for %s: %s", course_dir, e)
+    _SWEEP_WORKER.update(course_dir=str(course_dir), tee_scenario=tee_scenario, log_level=log_level)
+
+
+def run_sweep_combo(combo: SweepCombo) -> List[Dict[str, Any]]:
+    """Run one combo in this worker, writing outputs like run_new.py.
+
+    Returns:
+        One ``compact_run_metrics`` dict per run, in run order
+
+    Raises:
+        RuntimeError: If the worker was not initialised with init_sweep_worker
+    """
+    if not _SWEEP_WORKER:
+        raise RuntimeError("run_sweep_combo requires init_sweep_worker to run first in this process")
+    args = combo.to_args(_SWEEP_WORKER["course_dir"], _SWEEP_WORKER["tee_scenario"], _SWEEP_WORKER["log_level"])
+    config = SimulationConfig.from_args(args)
+    Path(combo.output_dir).mkdir(parents=True, exist_ok=True)
+    # Each run_new.py process writes detailed metrics for its first run; keep that layout
+    reset_metrics_flag()
+
+    compact: List[Dict[str, Any]] = []
+
+    def _collect(run_idx: int, run_path: Path, sim_result: Dict[str, Any]) -> None:
+        metrics = delivery_runner_metrics_for_run(config, sim_result, f"delivery_dynamic_{run_idx:02d}")
+        compact.append(compact_run_metrics(run_idx, metrics, sim_result.get("delivery_stats", []) or []))
+
+    run_delivery_runner_simulation(config, args=args, on_run_complete=_collect)
+    return compact
@@ -10,6 +10,8 @@ from __future__ import annotations
 import random
 from typing import Any, Dict, List, Optional
 
+from .rng import resolve_rng
+
 
 def simulate_beverage_cart_sales(
     course_dir: str,
@@ -18,6 +20,7 @@ def simulate_beverage_cart_sales(
     price_per_order: float,
     golfer_points: Optional[List[Dict]] = None,
     crossings_data: Optional[Dict[str, Any]] = None,
+    rng: Optional[random.Random] = None,
 ) -> Dict[str, Any]:
 
     """
@@ -30,10 +33,12 @@ def simulate_beverage_cart_sales(
         price_per_order: Price per order in dollars
         golfer_points: GPS points for golfers (optional)
         crossings_data: Crossings computation result from crossings service
+        rng: Per-run random stream (defaults to the global random module)
         
     Returns:
         Dictionary with sales, revenue, pass_intervals_per_group, activity_log, metadata
     """
+    rng = resolve_rng(rng)
     sales: List[Dict[str, Any]] = []
     pass_intervals_per_group: Dict[str, List] = {}
     activity_log: List[Dict[str, Any]] = []
@@ -68,7 +73,7 @@ def simulate_beverage_cart_sales(
                     last_crossing_time = crossing_timestamp_s
                     
                     # Probabilistic order placement at each crossing
-                    if random.random() < pass_order_probability:
+                    if rng.random() < pass_order_probability:
                         hole_num = crossing.get("hole") or 1
                         sale = {
                             "group_id": int(group_id),
@@ -96,14 +101,14 @@ def simulate_beverage_cart_sales(
             pass_intervals_per_group[group_id] = []
             
             # Simulate 2-3 potential pass events during the round
-            num_passes = random.randint(2, 3)
+            num_passes = rng.randint(2, 3)
             
             last_pass_offset = 0
             round_duration_s = 216 * 60  # 216 minutes total
             
             for pass_idx in range(num_passes):
                 # Random hole between 1-18
-                hole_num = random.randint(1, 18)
+                hole_num = rng.randint(1, 18)
                 
                 # Calculate pass time ensuring we don't exceed round duration
                 min_time = last_pass_offset + (1800 if pass_idx > 0 else 0)  # At least 30 min apart after first
@@ -113,7 +118,7 @@ def simulate_beverage_cart_sales(
                     # Not enough time left for another pass
                     break
                     
-                pass_time_offset = random.randint(min_time, max_time)
+                pass_time_offset = rng.randint(min_time, max_time)
                 pass_timestamp_s = tee_time_s + pass_time_offset
                 
                 # Record pass interval (time since last pass)
@@ -123,7 +128,7 @@ def simulate_beverage_cart_sales(
                 last_pass_offset = pass_time_offset
                 
                 # Probabilistic order placement
-                if random.random() < pass_order_probability:
+                if rng.random() < pass_order_probability:
                     sale = {
                         "group_id": group["group_id"],
                         "hole_num": hole_num,
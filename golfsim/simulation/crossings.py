@@ -8,6 +8,8 @@ from datetime import datetime, date, time, timedelta
 import json
 import random
 
+from ..routing.hole_locator import HoleLocator
+
 
 # -------------------------
 # Unit conversions
@@ -58,152 +60,31 @@ def pos_to_node_index(cum: List[float], s: float) -> int:
 # -------------------------
 # GeoJSON loaders
 # -------------------------
-def load_nodes_geojson(path: str) -> List[Tuple[float, float]]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+def _load_loop_nodes(path: str):
+    from ..data.course_assets import load_loop_nodes
 
-    if isinstance(data, dict) and data.get("type") == "FeatureCollection":
-        features = data.get("features", [])
-    elif isinstance(data, dict) and data.get("type") == "Feature":
-        features = [data]
-    else:
-        raise ValueError("Unsupported GeoJSON structure: expected FeatureCollection or Feature")
+    nodes = load_loop_nodes(path)
+    if nodes is None:
+        raise FileNotFoundError(path)
+    if not len(nodes):
+        raise ValueError("GeoJSON contains no Point features with usable coordinates.")
+    return nodes
 
-    def coerce_float(value: Any) -> Optional[float]:
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return None
 
-    def coerce_int(value: Any) -> Optional[int]:
-        try:
-            return int(value)
-        except (TypeError, ValueError):
-            return None
-
-    # Prefer Point features with ordering; they can carry hole labels and indices
-    ordered_points: List[Tuple[int, Optional[int], Optional[float], Optional[int], float, float]] = []
-    for idx, feat in enumerate(features):
-        if not isinstance(feat, dict):
-            continue
-        geom = feat.get("geometry") or {}
-        if not isinstance(geom, dict) or geom.get("type") != "Point":
-            continue
-        coords = geom.get("coordinates")
-        if not isinstance(coords, (list, tuple)) or len(coords) < 2:
-            continue
-        lon, lat = float(coords[0]), float(coords[1])
-        props = feat.get("properties") or {}
-        idx_prop = coerce_int(props.get("idx"))
-        seq = coerce_float(props.get("sequence_position"))
-        nid = coerce_int(props.get("node_id"))
-        ordered_points.append((idx, idx_prop, seq, nid, lat, lon))
-
-    if ordered_points:
-        def sort_key(item: Tuple[int, Optional[int], Optional[float], Optional[int], float, float]):
-            original_index, idx_opt, seq_opt, node_id_opt, _lat, _lon = item
-            if idx_opt is not None:
-                return (0, idx_opt)
-            if seq_opt is not None:
-                return (1, seq_opt)
-            if node_id_opt is not None:
-                return (2, node_id_opt)
-            return (3, original_index)
-
-        ordered_points.sort(key=sort_key)
-        nodes = [(lat, lon) for (_i, _idx, _s, _n, lat, lon) in ordered_points]
-        if len(nodes) < 2:
-            raise ValueError("GeoJSON must contain at least 2 Point features with coordinates.")
-        return nodes
-
-    # No Points available; do not use LineString for nodes
-    raise ValueError("GeoJSON contains no Point features with usable coordinates.")
+def load_nodes_geojson(path: str) -> List[Tuple[float, float]]:
+    """(lat, lon) loop nodes ordered by idx, sequence_position, node_id, then file order."""
+    nodes = _load_loop_nodes(path)
+    if len(nodes) < 2:
+        raise ValueError("GeoJSON must contain at least 2 Point features with coordinates.")
+    order = nodes.path_order()
+    return list(zip(nodes.lat[order].tolist(), nodes.lon[order].tolist()))
 
 
 def load_nodes_geojson_with_holes(path: str) -> Tuple[List[Tuple[float, float]], List[Optional[int]]]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    if isinstance(data, dict) and data.get("type") == "FeatureCollection":
-        features = data.get("features", [])
-    elif isinstance(data, dict) and data.get("type") == "Feature":
-        features = [data]
-    else:
-        raise ValueError("Unsupported GeoJSON structure: expected FeatureCollection or Feature")
-
-    def coerce_float(value: Any) -> Optional[float]:
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return None
-
-    def coerce_int(value: Any) -> Optional[int]:
-        try:
-            return int(value)
-        except (TypeError, ValueError):
-            return None
-
-    # Attempt to load hole polygons for fallback labeling
-    holes_fc: Optional[List[Dict[str, Any]]] = None
-    try:
-        # path → courses/<course>/geojson/generated/holes_connected.geojson
-        from pathlib import Path as _P
-        base = _P(path)
-        holes_path = base.parent / "holes_geofenced.geojson"
-        if holes_path.exists():
-            holes_fc = load_holes_geojson(str(holes_path))
-    except Exception:
-        holes_fc = None
-
-    # Prefer Point features with ordering and optional hole labels
-    temp: List[Tuple[int, Optional[int], Optional[float], Optional[int], float, float, Optional[int]]] = []
-    for idx, feat in enumerate(features):
-        if not isinstance(feat, dict):
-            continue
-        geom = feat.get("geometry") or {}
-        if not isinstance(geom, dict) or geom.get("type") != "Point":
-            continue
-        coords = geom.get("coordinates")
-        if not isinstance(coords, (list, tuple)) or len(coords) < 2:
-            continue
-        lon, lat = float(coords[0]), float(coords[1])
-        props = feat.get("properties") or {}
-        idx_prop = coerce_int(props.get("idx"))
-        seq = coerce_float(props.get("sequence_position"))
-        nid = coerce_int(props.get("node_id"))
-        hole_raw = (
-            props.get("hole_number")
-            or props.get("hole")
-            or props.get("hole_num")
-            or props.get("current_hole")
-        )
-        hole_num = coerce_int(hole_raw)
-        # Fallback to polygon lookup if label is missing
-        if hole_num is None and holes_fc is not None:
-            try:
-                hole_num = locate_hole_for_point(lon=lon, lat=lat, holes=holes_fc)  # type: ignore[arg-type]
-            except Exception:
-                hole_num = None
-        temp.append((idx, idx_prop, seq, nid, lat, lon, hole_num))
-
-    if temp:
-        def sort_key(item: Tuple[int, Optional[int], Optional[float], Optional[int], float, float, Optional[int]]):
-            original_index, idx_opt, seq_opt, node_id_opt, _lat, _lon, _h = item
-            if idx_opt is not None:
-                return (0, idx_opt)
-            if seq_opt is not None:
-                return (1, seq_opt)
-            if node_id_opt is not None:
-                return (2, node_id_opt)
-            return (3, original_index)
-
-        temp.sort(key=sort_key)
-        nodes = [(lat, lon) for (_i, _idx, _s, _n, lat, lon, _h) in temp]
-        node_holes: List[Optional[int]] = [h for (_i, _idx, _s, _n, _lat, _lon, h) in temp]
-        return nodes, node_holes
-
-    # No Points available; do not use LineString for nodes
-    raise ValueError("GeoJSON contains no Point features with usable coordinates.")
+    """Like ``load_nodes_geojson``, plus each node's hole (property or geofenced polygon)."""
+    nodes = _load_loop_nodes(path)
+    order = nodes.path_order()
+    return list(zip(nodes.lat[order].tolist(), nodes.lon[order].tolist())), nodes.hole_labels(order)
 
 
 def load_holes_geojson(path: str) -> List[Dict[str, Any]]:
@@ -279,6 +160,7 @@ def point_in_polygon(lon: float, lat: float, polygon_with_holes: List[List[Tuple
 
 
 def locate_hole_for_point(lon: float, lat: float, holes: List[Dict[str, Any]]) -> Optional[int]:
+    """Single-point ray-casting lookup; use ``HoleLocator`` for repeated or batched queries."""
     for h in holes:
         for polygon in h["polygons"]:
             if point_in_polygon(lon, lat, polygon):
@@ -312,6 +194,7 @@ def compute_crossings(
 ) -> Dict[str, Any]:
     cum = cumulative_distances(nodes)
     L = cum[-1]
+    locator = HoleLocator.from_features(holes) if holes is not None else None
 
     v_g = mph_to_mps(v_fwd_mph)
     v_b = mph_to_mps(v_bwd_mph)
@@ -358,8 +241,8 @@ def compute_crossings(
             hole_num: Optional[int] = None
             if node_holes is not None and 0 <= idx < len(node_holes) and node_holes[idx] is not None:
                 hole_num = int(node_holes[idx])
-            elif holes is not None:
-                hole_num = locate_hole_for_point(lon=lon, lat=lat, holes=holes)
+            elif locator is not None:
+                hole_num = locator.locate_point(lon, lat)
 
             crossings_list.append(
                 {
@@ -0,0 +1,252 @@
+"""
+Precomputed delivery-location prediction.
+
+The iterative prediction in ``engine.iterative_convergence_prediction_nodes``
+routes clubhouse -> predicted loop point on every refinement step. That travel
+time only depends on the loop point and the runner speed, so this module routes
+every loop point once per course (lengths in metres) and replays the same
+refinement as integer index updates against the precomputed array. Results are
+identical to routing on every step; a prediction costs a few array lookups and
+is additionally memoised with an LRU cache.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from ..data.course_assets import get_course_assets
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+LonLat = Tuple[float, float]
+
+# Rough metres per degree, kept identical to the legacy iterative predictor
+_M_PER_DEG = 111139
+# Predictions memoised per engine (keys include speed and timing offsets)
+PREDICTION_CACHE_SIZE = 4096
+
+
+class DeliveryPredictionEngine:
+    """Clubhouse -> loop point travel lengths for one course and clubhouse location."""
+
+    def __init__(
+        self,
+        node_coords: Tuple[LonLat, ...],
+        route_lengths_m: np.ndarray,
+        clubhouse_lonlat: LonLat,
+    ):
+        self.node_coords = node_coords
+        # NaN marks loop points the router could not reach
+        self.route_lengths_m = np.asarray(route_lengths_m, dtype=np.float64)
+        self.clubhouse_lonlat = (float(clubhouse_lonlat[0]), float(clubhouse_lonlat[1]))
+        self._times_by_speed: Dict[float, np.ndarray] = {}
+        self._cache: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @classmethod
+    def build(cls, cart_graph, node_coords: Tuple[LonLat, ...], clubhouse_lonlat: LonLat) -> "DeliveryPredictionEngine":
+        """Route the clubhouse to every loop point once (same router as the simulation)."""
+        from .engine import enhanced_delivery_routing
+
+        lengths = np.full(len(node_coords), np.nan, dtype=np.float64)
+        routed: Dict[LonLat, float] = {}
+        for k, point in enumerate(node_coords):
+            if point in routed:
+                lengths[k] = routed[point]
+                continue
+            try:
+                # Speed 1.0 m/s: length is speed independent, times are length / speed
+                length_m = float(enhanced_delivery_routing(cart_graph, clubhouse_lonlat, point, 1.0)["length_m"])
+            except Exception as e:  # noqa: BLE001
+                logger.debug("Prediction routing to loop point %d failed: %s", k, e)
+                length_m = float("nan")
+            routed[point] = length_m
+            lengths[k] = length_m
+        return cls(node_coords, lengths, clubhouse_lonlat)
+
+    def travel_times_s(self, runner_speed_mps: float) -> np.ndarray:
+        """Clubhouse -> loop point travel time (s) for a runner speed, cached per speed."""
+        speed = float(runner_speed_mps)
+        times = self._times_by_speed.get(speed)
+        if times is None:
+            times = self.route_lengths_m / speed
+            self._times_by_speed[speed] = times
+        return times
+
+    def predict_node_index(
+        self,
+        departure_time_s: float,
+        prep_time_s: float,
+        tee_time_s: float,
+        runner_speed_mps: float,
+        total_golfer_minutes: int = 240,
+        time_quantum_s: int = 60,
+        max_iterations: int = 5,
+        convergence_threshold_m: float = 25.0,
+    ) -> int:
+        """Return the predicted delivery loop index (may be negative, as list indices are).
+
+        The LRU cache is keyed by tee time, departure (minute and ready time), prep
+        time and speed, which fully determine the answer.
+
+        Raises:
+            ValueError: If the refinement lands on a loop point with no route
+        """
+        quantum = max(1, int(time_quantum_s))
+        departure_minute = int(departure_time_s // quantum)
+        ready_time_s = float(departure_time_s) + float(prep_time_s)
+        key = (
+            float(tee_time_s),
+            departure_minute,
+            ready_time_s,
+            float(prep_time_s),
+            float(runner_speed_mps),
+            int(total_golfer_minutes),
+            int(time_quantum_s),
+            int(max_iterations),
+            float(convergence_threshold_m),
+        )
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return hit
+        idx = self._refine(
+            float(tee_time_s),
+            departure_minute,
+            ready_time_s,
+            float(prep_time_s),
+            float(runner_speed_mps),
+            int(total_golfer_minutes),
+            time_quantum_s,
+            max_iterations,
+            convergence_threshold_m,
+        )
+        with self._lock:
+            self.cache_misses += 1
+            self._cache[key] = idx
+            if len(self._cache) > PREDICTION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return idx
+
+    def _refine(
+        self,
+        tee_time_s: float,
+        departure_minute: int,
+        ready_time_s: float,
+        prep_time_s: float,
+        runner_speed_mps: float,
+        total_golfer_minutes: int,
+        time_quantum_s: int,
+        max_iterations: int,
+        convergence_threshold_m: float,
+    ) -> int:
+        coords = self.padded_coords(total_golfer_minutes)
+        times = self.travel_times_s(runner_speed_mps)
+        n_real = len(times)
+        n = len(coords)
+        club_lon, club_lat = self.clubhouse_lonlat
+
+        def travel_time(idx: int) -> float:
+            # Padded tail repeats the last loop point (and therefore its time)
+            pos = idx % n if idx < 0 else idx
+            t = float(times[min(pos, n_real - 1)])
+            if math.isnan(t):
+                raise ValueError(f"No route from clubhouse to loop point {idx}")
+            return t
+
+        current_node_idx = min(departure_minute, n - 1)
+        golfer_pos = coords[current_node_idx]
+
+        # Initial estimate from straight-line distance with a 1.3x route factor
+        dx = (golfer_pos[0] - club_lon) * _M_PER_DEG
+        dy = (golfer_pos[1] - club_lat) * _M_PER_DEG
+        initial_travel_time_s = (math.sqrt(dx**2 + dy**2) * 1.3) / runner_speed_mps
+        quantum = max(1, int(time_quantum_s))
+        delivery_idx = current_node_idx + int((prep_time_s + initial_travel_time_s) // quantum)
+        delivery_idx = min(delivery_idx, n - 1)
+        current_prediction = coords[delivery_idx]
+
+        for _ in range(max_iterations):
+            # Golfer progress (minutes since tee-off) when the runner arrives
+            new_idx = int(((ready_time_s + travel_time(delivery_idx)) - tee_time_s) / time_quantum_s)
+            if new_idx >= n:
+                new_idx = n - 1
+            new_prediction = coords[new_idx]
+            conv_dx = (new_prediction[0] - current_prediction[0]) * _M_PER_DEG
+            conv_dy = (new_prediction[1] - current_prediction[1]) * _M_PER_DEG
+            if math.sqrt(conv_dx**2 + conv_dy**2) < convergence_threshold_m:
+                return new_idx
+            current_prediction = new_prediction
+            delivery_idx = new_idx
+        return delivery_idx
+
+    def padded_coords(self, total_golfer_minutes: int) -> Tuple[LonLat, ...]:
+        coords = self.node_coords
+        if len(coords) < total_golfer_minutes:
+            coords = coords + (coords[-1],) * (total_golfer_minutes - len(coords))
+        return coords
+
+
+# (course_dir, clubhouse) -> (graph, loop points, engine); entries are reused only
+# while the course asset cache hands out the same graph and loop point objects
+_ENGINES: Dict[Tuple[str, LonLat], Tuple[object, object, DeliveryPredictionEngine]] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def get_prediction_engine(course_dir: str, clubhouse_lonlat: LonLat) -> Optional[DeliveryPredictionEngine]:
+    """Return the shared prediction engine for a course, building it on first use.
+
+    Returns None when the loop points are unavailable.
+
+    Raises:
+        FileNotFoundError: If loop points exist but the cart graph does not
+    """
+    assets = get_course_assets(course_dir)
+    try:
+        node_coords = assets.loop_points()
+    except (FileNotFoundError, SystemExit):
+        return None
+    if not node_coords:
+        return None
+    cart_graph = assets.cart_graph()
+    if cart_graph is None:
+        raise FileNotFoundError(
+            f"Cart graph not found at {assets.course_dir / 'pkl' / 'cart_graph.pkl'}. "
+            "Build it with scripts/routing/build_cart_network_from_holes_connected.py"
+        )
+
+    key = (str(assets.course_dir), (float(clubhouse_lonlat[0]), float(clubhouse_lonlat[1])))
+    with _ENGINES_LOCK:
+        entry = _ENGINES.get(key)
+        if entry is not None and entry[0] is cart_graph and entry[1] is node_coords:
+            return entry[2]
+
+    engine = DeliveryPredictionEngine.build(cart_graph, node_coords, clubhouse_lonlat)
+    with _ENGINES_LOCK:
+        _ENGINES[key] = (cart_graph, node_coords, engine)
+    logger.debug("Built delivery prediction engine for %s (%d loop points)", course_dir, len(node_coords))
+    return engine
+
+
+def clear_prediction_engines() -> None:
+    """Drop all cached prediction engines."""
+    with _ENGINES_LOCK:
+        _ENGINES.clear()
+
+
+def nearest_loop_index(node_coords: List[LonLat], location: LonLat) -> int:
+    """Index of the loop point nearest to location (first wins on ties)."""
+    arr = np.asarray(node_coords, dtype=np.float64)
+    dx = (arr[:, 0] - location[0]) * _M_PER_DEG
+    dy = (arr[:, 1] - location[1]) * _M_PER_DEG
+    return int(np.argmin(np.sqrt(dx**2 + dy**2)))
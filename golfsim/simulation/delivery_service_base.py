@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -9,12 +10,16 @@ import simpy
 from ..config.loaders import load_simulation_config
 from ..logging import get_logger
 from .. import utils
+from .activity_log import ActivityLog, ActivityType
 
 
 logger = get_logger(__name__)
 
+# Orders are created by the thousand per sweep; __slots__ drops the per-instance dict (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class DeliveryOrder:
     order_id: Optional[str]
     golfer_group_id: int
@@ -39,7 +44,7 @@ class BaseDeliveryService:
     course_dir: str
     runner_speed_mps: float = 2.68
     prep_time_min: int = 10
-    activity_log: List[Dict] = field(default_factory=list)
+    activity_log: ActivityLog = field(default_factory=ActivityLog)
     delivery_stats: List[Dict] = field(default_factory=list)
     failed_orders: List[DeliveryOrder] = field(default_factory=list)
 
@@ -145,12 +150,19 @@ class BaseDeliveryService:
     def is_service_open(self) -> bool:
         return self.service_open_s <= self.env.now <= self.service_close_s
 
-    def log_activity(self, activity_type: str, description: str, order_id: Optional[str] = None, location: Optional[str] = None, orders_in_queue: Optional[int] = None, runner_id: Optional[str] = None) -> None:
-        current_time_min = self.env.now / 60
-        hours = int(current_time_min // 60) + 7
-        minutes = int(current_time_min % 60)
-        time_str = f"{hours:02d}:{minutes:02d}"
-        
+    def log_activity(
+        self,
+        activity_type: Union[ActivityType, str],
+        description: str,
+        order_id: Optional[str] = None,
+        location: Optional[str] = None,
+        orders_in_queue: Optional[int] = None,
+        runner_id: Optional[str] = None,
+        *,
+        hole: Optional[int] = None,
+        args: Tuple[Any, ...] = (),
+    ) -> None:
+        """Append a typed event; ``description`` is a str.format template for ``args``."""
         # Determine location from subclass-specific attributes if not provided
         if location is None:
             if hasattr(self, "runner_location"): # SingleRunner
@@ -159,19 +171,17 @@ class BaseDeliveryService:
             else:
                 location = "clubhouse"
 
-        entry = {
-            "timestamp_s": self.env.now,
-            "time_str": time_str,
-            "activity_type": activity_type,
-            "description": description,
-            "order_id": order_id,
-            "location": location,
-        }
-        if orders_in_queue is not None:
-            entry["orders_in_queue"] = int(orders_in_queue)
-        if runner_id is not None:
-            entry["runner_id"] = runner_id
-        self.activity_log.append(entry)
+        self.activity_log.append(
+            activity_type,
+            self.env.now,
+            description,
+            args,
+            runner_id=runner_id,
+            order_id=order_id,
+            hole=hole,
+            orders_in_queue=orders_in_queue,
+            location=location,
+        )
 
     def _calculate_delivery_details(self, hole_num: int, node_idx: Optional[int] = None) -> Tuple[float, float]:
         # Prefer precise, node-based travel times if available
@@ -0,0 +1,219 @@
+"""
+Columnar storage for per-order ``delivery_stats`` records.
+
+Every delivered order produces a dict with ~20 scalar fields plus routed
+``trip_to_golfer``/``trip_back`` dicts whose ``nodes`` lists hold one Python int
+per cart-graph node. Sweeps that keep many runs in memory pay dict and boxed-int
+overhead for each of them. ``DeliveryStatsTable`` stores the same records as one
+NumPy array per field, with all node paths concatenated into a single int32
+pool that rows reference by path index.
+
+The table is a read-only sequence of dicts: iterating or indexing rebuilds the
+original records, so metrics code written against ``List[Dict]`` keeps working.
+Numeric columns are available directly via ``column``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+# Record keys holding routed trips; their "nodes" lists go to the shared path pool
+TRIP_KEYS = ("trip_to_golfer", "trip_back")
+# Column name separator for trip sub-fields, e.g. "trip_back/length_m"
+_SEP = "/"
+_INT32 = np.iinfo(np.int32)
+# Largest magnitude at which every int survives a float64 column
+_FLOAT_EXACT_INT = 2**53
+
+
+def _typed_column(values: List[Any]) -> np.ndarray:
+    """Smallest faithful array for a column's present values (object when mixed)."""
+    if values and all(isinstance(v, bool) for v in values):
+        return np.asarray(values, dtype=bool)
+    if values and all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values):
+        arr = np.asarray(values, dtype=np.int64)
+        if arr.size and _INT32.min <= arr.min() and arr.max() <= _INT32.max:
+            return arr.astype(np.int32)
+        return arr
+    if values and all(
+        (isinstance(v, (float, np.floating)) or (isinstance(v, (int, np.integer)) and abs(int(v)) <= _FLOAT_EXACT_INT))
+        and not isinstance(v, bool)
+        for v in values
+    ):
+        # Mixed int/float columns; from_records remembers which values were ints
+        return np.asarray(values, dtype=np.float64)
+    out = np.empty(len(values), dtype=object)
+    # Element-wise so equal-length lists (e.g. [lon, lat]) are not broadcast into 2-D
+    for i, v in enumerate(values):
+        out[i] = v
+    return out
+
+
+def _node_path(nodes: Any) -> Optional[np.ndarray]:
+    """int32 array for a list of integer node ids, or None if they do not fit."""
+    try:
+        arr = np.asarray(list(nodes), dtype=np.int64)
+    except (TypeError, ValueError):
+        return None
+    if arr.ndim != 1 or (arr.size and (arr.min() < _INT32.min or arr.max() > _INT32.max)):
+        return None
+    return arr.astype(np.int32)
+
+
+class DeliveryStatsTable(Sequence):
+    """Dict-of-arrays view of delivery_stats records (see module docstring).
+
+    Each column has a value array aligned with the rows where the key is
+    present plus a boolean presence mask, so rows of different shapes (single
+    deliveries, batched stops, missing trips) round-trip exactly. Trip dicts are
+    flattened into ``"<trip>/<field>"`` columns and ``"<trip>/nodes"`` holds a
+    path index into ``path_nodes``/``path_offsets``.
+    """
+
+    def __init__(self) -> None:
+        self._n = 0
+        self._keys: List[str] = []
+        self._values: Dict[str, np.ndarray] = {}
+        self._present: Dict[str, np.ndarray] = {}
+        # Row position of each present value, per column
+        self._slot: Dict[str, np.ndarray] = {}
+        # Float columns holding some ints: True at each slot whose value was an int
+        self._int_slots: Dict[str, np.ndarray] = {}
+        self.path_nodes = np.zeros(0, dtype=np.int32)
+        self.path_offsets = np.zeros(1, dtype=np.int64)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "DeliveryStatsTable":
+        """Build a table from delivery_stats dicts (records are not modified)."""
+        rows = list(records)
+        table = cls()
+        table._n = len(rows)
+        keys: Dict[str, None] = {}
+        cells: Dict[str, Dict[int, Any]] = {}
+        paths: List[np.ndarray] = []
+
+        def put(key: str, row: int, value: Any) -> None:
+            keys.setdefault(key, None)
+            cells.setdefault(key, {})[row] = value
+
+        for row, record in enumerate(rows):
+            for key, value in record.items():
+                if key in TRIP_KEYS and isinstance(value, dict):
+                    put(key, row, {})  # marks the trip as a dict
+                    for sub, sub_value in value.items():
+                        path = _node_path(sub_value) if sub == "nodes" else None
+                        if path is not None:
+                            put(f"{key}{_SEP}nodes", row, len(paths))
+                            paths.append(path)
+                        elif sub == "nodes":
+                            # Node ids that are not int32-sized stay as given
+                            put(f"{key}{_SEP}nodes{_SEP}raw", row, sub_value)
+                        else:
+                            put(f"{key}{_SEP}{sub}", row, sub_value)
+                else:
+                    put(key, row, value)
+
+        table._keys = list(keys)
+        for key in table._keys:
+            present = np.zeros(table._n, dtype=bool)
+            rows_with = sorted(cells[key])
+            present[rows_with] = True
+            slot = np.full(table._n, -1, dtype=np.int32)
+            slot[rows_with] = np.arange(len(rows_with), dtype=np.int32)
+            table._present[key] = present
+            table._slot[key] = slot
+            values = [cells[key][r] for r in rows_with]
+            table._values[key] = _typed_column(values)
+            if table._values[key].dtype == np.float64:
+                is_int = np.fromiter((isinstance(v, (int, np.integer)) for v in values), dtype=bool, count=len(values))
+                if is_int.any():
+                    table._int_slots[key] = is_int
+        if paths:
+            table.path_nodes = np.concatenate(paths)
+            table.path_offsets = np.concatenate([[0], np.cumsum([len(p) for p in paths])]).astype(np.int64)
+        return table
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._n))]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("DeliveryStatsTable index out of range")
+        return self._record(int(index))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._n):
+            yield self._record(i)
+
+    def _cell(self, key: str, row: int) -> Any:
+        slot = self._slot[key][row]
+        value = self._values[key][slot]
+        int_slots = self._int_slots.get(key)
+        if int_slots is not None and int_slots[slot]:
+            return int(value)
+        return value.item() if isinstance(value, np.generic) else value
+
+    def _record(self, row: int) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for key in self._keys:
+            if not self._present[key][row]:
+                continue
+            if _SEP in key:
+                trip, sub = key.split(_SEP, 1)
+                value = self._cell(key, row)
+                if sub == "nodes":
+                    value = self.path(int(value)).tolist()
+                elif sub == f"nodes{_SEP}raw":
+                    sub = "nodes"
+                out[trip][sub] = value
+            elif key in TRIP_KEYS and isinstance(self._cell(key, row), dict):
+                out[key] = {}
+            else:
+                out[key] = self._cell(key, row)
+        return out
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """The original list of delivery_stats dicts."""
+        return list(self)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._keys)
+
+    def column(self, key: str, fill: Any = np.nan) -> np.ndarray:
+        """Values of ``key`` for every row, ``fill`` where the record lacks it.
+
+        Numeric columns come back as float64 when any row is missing (so NaN fits),
+        else in their stored dtype.
+
+        Raises:
+            KeyError: If no record has the key
+        """
+        values = self._values[key]
+        present = self._present[key]
+        if present.all():
+            return values.copy()
+        dtype = np.float64 if values.dtype.kind in "biuf" else object
+        out = np.full(self._n, fill, dtype=dtype)
+        out[present] = values
+        return out
+
+    def path(self, path_index: int) -> np.ndarray:
+        """Node ids of one stored path (int32 view into the pool)."""
+        return self.path_nodes[self.path_offsets[path_index]:self.path_offsets[path_index + 1]]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate array memory (object columns count pointers only)."""
+        arrays = [
+            *self._values.values(), *self._present.values(), *self._slot.values(), *self._int_slots.values(),
+            self.path_nodes, self.path_offsets,
+        ]
+        return int(sum(a.nbytes for a in arrays))
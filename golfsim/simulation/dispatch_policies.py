@@ -0,0 +1,146 @@
+"""
+Dispatch policies for the multi-runner delivery service.
+
+``MultiRunnerDeliveryService._dispatch_loop`` wakes whenever an order becomes
+ready or a runner is released, then asks its policy which ready order goes to
+which idle runner. A policy sees the ready orders in the order they became
+ready and the idle runner indices in ascending order, and returns the pair to
+dispatch (positions into those sequences) or None to leave everything queued
+until the next wake-up.
+
+Policies are selected by name from ``SimulationConfig.dispatch_policy`` (see
+``DISPATCH_POLICIES``); ``scripts/optimization/benchmark_dispatch_policies.py``
+compares them on shared order streams.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Type
+
+from .delivery_service_base import DeliveryOrder
+
+if TYPE_CHECKING:
+    from .multi_runner_service import MultiRunnerDeliveryService
+
+
+class DispatchPolicy:
+    """Base policy: FIFO queue, lowest-index idle runner."""
+
+    name = "fifo"
+
+    def select(
+        self,
+        service: "MultiRunnerDeliveryService",
+        orders: Sequence[DeliveryOrder],
+        idle_runners: Sequence[int],
+    ) -> Optional[Tuple[int, int]]:
+        """Pick (position in ``orders``, runner index from ``idle_runners``), or None to wait.
+
+        Only called with at least one ready order and one idle runner.
+        """
+        return 0, idle_runners[0]
+
+
+class FifoPolicy(DispatchPolicy):
+    """Oldest ready order to the lowest-index idle runner (the historical rule)."""
+
+
+@dataclass
+class EarliestDeadlinePolicy(DispatchPolicy):
+    """Order with the earliest queue-timeout deadline first, lowest-index idle runner.
+
+    The deadline is ``order_placed_time + queue_timeout_s``. With a uniform prep
+    time this matches FIFO; it differs once ready order and placement order
+    diverge (e.g. orders re-queued or prepared out of order). Expired orders are
+    still handed out so the runner records the timeout failure.
+    """
+
+    name = "edf"
+
+    def select(self, service, orders, idle_runners):
+        timeout_s = float(service.queue_timeout_s)
+
+        def deadline(pos: int) -> float:
+            placed = orders[pos].order_placed_time
+            return (float(placed) if placed is not None else float(service.env.now)) + timeout_s
+
+        return min(range(len(orders)), key=deadline), idle_runners[0]
+
+
+@dataclass
+class NearestHolePolicy(DispatchPolicy):
+    """Shortest trip first: the ready order whose hole is closest to the clubhouse.
+
+    Short trips free runners sooner, so more orders clear the queue before the
+    long ones time out. An order that has waited longer than
+    ``max_wait_fraction`` of the queue timeout is served first (oldest first)
+    so far holes are not starved.
+    """
+
+    name = "nearest_hole"
+    max_wait_fraction: float = 0.5
+
+    def select(self, service, orders, idle_runners):
+        now = float(service.env.now)
+        max_wait_s = float(service.queue_timeout_s) * float(self.max_wait_fraction)
+        for pos, order in enumerate(orders):
+            placed = order.order_placed_time if order.order_placed_time is not None else now
+            if now - float(placed) >= max_wait_s:
+                return pos, idle_runners[0]
+
+        def trip_s(pos: int) -> float:
+            _, travel_s = service._calculate_delivery_details(int(orders[pos].hole_num))
+            return float(travel_s)
+
+        return min(range(len(orders)), key=trip_s), idle_runners[0]
+
+
+@dataclass
+class ZonePolicy(DispatchPolicy):
+    """Each runner owns a contiguous block of holes; idle runners serve their zone first.
+
+    Holes 1..``num_holes`` are split into ``num_runners`` equal blocks, runner 0
+    taking the lowest block. An idle runner takes the oldest ready order in its
+    zone; with ``allow_steal`` it otherwise takes the oldest order anywhere, and
+    without it orders outside every idle runner's zone wait.
+    """
+
+    name = "zone"
+    num_holes: int = 18
+    allow_steal: bool = True
+
+    def zone_of(self, hole_num: int, num_runners: int) -> int:
+        hole = min(max(int(hole_num), 1), int(self.num_holes))
+        return (hole - 1) * int(num_runners) // int(self.num_holes)
+
+    def select(self, service, orders, idle_runners):
+        num_runners = max(1, int(service.num_runners))
+        for pos, order in enumerate(orders):
+            zone = self.zone_of(order.hole_num, num_runners)
+            if zone in idle_runners:
+                return pos, zone
+        if self.allow_steal:
+            return 0, idle_runners[0]
+        return None
+
+
+DISPATCH_POLICIES: Dict[str, Type[DispatchPolicy]] = {
+    "fifo": FifoPolicy,
+    "edf": EarliestDeadlinePolicy,
+    "nearest_hole": NearestHolePolicy,
+    "zone": ZonePolicy,
+}
+
+
+def get_dispatch_policy(name: Optional[str]) -> DispatchPolicy:
+    """Instantiate a dispatch policy by name (None means FIFO).
+
+    Raises:
+        ValueError: If the name is not in DISPATCH_POLICIES
+    """
+    key = (name or "fifo").strip().lower()
+    try:
+        return DISPATCH_POLICIES[key]()
+    except KeyError:
+        raise ValueError(f"Unknown dispatch policy {name!r}; choose from {sorted(DISPATCH_POLICIES)}") from None
@@ -22,6 +22,7 @@ import pandas as pd
 import simpy
 from shapely.geometry import LineString, Point
 
+from ..data.course_assets import get_course_assets
 from ..routing.networks import shortest_path_on_cartpaths
 from ..logging import get_logger
 
@@ -244,116 +245,31 @@ def iterative_convergence_prediction_nodes(
         Optimal delivery coordinates (lon, lat)
     """
 
-    # Load nodes from holes_connected.geojson
-    from ..simulation.tracks import load_holes_connected_points
-    try:
-        node_coords = load_holes_connected_points(course_dir)
-    except (FileNotFoundError, SystemExit) as e:
-        # Fallback to clubhouse if nodes can't be loaded
-        return clubhouse_lonlat
+    # Clubhouse -> loop point travel times are precomputed once per course, so the
+    # refinement is replayed against that array instead of routing every step
+    from .delivery_prediction import get_prediction_engine
 
-    if not node_coords or len(node_coords) == 0:
+    engine = get_prediction_engine(course_dir, clubhouse_lonlat)
+    if engine is None:
+        # Fallback to clubhouse if nodes can't be loaded
         return clubhouse_lonlat
 
-    # Ensure we have enough nodes for the total golfer minutes
-    if len(node_coords) < total_golfer_minutes:
-        # Extend with the last node if needed
-        while len(node_coords) < total_golfer_minutes:
-            node_coords.append(node_coords[-1])
-
-    # Initialize with golfer's current position at order time
-    current_minute = int(departure_time_s // max(1, int(time_quantum_s)))
-    current_node_idx = min(current_minute, len(node_coords) - 1)
-    
-    if current_node_idx >= len(node_coords):
-        return node_coords[-1]  # Return final position if beyond round
-
-    current_golfer_pos = node_coords[current_node_idx]
-
-    # INITIAL ESTIMATE: Start with speed-based prediction
-    prep_time_s = prep_time_min * 60 + estimated_delay_s
-
-    # Estimate initial travel time using straight-line distance
-    dx = (current_golfer_pos[0] - clubhouse_lonlat[0]) * 111139  # rough m per degree
-    dy = (current_golfer_pos[1] - clubhouse_lonlat[1]) * 111139
-    straight_line_distance = math.sqrt(dx**2 + dy**2)
-
-    # Initial travel time estimate (with 1.3x factor for route complexity)
-    initial_travel_time_s = (straight_line_distance * 1.3) / runner_speed_mps
-
-    # Start with prediction based on total delivery window
-    total_initial_time_s = prep_time_s + initial_travel_time_s
-    delivery_node_idx = current_node_idx + int(total_initial_time_s // max(1, int(time_quantum_s)))
-    delivery_node_idx = min(delivery_node_idx, len(node_coords) - 1)
-
-    current_prediction = node_coords[delivery_node_idx]
-
-    # Load cart graph for accurate routing
-    import pickle
-    from pathlib import Path
-    cart_graph_path = Path(course_dir) / "pkl" / "cart_graph.pkl"
-    if not cart_graph_path.exists():
-        raise FileNotFoundError(
-            f"Cart graph not found at {cart_graph_path}. Build it with scripts/routing/build_cart_network_from_holes_connected.py"
-        )
-    with open(cart_graph_path, 'rb') as f:
-        cart_graph = pickle.load(f)
-
-    # ITERATIVE REFINEMENT
-    iteration_history = []
-
     # Get the golfer's tee time to calculate progress accurately
     tee_time_s = 0.0
     if order:
         tee_time_s = float(order.get("tee_time_s", 0.0))
 
-    for iteration in range(max_iterations):
-        # Calculate actual travel time to current prediction via routing
-        route_result = enhanced_delivery_routing(
-            cart_graph, clubhouse_lonlat, current_prediction, runner_speed_mps
-        )
-        actual_travel_time_s = route_result["time_s"]
-
-        # Calculate when delivery will actually occur, relative to the start of the simulation
-        actual_delivery_time_s = departure_time_s + prep_time_s + actual_travel_time_s
-        
-        # Calculate golfer's progress in minutes (nodes) from their tee time
-        time_since_tee_off_s = actual_delivery_time_s - tee_time_s
-        new_delivery_node_idx = int(time_since_tee_off_s / time_quantum_s)
-        
-        # If predicted time is beyond the end of the round, deliver to the last node (e.g., clubhouse)
-        if new_delivery_node_idx >= len(node_coords):
-            new_delivery_node_idx = len(node_coords) - 1
-
-        # New prediction based on refined timing
-        new_prediction = node_coords[new_delivery_node_idx]
-
-        # Calculate convergence distance
-        conv_dx = (new_prediction[0] - current_prediction[0]) * 111139
-        conv_dy = (new_prediction[1] - current_prediction[1]) * 111139
-        convergence_distance = math.sqrt(conv_dx**2 + conv_dy**2)
-
-        # Store iteration data
-        iteration_history.append(
-            {
-                'iteration': iteration + 1,
-                'prediction': new_prediction,
-                'travel_time_s': actual_travel_time_s,
-                'delivery_node_idx': new_delivery_node_idx,
-                'convergence_distance_m': convergence_distance,
-            }
-        )
-
-        # Check for convergence
-        if convergence_distance < convergence_threshold_m:
-            # Converged! Return refined prediction
-            return new_prediction
-
-        # Update for next iteration
-        current_prediction = new_prediction
-
-    # Return final prediction even if not fully converged
-    return current_prediction
+    delivery_node_idx = engine.predict_node_index(
+        departure_time_s=departure_time_s,
+        prep_time_s=prep_time_min * 60 + estimated_delay_s,
+        tee_time_s=tee_time_s,
+        runner_speed_mps=runner_speed_mps,
+        total_golfer_minutes=total_golfer_minutes,
+        time_quantum_s=time_quantum_s,
+        max_iterations=max_iterations,
+        convergence_threshold_m=convergence_threshold_m,
+    )
+    return engine.padded_coords(total_golfer_minutes)[delivery_node_idx]
 
 
 def find_nearest_node_index(
@@ -380,21 +296,9 @@ def find_nearest_node_index(
     if not node_coords:
         return 0
         
-    order_lon, order_lat = order_location
-    min_distance = float('inf')
-    nearest_idx = 0
-    
-    for idx, (node_lon, node_lat) in enumerate(node_coords):
-        # Calculate approximate distance (rough but fast)
-        dx = (node_lon - order_lon) * 111139  # rough m per degree lon
-        dy = (node_lat - order_lat) * 111139  # rough m per degree lat
-        distance = math.sqrt(dx**2 + dy**2)
-        
-        if distance < min_distance:
-            min_distance = distance
-            nearest_idx = idx
-            
-    return nearest_idx
+    from .delivery_prediction import nearest_loop_index
+
+    return nearest_loop_index(node_coords, order_location)
 
 
 def run_unified_delivery_simulation(
@@ -408,6 +312,7 @@ def run_unified_delivery_simulation(
     time_quantum_s: int = 60,
     runner_delay_min: float = 0.0,
     order: Optional[Dict] = None,
+    rng: Optional[random.Random] = None,
 ) -> Dict[str, object]:
     """
     Unified delivery simulation using node-based positioning.
@@ -428,16 +333,12 @@ def run_unified_delivery_simulation(
         track_coordinates: Whether to generate GPS coordinates
         time_quantum_s: Seconds per node/minute
         runner_delay_min: Additional runner delay in minutes
+        rng: Random stream for the random order node (defaults to the global random module)
     """
-    import pickle
-    from pathlib import Path
-    
-    # Load cart graph for routing
-    cart_graph_path = Path(course_dir) / "pkl" / "cart_graph.pkl"
-    if not cart_graph_path.exists():
-        raise FileNotFoundError(f"Cart graph not found: {cart_graph_path}")
-    with open(cart_graph_path, 'rb') as f:
-        cart_graph = pickle.load(f)
+    # Shared cart graph for routing
+    cart_graph = get_course_assets(course_dir).cart_graph()
+    if cart_graph is None:
+        raise FileNotFoundError(f"Cart graph not found: {Path(course_dir) / 'pkl' / 'cart_graph.pkl'}")
     
     # Load golfer nodes
     try:
@@ -457,7 +358,7 @@ def run_unified_delivery_simulation(
     # Determine order timing and location
     if order_node_idx is None:
         # Random order between 10% and 90% through round
-        order_node_idx = random.randint(
+        order_node_idx = (rng or random).randint(
             int(0.1 * total_golfer_minutes),
             int(0.9 * total_golfer_minutes)
         )
@@ -0,0 +1,165 @@
+"""
+Shared golfer track template.
+
+Every golfer group walks the same loop (the first 300 ``holes_connected`` nodes
+by node id, one node per minute); groups differ only by tee time. The template
+holds that loop once per course as arrays (lon/lat, offset from tee-off and the
+per-minute hole), and each group's track is the template with its tee time added
+to the offsets. Point dicts are only built where a caller needs them
+(``points``); ``columns`` feeds the columnar coordinates.csv writer directly.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..data.course_assets import get_course_assets
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+# Only nodes with id in [0, 299] are walked, to avoid stray tail nodes
+MAX_NODE_ID_INCLUSIVE = 299
+MAX_GOLFER_NODES = 300
+# Loop length assumed for hole pacing when holes_connected is missing or invalid
+_FALLBACK_TOTAL_NODES = 18 * 12
+
+# Resolved course dir -> (LoopNodes the template was built from, template)
+_TEMPLATE_CACHE: Dict[str, Tuple[Any, "GolferTrackTemplate"]] = {}
+_TEMPLATE_LOCK = threading.Lock()
+
+
+def _fallback_points(course_dir: str) -> List[Dict[str, Any]]:
+    """Golfer loop from tee time 0 when holes_connected is unusable.
+
+    Uses the first 300 integer cart-graph nodes, else the legacy simple tracks.
+    """
+    import pickle
+    import runpy
+
+    pkl_path = Path(course_dir) / "pkl" / "cart_graph.pkl"
+    if pkl_path.exists():
+        with open(pkl_path, "rb") as f:
+            G = pickle.load(f)
+        int_nodes: List[int] = sorted([n for n in G.nodes if isinstance(n, int)])
+        return [
+            {"latitude": float(G.nodes[n].get("y")), "longitude": float(G.nodes[n].get("x")), "timestamp": i * 60}
+            for i, n in enumerate(int_nodes[:MAX_GOLFER_NODES])
+        ]
+
+    gen_module = runpy.run_path("scripts/sim/generate_simple_tracks.py")
+    tracks = gen_module["generate_tracks"](course_dir)
+    return list(tracks.get("golfer", [])[:MAX_GOLFER_NODES])
+
+
+def _pacing_holes(offset_s: np.ndarray, total_nodes: int) -> np.ndarray:
+    """Hole 1-18 per point, assuming the loop's nodes (capped at 300) split evenly over 18 holes."""
+    nodes_per_hole = max(1.0, float(min(int(total_nodes), MAX_GOLFER_NODES)) / 18.0)
+    hole = 1 + np.floor_divide(offset_s // 60, nodes_per_hole).astype(np.int64)
+    return np.clip(hole, 1, 18).astype(np.int16)
+
+
+@dataclass(frozen=True, eq=False)
+class GolferTrackTemplate:
+    """One golfer loop relative to tee-off; arrays are shared and read-only.
+
+    ``offset_s`` is seconds after tee-off (one point per minute on the loop
+    nodes) and ``hole`` the pacing hole for each point.
+    """
+
+    lon: np.ndarray
+    lat: np.ndarray
+    offset_s: np.ndarray
+    hole: np.ndarray
+
+    def __post_init__(self) -> None:
+        for name in ("lon", "lat", "offset_s", "hole"):
+            getattr(self, name).flags.writeable = False
+
+    def __len__(self) -> int:
+        return int(self.lon.size)
+
+    @classmethod
+    def for_course(cls, course_dir: str) -> "GolferTrackTemplate":
+        """Return the course's template, rebuilt only when its loop nodes change."""
+        assets = get_course_assets(course_dir)
+        try:
+            nodes = assets.loop_nodes()
+        except Exception as e:  # noqa: BLE001
+            logger.debug("Golfer track falls back from holes_connected for %s: %s", course_dir, e)
+            return cls._from_points(_fallback_points(course_dir), _FALLBACK_TOTAL_NODES)
+
+        key = str(Path(course_dir).resolve())
+        with _TEMPLATE_LOCK:
+            cached = _TEMPLATE_CACHE.get(key)
+        if cached is not None and cached[0] is nodes:
+            return cached[1]
+
+        order = nodes.by_node_id(max_node_id=MAX_NODE_ID_INCLUSIVE)
+        try:
+            total_nodes = len(assets.loop_points())
+        except (FileNotFoundError, SystemExit):
+            total_nodes = _FALLBACK_TOTAL_NODES
+        offset_s = np.arange(order.size, dtype=np.int64) * 60
+        template = cls(
+            lon=nodes.lon[order],
+            lat=nodes.lat[order],
+            offset_s=offset_s,
+            hole=_pacing_holes(offset_s, total_nodes),
+        )
+        with _TEMPLATE_LOCK:
+            _TEMPLATE_CACHE[key] = (nodes, template)
+        return template
+
+    @classmethod
+    def _from_points(cls, points: List[Dict[str, Any]], total_nodes: int) -> "GolferTrackTemplate":
+        offset_s = np.asarray([int(p.get("timestamp", 0)) for p in points], dtype=np.int64)
+        return cls(
+            lon=np.asarray([float(p["longitude"]) for p in points], dtype=np.float64),
+            lat=np.asarray([float(p["latitude"]) for p in points], dtype=np.float64),
+            offset_s=offset_s,
+            hole=_pacing_holes(offset_s, total_nodes),
+        )
+
+    def timestamps(self, tee_time_s: int) -> np.ndarray:
+        """Absolute timestamps for a group teeing off at ``tee_time_s``."""
+        return self.offset_s + int(tee_time_s)
+
+    def points(self, tee_time_s: int, group_id: Optional[Any] = None, with_hole: bool = True) -> List[Dict[str, Any]]:
+        """Point dicts for one group, as ``generate_golfer_track`` returns them.
+
+        ``group_id`` and ``hole`` are added when requested.
+        """
+        rows = zip(self.lat.tolist(), self.lon.tolist(), self.timestamps(tee_time_s).tolist(), self.hole.tolist())
+        out: List[Dict[str, Any]] = []
+        for lat, lon, ts, hole in rows:
+            p: Dict[str, Any] = {"latitude": lat, "longitude": lon, "timestamp": ts, "type": "golfer"}
+            if group_id is not None:
+                p["group_id"] = group_id
+            if with_hole:
+                p["hole"] = hole
+            out.append(p)
+        return out
+
+    def columns(self, tee_time_s: int, stream_id: str):
+        """The group's track as ``CoordinateColumns`` for ``write_coordinate_columns_csv``."""
+        from ..io.coordinate_columns import CoordinateColumns
+
+        return CoordinateColumns(
+            ids=str(stream_id),
+            latitude=self.lat,
+            longitude=self.lon,
+            timestamp=self.timestamps(tee_time_s).astype(np.float64),
+            types="golfer",
+            holes=self.hole.tolist(),
+        )
+
+    def iter_groups(self, groups: Iterable[Dict[str, Any]], with_hole: bool = True) -> Iterator[Tuple[Any, List[Dict[str, Any]]]]:
+        """Yield (group_id, points) per group, materializing one group at a time."""
+        for g in groups:
+            yield g["group_id"], self.points(int(g["tee_time_s"]), group_id=g["group_id"], with_hole=with_hole)
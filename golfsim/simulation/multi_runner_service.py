@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import simpy
 
 from ..logging import get_logger
 from .. import utils
+from ..data.course_assets import get_course_assets
+from .activity_log import ActivityType
 from .delivery_service_base import BaseDeliveryService, DeliveryOrder
+from .dispatch_policies import DispatchPolicy, FifoPolicy
 
 
 logger = get_logger(__name__)
@@ -23,13 +26,26 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
 
     # Shared queue implemented using a SimPy Store for incoming orders
     order_store: Optional[simpy.Store] = None
-    # Dedicated per-runner queues to enable deterministic assignment
+    # Dedicated per-runner queues (one list of orders per trip) to enable deterministic assignment
     runner_stores: List[simpy.Store] = field(default_factory=list)
     order_timing_logs: List[Dict] = field(default_factory=list)
 
     # Internal per-runner state
     runner_locations: List[str] = field(default_factory=list)
     runner_busy: List[bool] = field(default_factory=list)
+    # Which ready order goes to which idle runner (golfsim.simulation.dispatch_policies)
+    dispatch_policy: Optional[DispatchPolicy] = None
+    # Multi-order trips: up to batch_max_orders ready orders placed within
+    # batch_time_window_s and batch_hole_window holes of the dispatched order (1 = off)
+    batch_max_orders: int = 1
+    batch_hole_window: int = 2
+    batch_time_window_s: float = 600.0
+    # Intercept-hole score weights (minutes of runner lateness / earliness vs the golfer)
+    intercept_lateness_weight: float = 3.0
+    intercept_earliness_weight: float = 1.0
+    # Dispatcher wake-ups: fires when an order is ready or a runner is released / when service closes
+    _dispatch_wakeup: Optional[simpy.Event] = None
+    _service_closed: Optional[simpy.Event] = None
     # Derived helpers for prediction
     _tee_time_by_group: Dict[int, int] = field(default_factory=dict)
     groups_by_id: Dict[int, Dict[str, Any]] = field(default_factory=dict)
@@ -38,6 +54,9 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
     _loop_points: List[Tuple[float, float]] = field(default_factory=list)
     _loop_holes: List[Optional[int]] = field(default_factory=list)
     _hole_lines: Dict[int, Any] = field(default_factory=dict)
+    # Per-hole (index hole-1) clubhouse travel minutes and golfer arrival minute after tee
+    _hole_travel_min: Optional[np.ndarray] = None
+    _hole_golfer_arrival_min: Optional[np.ndarray] = None
 
     def __post_init__(self) -> None:
         self.prep_time_s = self.prep_time_min * 60
@@ -45,6 +64,7 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
         self._load_node_travel_times()  # New method to load node travel times
         self._init_runner_stores_and_processes()
         self._init_group_lookups()
+        self._init_intercept_tables()
         self._loop_points, self._loop_holes = utils.load_connected_points(self.course_dir)
 
     def _init_runner_stores_and_processes(self) -> None:
@@ -55,6 +75,10 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
         # Initialize busy flags and per-runner queues
         self.runner_busy = [False for _ in range(int(self.num_runners))]
         self.runner_stores = [simpy.Store(self.env) for _ in range(int(self.num_runners))]
+        if self.dispatch_policy is None:
+            self.dispatch_policy = FifoPolicy()
+        self._dispatch_wakeup = self.env.event()
+        self._service_closed = self.env.timeout(max(0, self.service_close_s - self.env.now))
         # Start runner processes
         for idx in range(int(self.num_runners)):
             self.env.process(self._runner_loop(idx))
@@ -171,14 +195,13 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
             logger.debug("Using predicted coordinates routing path")
             # Route to predicted coords using enhanced graph
             from .engine import enhanced_delivery_routing
-            import pickle
-            from pathlib import Path
             
             cart_graph = None
             try:
-                with open((Path(self.course_dir) / "pkl" / "cart_graph.pkl"), "rb") as f:
-                    cart_graph = pickle.load(f)
-                    logger.debug(f"Loaded cart graph with {cart_graph.number_of_nodes()} nodes")
+                cart_graph = get_course_assets(self.course_dir).cart_graph()
+                if cart_graph is None:
+                    raise FileNotFoundError("pkl/cart_graph.pkl not found")
+                logger.debug(f"Using cart graph with {cart_graph.number_of_nodes()} nodes")
             except Exception as e:
                 logger.debug(f"Failed to load cart graph: {e}")
                 raise Exception(f"Cannot load cart graph for routing: {e}")
@@ -259,13 +282,11 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
     def _calculate_enhanced_delivery_route(self, hole_num: int) -> Dict:
         """Calculate enhanced delivery route with actual path data for visualization."""
         try:
-            # Load cart graph for enhanced routing
-            import pickle
-            from pathlib import Path
+            # Shared cart graph for enhanced routing
             from .engine import enhanced_delivery_routing
             
-            cart_graph_path = Path(self.course_dir) / "pkl" / "cart_graph.pkl"
-            if not cart_graph_path.exists():
+            cart_graph = get_course_assets(self.course_dir).cart_graph()
+            if cart_graph is None:
                 # Fall back to simple calculation if no cart graph
                 distance_m, travel_time_s = self._calculate_delivery_details(hole_num)
                 return {
@@ -273,9 +294,6 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
                     "delivery_time_s": travel_time_s,
                 }
             
-            with open(cart_graph_path, 'rb') as f:
-                cart_graph = pickle.load(f)
-            
             # Get hole location for routing
             hole_location = self._get_hole_location(hole_num)
             logger.debug(f"Hole {hole_num} location: {hole_location}")
@@ -363,9 +381,11 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
         """Place an order and start its preparation process."""
         order.order_placed_time = self.env.now
         self.log_activity(
-            "order_placed",
-            f"Order {order.order_id} placed for Hole {order.hole_num}",
+            ActivityType.ORDER_PLACED,
+            "Order {} placed for Hole {}",
             order_id=order.order_id,
+            hole=order.hole_num,
+            args=(order.order_id, order.hole_num),
         )
         self.env.process(self._prepare_order(order))
 
@@ -374,78 +394,115 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
         yield self.env.timeout(self.prep_time_s)
         order.prep_completed_time = self.env.now
         self.log_activity(
-            "order_ready",
-            f"Order {order.order_id} is ready for pickup",
+            ActivityType.ORDER_READY,
+            "Order {} is ready for pickup",
             order_id=order.order_id,
+            args=(order.order_id,),
         )
         self.order_store.put(order)
+        self._wake_dispatcher()
+
+    def _wake_dispatcher(self) -> None:
+        if not self._dispatch_wakeup.triggered:
+            self._dispatch_wakeup.succeed()
+
+    def _release_runner(self, runner_index: int) -> None:
+        """Mark a runner available and wake the dispatcher."""
+        self.runner_busy[runner_index] = False
+        self._wake_dispatcher()
 
     def _dispatch_loop(self):  # simpy process
-        """Assign incoming orders to available runners with deterministic tie-breaking.
+        """Assign ready orders to idle runners as chosen by ``dispatch_policy``.
+
+        The default FIFO policy takes the oldest ready order and, among available
+        runners, the lowest index first (e.g., if runner_2 and runner_3 are both
+        available, pick runner_2).
 
-        Rule: Among available runners, choose the lowest index first
-        (e.g., if runner_2 and runner_3 are both available, pick runner_2).
+        The loop only wakes on order-ready, runner-released and service-close
+        events, so its event count scales with orders rather than clock time.
         """
         while True:
             # Stop condition: after close and no pending orders and all runners idle
             if (
-                self.env.now > self.service_close_s
+                self._service_closed.processed
                 and len(self.order_store.items) == 0
                 and all(not self.runner_stores[i].items for i in range(int(self.num_runners)))
             ):
                 break
 
-            # Wait briefly if no orders or no runner available
-            if len(self.order_store.items) == 0 or not any(not b for b in self.runner_busy):
-                yield self.env.timeout(5)
+            idle_runners = [i for i, busy in enumerate(self.runner_busy) if not busy]
+            choice = None
+            if idle_runners and self.order_store.items:
+                choice = self.dispatch_policy.select(self, list(self.order_store.items), idle_runners)
+            if choice is None:
+                self._dispatch_wakeup = self.env.event()
+                if self._service_closed.processed:
+                    yield self._dispatch_wakeup
+                else:
+                    yield self._dispatch_wakeup | self._service_closed
+                # Let orders and runners released at the same instant settle before choosing
+                yield self.env.timeout(0)
                 continue
 
-            # Pop next order and assign to the lowest-index available runner
-            order: DeliveryOrder = yield self.order_store.get()
-            
-            # Add tee time to order for prediction logic
-            order.tee_time_s = self._tee_time_by_group.get(order.golfer_group_id, 0)
-
-            try:
-                runner_index = next(i for i, busy in enumerate(self.runner_busy) if not busy)
-            except StopIteration:
-                # No runner available after get (race). Requeue order and wait a bit
-                self.order_store.items.insert(0, order)  # place back at front
-                yield self.env.timeout(5)
-                continue
+            order_pos, runner_index = choice
+            # Only this loop takes orders out of the store
+            order: DeliveryOrder = self.order_store.items.pop(order_pos)
+            trip = [order] + self._take_batch_companions(order)
 
             self.runner_busy[runner_index] = True
             runner_label = f"runner_{runner_index + 1}"
-            self.log_activity(
-                "order_assigned",
-                f"Assigned Order {order.order_id} to {runner_label}",
-                runner_id=runner_label,
-                order_id=order.order_id,
-                location=self.runner_locations[runner_index],
-            )
-            # Place order into the selected runner's personal queue
-            self.runner_stores[runner_index].put(order)
+            for o in trip:
+                # Add tee time to order for prediction logic
+                o.tee_time_s = self._tee_time_by_group.get(o.golfer_group_id, 0)
+                self.log_activity(
+                    ActivityType.ORDER_ASSIGNED,
+                    "Assigned Order {} to {}",
+                    runner_id=runner_label,
+                    order_id=o.order_id,
+                    location=self.runner_locations[runner_index],
+                    args=(o.order_id, runner_label),
+                )
+            # Place the trip into the selected runner's personal queue
+            self.runner_stores[runner_index].put(trip)
+
+    def _take_batch_companions(self, order: DeliveryOrder) -> List[DeliveryOrder]:
+        """Remove and return ready orders that can ride along with ``order`` (oldest first)."""
+        if int(self.batch_max_orders) <= 1:
+            return []
+        placed = float(order.order_placed_time or 0.0)
+        companions = [
+            o
+            for o in self.order_store.items
+            if abs(int(o.hole_num) - int(order.hole_num)) <= int(self.batch_hole_window)
+            and abs(float(o.order_placed_time or 0.0) - placed) <= float(self.batch_time_window_s)
+        ][: int(self.batch_max_orders) - 1]
+        for o in companions:
+            self.order_store.items.remove(o)
+        return companions
 
     def _runner_loop(self, runner_index: int):  # simpy process
         runner_label = f"runner_{runner_index + 1}"
         # Wait until service opens
         if self.env.now < self.service_open_s:
             wait_time = self.service_open_s - self.env.now
-            self.log_activity("service_closed", f"{runner_label} waiting {wait_time/60:.0f} minutes until opening", runner_id=runner_label, location="clubhouse")
+            self.log_activity(ActivityType.SERVICE_CLOSED, "{} waiting {:.0f} minutes until opening", runner_id=runner_label, location="clubhouse", args=(runner_label, wait_time / 60))
             yield self.env.timeout(wait_time)
-            self.log_activity("service_opened", f"{runner_label} started shift", runner_id=runner_label, location="clubhouse")
+            self.log_activity(ActivityType.SERVICE_OPENED, "{} started shift", runner_id=runner_label, location="clubhouse", args=(runner_label,))
 
         while True:
             # Stop condition: after close and personal queue empty
             if self.env.now > self.service_close_s and len(self.runner_stores[runner_index].items) == 0:
-                self.log_activity("service_closed", f"{runner_label} shift ended", runner_id=runner_label, location=self.runner_locations[runner_index])
+                self.log_activity(ActivityType.SERVICE_CLOSED, "{} shift ended", runner_id=runner_label, location=self.runner_locations[runner_index], args=(runner_label,))
                 break
 
-            # Wait for an order assigned to this runner
-            order: DeliveryOrder = yield self.runner_stores[runner_index].get()
+            # Wait for a trip assigned to this runner
+            trip: List[DeliveryOrder] = yield self.runner_stores[runner_index].get()
 
-            # Process the order (timeout checks handled in processing)
-            yield self.env.process(self._process_single_order(order, runner_index, runner_label))
+            # Process the order(s) (timeout checks handled in processing)
+            if len(trip) == 1:
+                yield self.env.process(self._process_single_order(trip[0], runner_index, runner_label))
+            else:
+                yield self.env.process(self._process_batch(trip, runner_index, runner_label))
 
     def _process_single_order(self, order: DeliveryOrder, runner_index: int, runner_label: str):  # simpy process
         # If not at clubhouse, return first
@@ -456,31 +513,33 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
             order.failure_reason = f"Not dispatched within {int(self.queue_timeout_s/60)} minutes"
             self.failed_orders.append(order)
             self.log_activity(
-                "order_failed_timeout",
-                f"{runner_label} received expired order {order.order_id}; discarding",
+                ActivityType.ORDER_FAILED_TIMEOUT,
+                "{} received expired order {}; discarding",
                 runner_id=runner_label,
                 order_id=order.order_id,
                 location=self.runner_locations[runner_index],
+                args=(runner_label, order.order_id),
             )
-            self.runner_busy[runner_index] = False
+            self._release_runner(runner_index)
             return
         if self.runner_locations[runner_index] != "clubhouse":
             return_time = self._calculate_return_time(self.runner_locations[runner_index])
-            self.log_activity("returning", f"{runner_label} returning to clubhouse from {self.runner_locations[runner_index]} ({return_time/60:.1f} min)", runner_id=runner_label, order_id=order.order_id, location=self.runner_locations[runner_index])
+            self.log_activity(ActivityType.RETURNING, "{} returning to clubhouse from {} ({:.1f} min)", runner_id=runner_label, order_id=order.order_id, location=self.runner_locations[runner_index], args=(runner_label, self.runner_locations[runner_index], return_time / 60))
             yield self.env.timeout(return_time)
             self.runner_locations[runner_index] = "clubhouse"
-            self.log_activity("arrived_clubhouse", f"{runner_label} arrived at clubhouse to prepare Order {order.order_id}", runner_id=runner_label, order_id=order.order_id, location="clubhouse")
+            self.log_activity(ActivityType.ARRIVED_CLUBHOUSE, "{} arrived at clubhouse to prepare Order {}", runner_id=runner_label, order_id=order.order_id, location="clubhouse", args=(runner_label, order.order_id))
 
         # The order is already prepared when the runner receives it.
         # The time from when the order was placed until now represents the total queue time,
         # which includes waiting for preparation and for a runner to become available.
         order.queue_delay_s = self.env.now - (order.order_placed_time or self.env.now)
         self.log_activity(
-            "pickup_order",
-            f"{runner_label} picked up Order {order.order_id}",
+            ActivityType.PICKUP_ORDER,
+            "{} picked up Order {}",
             runner_id=runner_label,
             order_id=order.order_id,
             location="clubhouse",
+            args=(runner_label, order.order_id),
         )
 
         # This is the actual departure time, after any return trips are completed and the order is picked up.
@@ -494,26 +553,11 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
         order_node_idx = -1
         predicted_delivery_node_idx = -1
         try:
-            from .engine import predict_optimal_delivery_location, find_nearest_node_index
-            
+            from .engine import find_nearest_node_index
+
             # Convert hole to node index (approximate: hole * nodes_per_hole)
             order_node_idx = max(0, (int(order.hole_num) - 1) * self._nodes_per_hole)
-            
-            # Convert order object to dict to pass to prediction function
-            from dataclasses import asdict
-            order_dict = asdict(order)
-
-            predicted_coords = predict_optimal_delivery_location(
-                order_node_idx=order_node_idx,
-                prep_time_min=0.0, # Prep is complete, so no additional prep time
-                travel_time_s=0.0,
-                course_dir=self.course_dir,
-                runner_speed_mps=float(self.runner_speed_mps),
-                departure_time_s=actual_departure_time_s, # Use actual departure time
-                clubhouse_lonlat=self.clubhouse_coords,
-                estimated_delay_s=0.0,
-                order=order_dict,
-            )
+            predicted_coords = self._predict_intercept(order, actual_departure_time_s)
             if predicted_coords:
                 predicted_delivery_node_idx = find_nearest_node_index(predicted_coords, self.course_dir)
             logger.debug(f"Predicted delivery location: {predicted_coords} (node: {predicted_delivery_node_idx})")
@@ -547,17 +591,18 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
             order.failure_reason = f"Not dispatched within {int(self.queue_timeout_s/60)} minutes"
             self.failed_orders.append(order)
             self.log_activity(
-                "order_failed_timeout",
-                f"{runner_label} exceeded timeout before departure for Order {order.order_id}; discarding",
+                ActivityType.ORDER_FAILED_TIMEOUT,
+                "{} exceeded timeout before departure for Order {}; discarding",
                 runner_id=runner_label,
                 order_id=order.order_id,
                 location="clubhouse",
+                args=(runner_label, order.order_id),
             )
-            self.runner_busy[runner_index] = False
+            self._release_runner(runner_index)
             return
 
         order.delivery_started_time = self.env.now
-        self.log_activity("delivery_start", f"{runner_label} departing to Hole {delivered_hole_num} ({delivery_distance_m:.0f}m, {delivery_time_s/60:.1f} min)", runner_id=runner_label, order_id=order.order_id, location="clubhouse")
+        self.log_activity(ActivityType.DELIVERY_START, "{} departing to Hole {} ({:.0f}m, {:.1f} min)", runner_id=runner_label, order_id=order.order_id, location="clubhouse", hole=delivered_hole_num, args=(runner_label, delivered_hole_num, delivery_distance_m, delivery_time_s / 60))
         yield self.env.timeout(delivery_time_s)
         order.delivered_time = self.env.now
         self.runner_locations[runner_index] = f"hole_{delivered_hole_num}"
@@ -583,7 +628,7 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
         except Exception:
             pass  # Could fail if group info not present
 
-        self.log_activity("delivery_complete", f"{runner_label} delivered Order {order.order_id} to Hole {delivered_hole_num} (Total completion: {order.total_completion_time_s/60:.1f} min)", runner_id=runner_label, order_id=order.order_id, location=self.runner_locations[runner_index])
+        self.log_activity(ActivityType.DELIVERY_COMPLETE, "{} delivered Order {} to Hole {} (Total completion: {:.1f} min)", runner_id=runner_label, order_id=order.order_id, location=self.runner_locations[runner_index], hole=delivered_hole_num, args=(runner_label, order.order_id, delivered_hole_num, order.total_completion_time_s / 60))
 
         # Log detailed order timing
         self.order_timing_logs.append({
@@ -597,10 +642,10 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
 
         # Immediately return to clubhouse after delivery so next order does not inherit the return as queue wait
         if return_time_s > 0:
-            self.log_activity("returning", f"{runner_label} returning to clubhouse from {self.runner_locations[runner_index]} ({return_time_s/60:.1f} min)", runner_id=runner_label, order_id=order.order_id, location=self.runner_locations[runner_index])
+            self.log_activity(ActivityType.RETURNING, "{} returning to clubhouse from {} ({:.1f} min)", runner_id=runner_label, order_id=order.order_id, location=self.runner_locations[runner_index], args=(runner_label, self.runner_locations[runner_index], return_time_s / 60))
             yield self.env.timeout(return_time_s)
             self.runner_locations[runner_index] = "clubhouse"
-            self.log_activity("arrived_clubhouse", f"{runner_label} arrived at clubhouse after delivering Order {order.order_id}", runner_id=runner_label, order_id=order.order_id, location="clubhouse")
+            self.log_activity(ActivityType.ARRIVED_CLUBHOUSE, "{} arrived at clubhouse after delivering Order {}", runner_id=runner_label, order_id=order.order_id, location="clubhouse", args=(runner_label, order.order_id))
         order.status = "processed"
         delivery_stats_entry = {
             "order_id": order.order_id,
@@ -638,7 +683,235 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
             
         self.delivery_stats.append(delivery_stats_entry)
         # Mark runner available for next assignment
-        self.runner_busy[runner_index] = False
+        self._release_runner(runner_index)
+
+    def _process_batch(self, orders: List[DeliveryOrder], runner_index: int, runner_label: str):  # simpy process
+        """Deliver several orders in one trip: clubhouse -> planned stops -> clubhouse.
+
+        Stops are ordered by _plan_batch_route. Each order gets its own delivered
+        time and delivery_stats entry; its ``trip_to_golfer`` is the leg from the
+        previous stop, and only the last order carries the ``trip_back`` leg.
+        If planning fails the first order is delivered alone and the rest are
+        returned to the front of the queue.
+        """
+        live = self._drop_expired_orders(orders, runner_label, self.runner_locations[runner_index], "{} received expired order {}; discarding")
+        if len(live) > 1 and self.runner_locations[runner_index] != "clubhouse":
+            return_time = self._calculate_return_time(self.runner_locations[runner_index])
+            self.log_activity(ActivityType.RETURNING, "{} returning to clubhouse from {} ({:.1f} min)", runner_id=runner_label, location=self.runner_locations[runner_index], args=(runner_label, self.runner_locations[runner_index], return_time / 60))
+            yield self.env.timeout(return_time)
+            self.runner_locations[runner_index] = "clubhouse"
+            # Final pre-departure timeout check, as in _process_single_order (no time passes otherwise)
+            live = self._drop_expired_orders(live, runner_label, "clubhouse", "{} exceeded timeout before departure for Order {}; discarding")
+        if len(live) <= 1:
+            if live:
+                yield from self._process_single_order(live[0], runner_index, runner_label)
+            else:
+                self._release_runner(runner_index)
+            return
+
+        departure_time_s = self.env.now
+        try:
+            stops, trip_back = self._plan_batch_route(live, departure_time_s)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Batch route planning failed, delivering orders one at a time: {e}")
+            # Hand the rest back to the front of the queue for the next free runner
+            self.order_store.items[0:0] = live[1:]
+            self._wake_dispatcher()
+            yield from self._process_single_order(live[0], runner_index, runner_label)
+            return
+
+        for order in live:
+            order.queue_delay_s = self.env.now - (order.order_placed_time or self.env.now)
+            self.log_activity(
+                ActivityType.PICKUP_ORDER,
+                "{} picked up Order {} (batch of {})",
+                runner_id=runner_label,
+                order_id=order.order_id,
+                location="clubhouse",
+                args=(runner_label, order.order_id, len(live)),
+            )
+
+        from .engine import find_nearest_node_index
+
+        entries: List[Dict[str, Any]] = []
+        for position, stop in enumerate(stops):
+            order: DeliveryOrder = stop["order"]
+            leg = stop["leg"]
+            leg_start_s = self.env.now
+            order.delivery_started_time = departure_time_s
+            self.log_activity(ActivityType.DELIVERY_START, "{} departing to Hole {} ({:.0f}m, {:.1f} min)", runner_id=runner_label, order_id=order.order_id, location=self.runner_locations[runner_index], hole=stop["hole_num"], args=(runner_label, stop["hole_num"], leg["length_m"], leg["time_s"] / 60))
+            yield self.env.timeout(float(leg["time_s"]))
+            order.delivered_time = self.env.now
+            order.total_completion_time_s = order.delivered_time - (order.order_placed_time or order.delivered_time)
+            self.runner_locations[runner_index] = f"hole_{stop['hole_num']}"
+            self.log_activity(ActivityType.DELIVERY_COMPLETE, "{} delivered Order {} to Hole {} (Total completion: {:.1f} min)", runner_id=runner_label, order_id=order.order_id, location=self.runner_locations[runner_index], hole=stop["hole_num"], args=(runner_label, order.order_id, stop["hole_num"], order.total_completion_time_s / 60))
+
+            actual_delivery_node_idx = -1
+            golfer_tee_time = self._tee_time_by_group.get(int(order.golfer_group_id), 0)
+            if golfer_tee_time > 0:
+                actual_delivery_node_idx = int((order.delivered_time - golfer_tee_time) // self.time_quantum_s)
+            is_last = position == len(stops) - 1
+            return_time_s = float(trip_back["time_s"]) if is_last else 0.0
+            self.order_timing_logs.append({
+                "order_id": order.order_id,
+                "order_time_s": order.order_time_s,
+                "ready_for_pickup_time_s": order.order_time_s + self.prep_time_s,
+                "departure_time_s": leg_start_s,
+                "delivery_timestamp_s": order.delivered_time,
+                "return_timestamp_s": order.delivered_time + return_time_s,
+            })
+            entry = {
+                "order_id": order.order_id,
+                "golfer_group_id": order.golfer_group_id,
+                "hole_num": int(stop["hole_num"]),
+                "placed_hole_num": int(order.hole_num),
+                "order_time_s": order.order_time_s,
+                "queue_delay_s": order.queue_delay_s,
+                "prep_time_s": self.prep_time_s,
+                # Time from leaving the clubhouse, including earlier stops
+                "delivery_time_s": order.delivered_time - departure_time_s,
+                "return_time_s": return_time_s,
+                "total_drive_time_s": float(leg["time_s"]) + return_time_s,
+                "delivery_distance_m": float(leg["length_m"]) + (float(trip_back["length_m"]) if is_last else 0.0),
+                "total_completion_time_s": order.total_completion_time_s,
+                "delivered_at_time_s": order.delivered_time,
+                "runner_id": runner_label,
+                "order_node_idx": max(0, (int(order.hole_num) - 1) * self._nodes_per_hole),
+                "predicted_delivery_node_idx": find_nearest_node_index(stop["coords"], self.course_dir),
+                "actual_delivery_node_idx": actual_delivery_node_idx,
+                "batch_size": len(stops),
+                "batch_position": position + 1,
+                "trip_to_golfer": leg,
+                "predicted_delivery_location": [float(stop["coords"][0]), float(stop["coords"][1])],
+            }
+            if is_last:
+                entry["trip_back"] = trip_back
+            entries.append(entry)
+
+        self.log_activity(ActivityType.RETURNING, "{} returning to clubhouse from {} ({:.1f} min)", runner_id=runner_label, location=self.runner_locations[runner_index], args=(runner_label, self.runner_locations[runner_index], trip_back["time_s"] / 60))
+        yield self.env.timeout(float(trip_back["time_s"]))
+        self.runner_locations[runner_index] = "clubhouse"
+        self.log_activity(ActivityType.ARRIVED_CLUBHOUSE, "{} arrived at clubhouse after a {}-order trip", runner_id=runner_label, location="clubhouse", args=(runner_label, len(stops)))
+        for stop in stops:
+            stop["order"].status = "processed"
+        self.delivery_stats.extend(entries)
+        self._release_runner(runner_index)
+
+    def _drop_expired_orders(self, orders: List[DeliveryOrder], runner_label: str, location: str, message: str) -> List[DeliveryOrder]:
+        """Fail orders waiting at least ``queue_timeout_s`` since placement and return the rest."""
+        live: List[DeliveryOrder] = []
+        for order in orders:
+            placed_time = order.order_placed_time if order.order_placed_time is not None else self.env.now
+            if (self.env.now - placed_time) >= self.queue_timeout_s:
+                order.status = "failed"
+                order.failure_reason = f"Not dispatched within {int(self.queue_timeout_s/60)} minutes"
+                self.failed_orders.append(order)
+                self.log_activity(
+                    ActivityType.ORDER_FAILED_TIMEOUT,
+                    message,
+                    runner_id=runner_label,
+                    order_id=order.order_id,
+                    location=location,
+                    args=(runner_label, order.order_id),
+                )
+            else:
+                live.append(order)
+        return live
+
+    def _plan_batch_route(self, orders: List[DeliveryOrder], departure_time_s: float) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Plan a multi-stop trip over predicted intercept points on the cart graph.
+
+        Intercepts are first predicted as if each order were delivered directly,
+        the visiting order is the shortest closed tour over their nearest cart
+        graph nodes (exhaustive, trips are small), and each stop is then
+        re-predicted with the time spent on earlier legs as extra delay.
+
+        Returns:
+            (stops in visiting order with ``order``, ``coords``, ``hole_num`` and
+            routed ``leg`` from the previous stop, routed leg back to the clubhouse)
+
+        Raises:
+            Exception: If the cart graph is missing or a leg cannot be routed
+        """
+        from .engine import enhanced_delivery_routing
+
+        cart_graph = get_course_assets(self.course_dir).cart_graph()
+        if cart_graph is None or self.clubhouse_coords is None:
+            raise FileNotFoundError("Batch routing needs pkl/cart_graph.pkl and clubhouse coordinates")
+
+        def intercept(order: DeliveryOrder, delay_s: float) -> Tuple[float, float]:
+            coords = self._predict_intercept(order, departure_time_s, estimated_delay_s=delay_s)
+            if not coords or coords == tuple(self.clubhouse_coords) or coords[0] == 0:
+                coords = self._get_hole_location(self._choose_intercept_hole(order))
+            if not coords:
+                raise ValueError(f"No delivery location for order {order.order_id}")
+            return (float(coords[0]), float(coords[1]))
+
+        direct = [intercept(o, 0.0) for o in orders]
+        stops: List[Dict[str, Any]] = []
+        prev = tuple(self.clubhouse_coords)
+        elapsed_s = 0.0
+        for pos in self._shortest_tour(cart_graph, direct):
+            order = orders[pos]
+            coords = intercept(order, elapsed_s) if elapsed_s > 0 else direct[pos]
+            leg = enhanced_delivery_routing(cart_graph, prev, coords, self.runner_speed_mps)
+            hole_num = self._nearest_hole_from_coords(coords[0], coords[1]) or int(order.hole_num)
+            stops.append({"order": order, "coords": coords, "hole_num": int(hole_num), "leg": leg})
+            elapsed_s += float(leg["time_s"])
+            prev = coords
+        trip_back = enhanced_delivery_routing(cart_graph, prev, self.clubhouse_coords, self.runner_speed_mps)
+        return stops, trip_back
+
+    def _shortest_tour(self, cart_graph: Any, points: List[Tuple[float, float]]) -> List[int]:
+        """Visiting order of ``points`` minimising clubhouse -> points -> clubhouse path length."""
+        from itertools import permutations
+
+        import networkx as nx
+
+        from ..routing.distance_matrix import get_distance_matrix
+        from ..routing.networks import nearest_nodes
+
+        lons = [float(self.clubhouse_coords[0])] + [p[0] for p in points]
+        lats = [float(self.clubhouse_coords[1])] + [p[1] for p in points]
+        nodes = nearest_nodes(cart_graph, lons, lats)
+        if any(n is None for n in nodes):
+            return list(range(len(points)))
+        matrix = get_distance_matrix(cart_graph)
+        cache: Dict[Tuple[int, int], float] = {}
+
+        def dist(a: int, b: int) -> float:
+            if (a, b) not in cache:
+                if matrix is not None:
+                    cache[(a, b)] = matrix.length_m(nodes[a], nodes[b])
+                else:
+                    try:
+                        cache[(a, b)] = float(nx.shortest_path_length(cart_graph, nodes[a], nodes[b], weight="length"))
+                    except nx.NetworkXNoPath:
+                        cache[(a, b)] = float("inf")
+            return cache[(a, b)]
+
+        def tour_length(perm: Tuple[int, ...]) -> float:
+            stops = [0] + [p + 1 for p in perm] + [0]
+            return sum(dist(a, b) for a, b in zip(stops, stops[1:]))
+
+        return list(min(permutations(range(len(points))), key=tour_length))
+
+    def _predict_intercept(self, order: DeliveryOrder, departure_time_s: float, estimated_delay_s: float = 0.0) -> Optional[Tuple[float, float]]:
+        """Predicted (lon, lat) where a runner leaving the clubhouse at ``departure_time_s`` meets the group."""
+        from dataclasses import asdict
+        from .engine import predict_optimal_delivery_location
+
+        return predict_optimal_delivery_location(
+            order_node_idx=max(0, (int(order.hole_num) - 1) * self._nodes_per_hole),
+            prep_time_min=0.0,  # Prep is complete, so no additional prep time
+            travel_time_s=0.0,
+            course_dir=self.course_dir,
+            runner_speed_mps=float(self.runner_speed_mps),
+            departure_time_s=departure_time_s,
+            clubhouse_lonlat=self.clubhouse_coords,
+            estimated_delay_s=estimated_delay_s,
+            order=asdict(order),
+        )
 
     def _calculate_return_time(self, runner_location: str, node_idx: Optional[int] = None) -> float:
         """Calculate return time from a location. Prioritizes node-based times."""
@@ -660,14 +933,26 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
         # Fallback constant
         return 8 * 60.0
 
-    def _choose_intercept_hole(self, order: DeliveryOrder) -> int:
-        """
-        Choose an intercept hole ahead of the golfer based on:
-        - Current golfer progression from tee time (1 minute per node pacing)
-        - Runner outbound travel time to each candidate hole
-        - Aim to minimize the mismatch between runner arrival and golfer arrival at the hole
+    def _init_intercept_tables(self) -> None:
+        """Precompute clubhouse->hole travel minutes (at this runner speed) and golfer arrival minutes."""
+        travel_min = np.full(18, np.inf)
+        for hole in range(1, 19):
+            try:
+                _, travel_time_s = self._calculate_delivery_details(hole)
+                travel_min[hole - 1] = max(0.0, float(travel_time_s) / 60.0)
+            except Exception:
+                continue
+        self._hole_travel_min = travel_min
+        self._hole_golfer_arrival_min = np.arange(18, dtype=float) * max(1, int(self._nodes_per_hole))
 
-        Always clamps to at least the placed hole; favors arriving slightly before golfer.
+    def intercept_scores(self, order: DeliveryOrder) -> Dict[str, Any]:
+        """Score breakdown for every candidate intercept hole of ``order`` at the current time.
+
+        Candidates run from the later of the placed hole and the golfer's
+        progress-derived hole to 18. Returns arrays aligned with ``holes``:
+        ``runner_min`` (clubhouse travel), ``golfer_remaining_min`` (until the
+        golfer reaches the hole), ``lateness``, ``earliness`` and the weighted
+        ``score`` (lower is better; unroutable holes score inf).
         """
         placed_hole = int(getattr(order, "hole_num", 1) or 1)
         nodes_per_hole = max(1, int(self._nodes_per_hole))
@@ -683,32 +968,36 @@ class MultiRunnerDeliveryService(BaseDeliveryService):
 
         # Start considering holes from the max of placed hole and current progress-derived hole
         progress_hole = 1 + int(current_delta_min // nodes_per_hole)
-        start_hole = max(placed_hole, max(1, min(18, progress_hole)))
-
-        best_hole = start_hole
-        best_score = float("inf")
+        start_hole = min(18, max(placed_hole, max(1, min(18, progress_hole))))
+
+        runner_min = self._hole_travel_min[start_hole - 1:]
+        golfer_remaining_min = np.maximum(0.0, self._hole_golfer_arrival_min[start_hole - 1:] - current_delta_min)
+        lateness = np.maximum(0.0, runner_min - golfer_remaining_min)
+        earliness = np.maximum(0.0, golfer_remaining_min - runner_min)
+        score = float(self.intercept_lateness_weight) * lateness + float(self.intercept_earliness_weight) * earliness
+        return {
+            "holes": np.arange(start_hole, 19),
+            "runner_min": runner_min,
+            "golfer_remaining_min": golfer_remaining_min,
+            "lateness": lateness,
+            "earliness": earliness,
+            "score": score,
+        }
 
-        for candidate in range(start_hole, 19):
-            try:
-                # Runner travel time to candidate hole (minutes)
-                _, travel_time_s = self._calculate_delivery_details(candidate)
-                runner_time_min = max(0.0, float(travel_time_s) / 60.0)
-
-                # Golfer time remaining (minutes) until candidate hole from current progress
-                golfer_arrival_min = (candidate - 1) * nodes_per_hole
-                golfer_time_remaining_min = max(0, int(golfer_arrival_min - current_delta_min))
-
-                # Penalize arriving after the golfer more heavily
-                lateness = max(0.0, runner_time_min - float(golfer_time_remaining_min))
-                earliness = max(0.0, float(golfer_time_remaining_min) - runner_time_min)
-                # Weight late arrivals 3x compared to earliness
-                score = (3.0 * lateness) + (1.0 * earliness)
-
-                if score < best_score - 1e-6:
-                    best_score = score
-                    best_hole = candidate
-            except Exception:
-                continue
+    def _choose_intercept_hole(self, order: DeliveryOrder) -> int:
+        """
+        Choose an intercept hole ahead of the golfer based on:
+        - Current golfer progression from tee time (1 minute per node pacing)
+        - Runner outbound travel time to each candidate hole
+        - Aim to minimize the mismatch between runner arrival and golfer arrival at the hole
 
-        # Ensure within [1, 18]
-        return int(max(1, min(18, best_hole)))
+        Always clamps to at least the placed hole; favors arriving slightly before golfer
+        (lateness weighs ``intercept_lateness_weight``, earliness ``intercept_earliness_weight``).
+        See intercept_scores for the per-hole breakdown.
+        """
+        scores = self.intercept_scores(order)
+        score = scores["score"]
+        if not np.isfinite(score).any():
+            return int(scores["holes"][0])
+        # First hole wins ties, as in a forward scan
+        return int(scores["holes"][int(np.argmin(score))])
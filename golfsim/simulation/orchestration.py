@@ -8,6 +8,7 @@ This module provides the main API for running simulations with various configura
 from __future__ import annotations
 
 import argparse
+import random
 from pathlib import Path
 from typing import Dict, Any, Optional
 import json
@@ -21,8 +22,8 @@ from ..config.loaders import (
 )
 from ..logging import get_logger
 from ..simulation.services import MultiRunnerDeliveryService, DeliveryOrder
+from ..simulation.golfer_track import GolferTrackTemplate
 from ..simulation.tracks import (
-    generate_golfer_points_for_groups,
     load_holes_connected_points,
     generate_runner_to_golfer_rendezvous_points,
 )
@@ -38,14 +39,19 @@ from ..io.reporting import (
     write_event_log_csv,
     write_order_timing_logs_csv,
 )
+from ..io.run_store import RunStore
+from ..io.coordinate_columns import write_coordinate_columns_csv
+from ..io.track_binary import tracks_path_for
 from ..io.results import (
     copy_to_public_coordinates,
     sync_run_outputs_to_public,
-    write_unified_coordinates_csv,
 )
-from ..analysis.metrics_integration import generate_and_save_metrics
+from ..analysis.metrics_integration import generate_and_save_metrics, generate_delivery_runner_metrics
 from ..viz.heatmap_viz import create_course_heatmap
 from ..utils import generate_standardized_output_name
+from .activity_log import ActivityLog
+from .dispatch_policies import get_dispatch_policy
+from .rng import run_random
 from .orders import (
     calculate_delivery_order_probability_per_9_holes,
     generate_delivery_orders_with_pass_boost,
@@ -57,17 +63,23 @@ from golfsim.simulation.beverage_cart_service import BeverageCartService
 from golfsim.simulation.order_generation import simulate_golfer_orders
 from golfsim.config.loaders import load_simulation_config
 from golfsim.viz.matplotlib_viz import render_delivery_plot, render_individual_delivery_plots, load_course_geospatial_data
-from golfsim.routing.utils import get_hole_for_node
+from golfsim.data.course_assets import get_course_assets
 import simpy
 from pathlib import Path
-import pickle
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 import pandas as pd
 
 logger = get_logger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """results.json encoder for the typed activity log (everything else as str)."""
+    if isinstance(obj, ActivityLog):
+        return obj.to_records()
+    return str(obj)
+
+
 def _determine_variant_key(blocked_holes: set[int]) -> str:
     if not blocked_holes:
         return "none"
@@ -112,6 +124,7 @@ def run_multi_golfer_simulation(
     create_visualization: bool = True,
     rng_seed: Optional[int] = None,
     use_golfer_graph: bool = True,  # Default to True for this simulation type
+    rng: Optional[random.Random] = None,
 ) -> Dict[str, Any]:
     simulation_env = env or simpy.Environment()
     config = load_simulation_config(course_dir)
@@ -125,7 +138,9 @@ def run_multi_golfer_simulation(
         groups=groups,
     )
 
-    orders = simulate_golfer_orders(groups, order_probability_per_9_holes, rng_seed=rng_seed, course_dir=course_dir)
+    orders = simulate_golfer_orders(
+        groups, order_probability_per_9_holes, rng_seed=rng_seed, course_dir=course_dir, rng=rng
+    )
 
     def order_arrival_process():
         last_time = simulation_env.now
@@ -204,12 +219,8 @@ def run_multi_golfer_simulation(
             clubhouse_coords = sim_cfg.clubhouse
             course_data = load_course_geospatial_data(course_dir)
             
-            cart_graph = None
             graph_filename = "cart_graph_golfers.pkl" if use_golfer_graph else "cart_graph.pkl"
-            cart_graph_path = Path(course_dir) / "pkl" / graph_filename
-            if cart_graph_path.exists():
-                with open(cart_graph_path, "rb") as f:
-                    cart_graph = pickle.load(f)
+            cart_graph = get_course_assets(course_dir).cart_graph(graph_filename)
             
             viz_path = output_path / "delivery_orders_map.png"
             render_delivery_plot(
@@ -246,223 +257,283 @@ def run_multi_golfer_simulation(
     return results
 
 
-def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: bool = False, **kwargs) -> Dict[str, Any]:
-    """Run delivery runner simulation."""
-    args = kwargs.get("args")
+def _resolve_blocked_holes(config: SimulationConfig, args: Optional[argparse.Namespace]) -> set[int]:
+    """Union of config.blocked_holes and the CLI blocking flags (--block-*)."""
+    blocked_holes: set[int] = set(int(h) for h in (getattr(config, "blocked_holes", None) or []))
 
-    config.output_dir.mkdir(parents=True, exist_ok=True)
+    block_up_to_hole = getattr(args, "block_up_to_hole", 0) or 0
+    if block_up_to_hole > 0:
+        blocked_holes.update(range(1, int(block_up_to_hole) + 1))
 
-    logger.info("Starting dynamic delivery runner sims: %d runs", config.num_runs)
-    all_runs: list[dict] = []
+    if getattr(args, "block_holes_10_12", False):
+        blocked_holes.update([10, 11, 12])
 
+    block_holes_list = getattr(args, "block_holes", None)
+    if block_holes_list:
+        try:
+            blocked_holes.update(int(h) for h in block_holes_list)
+        except (ValueError, TypeError):
+            logger.warning("Invalid value in --block-holes list; expected integers.")
+
+    block_holes_range = getattr(args, "block_holes_range", None)
+    if isinstance(block_holes_range, str) and "-" in block_holes_range:
+        try:
+            a_str, b_str = block_holes_range.split("-", 1)
+            a = int(a_str); b = int(b_str)
+            blocked_holes.update(range(min(a, b), max(a, b) + 1))
+        except (ValueError, TypeError):
+            logger.warning("Invalid value for --block-holes-range; expected format like '1-3'.")
+
+    return blocked_holes
+
+
+def simulate_delivery_runner_run(
+    config: SimulationConfig, args: Optional[argparse.Namespace] = None, run_idx: int = 1
+) -> Tuple[Dict[str, Any], MultiRunnerDeliveryService, List[Dict[str, Any]]]:
+    """Run one delivery-runner simulation in memory without writing any files.
+
+    Orders are drawn from a private stream derived from ``config.random_seed``,
+    ``run_idx`` and the combo (runners, orders, blocked holes), so seeded runs are
+    reproducible individually and runs never share global RNG state. With
+    ``config.common_random_numbers`` the combo is left out, so every runner count
+    and blocked-hole variant sees the same orders for a given seed and run index
+    (blocked slots are redrawn within their hour).
+
+    Returns:
+        Tuple of (sim_result dict as written to results.json, the finished
+        delivery service, golfer groups)
+    """
     first_tee_s = parse_hhmm_to_seconds_since_7am(config.first_tee)
-    
-    # Load simulation config to get total orders and optional hourly distribution
-    # This is already loaded into the config object
-    
-    for run_idx in range(1, int(config.num_runs) + 1):
-        # Prefer scenario unless explicitly disabled via --tee-scenario none
-        scenario_groups_base = build_groups_from_scenario(config.course_dir, str(config.tee_scenario))
-        if scenario_groups_base:
-            groups = scenario_groups_base
-            # Only shift scenario times if first_tee was explicitly provided (not using default)
-            # For detailed tee times scenarios, use the exact times from the scenario
-            should_shift_times = (
-                hasattr(args, 'first_tee') and args.first_tee is not None and args.first_tee != "09:00"
-            ) if args else False
-            
-            if should_shift_times:
-                # If a first tee override is provided, shift entire scenario to match desired first tee
-                try:
-                    if isinstance(groups, list) and groups:
-                        current_min = min(int(g.get("tee_time_s", 0) or 0) for g in groups)
-                        delta = int(first_tee_s - current_min)
-                        if delta != 0:
-                            for g in groups:
-                                g["tee_time_s"] = max(0, int(g.get("tee_time_s", 0) or 0) + delta)
-                            logger.info("Shifted scenario tee times by %+ds to align first tee to %s", delta, str(config.first_tee))
-                except Exception:
-                    pass
-            else:
-                # Use scenario times as-is for detailed tee times
-                if isinstance(groups, list) and groups:
-                    logger.info("Using detailed tee times from scenario '%s' without shifting", str(config.tee_scenario))
-            # Respect groups_count when a scenario is used by taking the first N groups by tee time
+
+    # Prefer scenario unless explicitly disabled via --tee-scenario none
+    scenario_groups_base = build_groups_from_scenario(config.course_dir, str(config.tee_scenario))
+    if scenario_groups_base:
+        groups = scenario_groups_base
+        # Only shift scenario times if first_tee was explicitly provided (not using default)
+        # For detailed tee times scenarios, use the exact times from the scenario
+        should_shift_times = (
+            hasattr(args, 'first_tee') and args.first_tee is not None and args.first_tee != "09:00"
+        ) if args else False
+        
+        if should_shift_times:
+            # If a first tee override is provided, shift entire scenario to match desired first tee
             try:
-                max_groups = int(getattr(config, "groups_count", 0) or 0)
-                if max_groups > 0 and len(groups) > max_groups:
-                    groups = sorted(groups, key=lambda g: int(g.get("tee_time_s", 0) or 0))[:max_groups]
-                    # Optionally renumber group_id sequentially for cleaner outputs
-                    for idx, g in enumerate(groups, start=1):
-                        g["group_id"] = idx
-                    logger.info("Using first %d golfer group(s) from scenario (of %d total)", max_groups, len(scenario_groups_base))
+                if isinstance(groups, list) and groups:
+                    current_min = min(int(g.get("tee_time_s", 0) or 0) for g in groups)
+                    delta = int(first_tee_s - current_min)
+                    if delta != 0:
+                        for g in groups:
+                            g["tee_time_s"] = max(0, int(g.get("tee_time_s", 0) or 0) + delta)
+                        logger.info("Shifted scenario tee times by %+ds to align first tee to %s", delta, str(config.first_tee))
             except Exception:
                 pass
         else:
-            groups = build_groups_interval(int(config.groups_count), first_tee_s, float(config.groups_interval_min)) if config.groups_count > 0 else []
+            # Use scenario times as-is for detailed tee times
+            if isinstance(groups, list) and groups:
+                logger.info("Using detailed tee times from scenario '%s' without shifting", str(config.tee_scenario))
+        # Respect groups_count when a scenario is used by taking the first N groups by tee time
+        try:
+            max_groups = int(getattr(config, "groups_count", 0) or 0)
+            if max_groups > 0 and len(groups) > max_groups:
+                groups = sorted(groups, key=lambda g: int(g.get("tee_time_s", 0) or 0))[:max_groups]
+                # Optionally renumber group_id sequentially for cleaner outputs
+                for idx, g in enumerate(groups, start=1):
+                    g["group_id"] = idx
+                logger.info("Using first %d golfer group(s) from scenario (of %d total)", max_groups, len(scenario_groups_base))
+        except Exception:
+            pass
+    else:
+        groups = build_groups_interval(int(config.groups_count), first_tee_s, float(config.groups_interval_min)) if config.groups_count > 0 else []
 
-        # Decide order generation mode
-        hourly_dist = getattr(config, "delivery_hourly_distribution", None)
-        
-        # If hourly distribution is not provided, create a default dynamic distribution
-        if not isinstance(hourly_dist, dict) or not hourly_dist:
-            service_start_hour = int(config.service_hours.start_hour) if config.service_hours else 10
-            service_end_hour = int(config.service_hours.end_hour) if config.service_hours else 19
-            hourly_dist = generate_dynamic_hourly_distribution(service_start_hour, service_end_hour)
+    # Decide order generation mode
+    hourly_dist = getattr(config, "delivery_hourly_distribution", None)
+    
+    # If hourly distribution is not provided, create a default dynamic distribution
+    if not isinstance(hourly_dist, dict) or not hourly_dist:
+        service_start_hour = int(config.service_hours.start_hour) if config.service_hours else 10
+        service_end_hour = int(config.service_hours.end_hour) if config.service_hours else 19
+        hourly_dist = generate_dynamic_hourly_distribution(service_start_hour, service_end_hour)
 
-        requested_total_orders = int(args.delivery_total_orders) if getattr(args, "delivery_total_orders", None) is not None else int(config.delivery_total_orders)
+    requested_total_orders = int(args.delivery_total_orders) if getattr(args, "delivery_total_orders", None) is not None else int(config.delivery_total_orders)
 
-        crossings = None # Disabled in this mode
+    crossings = None # Disabled in this mode
 
-        effective_runner_speed = config.delivery_runner_speed_mps
+    effective_runner_speed = config.delivery_runner_speed_mps
 
-        env = simpy.Environment()
+    env = simpy.Environment()
 
-        # Use the simulation config to create the service
-        delivery_service = MultiRunnerDeliveryService(
-            env,
-            course_dir=config.course_dir,
-            num_runners=int(config.num_runners),
-            runner_speed_mps=effective_runner_speed,
-            prep_time_min=int(config.delivery_prep_time_sec / 60),
+    # Use the simulation config to create the service
+    delivery_service = MultiRunnerDeliveryService(
+        env,
+        course_dir=config.course_dir,
+        num_runners=int(config.num_runners),
+        runner_speed_mps=effective_runner_speed,
+        prep_time_min=int(config.delivery_prep_time_sec / 60),
+        groups=groups,
+        time_quantum_s=config.speeds.time_quantum_s,
+        dispatch_policy=get_dispatch_policy(getattr(config, "dispatch_policy", "fifo")),
+        batch_max_orders=int(getattr(config, "delivery_batch_max_orders", 1)),
+        batch_hole_window=int(getattr(config, "delivery_batch_hole_window", 2)),
+        batch_time_window_s=float(getattr(config, "delivery_batch_time_window_min", 10)) * 60.0,
+        intercept_lateness_weight=float(getattr(config, "delivery_intercept_lateness_weight", 3.0)),
+        intercept_earliness_weight=float(getattr(config, "delivery_intercept_earliness_weight", 1.0)),
+    )
+
+    orders: list[DeliveryOrder] = []
+    orders_all: list[DeliveryOrder] = []
+    # Initialize defaults so metadata below is safe even when no groups
+    blocked_holes: set[int] = set()
+    variant_key: str = "none"
+    if groups:
+        blocked_holes = _resolve_blocked_holes(config, args)
+        if blocked_holes:
+            logger.info(f"Generating orders with blocked holes: {sorted(list(blocked_holes))}")
+        variant_key = _determine_variant_key(blocked_holes)
+        crn = bool(getattr(config, "common_random_numbers", False))
+        combo = () if crn else (int(config.num_runners), int(requested_total_orders), tuple(sorted(blocked_holes)))
+        rng = run_random(config.random_seed, run_idx, combo=combo)
+
+        orders_all = generate_delivery_orders_by_hour_distribution(
             groups=groups,
-            time_quantum_s=config.speeds.time_quantum_s
+            hourly_distribution=hourly_dist,
+            total_orders=int(requested_total_orders),
+            service_open_hhmm=str(config.service_hours.start_hour) + ":00" if config.service_hours else "10:00",
+            service_close_hhmm=str(config.service_hours.end_hour) + ":00" if config.service_hours else "19:00",
+            opening_ramp_minutes=int(getattr(config, "delivery_opening_ramp_minutes", 0)),
+            course_dir=config.course_dir,
+            service_open_s=int(delivery_service.service_open_s),
+            blocked_holes=blocked_holes if blocked_holes else None,
+            rng=rng,
+            common_random_numbers=crn,
         )
+        
+        orders = orders_all
 
-        orders: list[DeliveryOrder] = []
-        orders_all: list[DeliveryOrder] = []
-        # Initialize defaults so metadata below is safe even when no groups
-        blocked_holes: set[int] = set()
-        variant_key: str = "none"
-        if groups:
-            # --- Start: New blocked holes logic ---
-            blocked_holes: set[int] = set()
-            
-            block_up_to_hole = getattr(args, "block_up_to_hole", 0)
-            if block_up_to_hole > 0:
-                blocked_holes.update(range(1, int(block_up_to_hole) + 1))
+    # Resolved once: per-order hole lookups are then a single array read
+    node_holes = get_course_assets(config.course_dir).node_holes()
 
-            if getattr(args, "block_holes_10_12", False):
-                blocked_holes.update([10, 11, 12])
+    def order_arrival_process():
+        last_time = env.now
+        for order in orders:
+            # Get the golfer's current node at the time of the order
+            golfer_group = delivery_service.groups_by_id.get(order.golfer_group_id)
+            if golfer_group:
+                # Calculate current node index based on time elapsed since tee time
+                tee_time_s = int(golfer_group.get("tee_time_s", 0))
+                time_elapsed_s = order.order_time_s - tee_time_s
+                # Each node represents 1 minute of play time
+                current_node = max(0, int(time_elapsed_s // 60))
+                
+                # Get the correct hole for the node
+                correct_hole = node_holes.hole_for_node(current_node)
+                if correct_hole is not None:
+                    order.hole_num = correct_hole
 
-            block_holes_list = getattr(args, "block_holes", None)
-            if block_holes_list:
-                try:
-                    blocked_holes.update(int(h) for h in block_holes_list)
-                except (ValueError, TypeError):
-                    logger.warning("Invalid value in --block-holes list; expected integers.")
+            target_time = max(order.order_time_s, delivery_service.service_open_s)
+            if target_time > last_time:
+                yield env.timeout(target_time - last_time)
+            delivery_service.place_order(order)
+            last_time = target_time
 
-            block_holes_range = getattr(args, "block_holes_range", None)
-            if isinstance(block_holes_range, str) and "-" in block_holes_range:
-                try:
-                    a_str, b_str = block_holes_range.split("-", 1)
-                    a = int(a_str); b = int(b_str)
-                    blocked_holes.update(range(min(a, b), max(a, b) + 1))
-                except (ValueError, TypeError):
-                     logger.warning("Invalid value for --block-holes-range; expected format like '1-3'.")
-
-            if blocked_holes:
-                logger.info(f"Generating orders with blocked holes: {sorted(list(blocked_holes))}")
-            
-            variant_key = _determine_variant_key(blocked_holes)
-            # --- End: New blocked holes logic ---
-
-            orders_all = generate_delivery_orders_by_hour_distribution(
-                groups=groups,
-                hourly_distribution=hourly_dist,
-                total_orders=int(requested_total_orders),
-                service_open_hhmm=str(config.service_hours.start_hour) + ":00" if config.service_hours else "10:00",
-                service_close_hhmm=str(config.service_hours.end_hour) + ":00" if config.service_hours else "19:00",
-                opening_ramp_minutes=int(getattr(config, "delivery_opening_ramp_minutes", 0)),
-                course_dir=config.course_dir,
-                rng_seed=config.random_seed,
-                service_open_s=int(delivery_service.service_open_s),
-                blocked_holes=blocked_holes if blocked_holes else None,
-            )
-            
-            orders = orders_all
-
-        def order_arrival_process():
-            last_time = env.now
-            for order in orders:
-                # Get the golfer's current node at the time of the order
-                golfer_group = delivery_service.groups_by_id.get(order.golfer_group_id)
-                if golfer_group:
-                    # Calculate current node index based on time elapsed since tee time
-                    tee_time_s = int(golfer_group.get("tee_time_s", 0))
-                    time_elapsed_s = order.order_time_s - tee_time_s
-                    # Each node represents 1 minute of play time
-                    current_node = max(0, int(time_elapsed_s // 60))
-                    
-                    # Get the correct hole for the node
-                    correct_hole = get_hole_for_node(current_node, config.course_dir)
-                    if correct_hole is not None:
-                        order.hole_num = correct_hole
-
-                target_time = max(order.order_time_s, delivery_service.service_open_s)
-                if target_time > last_time:
-                    yield env.timeout(target_time - last_time)
-                delivery_service.place_order(order)
-                last_time = target_time
-
-        env.process(order_arrival_process())
-
-        run_until = max(delivery_service.service_close_s + 1, max((o.order_time_s for o in orders), default=0) + 4 * 3600)
-        env.run(until=run_until)
-
-        delivery_stats_map = {s["order_id"]: s for s in delivery_service.delivery_stats}
-
-        sim_result: dict[str, Any] = {
-            "success": True,
-            "simulation_type": "multi_golfer_multi_runner" if int(config.num_runners) > 1 else "multi_golfer_single_runner",
-            "orders": [
-                {
-                    "order_id": getattr(o, "order_id", None),
-                    "golfer_group_id": getattr(o, "golfer_group_id", None),
-                    "golfer_id": getattr(o, "golfer_id", None),
-                    "placed_hole": getattr(o, "hole_num", None),
-                    "delivered_hole": delivery_stats_map.get(o.order_id, {}).get("hole_num"),
-                    "order_time_s": getattr(o, "order_time_s", None),
-                    "queue_time_s": delivery_stats_map.get(o.order_id, {}).get("queue_delay_s"),
-                    "drive_time_s": delivery_stats_map.get(o.order_id, {}).get("total_drive_time_s"),
-                    "status": getattr(o, "status", "pending"),
-                    "total_completion_time_s": getattr(o, "total_completion_time_s", 0.0),
-                }
-                for o in orders
-            ],
-            "orders_all": [
-                {
-                    "order_id": getattr(o, "order_id", None),
-                    "golfer_group_id": getattr(o, "golfer_group_id", None),
-                    "golfer_id": getattr(o, "golfer_id", None),
-                    "placed_hole": getattr(o, "hole_num", None),
-                    "delivered_hole": delivery_stats_map.get(o.order_id, {}).get("hole_num"),
-                    "order_time_s": getattr(o, "order_time_s", None),
-                    "queue_time_s": delivery_stats_map.get(o.order_id, {}).get("queue_delay_s"),
-                    "drive_time_s": delivery_stats_map.get(o.order_id, {}).get("total_drive_time_s"),
-                    "status": getattr(o, "status", "pending"),
-                    "total_completion_time_s": getattr(o, "total_completion_time_s", 0.0),
-                }
-                for o in (orders_all or [])
-            ],
-            "delivery_stats": delivery_service.delivery_stats,
-            "failed_orders": [
-                {"order_id": getattr(o, "order_id", None), "reason": getattr(o, "failure_reason", None)}
-                for o in delivery_service.failed_orders
-            ],
-            "activity_log": delivery_service.activity_log,
-            "metadata": {
-                "prep_time_min": int(config.delivery_prep_time_sec / 60),
-                "runner_speed_mps": float(config.delivery_runner_speed_mps),
-                "num_groups": len(groups),
-                "num_runners": int(config.num_runners),
-                "course_dir": str(config.course_dir),
-                "service_open_s": int(delivery_service.service_open_s),
-                "service_close_s": int(delivery_service.service_close_s),
-                "blocked_holes": sorted(list(blocked_holes)),
-                "variant_key": variant_key,
-            },
-        }
+    env.process(order_arrival_process())
+
+    run_until = max(delivery_service.service_close_s + 1, max((o.order_time_s for o in orders), default=0) + 4 * 3600)
+    env.run(until=run_until)
+
+    delivery_stats_map = {s["order_id"]: s for s in delivery_service.delivery_stats}
+
+    sim_result: dict[str, Any] = {
+        "success": True,
+        "simulation_type": "multi_golfer_multi_runner" if int(config.num_runners) > 1 else "multi_golfer_single_runner",
+        "orders": [
+            {
+                "order_id": getattr(o, "order_id", None),
+                "golfer_group_id": getattr(o, "golfer_group_id", None),
+                "golfer_id": getattr(o, "golfer_id", None),
+                "placed_hole": getattr(o, "hole_num", None),
+                "delivered_hole": delivery_stats_map.get(o.order_id, {}).get("hole_num"),
+                "order_time_s": getattr(o, "order_time_s", None),
+                "queue_time_s": delivery_stats_map.get(o.order_id, {}).get("queue_delay_s"),
+                "drive_time_s": delivery_stats_map.get(o.order_id, {}).get("total_drive_time_s"),
+                "status": getattr(o, "status", "pending"),
+                "total_completion_time_s": getattr(o, "total_completion_time_s", 0.0),
+            }
+            for o in orders
+        ],
+        "orders_all": [
+            {
+                "order_id": getattr(o, "order_id", None),
+                "golfer_group_id": getattr(o, "golfer_group_id", None),
+                "golfer_id": getattr(o, "golfer_id", None),
+                "placed_hole": getattr(o, "hole_num", None),
+                "delivered_hole": delivery_stats_map.get(o.order_id, {}).get("hole_num"),
+                "order_time_s": getattr(o, "order_time_s", None),
+                "queue_time_s": delivery_stats_map.get(o.order_id, {}).get("queue_delay_s"),
+                "drive_time_s": delivery_stats_map.get(o.order_id, {}).get("total_drive_time_s"),
+                "status": getattr(o, "status", "pending"),
+                "total_completion_time_s": getattr(o, "total_completion_time_s", 0.0),
+            }
+            for o in (orders_all or [])
+        ],
+        "delivery_stats": delivery_service.delivery_stats,
+        "failed_orders": [
+            {"order_id": getattr(o, "order_id", None), "reason": getattr(o, "failure_reason", None)}
+            for o in delivery_service.failed_orders
+        ],
+        "activity_log": delivery_service.activity_log,
+        "metadata": {
+            "prep_time_min": int(config.delivery_prep_time_sec / 60),
+            "runner_speed_mps": float(config.delivery_runner_speed_mps),
+            "num_groups": len(groups),
+            "num_runners": int(config.num_runners),
+            "course_dir": str(config.course_dir),
+            "service_open_s": int(delivery_service.service_open_s),
+            "service_close_s": int(delivery_service.service_close_s),
+            "blocked_holes": sorted(list(blocked_holes)),
+            "variant_key": variant_key,
+            "dispatch_policy": delivery_service.dispatch_policy.name,
+            "batch_max_orders": int(delivery_service.batch_max_orders),
+        },
+    }
+
+    return sim_result, delivery_service, groups
+
+
+def delivery_runner_metrics_for_run(config: SimulationConfig, sim_result: Dict[str, Any], simulation_id: str):
+    """Delivery metrics for one run, with the parameters the orchestrator reports them with."""
+    num_runners = int(config.num_runners)
+    return generate_delivery_runner_metrics(
+        delivery_stats=sim_result.get("delivery_stats", []),
+        activity_log=sim_result.get("activity_log", []),
+        orders=sim_result.get("orders", []),
+        failed_orders=sim_result.get("failed_orders", []),
+        revenue_per_order=float(config.delivery_avg_order_usd),
+        sla_minutes=int(config.sla_minutes),
+        simulation_id=simulation_id,
+        runner_id="runner_1" if num_runners == 1 else f"{num_runners}_runners",
+        service_hours=float(config.service_hours_duration),
+    )
+
+
+def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: bool = False, **kwargs) -> Dict[str, Any]:
+    """Run delivery runner simulation.
+
+    Optional kwargs:
+        args: CLI namespace (order totals, blocked holes, ...)
+        on_run_complete: Callable ``(run_idx, run_path, sim_result)`` invoked after
+            each run's outputs are written, e.g. to stream metrics to a caller
+    """
+    args = kwargs.get("args")
+    on_run_complete = kwargs.get("on_run_complete")
+
+    config.output_dir.mkdir(parents=True, exist_ok=True)
+
+    logger.info("Starting dynamic delivery runner sims: %d runs", config.num_runs)
+    all_runs: list[dict] = []
+
+    first_run_idx = int(getattr(config, "run_index_offset", 0) or 0) + 1
+    for run_idx in range(first_run_idx, first_run_idx + int(config.num_runs)):
+        sim_result, delivery_service, groups = simulate_delivery_runner_run(config, args, run_idx)
 
         bev_points: list[dict[str, Any]] = []
         bev_sales_result: dict[str, Any] = {"sales": [], "revenue": 0.0}
@@ -491,7 +562,9 @@ def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: b
         run_path = config.output_dir / f"run_{run_idx:02d}"
         run_path.mkdir(parents=True, exist_ok=True)
 
-        (run_path / "results.json").write_text(json.dumps(sim_result, indent=2, default=str), encoding="utf-8")
+        # Sweeps write thousands of these; skip pretty-printing in minimal outputs mode
+        indent = None if bool(getattr(config, "minimal_outputs", False)) else 2
+        (run_path / "results.json").write_text(json.dumps(sim_result, indent=indent, default=_json_default), encoding="utf-8")
         
         # Other reports that must be written before coordinates
         if not bool(getattr(config, "minimal_outputs", False)):
@@ -511,9 +584,10 @@ def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: b
 
         
         # Other reports
+        simulation_metrics = None
         try:
             # Always generate core simulation metrics JSON (needed by map app)
-            generate_simulation_metrics_json(
+            simulation_metrics = generate_simulation_metrics_json(
                 sim_result,
                 run_path / "simulation_metrics.json",
                 service_hours=float(config.service_hours_duration),
@@ -528,6 +602,7 @@ def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: b
 
         # Metrics generation
         metrics = type('MinimalMetrics', (), {'revenue_per_round': 0.0})()
+        delivery_metrics = None
         try:
             bev_metrics, delivery_metrics = generate_and_save_metrics(
                 simulation_result=sim_result,
@@ -548,6 +623,28 @@ def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: b
         except Exception as e:
             logger.warning("Failed to generate and save detailed metrics: %s", e)
 
+        if config.run_store_path:
+            try:
+                meta = sim_result.get("metadata", {}) or {}
+                # Detailed metrics are only generated for a process's first run
+                store_metrics = delivery_metrics or delivery_runner_metrics_for_run(
+                    config, sim_result, f"delivery_dynamic_{run_idx:02d}"
+                )
+                requested_orders = getattr(args, "delivery_total_orders", None)
+                RunStore(config.run_store_path).append_run(
+                    run_path,
+                    run_idx=run_idx,
+                    orders=int(requested_orders if requested_orders is not None else config.delivery_total_orders),
+                    runners=int(config.num_runners),
+                    variant_key=meta.get("variant_key"),
+                    blocked_holes=meta.get("blocked_holes"),
+                    metrics=store_metrics,
+                    sim_result=sim_result,
+                    simulation_metrics=simulation_metrics,
+                )
+            except Exception as e:
+                logger.warning("Failed to append run to run store %s: %s", config.run_store_path, e)
+
         # Coordinate generation
         # Write coordinates when:
         # - full outputs (not minimal), OR
@@ -589,18 +686,14 @@ def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: b
                     golfer_points: list[dict[str, Any]] = []
                     cart_graph = None
                     
-                    # Load cart graph
+                    # Load cart graph (shared per process)
                     try:
-                        import pickle
                         graph_filename = "cart_graph_golfers.pkl" if use_golfer_graph else "cart_graph.pkl"
-                        cart_graph_path = Path(config.course_dir) / "pkl" / graph_filename
-                        logger.info(f"Attempting to load cart graph from: {cart_graph_path}")
-                        if cart_graph_path.exists():
-                            with cart_graph_path.open("rb") as f:
-                                cart_graph = pickle.load(f)
+                        cart_graph = get_course_assets(config.course_dir).cart_graph(graph_filename)
+                        if cart_graph is not None:
                             logger.info("Cart graph loaded successfully.")
                         else:
-                            logger.warning("Cart graph file does not exist.")
+                            logger.warning("Cart graph file does not exist: %s", Path(config.course_dir) / "pkl" / graph_filename)
                     except Exception as e:
                         logger.error(f"Failed to load cart graph: {e}")
                         cart_graph = None
@@ -608,14 +701,11 @@ def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: b
                     # Generate golfer coordinates first
                     golfer_points_csv: dict[str, list[dict[str, Any]]] = {}
                     if groups:
-                        gp = generate_golfer_points_for_groups(config.course_dir, groups)
-                        logger.debug(f"Run {run_idx}: Generated {len(gp)} total golfer points.")
-                        by_gid: dict[int, list[dict[str, Any]]] = {}
-                        for p in gp:
-                            gid = int(p.get("group_id", 0) or 0)
-                            by_gid.setdefault(gid, []).append(p)
-                        for gid, pts in by_gid.items():
-                            golfer_points_csv[f"golfer_group_{gid}"] = pts
+                        for gid, pts in GolferTrackTemplate.for_course(config.course_dir).iter_groups(groups):
+                            golfer_points_csv.setdefault(f"golfer_group_{int(gid or 0)}", []).extend(pts)
+                        logger.debug(
+                            f"Run {run_idx}: Generated {sum(len(v) for v in golfer_points_csv.values())} total golfer points."
+                        )
 
                     # Annotate golfer colors from order/delivery events
                     try:
@@ -829,7 +919,12 @@ def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: b
                             logger.warning(f"Failed to annotate golfer meeting flags: {e}")
 
                         # Write main combined CSV
-                        write_unified_coordinates_csv(streams, run_path / "coordinates.csv")
+                        coordinates_csv = run_path / "coordinates.csv"
+                        write_coordinate_columns_csv(
+                            streams,
+                            coordinates_csv,
+                            tracks_path=tracks_path_for(coordinates_csv) if getattr(config, "binary_tracks", False) else None,
+                        )
                         logger.info("Wrote coordinates CSV with %d streams", len(streams))
 
                         # Also write filtered delivery points CSV (only rows with is_delivery_event=True)
@@ -840,7 +935,7 @@ def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: b
                                 if filtered:
                                     delivery_only[sid] = filtered
                             if delivery_only:
-                                write_unified_coordinates_csv(delivery_only, run_path / "coordinates_delivery_points.csv")
+                                write_coordinate_columns_csv(delivery_only, run_path / "coordinates_delivery_points.csv")
                                 logger.info("Wrote filtered delivery points CSV (%d streams)", len(delivery_only))
                         except Exception as e:
                             logger.warning(f"Failed to write filtered delivery points CSV: {e}")
@@ -868,6 +963,9 @@ def run_delivery_runner_simulation(config: SimulationConfig, use_golfer_graph: b
                 logger.warning("Failed to copy to public coordinates: %s", e)
 
 
+        if on_run_complete is not None:
+            on_run_complete(run_idx, run_path, sim_result)
+
         all_runs.append({
             "run_idx": run_idx,
             "groups": len(groups),
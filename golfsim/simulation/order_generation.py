@@ -1,10 +1,19 @@
 from __future__ import annotations
+import random
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from .delivery_service_base import DeliveryOrder
+from .rng import resolve_rng
 
-def simulate_golfer_orders(groups: List[Dict], order_probability_per_9_holes: float, rng_seed: Optional[int] = None, *, course_dir: Optional[str] = None) -> List[DeliveryOrder]:
+def simulate_golfer_orders(
+    groups: List[Dict],
+    order_probability_per_9_holes: float,
+    rng_seed: Optional[int] = None,
+    *,
+    course_dir: Optional[str] = None,
+    rng: Optional[random.Random] = None,
+) -> List[DeliveryOrder]:
     """Generate delivery orders on a per-group, per-9-holes basis.
 
     Semantics:
@@ -16,21 +25,18 @@ def simulate_golfer_orders(groups: List[Dict], order_probability_per_9_holes: fl
     
     Parameters:
     - rng_seed: Optional random seed for deterministic order generation (for exact replay)
+    - rng: Optional per-run random stream (takes precedence over rng_seed)
     """
-    import random
-    
-    # Seed the random number generator if provided
-    if rng_seed is not None:
-        random.seed(rng_seed)
+    rng = resolve_rng(rng, rng_seed)
 
     orders: List[DeliveryOrder] = []
     # Derive node-based pacing from holes_connected.geojson (1 min per node)
     try:
         from pathlib import Path
-        import json as _json
+        from ..data.course_assets import load_loop_nodes
         if course_dir:
-            data = _json.loads((Path(course_dir) / "geojson" / "generated" / "holes_connected.geojson").read_text(encoding="utf-8"))
-            total_nodes = len([f for f in (data.get("features") or []) if (f.get("geometry") or {}).get("type") == "Point"]) or 18 * 12
+            nodes = load_loop_nodes(Path(course_dir) / "geojson" / "generated" / "holes_connected.geojson")
+            total_nodes = len(nodes) or 18 * 12
         else:
             total_nodes = 18 * 12
     except Exception:
@@ -42,8 +48,8 @@ def simulate_golfer_orders(groups: List[Dict], order_probability_per_9_holes: fl
         tee_time_s = group["tee_time_s"]
 
         # Front nine (holes 1..9)
-        if random.random() < order_probability_per_9_holes:
-            hole_front = int(random.randint(1, 9))
+        if rng.random() < order_probability_per_9_holes:
+            hole_front = int(rng.randint(1, 9))
             start_node = int(round((hole_front - 1) * nodes_per_hole))
             order_time_front_s = tee_time_s + start_node * 60
             orders.append(
@@ -57,8 +63,8 @@ def simulate_golfer_orders(groups: List[Dict], order_probability_per_9_holes: fl
             )
 
         # Back nine (holes 10..18)
-        if random.random() < order_probability_per_9_holes:
-            hole_back = int(random.randint(10, 18))
+        if rng.random() < order_probability_per_9_holes:
+            hole_back = int(rng.randint(10, 18))
             start_node = int(round((hole_back - 1) * nodes_per_hole))
             order_time_back_s = tee_time_s + start_node * 60
             orders.append(
@@ -10,7 +10,8 @@ from datetime import datetime, timedelta
 from .services import DeliveryOrder
 from ..config.loaders import parse_hhmm_to_seconds_since_7am
 from ..utils import distribute_counts_by_fraction
-from .tracks import load_holes_connected_points
+from ..data.course_assets import get_course_assets
+from .rng import resolve_rng
 
 def calculate_delivery_order_probability_per_9_holes(total_orders: int, num_groups: int) -> float:
     if num_groups == 0 or total_orders == 0:
@@ -78,9 +79,9 @@ def generate_delivery_orders_with_pass_boost(
     boost_per_nine: float = 0.10,
     service_open_s: Optional[int] = None,
     opening_ramp_minutes: int = 0,
+    rng: Optional[random.Random] = None,
 ) -> List[DeliveryOrder]:
-    if rng_seed is not None:
-        random.seed(int(rng_seed))
+    rng = resolve_rng(rng, int(rng_seed) if rng_seed is not None else None)
 
     front_back_pass_by_group: Dict[int, Tuple[bool, bool]] = {}
     if crossings_data and isinstance(crossings_data, dict) and crossings_data.get("groups"):
@@ -105,7 +106,7 @@ def generate_delivery_orders_with_pass_boost(
         return max(0.0, min(1.0, float(x)))
 
     try:
-        total_nodes = len(load_holes_connected_points(course_dir)) if course_dir else 0
+        total_nodes = len(get_course_assets(course_dir).loop_points()) if course_dir else 0
     except Exception:
         total_nodes = 0
     total_nodes = int(total_nodes) if total_nodes and total_nodes > 0 else 18 * 12
@@ -120,14 +121,14 @@ def generate_delivery_orders_with_pass_boost(
         p_front = clamp01(base_prob_per_9 + (boost_per_nine if front_pass else 0.0))
         p_back = clamp01(base_prob_per_9 + (boost_per_nine if back_pass else 0.0))
 
-        hole_front = int(random.randint(1, 9))
+        hole_front = int(rng.randint(1, 9))
         start_node = int(round((hole_front - 1) * nodes_per_hole))
         end_node = int(round(hole_front * nodes_per_hole)) - 1
-        node_idx = start_node if end_node < start_node else random.randint(start_node, end_node)
+        node_idx = start_node if end_node < start_node else rng.randint(start_node, end_node)
         order_time_front_s = tee_time_s + int(node_idx) * 60
         
         if not isinstance(service_open_s, (int, float)) or order_time_front_s >= int(service_open_s):
-            if random.random() < p_front:
+            if rng.random() < p_front:
                 orders.append(
                     DeliveryOrder(
                         order_id=None,
@@ -138,14 +139,14 @@ def generate_delivery_orders_with_pass_boost(
                     )
                 )
 
-        hole_back = int(random.randint(10, 18))
+        hole_back = int(rng.randint(10, 18))
         start_node = int(round((hole_back - 1) * nodes_per_hole))
         end_node = int(round(hole_back * nodes_per_hole)) - 1
-        node_idx = start_node if end_node < start_node else random.randint(start_node, end_node)
+        node_idx = start_node if end_node < start_node else rng.randint(start_node, end_node)
         order_time_back_s = tee_time_s + int(node_idx) * 60
         
         if not isinstance(service_open_s, (int, float)) or order_time_back_s >= int(service_open_s):
-            if random.random() < p_back:
+            if rng.random() < p_back:
                 orders.append(
                     DeliveryOrder(
                         order_id=None,
@@ -175,14 +176,29 @@ def generate_delivery_orders_by_hour_distribution(
     rng_seed: Optional[int] = None,
     service_open_s: Optional[int] = None,
     blocked_holes: Optional[set[int]] = None,
+    rng: Optional[random.Random] = None,
+    common_random_numbers: bool = False,
 ) -> List[DeliveryOrder]:
     """
     Generates a list of delivery orders based on an hourly distribution of demand,
     ensuring that no orders are placed within the last hour of the service day.
+
+    Draws come from ``rng`` (a per-run stream, see golfsim.simulation.rng) when
+    given, else from ``random.Random(rng_seed)``, else from the global generator.
+
+    With ``common_random_numbers`` every order slot draws from its own substream
+    seeded up front, so for the same ``rng`` seed the blocked-hole retries of one
+    slot never shift the draws of later slots: variants that differ only in
+    ``blocked_holes`` get identical orders except where a slot landed on a
+    blocked hole and was redrawn within its hour.
     """
-    if rng_seed:
-        random.seed(rng_seed)
-        
+    rng = resolve_rng(rng, rng_seed if rng_seed else None)
+    # Hour slots first, then remainder slots
+    slot_seeds = [rng.getrandbits(64) for _ in range(2 * int(total_orders))] if common_random_numbers else []
+
+    def slot_rng(slot: int) -> random.Random:
+        return random.Random(slot_seeds[slot]) if common_random_numbers else rng
+
     _blocked_holes = blocked_holes or set()
 
     # --- MODIFICATION: Prevent orders in the last hour ---
@@ -211,7 +227,7 @@ def generate_delivery_orders_by_hour_distribution(
     counts = distribute_counts_by_fraction(total_orders, fractions)
 
     try:
-        total_nodes = len(load_holes_connected_points(course_dir)) if course_dir else 0
+        total_nodes = len(get_course_assets(course_dir).loop_points()) if course_dir else 0
     except Exception:
         total_nodes = 18 * 12
     total_nodes = int(total_nodes) if total_nodes and total_nodes > 0 else 18 * 12
@@ -237,6 +253,7 @@ def generate_delivery_orders_by_hour_distribution(
     orders: List[DeliveryOrder] = []
     _blocked_holes = set(blocked_holes) if blocked_holes else set()
 
+    slot = 0
     for idx, (hh, cnt) in enumerate(zip(hour_labels, counts)):
         start_s = hhmm_to_s(hh)
         end_s = min(start_s + 3600, close_s)
@@ -244,8 +261,10 @@ def generate_delivery_orders_by_hour_distribution(
             continue
         
         for _ in range(cnt):
+            draw = slot_rng(slot)
+            slot += 1
             for attempt in range(50):  # Try up to 5 times to place an order on an allowed hole
-                order_time_s = random.randint(start_s, end_s - 1)
+                order_time_s = draw.randint(start_s, end_s - 1)
                 if service_open_s is not None:
                     order_time_s = max(order_time_s, service_open_s)
                 
@@ -253,7 +272,7 @@ def generate_delivery_orders_by_hour_distribution(
                 if not active_groups:
                     continue
 
-                group = random.choice(active_groups)
+                group = draw.choice(active_groups)
                 hole = infer_hole_for_group_at_time(group, order_time_s)
                 
                 if hole not in _blocked_holes:
@@ -274,12 +293,13 @@ def generate_delivery_orders_by_hour_distribution(
         
         fallback_group = groups[0] if groups else {"group_id": 1, "tee_time_s": open_s}
 
-        for _ in range(num_to_add):
+        for extra in range(num_to_add):
+            draw = slot_rng(int(total_orders) + extra)
             for attempt in range(20): # More attempts to find a valid spot
-                order_time_s = random.randint(open_s, close_s - 1)
+                order_time_s = draw.randint(open_s, close_s - 1)
                 
                 active_groups = group_active_at(order_time_s)
-                group = random.choice(active_groups) if active_groups else fallback_group
+                group = draw.choice(active_groups) if active_groups else fallback_group
                 hole = infer_hole_for_group_at_time(group, order_time_s)
 
                 if hole not in _blocked_holes:
@@ -7,7 +7,11 @@ and related time formatting utilities.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .proximity_index import haversine_m_array
 
 
 def format_time_from_baseline(seconds_since_7am: int) -> str:
@@ -149,8 +153,26 @@ def find_proximity_pass_events(
     
     # Find common timestamps
     common_times = sorted(set(bev_by_time.keys()) & set(golfer_by_time.keys()))
-    
-    for timestamp in common_times:
+    if not common_times:
+        return pass_events
+
+    # Distances at every common timestamp in one vectorised pass; only the few
+    # in-range timestamps go through the sequential pass-interval rule below
+    def _coords(by_time: Dict[Any, Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        pts = [by_time[t] for t in common_times]
+        return (
+            np.asarray([p.get("latitude", 0.0) for p in pts], dtype=np.float64),
+            np.asarray([p.get("longitude", 0.0) for p in pts], dtype=np.float64),
+        )
+
+    bev_lats, bev_lons = _coords(bev_by_time)
+    golfer_lats, golfer_lons = _coords(golfer_by_time)
+    distances = haversine_m_array(bev_lats, bev_lons, golfer_lats, golfer_lons)
+    # Padded so the scalar re-check below decides boundary cases
+    in_range = np.flatnonzero(distances <= proximity_threshold_m + 1e-6)
+
+    for i in in_range.tolist():
+        timestamp = common_times[i]
         if timestamp < tee_time_s:
             continue
             
@@ -9,9 +9,8 @@ from __future__ import annotations
 
 import json
 import random
-import runpy
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 import simpy
 from shapely.geometry import LineString
@@ -19,6 +18,7 @@ from shapely.geometry import LineString
 from ..config.loaders import load_simulation_config, load_tee_times_config
 from ..io.results import write_unified_coordinates_csv, write_coordinates_csv_with_visibility
 from .bev_cart_pass import simulate_beverage_cart_sales
+from .golfer_track import GolferTrackTemplate
 from .engine import (
     get_node_timing,
     simulate_beverage_cart_gps
@@ -172,6 +172,9 @@ def generate_golfer_track(course_dir: str, tee_time_s: int) -> List[Dict]:
     - Emits one point per minute starting at tee_time_s
     - Only the first 300 nodes [0..299] are used to avoid stray tail nodes
 
+    The loop is built once per course (see ``golfsim.simulation.golfer_track``);
+    each call only offsets it by the tee time.
+
     Args:
         course_dir: Path to course directory
         tee_time_s: When golfer starts their round (seconds since 7 AM baseline)
@@ -179,100 +182,7 @@ def generate_golfer_track(course_dir: str, tee_time_s: int) -> List[Dict]:
     Returns:
         List of golfer GPS coordinate dicts with fields: latitude, longitude, timestamp, type
     """
-    from pathlib import Path
-    import pickle
-    import networkx as nx  # type: ignore
-    import runpy
-    import json
-
-    MAX_NODE_ID_INCLUSIVE = 299  # only use nodes with id in [0, 299]
-    MAX_GOLFER_NODES = 300
-
-    try:
-        # Prefer holes_connected_updated.geojson then holes_connected.geojson
-        holes_updated = Path(course_dir) / "geojson" / "generated" / "holes_connected_updated.geojson"
-        holes_original = Path(course_dir) / "geojson" / "generated" / "holes_connected.geojson"
-        holes_path = holes_updated if holes_updated.exists() else holes_original
-        if not holes_path.exists():
-            raise FileNotFoundError("holes_connected geojson not found")
-
-        with holes_path.open("r", encoding="utf-8") as f:
-            gj = json.load(f)
-
-        # Collect points with node_id in desired range and sort by node_id
-        filtered: List[Tuple[int, float, float]] = []  # (node_id, lon, lat)
-        for feat in (gj.get("features") or []):
-            if (feat.get("geometry", {}) or {}).get("type") != "Point":
-                continue
-            props = (feat.get("properties") or {})
-            node_id = None
-            if "node_id" in props:
-                try:
-                    node_id = int(props["node_id"])
-                except Exception:
-                    continue
-            elif "idx" in props:
-                try:
-                    node_id = int(props["idx"])
-                except Exception:
-                    continue
-            else:
-                continue
-            if node_id is None or node_id < 0 or node_id > MAX_NODE_ID_INCLUSIVE:
-                continue
-            coords = (feat.get("geometry") or {}).get("coordinates") or []
-            if not coords or len(coords) < 2:
-                continue
-            lon = float(coords[0])
-            lat = float(coords[1])
-            filtered.append((node_id, lon, lat))
-
-        filtered.sort(key=lambda t: t[0])
-
-        golfer_points: List[Dict] = []
-        timestamp = int(tee_time_s)
-        for _node_id, lon, lat in filtered:
-            golfer_points.append({
-                "latitude": float(lat),
-                "longitude": float(lon),
-                "timestamp": int(timestamp),
-                "type": "golfer",
-            })
-            timestamp += 60
-        return golfer_points
-    except Exception:
-        # Fallback for robustness: use cart_graph if holes_connected is missing,
-        # still clamping to first 300 integer nodes.
-        pkl_path = Path(course_dir) / "pkl" / "cart_graph.pkl"
-        if pkl_path.exists():
-            with open(pkl_path, "rb") as f:
-                G: nx.Graph = pickle.load(f)
-            int_nodes: List[int] = sorted([n for n in G.nodes if isinstance(n, int)])
-            ordered_nodes = int_nodes[:MAX_GOLFER_NODES]
-            golfer_points: List[Dict] = []
-            timestamp = int(tee_time_s)
-            for n in ordered_nodes:
-                data = G.nodes[n]
-                lon = float(data.get("x"))
-                lat = float(data.get("y"))
-                golfer_points.append({
-                    "latitude": lat,
-                    "longitude": lon,
-                    "timestamp": int(timestamp),
-                    "type": "golfer",
-                })
-                timestamp += 60
-            return golfer_points
-
-        # Legacy simple tracks fallback
-        gen_module = runpy.run_path("scripts/sim/generate_simple_tracks.py")
-        generate_tracks = gen_module["generate_tracks"]
-        tracks = generate_tracks(course_dir)
-        golfer_points: List[Dict] = tracks.get("golfer", [])[:MAX_GOLFER_NODES]
-        for p in golfer_points:
-            p["timestamp"] = int(p.get("timestamp", 0)) + int(tee_time_s)
-            p["type"] = p.get("type", "golfer")
-        return golfer_points
+    return GolferTrackTemplate.for_course(course_dir).points(tee_time_s, with_hole=False)
 
 
 def run_phase3_beverage_cart_simulation(
@@ -291,16 +201,16 @@ def run_phase3_beverage_cart_simulation(
     Returns:
         Dictionary with simulation results and metadata
     """
-    # Seed RNG for reproducibility
-    random.seed(run_idx)
+    # Per-run RNG for reproducibility
+    rng = random.Random(run_idx)
     
     # Load configuration
     sim_cfg = load_simulation_config(course_dir)
     # Random tee time between 09:00 and 11:00 (seconds since 07:00 baseline)
-    # Reproducible per run_idx due to seeding above
+    # Reproducible per run_idx via the per-run RNG above
     nine_am_s = (9 - 7) * 3600
     eleven_am_s = (11 - 7) * 3600
-    tee_time_s = int(random.randint(nine_am_s, eleven_am_s))
+    tee_time_s = int(rng.randint(nine_am_s, eleven_am_s))
     group = {"group_id": 1, "tee_time_s": int(tee_time_s), "num_golfers": 4}
     
     # Generate golfer track
@@ -326,8 +236,8 @@ def _run_standard_simulation(
     """Run standard Phase 3 simulation without synchronized timing."""
     tee_time_s = group["tee_time_s"]
     
-    # Ensure random seed is set for this specific simulation
-    random.seed(run_idx)
+    # Per-run RNG for this specific simulation
+    rng = random.Random(run_idx)
     
     # Compute crossings to determine when sales opportunities occur
     from .crossings import compute_crossings_from_files
@@ -375,6 +285,7 @@ def _run_standard_simulation(
         minutes_between_holes=2.0,
         golfer_points=golfer_points,
         crossings_data=crossings_data,
+        rng=rng,
     )
     
     # Generate beverage cart GPS using exact same nodes as crossings calculation
@@ -429,8 +340,8 @@ def _run_simplified_simulation(
     """Run simulation with simplified node-per-minute timing."""
     tee_time_s = group["tee_time_s"]
     
-    # Ensure random seed is set for this specific simulation
-    random.seed(run_idx)
+    # Per-run RNG for this specific simulation
+    rng = random.Random(run_idx)
     
     # Use simple node-per-minute timing
     node_timing = get_node_timing(
@@ -461,6 +372,7 @@ def _run_simplified_simulation(
         pass_order_probability=float(sim_cfg.bev_cart_order_probability_per_9_holes),
         price_per_order=float(sim_cfg.bev_cart_avg_order_usd),
         golfer_points=golfer_points,
+        rng=rng,
     )
     
     # Compute pass events using proximity-based detection
@@ -500,8 +412,8 @@ def run_phase4_beverage_cart_simulation(
     Returns:
         Dictionary with simulation results and metadata
     """
-    # Seed RNG for reproducibility
-    random.seed(run_idx)
+    # Per-run RNG for reproducibility
+    rng = random.Random(run_idx)
     
     # Load configuration
     sim_cfg = load_simulation_config(course_dir)
@@ -509,7 +421,7 @@ def run_phase4_beverage_cart_simulation(
     # Create 4 groups spaced 15 minutes apart, starting at random time between 09:00 and 10:00
     nine_am_s = (9 - 7) * 3600
     ten_am_s = (10 - 7) * 3600
-    first_tee_time_s = int(random.randint(nine_am_s, ten_am_s))
+    first_tee_time_s = int(rng.randint(nine_am_s, ten_am_s))
     
     groups = []
     all_golfer_points = []
@@ -549,8 +461,8 @@ def _run_phase4_standard_simulation(
 ) -> Dict:
     """Run standard Phase 4 simulation without synchronized timing."""
     
-    # Ensure random seed is set for this specific simulation
-    random.seed(run_idx)
+    # Per-run RNG for this specific simulation
+    rng = random.Random(run_idx)
     
     # Compute crossings for all groups to determine when sales opportunities occur
     from .crossings import compute_crossings_from_files
@@ -604,6 +516,7 @@ def _run_phase4_standard_simulation(
         minutes_per_hole=None,
         golfer_points=all_golfer_points,
         crossings_data=crossings_data,
+        rng=rng,
     )
     
     # Generate beverage cart GPS using exact same nodes as crossings calculation
@@ -661,8 +574,8 @@ def _run_phase4_simplified_simulation(
     """Run Phase 4 simulation with simplified node-per-minute timing."""
     first_tee_time_s = groups[0]["tee_time_s"]
     
-    # Ensure random seed is set for this specific simulation
-    random.seed(run_idx)
+    # Per-run RNG for this specific simulation
+    rng = random.Random(run_idx)
     
     # Use simple node-per-minute timing
     node_timing = get_node_timing(
@@ -693,6 +606,7 @@ def _run_phase4_simplified_simulation(
         pass_order_probability=float(sim_cfg.bev_cart_order_probability_per_9_holes),
         price_per_order=float(sim_cfg.bev_cart_avg_order_usd),
         golfer_points=all_golfer_points,
+        rng=rng,
     )
     
     # Compute pass events using proximity-based detection
@@ -734,9 +648,7 @@ def build_groups_from_scenario(
     Returns:
         List of group dictionaries with group_id, tee_time_s, num_golfers
     """
-    import random
-    
-    random.seed(random_seed)
+    rng = random.Random(random_seed)
     
     hourly_golfers = scenario_config.get("hourly_golfers", {})
     groups = []
@@ -770,7 +682,7 @@ def build_groups_from_scenario(
                 group_golfers = min(4, remaining_golfers)
                 
                 # Random tee time within this hour (0-3599 seconds)
-                random_offset_s = random.randint(0, 3599)
+                random_offset_s = rng.randint(0, 3599)
                 tee_time_s = base_time_s + random_offset_s
                 
                 groups.append({
@@ -816,9 +728,6 @@ def run_phase5_beverage_cart_simulation(
     Returns:
         Dictionary with simulation results and metadata
     """
-    # Seed RNG for reproducibility
-    random.seed(run_idx)
-    
     # Load configurations
     sim_cfg = load_simulation_config(course_dir)
     tee_times_cfg = load_tee_times_config(course_dir)
@@ -864,8 +773,8 @@ def _run_phase5_standard_simulation(
     scenario_name: str
 ) -> Dict:
     """Run standard Phase 5 simulation without synchronized timing."""
-    # Ensure random seed is set for this specific simulation
-    random.seed(run_idx)
+    # Per-run RNG for this specific simulation
+    rng = random.Random(run_idx)
     
     # Compute crossings for all groups to determine when sales opportunities occur
     from .crossings import compute_crossings_from_files
@@ -919,6 +828,7 @@ def _run_phase5_standard_simulation(
         minutes_per_hole=None,
         golfer_points=all_golfer_points,
         crossings_data=crossings_data,
+        rng=rng,
     )
     
     # Generate beverage cart GPS using exact same nodes as crossings calculation
@@ -978,8 +888,8 @@ def _run_phase5_simplified_simulation(
     """Run Phase 5 simulation with simplified node-per-minute timing."""
     first_tee_time_s = min(g["tee_time_s"] for g in groups)
     
-    # Ensure random seed is set for this specific simulation
-    random.seed(run_idx)
+    # Per-run RNG for this specific simulation
+    rng = random.Random(run_idx)
     
     # Use simple node-per-minute timing
     node_timing = get_node_timing(
@@ -1010,6 +920,7 @@ def _run_phase5_simplified_simulation(
         pass_order_probability=float(sim_cfg.bev_cart_order_probability_per_9_holes),
         price_per_order=float(sim_cfg.bev_cart_avg_order_usd),
         golfer_points=all_golfer_points,
+        rng=rng,
     )
     
     # Compute pass events using proximity-based detection
@@ -0,0 +1,160 @@
+"""
+Spatio-temporal grid index for proximity joins between GPS streams.
+
+Visibility tracking and pass detection ask "which cart points are within
+``radius`` metres of this golfer point at this time?" for every golfer point.
+``SpatioTemporalIndex`` buckets the indexed points by an integer time key and by
+a lat/lon grid cell at least ``cell_m`` metres on each side, so a query only
+looks at its own time bucket and the 3x3 neighbouring cells. Queries run as one
+vectorised join over all query points rather than a Python loop per point.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371000.0
+_M_PER_DEG = EARTH_RADIUS_M * math.pi / 180.0
+# Cells are padded slightly so great-circle vs grid-axis differences never drop a pair
+_CELL_PAD = 1.01
+
+
+def haversine_m_array(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorised great-circle distance in metres between (lat, lon) arrays."""
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = np.radians(np.subtract(lat2, lat1))
+    dlambda = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def nearest_time_index(sorted_times: np.ndarray, targets: np.ndarray, max_diff_s: float) -> np.ndarray:
+    """Index into ``sorted_times`` of the time nearest each target, or -1 beyond ``max_diff_s``.
+
+    Runs the same binary search as ``VisibilityTrackingService._find_nearest_timestamp``
+    for every target at once, so equidistant neighbours resolve the same way.
+    """
+    sorted_times = np.asarray(sorted_times)
+    targets = np.asarray(targets)
+    best = np.full(targets.shape, -1, dtype=np.int64)
+    if sorted_times.size == 0 or targets.size == 0:
+        return best
+    min_diff = np.full(targets.shape, np.inf)
+    left = np.zeros(targets.shape, dtype=np.int64)
+    right = np.full(targets.shape, sorted_times.size - 1, dtype=np.int64)
+    active = left <= right
+    while active.any():
+        mid = np.where(active, (left + right) // 2, 0)
+        value = sorted_times[mid]
+        diff = np.abs(value - targets)
+        better = active & (diff < min_diff)
+        best[better] = mid[better]
+        min_diff[better] = diff[better]
+        go_right = value < targets
+        left = np.where(active & go_right, mid + 1, left)
+        right = np.where(active & ~go_right, mid - 1, right)
+        active = left <= right
+    best[min_diff > max_diff_s] = -1
+    return best
+
+
+class SpatioTemporalIndex:
+    """Points bucketed by (time key, grid cell) for radius joins.
+
+    ``time_keys`` are non-negative integers (e.g. the index of the point's
+    timestamp or minute); points only match queries with the same key.
+    """
+
+    def __init__(self, time_keys, lat, lon, cell_m: float) -> None:
+        self.time_keys = np.asarray(time_keys, dtype=np.int64)
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        cell_m = max(float(cell_m), 1.0) * _CELL_PAD
+        # Points without a finite position or a time key never match
+        valid = np.flatnonzero(np.isfinite(self.lat) & np.isfinite(self.lon) & (self.time_keys >= 0))
+        # Longitude cells are sized at the highest latitude present so they are wide enough everywhere
+        max_abs_lat = float(np.abs(self.lat[valid]).max()) if valid.size else 0.0
+        self._dlat = cell_m / _M_PER_DEG
+        self._dlon = cell_m / (_M_PER_DEG * max(math.cos(math.radians(min(max_abs_lat, 89.9))), 1e-6))
+
+        cx, cy = self._cells(self.lat[valid], self.lon[valid])
+        self._cx0 = int(cx.min()) - 1 if cx.size else 0
+        self._cy0 = int(cy.min()) - 1 if cy.size else 0
+        self._wx = int(cx.max()) - self._cx0 + 2 if cx.size else 1
+        self._wy = int(cy.max()) - self._cy0 + 2 if cy.size else 1
+        keys = self._pack(self.time_keys[valid], cx - self._cx0, cy - self._cy0)
+        order = np.argsort(keys, kind="stable")
+        self._order = valid[order]
+        self._keys = keys[order]
+
+    def __len__(self) -> int:
+        return int(self.time_keys.size)
+
+    def _cells(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return np.floor(lon / self._dlon).astype(np.int64), np.floor(lat / self._dlat).astype(np.int64)
+
+    def _pack(self, t: np.ndarray, cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+        return (t * self._wx + cx) * self._wy + cy
+
+    def candidate_pairs(self, time_keys, lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+        """(query index, point index) pairs sharing a time key in neighbouring cells.
+
+        A superset of the pairs within ``cell_m``, sorted by query then point index.
+        """
+        t = np.asarray(time_keys, dtype=np.int64)
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        if not self._keys.size or not t.size:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        finite = np.isfinite(lat) & np.isfinite(lon) & (t >= 0)
+        cx = np.zeros(t.shape, dtype=np.int64)
+        cy = np.zeros(t.shape, dtype=np.int64)
+        cx[finite], cy[finite] = self._cells(lat[finite], lon[finite])
+        cx = cx - self._cx0
+        cy = cy - self._cy0
+
+        queries, starts, counts = [], [], []
+        query_idx = np.arange(t.size, dtype=np.int64)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                nx, ny = cx + dx, cy + dy
+                ok = finite & (nx >= 0) & (nx < self._wx) & (ny >= 0) & (ny < self._wy)
+                key = self._pack(t[ok], nx[ok], ny[ok])
+                lo = np.searchsorted(self._keys, key, side="left")
+                hi = np.searchsorted(self._keys, key, side="right")
+                hit = hi > lo
+                queries.append(query_idx[ok][hit])
+                starts.append(lo[hit])
+                counts.append((hi - lo)[hit])
+        q = np.concatenate(queries)
+        start = np.concatenate(starts)
+        count = np.concatenate(counts)
+        total = int(count.sum())
+        if not total:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        # Expand each [start, start + count) range of the sorted keys
+        first = np.cumsum(count) - count
+        pos = np.arange(total, dtype=np.int64) - np.repeat(first, count) + np.repeat(start, count)
+        q_pairs = np.repeat(q, count)
+        p_pairs = self._order[pos]
+        order = np.lexsort((p_pairs, q_pairs))
+        return q_pairs[order], p_pairs[order]
+
+    def within(self, time_keys, lat, lon, radius_m: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(query index, point index, distance_m) for pairs within ``radius_m``, sorted by query then point.
+
+        ``radius_m`` should not exceed the index's ``cell_m``.
+        """
+        q, p = self.candidate_pairs(time_keys, lat, lon)
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        dist = haversine_m_array(lat[q], lon[q], self.lat[p], self.lon[p])
+        keep = dist <= radius_m
+        return q[keep], p[keep], dist[keep]
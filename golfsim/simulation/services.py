@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -10,6 +11,7 @@ from ..config.loaders import load_simulation_config
 from ..logging import get_logger
 from ..io.results import SimulationResult
 from .. import utils
+from ..data.course_assets import get_course_assets
 from .order_generation import simulate_golfer_orders
 from .delivery_service_base import BaseDeliveryService, DeliveryOrder
 from .single_runner_service import SingleRunnerDeliveryService
@@ -31,6 +33,7 @@ def run_multi_golfer_simulation(
     create_visualization: bool = True,
     rng_seed: Optional[int] = None,
     use_golfer_graph: bool = True,  # Default to True for this simulation type
+    rng: Optional[random.Random] = None,
 ) -> Dict[str, Any]:
     """
     Run a simple multi-golfer simulation using a single runner queue.
@@ -53,6 +56,8 @@ def run_multi_golfer_simulation(
         Directory to save visualization PNG. If None, no visualization created.
     create_visualization: bool
         Whether to create delivery visualization PNG map.
+    rng: random.Random | None
+        Per-run random stream for order generation (takes precedence over rng_seed).
 
     Returns
     -------
@@ -69,7 +74,7 @@ def run_multi_golfer_simulation(
     )
 
     # Generate synthetic orders based on groups and probabilities
-    orders = simulate_golfer_orders(groups, order_probability_per_9_holes, rng_seed=rng_seed)
+    orders = simulate_golfer_orders(groups, order_probability_per_9_holes, rng_seed=rng_seed, rng=rng)
 
     def order_arrival_process():  # simpy process
         last_time = simulation_env.now
@@ -110,7 +115,7 @@ def run_multi_golfer_simulation(
             }
             for o in service.failed_orders
         ],
-        "activity_log": service.activity_log,
+        "activity_log": service.activity_log.to_records(),
         "metadata": {
             "prep_time_min": prep_time_min,
             "runner_speed_mps": runner_speed_mps,
@@ -157,13 +162,8 @@ def run_multi_golfer_simulation(
             course_data = load_course_geospatial_data(course_dir)
             
             # Try to load cart graph
-            cart_graph = None
             graph_filename = "cart_graph_golfers.pkl" if use_golfer_graph else "cart_graph.pkl"
-            cart_graph_path = Path(course_dir) / "pkl" / graph_filename
-            if cart_graph_path.exists():
-                import pickle
-                with open(cart_graph_path, "rb") as f:
-                    cart_graph = pickle.load(f)
+            cart_graph = get_course_assets(course_dir).cart_graph(graph_filename)
             
             # Create main visualization (all orders together)
             viz_path = output_path / "delivery_orders_map.png"
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+from .activity_log import ActivityType
 from .delivery_service_base import BaseDeliveryService, DeliveryOrder
 
 
@@ -25,10 +26,11 @@ class SingleRunnerDeliveryService(BaseDeliveryService):
                 o.failure_reason = f"Not dispatched within {int(self.queue_timeout_s/60)} minutes"
                 self.failed_orders.append(o)
                 self.log_activity(
-                    "order_failed_timeout",
-                    f"Order {o.order_id} exceeded timeout before departure; discarding",
+                    ActivityType.ORDER_FAILED_TIMEOUT,
+                    "Order {} exceeded timeout before departure; discarding",
                     o.order_id,
                     "clubhouse",
+                    args=(o.order_id,),
                 )
                 self.runner_busy = False
                 return
@@ -44,31 +46,35 @@ class SingleRunnerDeliveryService(BaseDeliveryService):
         queue_size = len(self.order_queue)
         if queue_size == 1:
             self.log_activity(
-                "order_received",
-                f"New order from Group {order.golfer_group_id} on Hole {order.hole_num} - Processing immediately",
+                ActivityType.ORDER_RECEIVED,
+                "New order from Group {} on Hole {} - Processing immediately",
                 order.order_id,
                 "clubhouse",
                 orders_in_queue=prior_queue_len,
+                hole=order.hole_num,
+                args=(order.golfer_group_id, order.hole_num),
             )
         else:
             self.log_activity(
-                "order_queued",
-                f"New order from Group {order.golfer_group_id} on Hole {order.hole_num} - Added to queue (position {queue_size})",
+                ActivityType.ORDER_QUEUED,
+                "New order from Group {} on Hole {} - Added to queue (position {})",
                 order.order_id,
                 "clubhouse",
                 orders_in_queue=prior_queue_len,
+                hole=order.hole_num,
+                args=(order.golfer_group_id, order.hole_num, queue_size),
             )
 
     def _delivery_service_process(self):  # simpy process
         if self.env.now < self.service_open_s:
             wait_time = self.service_open_s - self.env.now
-            self.log_activity("service_closed", f"Delivery service closed. Waiting {wait_time/60:.0f} minutes until opening", None, "clubhouse")
+            self.log_activity(ActivityType.SERVICE_CLOSED, "Delivery service closed. Waiting {:.0f} minutes until opening", None, "clubhouse", args=(wait_time / 60,))
             yield self.env.timeout(wait_time)
-            self.log_activity("service_opened", "Delivery service opened for business", None, "clubhouse")
+            self.log_activity(ActivityType.SERVICE_OPENED, "Delivery service opened for business", None, "clubhouse")
 
         while True:
             if self.env.now > self.service_close_s:
-                self.log_activity("service_closed", "Delivery service closed for the day. Remaining orders left unprocessed", None, "clubhouse")
+                self.log_activity(ActivityType.SERVICE_CLOSED, "Delivery service closed for the day. Remaining orders left unprocessed", None, "clubhouse")
                 for remaining in self.order_queue:
                     remaining.status = "failed"
                     remaining.failure_reason = "Service closed before order could be processed"
@@ -95,32 +101,34 @@ class SingleRunnerDeliveryService(BaseDeliveryService):
             order.failure_reason = f"Not dispatched within {int(self.queue_timeout_s/60)} minutes"
             self.failed_orders.append(order)
             self.log_activity(
-                "order_failed_timeout",
-                f"Order {order.order_id} exceeded timeout before processing (>{int(self.queue_timeout_s/60)} min)",
+                ActivityType.ORDER_FAILED_TIMEOUT,
+                "Order {} exceeded timeout before processing (>{} min)",
                 order.order_id,
                 self.runner_location,
+                args=(order.order_id, int(self.queue_timeout_s / 60)),
             )
             self.runner_busy = False
             return
         order.queue_delay_s = self.env.now - placed_time
         self.log_activity(
-            "processing_start",
-            f"Started processing Order {order.order_id} for Group {order.golfer_group_id} (waited {order.queue_delay_s/60:.1f} min in queue)",
+            ActivityType.PROCESSING_START,
+            "Started processing Order {} for Group {} (waited {:.1f} min in queue)",
             order.order_id,
+            args=(order.order_id, order.golfer_group_id, order.queue_delay_s / 60),
         )
 
         if self.runner_location != "clubhouse":
             return_time = self._calculate_return_time(self.runner_location)
-            self.log_activity("returning", f"Returning to clubhouse from {self.runner_location} ({return_time/60:.1f} min)", order.order_id, self.runner_location)
+            self.log_activity(ActivityType.RETURNING, "Returning to clubhouse from {} ({:.1f} min)", order.order_id, self.runner_location, args=(self.runner_location, return_time / 60))
             yield self.env.timeout(return_time)
             self.runner_location = "clubhouse"
-            self.log_activity("arrived_clubhouse", f"Arrived back at clubhouse to prepare Order {order.order_id}", order.order_id, "clubhouse")
+            self.log_activity(ActivityType.ARRIVED_CLUBHOUSE, "Arrived back at clubhouse to prepare Order {}", order.order_id, "clubhouse", args=(order.order_id,))
 
         order.prep_started_time = self.env.now
-        self.log_activity("prep_start", f"Started food preparation for Order {order.order_id} (Hole {order.hole_num})", order.order_id, "clubhouse")
+        self.log_activity(ActivityType.PREP_START, "Started food preparation for Order {} (Hole {})", order.order_id, "clubhouse", args=(order.order_id, order.hole_num))
         yield self.env.timeout(self.prep_time_s)
         order.prep_completed_time = self.env.now
-        self.log_activity("prep_complete", f"Completed food preparation for Order {order.order_id} ({self.prep_time_s/60:.0f} min)", order.order_id, "clubhouse")
+        self.log_activity(ActivityType.PREP_COMPLETE, "Completed food preparation for Order {} ({:.0f} min)", order.order_id, "clubhouse", args=(order.order_id, self.prep_time_s / 60))
 
         delivery_distance_m, delivery_time_s = self._calculate_delivery_details(order.hole_num)
         # Final pre-departure timeout check
@@ -129,15 +137,16 @@ class SingleRunnerDeliveryService(BaseDeliveryService):
             order.failure_reason = f"Not dispatched within {int(self.queue_timeout_s/60)} minutes"
             self.failed_orders.append(order)
             self.log_activity(
-                "order_failed_timeout",
-                f"Order {order.order_id} exceeded timeout before departure; discarding",
+                ActivityType.ORDER_FAILED_TIMEOUT,
+                "Order {} exceeded timeout before departure; discarding",
                 order.order_id,
                 "clubhouse",
+                args=(order.order_id,),
             )
             self.runner_busy = False
             return
         order.delivery_started_time = self.env.now
-        self.log_activity("delivery_start", f"Departing clubhouse to deliver Order {order.order_id} to Hole {order.hole_num} ({delivery_distance_m:.0f}m, {delivery_time_s/60:.1f} min)", order.order_id, "clubhouse")
+        self.log_activity(ActivityType.DELIVERY_START, "Departing clubhouse to deliver Order {} to Hole {} ({:.0f}m, {:.1f} min)", order.order_id, "clubhouse", hole=order.hole_num, args=(order.order_id, order.hole_num, delivery_distance_m, delivery_time_s / 60))
         yield self.env.timeout(delivery_time_s)
         order.delivered_time = self.env.now
         self.runner_location = f"hole_{order.hole_num}"
@@ -146,7 +155,7 @@ class SingleRunnerDeliveryService(BaseDeliveryService):
         order.total_completion_time_s = order.delivered_time - placed_time
         return_time_s = self._calculate_return_time(self.runner_location)
         total_drive_time_s = delivery_time_s + return_time_s
-        self.log_activity("delivery_complete", f"Delivered Order {order.order_id} to Group {order.golfer_group_id} at Hole {order.hole_num} (Total completion: {order.total_completion_time_s/60:.1f} min)", order.order_id, f"hole_{order.hole_num}")
+        self.log_activity(ActivityType.DELIVERY_COMPLETE, "Delivered Order {} to Group {} at Hole {} (Total completion: {:.1f} min)", order.order_id, self.runner_location, hole=order.hole_num, args=(order.order_id, order.golfer_group_id, order.hole_num, order.total_completion_time_s / 60))
         order.status = "processed"
         self.delivery_stats.append(
             {
@@ -167,8 +176,8 @@ class SingleRunnerDeliveryService(BaseDeliveryService):
 
         if self.order_queue:
             next_order = self.order_queue[0]
-            self.log_activity("queue_status", f"{len(self.order_queue)} orders waiting. Next: Order {next_order.order_id} for Group {next_order.golfer_group_id} on Hole {next_order.hole_num}", None, f"hole_{order.hole_num}")
+            self.log_activity(ActivityType.QUEUE_STATUS, "{} orders waiting. Next: Order {} for Group {} on Hole {}", None, self.runner_location, orders_in_queue=len(self.order_queue), args=(len(self.order_queue), next_order.order_id, next_order.golfer_group_id, next_order.hole_num))
         else:
-            self.log_activity("idle", f"No orders in queue. Runner waiting at Hole {order.hole_num}", None, f"hole_{order.hole_num}")
+            self.log_activity(ActivityType.IDLE, "No orders in queue. Runner waiting at Hole {}", None, self.runner_location, args=(order.hole_num,))
 
         self.runner_busy = False
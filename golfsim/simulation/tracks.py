@@ -7,11 +7,10 @@ for golfers, runners, and carts in the golf course simulation.
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
 from typing import Dict, List, Tuple, Any
 
-from golfsim.simulation.phase_simulations import generate_golfer_track
+from golfsim.data.course_assets import get_course_assets
+from golfsim.simulation.golfer_track import GolferTrackTemplate
 
 
 def ease_in_out_cubic(x: float) -> float:
@@ -29,40 +28,22 @@ def generate_golfer_points_for_groups(course_dir: str, groups: List[Dict]) -> Li
         groups: List of group dictionaries with 'tee_time_s' and 'group_id'
         
     Returns:
-        List of GPS points with group_id and hole number added to each point
+        List of GPS points with group_id and hole number added to each point.
+        The hole is paced evenly over the loop (nodes capped at 300, 18 holes).
     """
+    template = GolferTrackTemplate.for_course(course_dir)
     all_points: List[Dict] = []
-    
-    try:
-        total_nodes = len(load_holes_connected_points(course_dir))
-    except (FileNotFoundError, SystemExit):
-        total_nodes = 18 * 12  # Fallback if file is missing or invalid
-    # Clamp to a maximum of 300 nodes for golfer tracks
-    effective_total_nodes = min(int(total_nodes), 300)
-    nodes_per_hole = max(1.0, float(effective_total_nodes) / 18.0)
-
-    for g in groups:
-        tee_time_s = int(g["tee_time_s"])
-        pts = generate_golfer_track(course_dir, tee_time_s) or []
-        for p in pts:
-            p["group_id"] = g["group_id"]
-            
-            # Calculate current hole based on timestamp
-            time_since_tee_off_s = int(p["timestamp"]) - tee_time_s
-            node_idx = time_since_tee_off_s // 60  # Each node represents 1 minute
-            
-            # Assign hole number, ensuring it's within 1-18
-            hole = 1 + int(node_idx // nodes_per_hole)
-            p["hole"] = max(1, min(18, hole))
-
+    for _, pts in template.iter_groups(groups):
         all_points.extend(pts)
-        
     return all_points
 
 
 def load_holes_connected_points(course_dir: str) -> List[Tuple[float, float]]:
     """Load Point features from holes_connected.geojson or holes_connected_updated.geojson sorted by node_id.
 
+    Parsed points are cached per process (see ``golfsim.data.course_assets``);
+    the returned list is a fresh copy that callers may extend.
+
     Args:
         course_dir: Path to course directory
         
@@ -73,61 +54,7 @@ def load_holes_connected_points(course_dir: str) -> List[Tuple[float, float]]:
         FileNotFoundError: If neither holes_connected file is found
         SystemExit: If the file is invalid or contains no valid points
     """
-    # Try updated file first, then fall back to original
-    updated_path = Path(course_dir) / "geojson" / "generated" / "holes_connected_updated.geojson"
-    original_path = Path(course_dir) / "geojson" / "generated" / "holes_connected.geojson"
-    
-    path = None
-    if updated_path.exists():
-        path = updated_path
-    elif original_path.exists():
-        path = original_path
-    else:
-        raise FileNotFoundError(f"Neither holes_connected.geojson nor holes_connected_updated.geojson found")
-    
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            gj = json.load(f)
-    except Exception as e:  # noqa: BLE001
-        raise SystemExit(f"Failed reading {path.name}: {e}")
-
-    pts: Dict[int, Tuple[float, float]] = {}
-    for feat in (gj.get("features") or []):
-        if feat.get("geometry", {}).get("type") != "Point":
-            continue
-
-        geom = (feat or {}).get("geometry") or {}
-        if geom.get("type") != "Point":
-            continue
-        props = (feat or {}).get("properties") or {}
-        
-        # Support both old format (idx) and new format (node_id)
-        node_id = None
-        if "node_id" in props:
-            try:
-                node_id = int(props["node_id"])
-            except Exception:
-                continue
-        elif "idx" in props:
-            try:
-                node_id = int(props["idx"])
-            except Exception:
-                continue
-        else:
-            continue
-            
-        coords = geom.get("coordinates") or []
-        if not coords or len(coords) < 2:
-            continue
-        lon = float(coords[0])
-        lat = float(coords[1])
-        pts[node_id] = (lon, lat)
-
-    if not pts:
-        raise SystemExit(f"{path.name} contains no Point features with integer 'node_id' or 'idx'")
-
-    ordered = [pts[i] for i in sorted(pts.keys())]
-    return ordered
+    return list(get_course_assets(course_dir).loop_points())
 
 
 def generate_runner_to_golfer_rendezvous_points(
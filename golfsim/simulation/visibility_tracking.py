@@ -12,7 +12,10 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
+import numpy as np
+
 from golfsim.logging import get_logger
+from golfsim.simulation.proximity_index import SpatioTemporalIndex, nearest_time_index
 
 logger = get_logger(__name__)
 
@@ -118,73 +121,86 @@ class VisibilityTrackingService:
         golfer_points: List[Dict[str, Any]],
         cart_points: List[Dict[str, Any]]
     ) -> None:
-        """Process a batch of coordinates to detect visibility events."""
-        # Create timestamp-indexed lookups for cart points
-        cart_by_time_and_id: Dict[int, Dict[str, Dict]] = {}
-        cart_timestamps = set()
-        
+        """Process a batch of coordinates to detect visibility events.
+
+        Each golfer point is compared against every cart at the cart timestamp
+        nearest to it (within 5 minutes). Candidate pairs come from a
+        ``SpatioTemporalIndex`` join over all golfer points at once; sightings
+        are recorded in golfer point order, then cart order.
+        """
+        # One row per (timestamp, cart id); a repeated pair keeps the later point
+        row_by_key: Dict[Tuple[int, Any], int] = {}
+        cart_rows: List[Dict[str, Any]] = []
+        cart_row_ids: List[Any] = []
+        cart_row_ts: List[int] = []
         for point in cart_points:
             timestamp = int(point.get("timestamp", 0))
             cart_id = point.get("id", "unknown_cart")
-            cart_timestamps.add(timestamp)
-            
-            if timestamp not in cart_by_time_and_id:
-                cart_by_time_and_id[timestamp] = {}
-            cart_by_time_and_id[timestamp][cart_id] = point
-        
-        # Sort cart timestamps for efficient nearest-neighbor search
-        sorted_cart_timestamps = sorted(cart_timestamps)
-        
-        # Find the earliest golfer timestamp to establish round start
-        golfer_start_times = {}
-        for golfer_point in golfer_points:
-            golfer_id = golfer_point.get("id", "unknown_golfer")
-            timestamp = int(golfer_point.get("timestamp", 0))
-            if golfer_id not in golfer_start_times:
-                golfer_start_times[golfer_id] = timestamp
+            row = row_by_key.get((timestamp, cart_id))
+            if row is None:
+                row_by_key[(timestamp, cart_id)] = len(cart_rows)
+                cart_rows.append(point)
+                cart_row_ids.append(cart_id)
+                cart_row_ts.append(timestamp)
             else:
-                golfer_start_times[golfer_id] = min(golfer_start_times[golfer_id], timestamp)
-        
-        # Process each golfer point
-        for golfer_point in golfer_points:
-            golfer_timestamp = int(golfer_point.get("timestamp", 0))
-            golfer_id = golfer_point.get("id", "unknown_golfer")
-            golfer_lat = float(golfer_point.get("latitude", 0.0))
-            golfer_lon = float(golfer_point.get("longitude", 0.0))
-            hole_num = golfer_point.get("hole")
-            
-            # Find the nearest cart timestamp (within 5 minutes)
-            nearest_cart_timestamp = self._find_nearest_timestamp(
-                golfer_timestamp, sorted_cart_timestamps, max_diff_s=300
+                cart_rows[row] = point
+        if not cart_rows or not golfer_points:
+            return
+
+        cart_ts = np.asarray(cart_row_ts, dtype=np.int64)
+        cart_lat = np.asarray([float(p.get("latitude", 0.0)) for p in cart_rows], dtype=np.float64)
+        cart_lon = np.asarray([float(p.get("longitude", 0.0)) for p in cart_rows], dtype=np.float64)
+        sorted_cart_timestamps = np.unique(cart_ts)
+
+        golfer_ids = [p.get("id", "unknown_golfer") for p in golfer_points]
+        golfer_ts = np.asarray([int(p.get("timestamp", 0)) for p in golfer_points], dtype=np.int64)
+        golfer_lat = np.asarray([float(p.get("latitude", 0.0)) for p in golfer_points], dtype=np.float64)
+        golfer_lon = np.asarray([float(p.get("longitude", 0.0)) for p in golfer_points], dtype=np.float64)
+
+        # Earliest timestamp per golfer marks the start of their round
+        code_by_id: Dict[Any, int] = {}
+        golfer_codes = np.asarray([code_by_id.setdefault(g, len(code_by_id)) for g in golfer_ids], dtype=np.int64)
+        start_ts = np.full(len(code_by_id), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(start_ts, golfer_codes, golfer_ts)
+
+        # Nearest cart timestamp within 5 minutes; only sightings during or after the round count
+        time_key = nearest_time_index(sorted_cart_timestamps, golfer_ts, max_diff_s=300)
+        matched = time_key >= 0
+        matched[matched] = sorted_cart_timestamps[time_key[matched]] >= start_ts[golfer_codes[matched]]
+        time_key[~matched] = -1
+
+        threshold_m = self.thresholds.proximity_threshold_m
+        index = SpatioTemporalIndex(
+            np.searchsorted(sorted_cart_timestamps, cart_ts), cart_lat, cart_lon, cell_m=threshold_m
+        )
+        # Pad the vectorised radius test; pairs at the boundary are re-checked with the scalar distance
+        golfer_idx, cart_idx, distances = index.within(time_key, golfer_lat, golfer_lon, threshold_m + 1e-6)
+        boundary = set(np.flatnonzero(distances > threshold_m - 1e-6).tolist())
+
+        golfer_lat_l, golfer_lon_l = golfer_lat.tolist(), golfer_lon.tolist()
+        cart_lat_l, cart_lon_l = cart_lat.tolist(), cart_lon.tolist()
+        rows = zip(golfer_idx.tolist(), cart_idx.tolist(), distances.tolist())
+        for k, (gi, ci, distance_m) in enumerate(rows):
+            g_lat, g_lon = golfer_lat_l[gi], golfer_lon_l[gi]
+            c_lat, c_lon = cart_lat_l[ci], cart_lon_l[ci]
+            if k in boundary:
+                distance_m = self._haversine_distance_m(g_lat, g_lon, c_lat, c_lon)
+                if distance_m > threshold_m:
+                    continue
+            golfer_id = golfer_ids[gi]
+            # Record visibility event (use golfer timestamp for consistency)
+            event = VisibilityEvent(
+                timestamp_s=int(golfer_ts[gi]),
+                golfer_id=golfer_id,
+                cart_id=cart_row_ids[ci],
+                distance_m=distance_m,
+                golfer_position=(g_lat, g_lon),
+                cart_position=(c_lat, c_lon),
+                hole_num=golfer_points[gi].get("hole"),
             )
-            
-            if nearest_cart_timestamp is not None and nearest_cart_timestamp in cart_by_time_and_id:
-                for cart_id, cart_point in cart_by_time_and_id[nearest_cart_timestamp].items():
-                    cart_lat = float(cart_point.get("latitude", 0.0))
-                    cart_lon = float(cart_point.get("longitude", 0.0))
-                    
-                    distance_m = self._haversine_distance_m(
-                        golfer_lat, golfer_lon, cart_lat, cart_lon
-                    )
-                    
-                    if distance_m <= self.thresholds.proximity_threshold_m:
-                        # Only record sightings that happen during or after the golfer's round
-                        golfer_start_time = golfer_start_times.get(golfer_id, golfer_timestamp)
-                        if nearest_cart_timestamp >= golfer_start_time:
-                            # Record visibility event (use golfer timestamp for consistency)
-                            event = VisibilityEvent(
-                                timestamp_s=golfer_timestamp,
-                                golfer_id=golfer_id,
-                                cart_id=cart_id,
-                                distance_m=distance_m,
-                                golfer_position=(golfer_lat, golfer_lon),
-                                cart_position=(cart_lat, cart_lon),
-                                hole_num=hole_num
-                            )
-                            
-                            tracker = self.get_or_create_tracker(golfer_id)
-                            tracker.record_sighting(event)
-                            self.all_visibility_events.append(event)
+            tracker = self.get_or_create_tracker(golfer_id)
+            tracker.record_sighting(event)
+            self.all_visibility_events.append(event)
     
     def _find_nearest_timestamp(
         self, 
@@ -1,5 +1,4 @@
 from typing import List, Tuple, Optional, Union
-from pathlib import Path
 
 
 def seconds_to_clock_str(sec_since_7am: int) -> str:
@@ -52,65 +51,16 @@ def haversine_m(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
 def load_connected_points(course_dir: str) -> Tuple[List[Tuple[float, float]], List[Optional[int]]]:
     """Load per-minute loop points from holes_connected.geojson.
 
+    Parsing is cached per process by ``golfsim.data.course_assets``; the returned
+    lists are fresh copies.
+
     Returns:
         (coords_lonlat, hole_numbers)
     """
-    import json
-    # Local imports to avoid module-level dependency cycles
-    try:
-        from golfsim.simulation.crossings import load_holes_geojson, locate_hole_for_point  # type: ignore
-    except Exception:
-        load_holes_geojson = None  # type: ignore
-        locate_hole_for_point = None  # type: ignore
-    coords: List[Tuple[float, float]] = []
-    hole_nums: List[Optional[int]] = []
-    path = Path(course_dir) / "geojson" / "generated" / "holes_connected.geojson"
-    if not path.exists():
-        return [], []
-    data = json.loads(path.read_text(encoding="utf-8"))
-    features = data.get("features", []) if isinstance(data, dict) else []
-    # Optional hole polygons for labeling when Point properties absent
-    holes_fc = None
-    try:
-        if load_holes_geojson is not None:
-            holes_path = Path(course_dir) / "geojson" / "generated" / "holes_geofenced.geojson"
-            if holes_path.exists():
-                holes_fc = load_holes_geojson(str(holes_path))
-    except Exception:
-        holes_fc = None
-
-    # Use Point features only (no LineString resampling) and use embedded hole labels or polygon fallback
-    for feat in features:
-        if not isinstance(feat, dict):
-            continue
-        geom = feat.get("geometry") or {}
-        if geom.get("type") != "Point":
-            continue
-        coords_xy = geom.get("coordinates") or []
-        if not isinstance(coords_xy, (list, tuple)) or len(coords_xy) < 2:
-            continue
-        lon = float(coords_xy[0])
-        lat = float(coords_xy[1])
-        props = feat.get("properties") or {}
-        hn = (
-            props.get("hole_number")
-            or props.get("hole")
-            or props.get("hole_num")
-            or props.get("current_hole")
-        )
-        hole_num = None
-        try:
-            hole_num = int(hn) if hn is not None else None
-        except Exception:
-            hole_num = None
-        if hole_num is None and holes_fc is not None and locate_hole_for_point is not None:
-            try:
-                hole_num = locate_hole_for_point(lon=lon, lat=lat, holes=holes_fc)
-            except Exception:
-                hole_num = None
-        coords.append((lon, lat))
-        hole_nums.append(hole_num)
-    return coords, hole_nums
+    from golfsim.data.course_assets import get_course_assets
+
+    coords, hole_nums = get_course_assets(course_dir).connected_points()
+    return list(coords), list(hole_nums)
 
 
 from datetime import datetime
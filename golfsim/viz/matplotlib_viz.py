@@ -22,6 +22,8 @@ from shapely.geometry import LineString, Point
 
 from ..logging import get_logger
 from ..performance_logger import timed_visualization, timed_file_io
+from ..routing.distance_matrix import shortest_path_nodes
+from ..routing.networks import nearest_nodes
 
 logger = get_logger(__name__)
 
@@ -402,6 +404,13 @@ def plot_runner_route(ax, runner_df: Optional[pd.DataFrame], results: Dict, cour
             for _, row in holes_gdf.iterrows():
                 hole_locations[row['hole']] = (row.geometry.centroid.x, row.geometry.centroid.y)
 
+        # Snap the clubhouse and every hole centroid to the cart graph in one query
+        snap_keys = ['clubhouse'] + list(hole_locations.keys())
+        snap_coords = [clubhouse_coords] + list(hole_locations.values())
+        snapped = dict(zip(snap_keys, nearest_nodes(
+            cart_graph, [c[0] for c in snap_coords], [c[1] for c in snap_coords]
+        )))
+
         for i, order in enumerate(orders):
             hole_num = order.get('hole_num')
             hole_location = hole_locations.get(hole_num)
@@ -410,13 +419,13 @@ def plot_runner_route(ax, runner_df: Optional[pd.DataFrame], results: Dict, cour
                 continue
 
             try:
-                # Find nearest nodes in cart graph
-                clubhouse_node = _find_nearest_cart_node(cart_graph, clubhouse_coords)
-                hole_node = _find_nearest_cart_node(cart_graph, hole_location)
+                # Nearest nodes in cart graph (pre-snapped above)
+                clubhouse_node = snapped.get('clubhouse')
+                hole_node = snapped.get(hole_num)
 
                 if clubhouse_node and hole_node:
                     try:
-                        path = nx.shortest_path(cart_graph, clubhouse_node, hole_node, weight='length')
+                        path = shortest_path_nodes(cart_graph, clubhouse_node, hole_node)
                         
                         path_coords = []
                         for node in path:
@@ -751,27 +760,6 @@ def render_bev_cart_crossings(
             fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
         plt.close(fig)
 
-def _find_nearest_cart_node(cart_graph, target_coords):
-    """Find the nearest node in the cart graph to the target coordinates."""
-    if not cart_graph or not cart_graph.nodes:
-        return None
-        
-    min_distance = float('inf')
-    nearest_node = None
-    
-    for node, data in cart_graph.nodes(data=True):
-        if 'x' in data and 'y' in data:
-            # Calculate distance
-            dx = data['x'] - target_coords[0]
-            dy = data['y'] - target_coords[1]
-            distance = (dx*dx + dy*dy)**0.5
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_node = node
-                
-    return nearest_node
-
 
 def _add_path_arrows(ax, path_coords):
     """Add directional arrows along a path."""
@@ -199,9 +199,11 @@ def _create_group_name(parsed: Dict[str, str]) -> str:
         return "Other Simulations"
 
 
-def _sanitize_and_copy_coordinates_csv(source_path: str, target_path: str) -> None:
+def _sanitize_and_copy_coordinates_csv(source_path: str, target_path: str) -> Tuple[List[str], List[Dict[str, str]]]:
     """Copy coordinates.csv while removing leading runner clubhouse idle points and de-duping id+timestamp.
 
+    Returns the written field names and rows, so callers can reuse them without re-reading the copy.
+
     Rules:
     - For each runner stream (type == 'runner' or id startswith 'runner'), drop rows where hole == 'clubhouse'
       that occur strictly before the first non-clubhouse row for that runner.
@@ -282,6 +284,7 @@ def _sanitize_and_copy_coordinates_csv(source_path: str, target_path: str) -> No
         writer.writeheader()
         for r in deduped:
             writer.writerow(r)
+    return fieldnames, deduped
 
 def find_all_simulations() -> Dict[str, List[Tuple[str, str, str]]]:
     """
@@ -741,13 +744,14 @@ def copy_all_coordinate_files(all_simulations: Dict[str, List[Tuple[str, str, st
                 # Copy the file to all coordinates directories
                 all_copies_successful = True
                 sanitized_mode = (os.path.basename(source_path) == 'coordinates.csv')
+                sanitized: Optional[Tuple[List[str], List[Dict[str, str]]]] = None
                 for coordinates_dir in coordinates_dirs:
                     target_path = os.path.join(coordinates_dir, target_filename)
                     
                     # Copy the file (with optional sanitization for runner coordinates)
                     try:
                         if os.path.basename(source_path) == 'coordinates.csv':
-                            _sanitize_and_copy_coordinates_csv(source_path, target_path)
+                            sanitized = _sanitize_and_copy_coordinates_csv(source_path, target_path)
                         else:
                             shutil.copy2(source_path, target_path)
                     except Exception as e:
@@ -783,10 +787,25 @@ def copy_all_coordinate_files(all_simulations: Dict[str, List[Tuple[str, str, st
                     found_heatmap_filename: str | None = None
                     found_metrics_filename: str | None = None
                     found_hole_geojson_filename: str | None = None
+                    found_tracks_filename: str | None = None
                     orders_value: int | None = None
                     variant_key: str | None = "none"
                     blocked_holes: list[int] | None = []
 
+                    # Binary tracks (written with --binary-tracks): re-encode from the sanitized rows
+                    if sanitized is not None and os.path.exists(os.path.splitext(source_path)[0] + ".bin"):
+                        try:
+                            from golfsim.io.track_binary import write_tracks
+
+                            fieldnames, rows = sanitized
+                            tracks_columns = {f: [r.get(f) for r in rows] for f in fieldnames}
+                            tracks_filename = f"{scenario_id}.bin"
+                            for coordinates_dir in coordinates_dirs:
+                                write_tracks(tracks_columns, os.path.join(coordinates_dir, tracks_filename))
+                            found_tracks_filename = tracks_filename
+                        except Exception as e:
+                            print(f"⚠️  Warning: Could not write binary tracks for {display_name}: {e}")
+
                     # Heatmap files
                     for fname in os.listdir(csv_dir):
                         if fname in {"delivery_heatmap.png", "heatmap.png"}:
@@ -937,6 +956,8 @@ def copy_all_coordinate_files(all_simulations: Dict[str, List[Tuple[str, str, st
                         entry["metricsFilename"] = found_metrics_filename
                     if found_hole_geojson_filename:
                         entry["holeDeliveryGeojson"] = found_hole_geojson_filename
+                    if found_tracks_filename:
+                        entry["tracksFilename"] = found_tracks_filename
 
                     manifest["simulations"].append(entry)
                     print(f"✅ {display_name} ({source_size//1024:,} KB) - copied to all locations")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark dispatch policies on identical seeded order streams for every course.
+
+- Discovers courses under --courses-root (directories with config/simulation_config.json)
+- For each (course, runners, policy) runs --runs-per simulations in-process via
+  golfsim.simulation.batch.run_batch; run streams depend only on the seed, run
+  index, runner count, orders and blocked holes, so every policy sees the same
+  tee sheet and orders
+- Aggregates on-time rate, failed rate, p90 and orders per runner-hour and writes
+  a CSV + Markdown summary
+
+Example:
+  python scripts/optimization/benchmark_dispatch_policies.py \
+    --policies fifo edf nearest_hole zone \
+    --runners 2 3 \
+    --orders 30 \
+    --runs-per 10 \
+    --random-seed 42
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Ensure project root is importable
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from golfsim.config.models import SimulationConfig
+from golfsim.logging import init_logging
+from golfsim.simulation.batch import run_batch
+from golfsim.simulation.dispatch_policies import DISPATCH_POLICIES
+
+
+@dataclass
+class Agg:
+    on_time: float
+    failed: float
+    p90: float
+    oph: float
+    runs: int
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Compare dispatch policies on shared seeded order streams")
+    p.add_argument("--courses-root", default="courses")
+    p.add_argument("--courses", nargs="+", default=None, help="Course directory names under --courses-root (default: all)")
+    p.add_argument("--tee-scenario", default="real_tee_sheet")
+    p.add_argument("--policies", nargs="+", default=sorted(DISPATCH_POLICIES), choices=sorted(DISPATCH_POLICIES))
+    p.add_argument("--runners", nargs="+", type=int, default=[2])
+    p.add_argument("--orders", type=int, default=None, help="Orders per run (default: each course's config)")
+    p.add_argument("--runs-per", type=int, default=5)
+    p.add_argument("--random-seed", type=int, default=42)
+    p.add_argument("--log-level", default="WARNING")
+    p.add_argument("--exp-name", default=None)
+    p.add_argument("--output-root", default="outputs/experiments")
+    return p.parse_args()
+
+
+def discover_courses(root: Path, names: Optional[List[str]] = None) -> List[Path]:
+    dirs = [root / n for n in names] if names else sorted(p for p in root.iterdir() if p.is_dir())
+    return [d for d in dirs if (d / "config" / "simulation_config.json").exists()]
+
+
+def make_config(a: argparse.Namespace, course_dir: Path, runners: int, policy: str, out: Path) -> SimulationConfig:
+    args = argparse.Namespace(
+        course_dir=str(course_dir),
+        num_runs=int(a.runs_per),
+        output_dir=str(out),
+        log_level=a.log_level,
+        num_carts=0,
+        num_runners=int(runners),
+        groups_count=0,
+        tee_scenario=a.tee_scenario,
+        first_tee="09:00",
+        random_seed=int(a.random_seed),
+        dispatch_policy=policy,
+        minimal_outputs=True,
+        no_heatmap=True,
+    )
+    cfg = SimulationConfig.from_args(args)
+    if a.orders is not None:
+        cfg.delivery_total_orders = int(a.orders)
+    return cfg
+
+
+def mean(vals: Iterable[float]) -> float:
+    vals = list(vals)
+    return sum(vals) / len(vals) if vals else 0.0
+
+
+def aggregate(metrics: List[Any]) -> Agg:
+    return Agg(
+        on_time=mean(m.on_time_rate for m in metrics),
+        failed=mean(m.failed_rate for m in metrics),
+        p90=mean(m.delivery_cycle_time_p90 for m in metrics),
+        oph=mean(m.orders_per_runner_hour for m in metrics),
+        runs=len(metrics),
+    )
+
+
+def write_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not rows:
+        path.write_text("", encoding="utf-8")
+        return
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        w.writeheader()
+        for r in rows:
+            w.writerow(r)
+
+
+def main() -> None:
+    a = parse_args()
+    init_logging(a.log_level)
+    exp = a.exp_name or datetime.now().strftime("dispatch_%Y%m%d_%H%M%S")
+    root = Path(a.output_root) / exp
+    root.mkdir(parents=True, exist_ok=True)
+
+    courses = discover_courses(Path(a.courses_root), a.courses)
+    if not courses:
+        raise SystemExit(f"No courses with config/simulation_config.json under {a.courses_root}")
+
+    rows: List[Dict[str, Any]] = []
+    for course_dir in courses:
+        for n in a.runners:
+            configs = [make_config(a, course_dir, n, policy, root / course_dir.name) for policy in a.policies]
+            results = run_batch(configs)
+            for idx, policy in enumerate(a.policies):
+                agg = aggregate([r.metrics for r in results if r.config_index == idx])
+                rows.append({
+                    "course": course_dir.name,
+                    "tee_scenario": a.tee_scenario,
+                    "orders": int(configs[idx].delivery_total_orders),
+                    "num_runners": n,
+                    "policy": policy,
+                    "runs": agg.runs,
+                    "on_time_rate_mean": round(agg.on_time, 4),
+                    "failed_rate_mean": round(agg.failed, 4),
+                    "p90_mean": round(agg.p90, 2),
+                    "orders_per_runner_hour_mean": round(agg.oph, 3),
+                })
+                print(
+                    f"{course_dir.name} runners={n} {policy}: on-time {agg.on_time:.2%}, "
+                    f"p90 {agg.p90:.1f} min, O/R-hr {agg.oph:.2f}"
+                )
+
+    write_csv(root / "dispatch_policy_summary.csv", rows)
+
+    md = root / "dispatch_policy_summary.md"
+    lines = [f"## Dispatch policy benchmark: scenario {a.tee_scenario}, seed {a.random_seed}, {a.runs_per} runs each\n\n"]
+    lines.append("| course | runners | policy | on-time | failed | p90 (min) | orders/runner-hr |\n")
+    lines.append("|---|---|---|---|---|---|---|\n")
+    for r in rows:
+        lines.append(
+            f"| {r['course']} | {r['num_runners']} | {r['policy']} | {r['on_time_rate_mean']:.2%} | "
+            f"{r['failed_rate_mean']:.2%} | {r['p90_mean']:.1f} | {r['orders_per_runner_hour_mean']:.2f} |\n"
+        )
+    md.write_text("".join(lines), encoding="utf-8")
+
+    print(f"Done. Experiment directory: {root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,12 @@
 """
 Collect delivery_runner_metrics_run_*.json across an experiment tree into a flat CSV.
 
+When the root holds a sweep run store (runs.sqlite), rows are read from it instead,
+one per run, optionally filtered by orders/runners/variant.
+
 Usage:
   python scripts/optimization/collect_metrics_csv.py --root outputs/experiments/20250822_foo --out metrics_flat.csv
+  python scripts/optimization/collect_metrics_csv.py --root output/pinetree_country_club/20250822_real_tee_sheet --out p.csv --runners 2 --variant none
 """
 
 from __future__ import annotations
@@ -14,11 +18,17 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+from golfsim.io.run_store import RUN_STORE_FILENAME, RunStore
+
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Flatten metrics JSON into a CSV")
     p.add_argument("--root", required=True, help="Root directory to scan (experiment root)")
     p.add_argument("--out", required=True, help="Output CSV path")
+    p.add_argument("--store", default=None, help=f"Run store to read (default: <root>/{RUN_STORE_FILENAME} when present)")
+    p.add_argument("--orders", type=int, default=None, help="Only runs with this orders level (run store only)")
+    p.add_argument("--runners", type=int, default=None, help="Only runs with this runner count (run store only)")
+    p.add_argument("--variant", default=None, help="Only runs with this blocking variant key (run store only)")
     return p.parse_args()
 
 
@@ -52,30 +62,57 @@ FIELDS = [
 ]
 
 
-def main() -> None:
-    a = parse_args()
-    root = Path(a.root)
-    out_csv = Path(a.out)
-    out_csv.parent.mkdir(parents=True, exist_ok=True)
+def _base_row(root: Path, path: Path) -> Dict[str, Any]:
+    row: Dict[str, Any] = {"file": str(path.relative_to(root))}
+    # Extract triad name from path, e.g., "triad_1_3"
+    triad_part = [part for part in path.parts if "triad_" in part]
+    if triad_part:
+        row["triad"] = triad_part[0]
+    return row
+
 
+def rows_from_store(store: RunStore, root: Path, predicates: Dict[str, Any]) -> List[Dict[str, Any]]:
     rows: List[Dict[str, Any]] = []
-    for fp in find_metrics(root):
-        d = load_json(fp)
-        row: Dict[str, Any] = {
-            "file": str(fp.relative_to(root)),
-        }
-        
-        # Extract triad name from path, e.g., "triad_1_3"
+    for run in store.query_runs(**predicates):
+        run_dir = Path(run["run_dir"])
         try:
-            triad_part = [part for part in fp.parts if "triad_" in part]
-            if triad_part:
-                row["triad"] = triad_part[0]
-        except Exception:
-            pass
+            row = _base_row(root.resolve(), run_dir)
+        except ValueError:
+            # Run outside the root (store passed explicitly); keep the absolute path
+            row = {"file": str(run_dir)}
+        for k in FIELDS:
+            row[k] = run.get(k)
+        rows.append(row)
+    return rows
 
+
+def rows_from_json(root: Path) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for fp in find_metrics(root):
+        d = load_json(fp)
+        row = _base_row(root, fp)
         for k in FIELDS:
             row[k] = d.get(k)
         rows.append(row)
+    return rows
+
+
+def main() -> None:
+    a = parse_args()
+    root = Path(a.root)
+    out_csv = Path(a.out)
+    out_csv.parent.mkdir(parents=True, exist_ok=True)
+
+    store = RunStore(a.store) if a.store else RunStore.for_sweep(root)
+    predicates = {
+        k: v for k, v in (("orders", a.orders), ("runners", a.runners), ("variant_key", a.variant)) if v is not None
+    }
+    if store.exists():
+        rows = rows_from_store(store, root, predicates)
+    else:
+        if predicates:
+            print("Filters need a run store; ignoring --orders/--runners/--variant.")
+        rows = rows_from_json(root)
 
     if not rows:
         out_csv.write_text("", encoding="utf-8")
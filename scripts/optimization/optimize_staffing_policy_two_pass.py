@@ -11,11 +11,27 @@ Pass 2 (second_pass):
 
 Notes:
 - This substitutes the staged 4/8/8 logic with a simpler 10 + 10 confirmation.
+- With --adaptive-first-pass, first-pass combos stop replicating once their on-time
+  Wilson interval and p90 t-interval settle the targets, and the saved runs go to
+  borderline combos (same total budget).
+- With --runner-search monotone, each variant's runner counts are searched
+  (galloping, then bisection) for the minimal compliant staffing instead of
+  simulating the full range; --fill-frontier runs the skipped counts afterwards.
+- With --common-random-numbers (and a --random-seed), every combo of a replication
+  index sees the same tee sheet and order stream (blocked-hole orders are redrawn
+  within their hour), and each variant's aggregate gets paired differences against
+  the "none" variant with the same runner count (`paired_vs_baseline`).
+- Every run appends its metrics, orders and delivery stats to one SQLite run store
+  per sweep (`<root>/runs.sqlite`, see golfsim.io.run_store); aggregation and
+  heatmaps query it instead of reparsing per-run JSON (legacy roots still work).
 - Outputs are organized under `<output_root>/<stamp>_<scenario>/{first_pass|second_pass}/orders_XXX/...`.
 
 Example (single course):
   python scripts/optimization/optimize_staffing_policy_two_pass.py --course-dir courses/pinetree_country_club --tee-scenario real_tee_sheet --orders-levels 20 30 40 50 --runner-range 1-3 --concurrency 3
 
+Example (in-process worker pool; course assets loaded once per worker):
+  python scripts/optimization/optimize_staffing_policy_two_pass.py --course-dir courses/pinetree_country_club --tee-scenario real_tee_sheet --orders-levels 20 30 40 50 --runner-range 1-3 --concurrency 16 --executor process
+
 Example (all courses):
   python scripts/optimization/optimize_staffing_policy_two_pass.py --run-all-courses --tee-scenario real_tee_sheet --orders-levels 10 20 30 40 50 --runner-range 1-3 --concurrency 10
 """
@@ -27,12 +43,13 @@ import json
 import math
 import csv
 import os
+import random
 import re
 import shutil
 import subprocess
 import sys
 import statistics
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
@@ -43,7 +60,12 @@ import geopandas as gpd
 from golfsim.viz.heatmap_viz import create_course_heatmap
 
 # GEOJSON EXPORT
-from golfsim.viz.heatmap_viz import load_geofenced_holes
+from golfsim.viz.heatmap_viz import calculate_delivery_time_stats, extract_order_data, load_geofenced_holes
+
+# In-process sweep execution
+from golfsim.simulation.batch import SweepCombo, init_sweep_worker, run_sweep_combo
+from golfsim.analysis.staffing_search import MonotoneRunnerSearch
+from golfsim.io.run_store import RUN_STORE_FILENAME, RunStore
 
 # Optional .env loader (for GEMINI_API_KEY/GOOGLE_API_KEY)
 try:
@@ -57,6 +79,18 @@ class BlockingVariant:
     cli_flags: List[str]
     description: str
 
+    @property
+    def blocked_holes(self) -> Tuple[int, ...]:
+        """Hole numbers passed via --block-holes (used by the in-process executor)."""
+        if "--block-holes" not in self.cli_flags:
+            return ()
+        holes: List[int] = []
+        for flag in self.cli_flags[self.cli_flags.index("--block-holes") + 1 :]:
+            if flag.startswith("--"):
+                break
+            holes.append(int(flag))
+        return tuple(holes)
+
 
 BLOCKING_VARIANTS: List[BlockingVariant] = [
     BlockingVariant(key="none", cli_flags=[], description="no blocked holes"),
@@ -94,6 +128,24 @@ def wilson_ci(successes: int, total: int, confidence: float = 0.95) -> Tuple[flo
     return (max(0.0, lower), min(1.0, upper))
 
 
+# Two-sided 95% Student-t critical values by degrees of freedom; the largest
+# tabulated df not above the actual df is used (conservative), 1.96 beyond 30
+_T95_BY_DF = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+              9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 30: 2.042}
+
+
+def mean_ci(values: Iterable[float]) -> Tuple[float, float]:
+    """95% t-interval for the mean of per-run values; (nan, nan) with fewer than 2 values."""
+    vals = [float(v) for v in values if not math.isnan(v)]
+    if len(vals) < 2:
+        return (float("nan"), float("nan"))
+    df = len(vals) - 1
+    t = 1.96 if df > 30 else _T95_BY_DF[max(k for k in _T95_BY_DF if k <= df)]
+    half = t * statistics.stdev(vals) / math.sqrt(len(vals))
+    center = mean(vals)
+    return (center - half, center + half)
+
+
 @dataclass
 class RunMetrics:
     on_time_rate: float
@@ -112,6 +164,45 @@ class RunMetrics:
     total_revenue: Optional[float] = None
     failed_orders: Optional[int] = None
     active_runner_hours: Optional[float] = None
+    # Pass and run directory (e.g. "first_pass/run_03"); pairs runs across combos under CRN
+    replication: Optional[str] = None
+
+
+def replication_key(run_dir: Path) -> str:
+    """Replication id of a run dir: its pass directory name and run directory name."""
+    pass_name = next((p.name for p in run_dir.parents if p.name in ("first_pass", "second_pass")), "")
+    return f"{pass_name}/{run_dir.name}" if pass_name else run_dir.name
+
+
+def run_metrics_from_detailed(data: Dict[str, Any], delivery_stats: List[Dict[str, Any]]) -> RunMetrics:
+    """Build RunMetrics from delivery_runner_metrics JSON fields."""
+    queue_wait_avg = data.get("queue_wait_avg")
+    runner_utilization_driving_pct = data.get("runner_utilization_driving_pct")
+    runner_utilization_prep_pct = data.get("runner_utilization_prep_pct")
+    runner_utilization_pct = None
+    if runner_utilization_driving_pct is not None:
+        runner_utilization_pct = float(runner_utilization_driving_pct) + float(runner_utilization_prep_pct or 0.0)
+
+    total_revenue = data.get("total_revenue")
+    failed_orders = data.get("failed_orders")
+    active_runner_hours = data.get("active_runner_hours")
+
+    return RunMetrics(
+        on_time_rate=float(data.get("on_time_rate", 0.0) or 0.0),
+        failed_rate=float(data.get("failed_rate", 0.0) or 0.0),
+        p90=float(data.get("delivery_cycle_time_p90", 0.0) or 0.0),
+        avg=float(data.get("delivery_cycle_time_avg", 0.0) or 0.0),
+        orders_per_runner_hour=float(data.get("orders_per_runner_hour", 0.0) or 0.0),
+        successful_orders=int(data.get("successful_orders", data.get("successfulDeliveries", 0)) or 0),
+        total_orders=int(data.get("total_orders", data.get("totalOrders", 0)) or 0),
+        delivery_stats=delivery_stats,
+        queue_wait_avg=float(queue_wait_avg) if queue_wait_avg is not None else None,
+        runner_utilization_pct=runner_utilization_pct,
+        runner_utilization_driving_pct=float(runner_utilization_driving_pct) if runner_utilization_driving_pct is not None else None,
+        total_revenue=float(total_revenue) if total_revenue is not None else None,
+        failed_orders=int(failed_orders) if failed_orders is not None else None,
+        active_runner_hours=float(active_runner_hours) if active_runner_hours is not None else None,
+    )
 
 
 def load_one_run_metrics(run_dir: Path) -> Optional[RunMetrics]:
@@ -132,34 +223,7 @@ def load_one_run_metrics(run_dir: Path) -> Optional[RunMetrics]:
         except Exception:
             pass # Non-fatal if results.json is missing or malformed
 
-        # Extract new detailed metrics
-        queue_wait_avg = data.get("queue_wait_avg")
-        runner_utilization_driving_pct = data.get("runner_utilization_driving_pct")
-        runner_utilization_prep_pct = data.get("runner_utilization_prep_pct")
-        runner_utilization_pct = None
-        if runner_utilization_driving_pct is not None:
-            runner_utilization_pct = float(runner_utilization_driving_pct) + float(runner_utilization_prep_pct or 0.0)
-        
-        total_revenue = data.get("total_revenue")
-        failed_orders = data.get("failed_orders")
-        active_runner_hours = data.get("active_runner_hours")
-
-        return RunMetrics(
-            on_time_rate=float(data.get("on_time_rate", 0.0) or 0.0),
-            failed_rate=float(data.get("failed_rate", 0.0) or 0.0),
-            p90=float(data.get("delivery_cycle_time_p90", 0.0) or 0.0),
-            avg=float(data.get("delivery_cycle_time_avg", 0.0) or 0.0),
-            orders_per_runner_hour=float(data.get("orders_per_runner_hour", 0.0) or 0.0),
-            successful_orders=int(data.get("successful_orders", data.get("successfulDeliveries", 0)) or 0),
-            total_orders=int(data.get("total_orders", data.get("totalOrders", 0)) or 0),
-            delivery_stats=delivery_stats,
-            queue_wait_avg=float(queue_wait_avg) if queue_wait_avg is not None else None,
-            runner_utilization_pct=runner_utilization_pct,
-            runner_utilization_driving_pct=float(runner_utilization_driving_pct) if runner_utilization_driving_pct is not None else None,
-            total_revenue=float(total_revenue) if total_revenue is not None else None,
-            failed_orders=int(failed_orders) if failed_orders is not None else None,
-            active_runner_hours=float(active_runner_hours) if active_runner_hours is not None else None,
-        )
+        return run_metrics_from_detailed(data, delivery_stats)
 
     # Fallback simulation_metrics.json
     sm = run_dir / "simulation_metrics.json"
@@ -220,12 +284,67 @@ def load_one_run_metrics(run_dir: Path) -> Optional[RunMetrics]:
     return None
 
 
-def aggregate_runs(run_dirs: List[Path]) -> Dict[str, Any]:
+def load_runs_from_store(store: RunStore, run_dirs: List[Path]) -> Dict[Path, RunMetrics]:
+    """RunMetrics for the run dirs recorded in the run store (one query for runs, one for deliveries)."""
+    rows = store.query_runs(run_dirs=run_dirs)
+    if not rows:
+        return {}
+    stats_by_id = store.delivery_stats([r["id"] for r in rows])
+    by_key = {str(r["run_dir"]): r for r in rows}
+    out: Dict[Path, RunMetrics] = {}
+    for rd in run_dirs:
+        row = by_key.get(str(rd.resolve()))
+        if row is None:
+            continue
+        m = run_metrics_from_detailed(row, stats_by_id.get(row["id"], []))
+        m.replication = replication_key(rd)
+        # Per-runner utilisation comes from the stored simulation_metrics payload
+        dm = (row.get("simulation_metrics") or {}).get("deliveryMetrics") or {}
+        for runner_id, stats in (dm.get("runnerUtilizationByRunner") or {}).items():
+            if isinstance(stats, dict) and stats.get("utilizationPct") is not None:
+                m.runner_utilization_by_runner[runner_id] = float(stats["utilizationPct"])
+        out[rd] = m
+    return out
+
+
+def aggregate_runs(
+    run_dirs: List[Path], store: Optional[RunStore] = None, baseline: Optional[List[RunMetrics]] = None
+) -> Dict[str, Any]:
+    """Aggregate runs, reading the run store where it has them and per-run JSON otherwise.
+
+    With ``baseline`` (the runs of a comparison combo), paired differences are
+    added under ``paired_vs_baseline`` (see paired_differences).
+    """
+    stored = load_runs_from_store(store, run_dirs) if store is not None else {}
     items: List[RunMetrics] = []
     for rd in run_dirs:
-        m = load_one_run_metrics(rd)
+        m = stored.get(rd) or load_one_run_metrics(rd)
         if m is not None:
+            m.replication = replication_key(rd)
             items.append(m)
+    return aggregate_run_metrics(items, baseline)
+
+
+def paired_differences(items: List[RunMetrics], baseline: List[RunMetrics]) -> Dict[str, Any]:
+    """Per-replication differences (items minus baseline) with 95% t-intervals.
+
+    Runs are paired by replication id. Under common random numbers both runs of a
+    pair saw the same orders, so the demand noise cancels and the interval is far
+    narrower than the difference of two independent means.
+    """
+    by_rep = {m.replication: m for m in baseline if m.replication}
+    pairs = [(m, by_rep[m.replication]) for m in items if m.replication in by_rep]
+    out: Dict[str, Any] = {"pairs": len(pairs)}
+    for name in ("on_time_rate", "failed_rate", "p90", "avg"):
+        diffs = [getattr(a, name) - getattr(b, name) for a, b in pairs]
+        diffs = [d for d in diffs if not math.isnan(d)]
+        lo, hi = mean_ci(diffs)
+        out[name] = {"mean_diff": mean(diffs) if diffs else float("nan"), "ci_lo": lo, "ci_hi": hi, "n": len(diffs)}
+    return out
+
+
+def aggregate_run_metrics(items: List[RunMetrics], baseline: Optional[List[RunMetrics]] = None) -> Dict[str, Any]:
+    """Aggregate per-run metrics (loaded from run dirs or streamed from workers)."""
     if not items:
         return {"runs": 0}
 
@@ -257,6 +376,7 @@ def aggregate_runs(run_dirs: List[Path]) -> Dict[str, Any]:
     total_successes = sum(m.successful_orders for m in items)
     total_orders = sum(m.total_orders for m in items)
     ot_lo, ot_hi = wilson_ci(total_successes, total_orders, confidence=0.95)
+    p90_ci_lo, p90_ci_hi = mean_ci(p90_vals)
 
     # --- New Detailed Metrics Aggregation ---
     
@@ -337,6 +457,8 @@ def aggregate_runs(run_dirs: List[Path]) -> Dict[str, Any]:
         "on_time_mean": mean(on_time_vals),
         "failed_mean": mean(failed_vals),
         "p90_mean": mean(p90_vals) if p90_vals else float("nan"),
+        "p90_ci_lo": p90_ci_lo,
+        "p90_ci_hi": p90_ci_hi,
         "avg_delivery_time_mean": mean(avg_vals) if avg_vals else float("nan"),
         "oph_mean": mean(oph_vals),
         "avg_drive_time_per_hole": avg_drive_time_per_hole,
@@ -352,6 +474,7 @@ def aggregate_runs(run_dirs: List[Path]) -> Dict[str, Any]:
         "avg_queue_wait_minutes": avg_queue_wait_minutes,
         "delivery_time_histogram": delivery_time_histogram,
         "peak_hours_metrics": peak_metrics,
+        **({"paired_vs_baseline": paired_differences(items, baseline)} if baseline else {}),
     }
 
 
@@ -494,22 +617,37 @@ def _write_group_aggregate_heatmap(
     variant_key: str,
     runners: int,
     run_dirs: List[Path],
+    store: Optional[RunStore] = None,
 ) -> Optional[Path]:
     """Create a single averaged heatmap.png for a runners group by combining all runs.
 
-    The heatmap uses concatenated orders and delivery_stats from each run's results.json
-    and is written to `<group_dir>/heatmap.png`.
+    The heatmap uses concatenated orders and delivery_stats from each run (run store
+    rows when available, else the run's results.json) and is written to
+    `<group_dir>/heatmap.png`.
     """
     try:
+        stored: Dict[str, Dict[str, Any]] = {}
+        if store is not None:
+            rows = store.query_runs(run_dirs=run_dirs)
+            ids = [r["id"] for r in rows]
+            orders_by_id = store.orders(ids)
+            stats_by_id = store.delivery_stats(ids)
+            stored = {
+                str(r["run_dir"]): {"orders": orders_by_id[r["id"]], "delivery_stats": stats_by_id[r["id"]]}
+                for r in rows
+            }
+
         combined: Dict[str, Any] = {"orders": [], "delivery_stats": []}
         for rd in run_dirs:
-            rp = rd / "results.json"
-            if not rp.exists():
-                continue
-            try:
-                data = json.loads(rp.read_text(encoding="utf-8"))
-            except Exception:
-                continue
+            data = stored.get(str(rd.resolve()))
+            if data is None:
+                rp = rd / "results.json"
+                if not rp.exists():
+                    continue
+                try:
+                    data = json.loads(rp.read_text(encoding="utf-8"))
+                except Exception:
+                    continue
 
             # To avoid cross-run collisions where order_ids typically restart at 1
             # for every run, we rewrite order_id values with a run-specific suffix
@@ -1463,6 +1601,10 @@ def run_combo(
     runner_speed: Optional[float],
     prep_time: Optional[int],
     minimal_output: bool,
+    run_index_offset: int = 0,
+    run_store: Optional[str] = None,
+    random_seed: Optional[int] = None,
+    common_random_numbers: bool = False,
 ) -> None:
     out.mkdir(parents=True, exist_ok=True)
     cmd: List[str] = [
@@ -1497,9 +1639,129 @@ def run_combo(
         cmd += ["--runner-speed", str(runner_speed)]
     if prep_time is not None:
         cmd += ["--prep-time", str(prep_time)]
+    if run_index_offset:
+        cmd += ["--run-index-offset", str(run_index_offset)]
+    if run_store:
+        cmd += ["--run-store", run_store]
+    if random_seed is not None:
+        cmd += ["--random-seed", str(random_seed)]
+    if common_random_numbers:
+        cmd += ["--common-random-numbers"]
     subprocess.run(cmd, check=True)
 
 
+def _make_executor(args: argparse.Namespace, course_dir: Path) -> Executor:
+    """Executor for simulation combos.
+
+    ``subprocess``: threads that each block on a ``run_new.py`` child process.
+    ``process``: a process pool whose workers load the course assets once and run
+    combos in-process, streaming compact per-run metrics back.
+    """
+    if args.executor == "process":
+        return ProcessPoolExecutor(
+            max_workers=args.concurrency,
+            initializer=init_sweep_worker,
+            initargs=(str(course_dir), args.tee_scenario, args.log_level),
+        )
+    return ThreadPoolExecutor(max_workers=args.concurrency)
+
+
+def _submit_combo(
+    executor: Executor,
+    args: argparse.Namespace,
+    *,
+    course_dir: Path,
+    runners: int,
+    orders: int,
+    runs: int,
+    out: Path,
+    variant: BlockingVariant,
+    minimal_output: bool,
+    run_index_offset: int = 0,
+) -> Future:
+    """Submit one combo; process-mode futures resolve to compact per-run metrics."""
+    # Second-pass (full output) runs reuse run indices, so give them their own seed
+    random_seed = args.random_seed
+    if random_seed is not None and not minimal_output:
+        random_seed += 1
+    if args.executor == "process":
+        combo = SweepCombo(
+            num_runners=runners,
+            total_orders=orders,
+            num_runs=runs,
+            output_dir=str(out),
+            blocked_holes=variant.blocked_holes,
+            minimal_outputs=minimal_output,
+            runner_speed=args.runner_speed,
+            prep_time=args.prep_time,
+            run_index_offset=run_index_offset,
+            run_store=args.run_store,
+            random_seed=random_seed,
+            common_random_numbers=bool(args.common_random_numbers),
+        )
+        return executor.submit(run_sweep_combo, combo)
+    return executor.submit(
+        run_combo,
+        py=args.python_bin,
+        course_dir=course_dir,
+        scenario=args.tee_scenario,
+        runners=runners,
+        orders=orders,
+        runs=runs,
+        out=out,
+        log_level=args.log_level,
+        variant=variant,
+        runner_speed=args.runner_speed,
+        prep_time=args.prep_time,
+        minimal_output=minimal_output,
+        run_index_offset=run_index_offset,
+        run_store=args.run_store,
+        random_seed=random_seed,
+        common_random_numbers=bool(args.common_random_numbers),
+    )
+
+
+def _sweep_store(args: argparse.Namespace) -> Optional[RunStore]:
+    """The sweep's run store, or None when it has not been written (legacy output roots)."""
+    store = RunStore(args.run_store) if args.run_store else None
+    return store if store is not None and store.exists() else None
+
+
+def run_metrics_from_compact(item: Dict[str, Any], group_dir: Optional[Path] = None) -> RunMetrics:
+    """RunMetrics from one ``compact_run_metrics`` dict streamed by a pool worker."""
+    m = run_metrics_from_detailed(item.get("metrics") or {}, list(item.get("delivery_stats") or []))
+    if group_dir is not None:
+        m.replication = replication_key(group_dir / f"run_{int(item['run_idx']):02d}")
+    return m
+
+
+def _aggregate_group(
+    run_dirs: List[Path],
+    group_dirs: List[Path],
+    streamed: Dict[Path, List[RunMetrics]],
+    store: Optional[RunStore] = None,
+    baseline: Optional[List[RunMetrics]] = None,
+) -> Dict[str, Any]:
+    """Aggregate a combo from streamed worker metrics when every group has them, else from the store/disk."""
+    if group_dirs and all(d in streamed for d in group_dirs):
+        return aggregate_run_metrics([m for d in group_dirs for m in streamed[d]], baseline)
+    return aggregate_runs(run_dirs, store, baseline)
+
+
+def _export_run_hole_geojson(run_dir: Path, course_dir: Path) -> Optional[Path]:
+    """Write ``hole_delivery_times.geojson`` for a run, as run_new.py does for full-output runs."""
+    try:
+        results = json.loads((run_dir / "results.json").read_text(encoding="utf-8"))
+        hole_stats = calculate_delivery_time_stats(extract_order_data(results))
+        feature_collection = build_feature_collection(load_geofenced_holes(course_dir), hole_stats)
+        out_path = run_dir / "hole_delivery_times.geojson"
+        with out_path.open("w", encoding="utf-8") as f:
+            json.dump(feature_collection, f)
+        return out_path
+    except Exception:
+        return None
+
+
 def _collect_run_dirs(
     root: Path, orders: int, variant_key: str, runners: int, include_first: bool = True, include_second: bool = True
 ) -> List[Path]:
@@ -1532,6 +1794,215 @@ def meets_targets(agg: Dict[str, Any], args: argparse.Namespace) -> bool:
     )
 
 
+def replication_decision(agg: Dict[str, Any], args: argparse.Namespace) -> Optional[bool]:
+    """Sequential-test verdict for a combo's targets.
+
+    Returns False once the whole on-time Wilson interval is below ``target_on_time``
+    or the whole p90 interval is above ``max_p90``; True once ``meets_targets``
+    holds and the p90 interval is below ``max_p90`` (or no p90 data exists); None
+    while the combo is still borderline and more runs could change the outcome.
+    """
+    if not agg or not agg.get("runs"):
+        return None
+    p90_lo = float(agg.get("p90_ci_lo", float("nan")))
+    p90_hi = float(agg.get("p90_ci_hi", float("nan")))
+    if agg.get("on_time_wilson_hi", 1.0) < args.target_on_time:
+        return False
+    if not math.isnan(p90_lo) and p90_lo > args.max_p90:
+        return False
+    if meets_targets(agg, args):
+        if math.isnan(float(agg.get("p90_mean", float("nan")))):
+            return True
+        if not math.isnan(p90_hi) and p90_hi <= args.max_p90:
+            return True
+    return None
+
+
+def _borderline_rank(agg: Dict[str, Any], target_on_time: float) -> float:
+    """Distance of the on-time interval centre from target, in interval widths (lower = closer)."""
+    lo = float(agg.get("on_time_wilson_lo", 0.0))
+    hi = float(agg.get("on_time_wilson_hi", 1.0))
+    return abs((lo + hi) / 2.0 - target_on_time) / max(hi - lo, 1e-9)
+
+
+def _run_adaptive_first_pass(
+    executor: Executor,
+    args: argparse.Namespace,
+    *,
+    course_dir: Path,
+    root: Path,
+    orders: int,
+    combos_to_run: List[Tuple[BlockingVariant, int]],
+    streamed: Dict[Path, List[RunMetrics]],
+) -> Dict[Tuple[str, int], int]:
+    """First pass with early stopping; returns runs executed per (variant, runners).
+
+    Every combo starts with ``--adaptive-batch-runs`` runs. After each round,
+    combos whose targets are settled by ``replication_decision`` stop; borderline
+    combos (closest to the on-time target first) receive further rounds from the
+    budget the settled ones saved, up to ``--max-first-pass-runs`` each. The total
+    never exceeds ``--first-pass-runs`` times the number of combos.
+    """
+    step = max(1, int(args.adaptive_batch_runs))
+    cap = int(args.max_first_pass_runs or 2 * args.first_pass_runs)
+    combos: Dict[Tuple[str, int], Tuple[BlockingVariant, Path]] = {}
+    for variant, n in combos_to_run:
+        details = f"orders_{orders:03d}/runners_{n}/{variant.key}"
+        combos[(variant.key, n)] = (variant, root / "first_pass" / details)
+    budget = args.first_pass_runs * len(combos)
+    runs_done: Dict[Tuple[str, int], int] = {key: 0 for key in combos}
+    initial = max(1, min(step, args.first_pass_runs, cap))
+    pending: Dict[Tuple[str, int], int] = {key: initial for key in combos}
+
+    while pending:
+        futures: Dict[Any, Tuple[str, int]] = {}
+        for key, runs in pending.items():
+            variant, group_dir = combos[key]
+            fut = _submit_combo(
+                executor,
+                args,
+                course_dir=course_dir,
+                runners=key[1],
+                orders=orders,
+                runs=runs,
+                out=group_dir,
+                variant=variant,
+                minimal_output=True,
+                run_index_offset=runs_done[key],
+            )
+            futures[fut] = key
+        for fut in as_completed(futures):
+            key = futures[fut]
+            compact = fut.result()
+            if compact is not None:
+                streamed.setdefault(combos[key][1], []).extend(run_metrics_from_compact(c, combos[key][1]) for c in compact)
+        for key, runs in pending.items():
+            runs_done[key] += runs
+        budget -= sum(pending.values())
+
+        borderline: List[Tuple[float, Tuple[str, int]]] = []
+        for key, (variant, group_dir) in combos.items():
+            if runs_done[key] >= cap:
+                continue
+            run_dirs = _collect_run_dirs(
+                root, orders=orders, variant_key=variant.key, runners=key[1], include_first=True, include_second=False
+            )
+            agg = _aggregate_group(run_dirs, [group_dir], streamed, _sweep_store(args))
+            if replication_decision(agg, args) is None:
+                borderline.append((_borderline_rank(agg, args.target_on_time), key))
+        borderline.sort()
+
+        pending = {}
+        for _, key in borderline:
+            runs = min(step, cap - runs_done[key], budget - sum(pending.values()))
+            if runs <= 0:
+                break
+            pending[key] = runs
+
+    used = sum(runs_done.values())
+    print(f"Orders {orders}: adaptive first pass used {used} of {args.first_pass_runs * len(combos)} budgeted runs.")
+    return runs_done
+
+
+def _run_first_pass_combos(
+    executor: Executor,
+    args: argparse.Namespace,
+    *,
+    course_dir: Path,
+    root: Path,
+    orders: int,
+    combos_to_run: List[Tuple[BlockingVariant, int]],
+    streamed: Dict[Path, List[RunMetrics]],
+) -> None:
+    """Run first-pass combos (minimal outputs), adaptively when --adaptive-first-pass is set."""
+    if args.adaptive_first_pass:
+        _run_adaptive_first_pass(
+            executor,
+            args,
+            course_dir=course_dir,
+            root=root,
+            orders=orders,
+            combos_to_run=combos_to_run,
+            streamed=streamed,
+        )
+        return
+    future_to_group: Dict[Any, Path] = {}
+    for variant, n in combos_to_run:
+        group_dir = root / "first_pass" / f"orders_{orders:03d}/runners_{n}/{variant.key}"
+        fut = _submit_combo(
+            executor,
+            args,
+            course_dir=course_dir,
+            runners=n,
+            orders=orders,
+            runs=args.first_pass_runs,
+            out=group_dir,
+            variant=variant,
+            minimal_output=True,
+        )
+        future_to_group[fut] = group_dir
+    for fut in as_completed(future_to_group):
+        compact = fut.result()
+        if compact is not None:
+            group_dir = future_to_group[fut]
+            streamed[group_dir] = [run_metrics_from_compact(c, group_dir) for c in compact]
+
+
+def _search_runner_counts(
+    executor: Executor,
+    args: argparse.Namespace,
+    *,
+    course_dir: Path,
+    root: Path,
+    orders: int,
+    variants: List[BlockingVariant],
+    runner_values: List[int],
+    streamed: Dict[Path, List[RunMetrics]],
+) -> set:
+    """Monotone search for the minimal compliant runner count per variant.
+
+    Each round simulates one probe per unfinished variant (galloping, then
+    bisection; see MonotoneRunnerSearch) and judges it with ``meets_targets``.
+    With --fill-frontier the skipped runner counts are simulated afterwards so
+    reports still cover the whole range. Returns the (variant, runners) combos run.
+    """
+    searches = {v.key: MonotoneRunnerSearch(runner_values) for v in variants}
+    evaluated: set = set()
+    while True:
+        probes: List[Tuple[BlockingVariant, int]] = []
+        for variant in variants:
+            n = searches[variant.key].next_probe()
+            if n is not None:
+                probes.append((variant, n))
+        if not probes:
+            break
+        _run_first_pass_combos(
+            executor, args, course_dir=course_dir, root=root, orders=orders, combos_to_run=probes, streamed=streamed
+        )
+        for variant, n in probes:
+            evaluated.add((variant.key, n))
+            run_dirs = _collect_run_dirs(
+                root, orders=orders, variant_key=variant.key, runners=n, include_first=True, include_second=False
+            )
+            group_dir = root / "first_pass" / f"orders_{orders:03d}/runners_{n}/{variant.key}"
+            agg = _aggregate_group(run_dirs, [group_dir], streamed, _sweep_store(args))
+            searches[variant.key].record(n, meets_targets(agg, args))
+
+    for variant in variants:
+        minimal = searches[variant.key].minimal_runners
+        probed = sorted(searches[variant.key].outcomes)
+        print(f"Orders {orders} [{variant.key}]: minimal compliant runners = {minimal} (probed {probed})")
+
+    if args.fill_frontier:
+        rest = [(v, n) for v in variants for n in searches[v.key].unprobed()]
+        if rest:
+            _run_first_pass_combos(
+                executor, args, course_dir=course_dir, root=root, orders=orders, combos_to_run=rest, streamed=streamed
+            )
+            evaluated.update((v.key, n) for v, n in rest)
+    return evaluated
+
+
 def _publish_map_assets(*, optimization_root: Path, project_root: Path) -> None:
     """Finds and copies simulation artifacts to the map app's public directories."""
 
@@ -2435,6 +2906,26 @@ def main() -> None:
     p.add_argument("--runner-range", type=str, default="1-3")
     p.add_argument("--first-pass-runs", type=int, default=10, help="runs per combo in first pass (minimal outputs)")
     p.add_argument("--second-pass-runs", type=int, default=10, help="runs for winner confirmation in second pass (full outputs)")
+    p.add_argument(
+        "--adaptive-first-pass",
+        action="store_true",
+        help="Stop replicating first-pass combos once their on-time/p90 confidence intervals settle the targets; spend the saved runs on borderline combos",
+    )
+    p.add_argument("--adaptive-batch-runs", type=int, default=2, help="runs per combo per adaptive round (also the initial runs)")
+    p.add_argument("--max-first-pass-runs", type=int, default=None, help="per-combo cap in adaptive mode (default: 2x --first-pass-runs)")
+    p.add_argument(
+        "--runner-search",
+        choices=["grid", "monotone"],
+        default="grid",
+        help="grid: simulate every runner count; monotone: galloping/binary search for the minimal compliant runner count per variant",
+    )
+    p.add_argument("--fill-frontier", action="store_true", help="With --runner-search monotone, also simulate the skipped runner counts for reporting")
+    p.add_argument("--random-seed", type=int, default=None, help="Base seed for per-run order streams (second pass uses seed+1)")
+    p.add_argument(
+        "--common-random-numbers",
+        action="store_true",
+        help="All combos of a replication index share the tee sheet and order stream; adds paired differences vs the 'none' variant",
+    )
     p.add_argument("--python-bin", default=sys.executable)
     p.add_argument("--log-level", default="INFO")
     p.add_argument("--runner-speed", type=float, default=None)
@@ -2443,11 +2934,18 @@ def main() -> None:
     p.add_argument("--output-root", default=None, help="Base for outputs, defaults to output/<course_name>")
     p.add_argument("--summarize-only", action="store_true", help="Skip running sims; summarize an existing output root")
     p.add_argument("--existing-root", type=str, default=None, help="Path to existing optimization output root to summarize")
+    p.add_argument("--run-store", type=str, default=None, help=f"SQLite run store for the sweep (default: <root>/{RUN_STORE_FILENAME})")
     # Targets for recommendation
     p.add_argument("--target-on-time", type=float, default=0.90)
     p.add_argument("--max-failed-rate", type=float, default=0.05)
     p.add_argument("--max-p90", type=float, default=40.0)
     p.add_argument("--concurrency", type=int, default=max(1, min(4, (os.cpu_count() or 2))), help="max concurrent simulations")
+    p.add_argument(
+        "--executor",
+        choices=["subprocess", "process"],
+        default="subprocess",
+        help="subprocess: one run_new.py child per combo; process: in-process worker pool that loads course assets once per worker",
+    )
     p.add_argument("--auto-report", action="store_true", help="Automatically generate GM-friendly reports after simulations complete")
     args = p.parse_args()
 
@@ -2529,6 +3027,13 @@ def main() -> None:
             out_base = project_root / "output" / course_name
         root = out_base / f"{stamp}_{args.tee_scenario}"
 
+    if args.run_store is None:
+        args.run_store = str(root / RUN_STORE_FILENAME)
+    if args.common_random_numbers and args.random_seed is None and not args.summarize_only:
+        # Workers must agree on the base seed for streams to be shared
+        args.random_seed = random.SystemRandom().randrange(2**31)
+        print(f"Common random numbers: using --random-seed {args.random_seed}")
+
     # Identify orders levels
     if args.summarize_only:
         orders_found: List[int] = []
@@ -2567,47 +3072,58 @@ def main() -> None:
 
     summary: Dict[int, Dict[str, Any]] = {}
     csv_rows: List[Dict[str, Any]] = []
+    # Per-run metrics streamed back by process-mode workers, keyed by group output dir
+    streamed: Dict[Path, List[RunMetrics]] = {}
+    # One executor for the whole sweep so process-mode workers keep their course assets
+    executor: Optional[Executor] = None if args.summarize_only else _make_executor(args, course_dir)
 
     for orders in orders_iter:
         results_by_variant: Dict[str, Dict[int, Dict[str, Any]]] = {}
 
-        # First pass: run all combos (minimal outputs)
-        if not args.summarize_only:
-            future_to_combo: Dict[Any, Tuple[BlockingVariant, int, Path]] = {}
-            with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-                for variant in selected_variants:
-                    for n in runner_values:
-                        details = f"orders_{orders:03d}/runners_{n}/{variant.key}"
-                        out_dir = root / "first_pass" / details
-                        group_dir = root / "first_pass" / details
-                        fut = executor.submit(
-                            run_combo,
-                            py=args.python_bin,
-                            course_dir=course_dir,
-                            scenario=args.tee_scenario,
-                            runners=n,
-                            orders=orders,
-                            runs=args.first_pass_runs,
-                            out=out_dir,
-                            log_level=args.log_level,
-                            variant=variant,
-                            runner_speed=args.runner_speed,
-                            prep_time=args.prep_time,
-                            minimal_output=True,
-                        )
-                        future_to_combo[fut] = (variant, n, group_dir)
-                for fut in as_completed(future_to_combo):
-                    _ = fut.result()
-
-        # Aggregate after first pass (only first_pass runs for selection)
-        for variant in selected_variants:
+        # First pass: run all combos (minimal outputs), or only the runner counts a
+        # monotone search needs; evaluated stays None when every combo was run
+        evaluated: Optional[set] = None
+        if executor is not None and args.runner_search == "monotone":
+            evaluated = _search_runner_counts(
+                executor,
+                args,
+                course_dir=course_dir,
+                root=root,
+                orders=orders,
+                variants=selected_variants,
+                runner_values=runner_values,
+                streamed=streamed,
+            )
+        elif executor is not None:
+            _run_first_pass_combos(
+                executor,
+                args,
+                course_dir=course_dir,
+                root=root,
+                orders=orders,
+                combos_to_run=[(v, n) for v in selected_variants for n in runner_values],
+                streamed=streamed,
+            )
+
+        # Aggregate after first pass (only first_pass runs for selection); the "none"
+        # variant goes first so it can serve as the paired baseline under CRN
+        store = _sweep_store(args)
+        for variant in sorted(selected_variants, key=lambda v: v.key != "none"):
             for n in runner_values:
+                if evaluated is not None and (variant.key, n) not in evaluated:
+                    continue
                 details = f"orders_{orders:03d}/runners_{n}/{variant.key}"
                 group_dir = root / "first_pass" / details
                 run_dirs = _collect_run_dirs(
                     root, orders=orders, variant_key=variant.key, runners=n, include_first=True, include_second=False
                 )
-                agg = aggregate_runs(run_dirs)
+                baseline_agg = results_by_variant.get("none", {}).get(n) or {}
+                baseline = (
+                    baseline_agg.get("raw_metrics")
+                    if args.common_random_numbers and variant.key != "none"
+                    else None
+                )
+                agg = _aggregate_group(run_dirs, [group_dir], streamed, store, baseline)
                 results_by_variant.setdefault(variant.key, {})[n] = agg
                 context = _make_group_context(
                     course_dir=course_dir,
@@ -2625,6 +3141,7 @@ def main() -> None:
                     variant_key=variant.key,
                     runners=n,
                     run_dirs=run_dirs,
+                    store=store,
                 )
                 _write_group_delivery_geojson(
                     group_dir,
@@ -2669,30 +3186,30 @@ def main() -> None:
                 print(f"  - Candidate: {v_runners} runner(s) with policy: {desc}")
 
             # Second pass: run confirmation for all winners (full outputs)
-            if not args.summarize_only:
-                with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-                    futures = []
-                    for v_key, v_runners in winners:
-                        details = f"orders_{orders:03d}/runners_{v_runners}/{v_key}"
-                        out_dir = root / "second_pass" / details
-                        fut = executor.submit(
-                            run_combo,
-                            py=args.python_bin,
-                            course_dir=course_dir,
-                            scenario=args.tee_scenario,
-                            runners=v_runners,
-                            orders=orders,
-                            runs=args.second_pass_runs,
-                            out=out_dir,
-                            log_level=args.log_level,
-                            variant=next(v for v in BLOCKING_VARIANTS if v.key == v_key),
-                            runner_speed=args.runner_speed,
-                            prep_time=args.prep_time,
-                            minimal_output=False,
-                        )
-                        futures.append(fut)
-                    for fut in as_completed(futures):
-                        _ = fut.result()
+            if executor is not None:
+                second_futures: Dict[Any, Path] = {}
+                for v_key, v_runners in winners:
+                    details = f"orders_{orders:03d}/runners_{v_runners}/{v_key}"
+                    out_dir = root / "second_pass" / details
+                    fut = _submit_combo(
+                        executor,
+                        args,
+                        course_dir=course_dir,
+                        runners=v_runners,
+                        orders=orders,
+                        runs=args.second_pass_runs,
+                        out=out_dir,
+                        variant=next(v for v in BLOCKING_VARIANTS if v.key == v_key),
+                        minimal_output=False,
+                    )
+                    second_futures[fut] = out_dir
+                for fut in as_completed(second_futures):
+                    compact = fut.result()
+                    if compact is not None:
+                        streamed[second_futures[fut]] = [
+                            run_metrics_from_compact(c, second_futures[fut]) for c in compact
+                        ]
+                        _export_run_hole_geojson(second_futures[fut] / "run_01", course_dir)
 
             # Re-aggregate winners including both passes
             for v_key, v_runners in winners:
@@ -2701,7 +3218,9 @@ def main() -> None:
                 win_run_dirs = _collect_run_dirs(
                     root, orders=orders, variant_key=v_key, runners=v_runners, include_first=True, include_second=True
                 )
-                win_agg = aggregate_runs(win_run_dirs)
+                win_agg = _aggregate_group(
+                    win_run_dirs, [root / "first_pass" / details, group_dir], streamed, store
+                )
                 results_by_variant.setdefault(v_key, {})[v_runners] = win_agg
                 win_context = _make_group_context(
                     course_dir=course_dir,
@@ -2718,6 +3237,7 @@ def main() -> None:
                     variant_key=v_key,
                     runners=v_runners,
                     run_dirs=win_run_dirs,
+                    store=store,
                 )
                 _write_group_delivery_geojson(
                     group_dir,
@@ -2771,6 +3291,9 @@ def main() -> None:
             },
         }
 
+    if executor is not None:
+        executor.shutdown()
+
     # Print machine-readable JSON at the end (with serialization fix)
     def make_serializable(obj):
         """Convert non-serializable objects to serializable format"""
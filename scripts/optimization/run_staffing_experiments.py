@@ -8,6 +8,9 @@ Strategy:
 - For each scenario/order/runner/sensitivity combo, run scripts/sim/run_new.py with an explicit --output-dir
 - Parse delivery_runner_metrics_run_*.json metrics per run and aggregate
 - Produce staffing curve summary CSV and hole restriction recommendations (markdown)
+- With --runner-search monotone, only the runner counts needed to find the minimal
+  compliant staffing are simulated (galloping + binary search); --fill-frontier
+  simulates the rest afterwards for complete reports
 
 Usage (example):
   python scripts/optimization/run_staffing_experiments.py \
@@ -42,6 +45,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from golfsim.analysis.staffing_search import MonotoneRunnerSearch
+
 
 @dataclass
 class BlockingVariant:
@@ -112,6 +117,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--base-seed", type=int, help="Base seed for reproducible runs (each run gets base_seed + run_number)")
     parser.add_argument("--max-retries", type=int, default=2, help="Maximum retries for failed runs")
     parser.add_argument("--run-blocking-variants", action="store_true", help="Run all four blocking variants for each combination")
+    # Runner search
+    parser.add_argument("--runner-search", choices=["grid", "monotone"], default="grid", help="grid: simulate every runner count; monotone: galloping/binary search for the minimal compliant runner count")
+    parser.add_argument("--fill-frontier", action="store_true", help="With --runner-search monotone, also simulate the skipped runner counts for reporting")
     return parser.parse_args()
 
 
@@ -511,6 +519,51 @@ def run_combo_job(job: ComboJob) -> Tuple[str, int, int, str, bool, Optional[Met
         return (job.scenario, job.orders, job.num_runners, job.variant_key, False, None)
 
 
+def execute_jobs(
+    all_jobs: List[ComboJob], parallel_jobs: int
+) -> Tuple[Dict[Tuple[str, int, int, str], MetricsAggregate], List[Tuple[str, int, int, str]]]:
+    """Run jobs (in parallel when requested); returns (aggregates by combo key, failed combo keys)."""
+    job_results: Dict[Tuple[str, int, int, str], MetricsAggregate] = {}
+    failed_jobs: List[Tuple[str, int, int, str]] = []
+    
+    if parallel_jobs > 1 and len(all_jobs) > 1:
+        print(f"Running jobs in parallel with {parallel_jobs} workers")
+        with ProcessPoolExecutor(max_workers=parallel_jobs) as executor:
+            # Submit all jobs
+            future_to_job = {executor.submit(run_combo_job, job): job for job in all_jobs}
+            
+            # Collect results as they complete
+            for future in as_completed(future_to_job):
+                job = future_to_job[future]
+                try:
+                    scenario, orders, num_runners, variant_key, success, agg = future.result()
+                    if success and agg:
+                        job_results[(scenario, orders, num_runners, variant_key)] = agg
+                        print(f"✅ Completed {scenario}/orders_{orders:03d}/runners_{num_runners}/{variant_key}")
+                    else:
+                        failed_jobs.append((scenario, orders, num_runners, variant_key))
+                        print(f"❌ Failed {scenario}/orders_{orders:03d}/runners_{num_runners}/{variant_key}")
+                except Exception as e:
+                    failed_jobs.append((job.scenario, job.orders, job.num_runners, job.variant_key))
+                    print(f"❌ Exception in {job.scenario}/orders_{job.orders:03d}/runners_{job.num_runners}/{job.variant_key}: {e}")
+    else:
+        print("Running jobs sequentially")
+        for job in all_jobs:
+            try:
+                scenario, orders, num_runners, variant_key, success, agg = run_combo_job(job)
+                if success and agg:
+                    job_results[(scenario, orders, num_runners, variant_key)] = agg
+                    print(f"✅ Completed {scenario}/orders_{orders:03d}/runners_{num_runners}/{variant_key}")
+                else:
+                    failed_jobs.append((scenario, orders, num_runners, variant_key))
+                    print(f"❌ Failed {scenario}/orders_{orders:03d}/runners_{num_runners}/{variant_key}")
+            except Exception as e:
+                failed_jobs.append((job.scenario, job.orders, job.num_runners, job.variant_key))
+                print(f"❌ Exception in {job.scenario}/orders_{job.orders:03d}/runners_{job.num_runners}/{job.variant_key}: {e}")
+
+    return job_results, failed_jobs
+
+
 def write_staffing_csv(
     csv_path: Path,
     rows: List[Dict[str, Any]],
@@ -571,90 +624,114 @@ def main() -> None:
     # For hole policy recommendations (1 runner only)
     one_runner_aggs: Dict[Tuple[str, int], MetricsAggregate] = {}
 
-    # Prepare all jobs
-    all_jobs = []
-    
     variants_to_run = BLOCKING_VARIANTS if args.run_blocking_variants else [BLOCKING_VARIANTS[0]]
 
+    def build_job(scenario: str, orders: int, n_runners: int, variant: BlockingVariant) -> ComboJob:
+        out_dir = exp_root / scenario / f"orders_{orders:03d}" / f"runners_{n_runners}" / variant.key
+        # Calculate seed for this job
+        job_seed = None
+        if args.base_seed is not None:
+            # Create unique seed based on scenario, orders, runners, and variant
+            job_seed = args.base_seed + hash(f"{scenario}_{orders}_{n_runners}_{variant.key}") % 10000
+        return ComboJob(
+            scenario=scenario,
+            orders=orders,
+            num_runners=n_runners,
+            course_dir=course_copies[scenario],
+            output_dir=out_dir,
+            python_bin=args.python_bin,
+            runs_per=args.runs_per,
+            runner_speed=args.runner_speed,
+            prep_time=args.prep_time,
+            log_level=args.log_level,
+            base_seed=job_seed,
+            max_retries=args.max_retries,
+            variant_key=variant.key,
+            # Orders are passed explicitly: jobs for several order levels share one course copy
+            extra_cli_args=list(variant.cli_flags) + ["--delivery-total-orders", str(orders)],
+        )
+
+    def is_resumable(job: ComboJob) -> bool:
+        return bool(args.resume and not args.force and is_combo_complete(job.output_dir, args.runs_per))
+
     for scenario in args.tee_scenarios:
         for orders in args.order_levels:
             # Update config in the copied course dir
             update_sim_config(course_copies[scenario], delivery_total_orders=orders, opening_ramp_min=args.opening_ramp_min)
 
-            for n_runners in runner_values:
-                for variant in variants_to_run:
-                    out_dir = exp_root / scenario / f"orders_{orders:03d}" / f"runners_{n_runners}" / variant.key
-                    
-                    # Check if we should skip this combination
-                    if args.resume and not args.force and is_combo_complete(out_dir, args.runs_per):
-                        print(f"Skipping {scenario}/orders_{orders:03d}/runners_{n_runners}/{variant.key} (already complete)")
-                        continue
-                    
-                    # Calculate seed for this job
-                    job_seed = None
-                    if args.base_seed is not None:
-                        # Create unique seed based on scenario, orders, runners, and variant
-                        job_seed = args.base_seed + hash(f"{scenario}_{orders}_{n_runners}_{variant.key}") % 10000
-                    
-                    job = ComboJob(
-                        scenario=scenario,
-                        orders=orders,
-                        num_runners=n_runners,
-                        course_dir=course_copies[scenario],
-                        output_dir=out_dir,
-                        python_bin=args.python_bin,
-                        runs_per=args.runs_per,
-                        runner_speed=args.runner_speed,
-                        prep_time=args.prep_time,
-                        log_level=args.log_level,
-                        base_seed=job_seed,
-                        max_retries=args.max_retries,
-                        variant_key=variant.key,
-                        extra_cli_args=variant.cli_flags,
-                    )
-                    all_jobs.append(job)
-
-    print(f"Prepared {len(all_jobs)} jobs to execute")
-    
-    # Execute jobs (parallel or sequential)
-    job_results = {}
-    failed_jobs = []
-    
-    if args.parallel_jobs > 1 and len(all_jobs) > 1:
-        print(f"Running jobs in parallel with {args.parallel_jobs} workers")
-        with ProcessPoolExecutor(max_workers=args.parallel_jobs) as executor:
-            # Submit all jobs
-            future_to_job = {executor.submit(run_combo_job, job): job for job in all_jobs}
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_job):
-                job = future_to_job[future]
-                try:
-                    scenario, orders, num_runners, variant_key, success, agg = future.result()
-                    if success and agg:
-                        job_results[(scenario, orders, num_runners, variant_key)] = agg
-                        print(f"✅ Completed {scenario}/orders_{orders:03d}/runners_{num_runners}/{variant_key}")
-                    else:
-                        failed_jobs.append((scenario, orders, num_runners, variant_key))
-                        print(f"❌ Failed {scenario}/orders_{orders:03d}/runners_{num_runners}/{variant_key}")
-                except Exception as e:
-                    failed_jobs.append((job.scenario, job.orders, job.num_runners, job.variant_key))
-                    print(f"❌ Exception in {job.scenario}/orders_{job.orders:03d}/runners_{job.num_runners}/{job.variant_key}: {e}")
+    if args.runner_search == "monotone":
+        # Search each (scenario, orders, variant) for its minimal compliant runner count,
+        # running one probe per search per round
+        searches: Dict[Tuple[str, int, str], MonotoneRunnerSearch] = {
+            (scenario, orders, variant.key): MonotoneRunnerSearch(runner_values)
+            for scenario in args.tee_scenarios
+            for orders in args.order_levels
+            for variant in variants_to_run
+        }
+        variant_by_key = {v.key: v for v in variants_to_run}
+        job_results: Dict[Tuple[str, int, int, str], MetricsAggregate] = {}
+        failed_jobs: List[Tuple[str, int, int, str]] = []
+
+        def record(job: ComboJob, agg: Optional[MetricsAggregate]) -> None:
+            meets = agg is not None and meets_targets(
+                agg, target_on_time=args.target_on_time, max_failed=args.max_failed_rate, max_p90=args.max_p90
+            )
+            searches[(job.scenario, job.orders, job.variant_key)].record(job.num_runners, meets)
+
+        while True:
+            round_jobs: List[ComboJob] = []
+            for (scenario, orders, variant_key), search in searches.items():
+                n_runners = search.next_probe()
+                if n_runners is None:
+                    continue
+                job = build_job(scenario, orders, n_runners, variant_by_key[variant_key])
+                if is_resumable(job):
+                    print(f"Skipping {scenario}/orders_{orders:03d}/runners_{n_runners}/{variant_key} (already complete)")
+                    record(job, aggregate_metrics(load_metrics_from_output(job.output_dir, args.runs_per)))
+                    continue
+                round_jobs.append(job)
+            if not round_jobs:
+                if all(search.done for search in searches.values()):
+                    break
+                continue
+            print(f"Search round: {len(round_jobs)} probes")
+            round_results, round_failed = execute_jobs(round_jobs, args.parallel_jobs)
+            job_results.update(round_results)
+            failed_jobs += round_failed
+            for job in round_jobs:
+                # A failed job counts as not meeting targets
+                record(job, round_results.get((job.scenario, job.orders, job.num_runners, job.variant_key)))
+
+        if args.fill_frontier:
+            fill_jobs = [
+                build_job(scenario, orders, n_runners, variant_by_key[variant_key])
+                for (scenario, orders, variant_key), search in searches.items()
+                for n_runners in search.unprobed()
+            ]
+            fill_jobs = [job for job in fill_jobs if not is_resumable(job)]
+            print(f"Filling frontier: {len(fill_jobs)} jobs")
+            fill_results, fill_failed = execute_jobs(fill_jobs, args.parallel_jobs)
+            job_results.update(fill_results)
+            failed_jobs += fill_failed
     else:
-        print("Running jobs sequentially")
-        for job in all_jobs:
-            try:
-                scenario, orders, num_runners, variant_key, success, agg = run_combo_job(job)
-                if success and agg:
-                    job_results[(scenario, orders, num_runners, variant_key)] = agg
-                    print(f"✅ Completed {scenario}/orders_{orders:03d}/runners_{num_runners}/{variant_key}")
-                else:
-                    failed_jobs.append((scenario, orders, num_runners, variant_key))
-                    print(f"❌ Failed {scenario}/orders_{orders:03d}/runners_{num_runners}/{variant_key}")
-            except Exception as e:
-                failed_jobs.append((job.scenario, job.orders, job.num_runners, job.variant_key))
-                print(f"❌ Exception in {job.scenario}/orders_{job.orders:03d}/runners_{job.num_runners}/{job.variant_key}: {e}")
-    
+        # Prepare all jobs
+        all_jobs = []
+        for scenario in args.tee_scenarios:
+            for orders in args.order_levels:
+                for n_runners in runner_values:
+                    for variant in variants_to_run:
+                        job = build_job(scenario, orders, n_runners, variant)
+                        # Check if we should skip this combination
+                        if is_resumable(job):
+                            print(f"Skipping {scenario}/orders_{orders:03d}/runners_{n_runners}/{variant.key} (already complete)")
+                            continue
+                        all_jobs.append(job)
+
+        print(f"Prepared {len(all_jobs)} jobs to execute")
+
+        # Execute jobs (parallel or sequential)
+        job_results, failed_jobs = execute_jobs(all_jobs, args.parallel_jobs)
+
     # Load results for completed jobs (including resumed ones)
     for scenario in args.tee_scenarios:
         for orders in args.order_levels:
@@ -20,6 +20,9 @@ import geopandas as gpd
 import networkx as nx
 
 from golfsim.logging import init_logging
+from golfsim.data.course_assets import get_course_assets
+from golfsim.routing.distance_matrix import build_and_save_distance_matrix
+from golfsim.routing.node_holes import build_and_save_node_holes
 
 
 # ----------------------------- Helpers -------------------------------------
@@ -236,6 +239,19 @@ def build_graph_from_holes_connected(course_dir: Path) -> Tuple[nx.Graph, nx.Gra
     with open(pkl_path_golfers, "wb") as f:
         pickle.dump(G_golfers, f)
 
+    # --- Precompute all-pairs shortest paths next to each pickle ---
+    matrix_path_runners = build_and_save_distance_matrix(G_runners, pkl_path_runners)
+    matrix_path_golfers = build_and_save_distance_matrix(G_golfers, pkl_path_golfers)
+
+    # --- Precompute node -> hole labels for order placement (runner graph) ---
+    holes_path = course_dir / "geojson" / "generated" / "holes_geofenced.geojson"
+    holes_gdf = get_course_assets(course_dir).hole_polygons()
+    node_holes_path_runners = None
+    if holes_gdf is not None:
+        node_holes_path_runners = build_and_save_node_holes(G_runners, pkl_path_runners, holes_gdf, holes_path)
+    else:
+        print(f"Skipping node-hole index: {holes_path} not found")
+
     # --- Report ---
     # Runner graph report
     total_nodes_r = G_runners.number_of_nodes()
@@ -245,6 +261,9 @@ def build_graph_from_holes_connected(course_dir: Path) -> Tuple[nx.Graph, nx.Gra
     print(f"Built cart network graph: {total_nodes_r} nodes, {total_edges_r} edges")
     print(f"Clubhouse node: {clubhouse_node_r}")
     print(f"Saved to: {pkl_path_runners}")
+    print(f"Distance matrix: {matrix_path_runners}")
+    if node_holes_path_runners is not None:
+        print(f"Node-hole index: {node_holes_path_runners}")
 
     # Golfer graph report
     total_nodes_g = G_golfers.number_of_nodes()
@@ -254,6 +273,7 @@ def build_graph_from_holes_connected(course_dir: Path) -> Tuple[nx.Graph, nx.Gra
     print(f"Built cart network graph: {total_nodes_g} nodes, {total_edges_g} edges")
     print(f"Clubhouse node: {clubhouse_node_g}")
     print(f"Saved to: {pkl_path_golfers}")
+    print(f"Distance matrix: {matrix_path_golfers}")
     
     return G_runners, G_golfers
 
@@ -24,6 +24,7 @@ import golfsim
 gpd = None  # type: ignore
 
 from golfsim.logging import init_logging, get_logger
+from golfsim.simulation.dispatch_policies import DISPATCH_POLICIES
 from golfsim.simulation.orchestration import run_delivery_runner_simulation, create_simulation_config_from_args
 from golfsim.viz.heatmap_viz import (
     load_geofenced_holes,
@@ -147,7 +148,9 @@ def main() -> None:
     # Common arguments
     parser.add_argument("--course-dir", default="courses/pinetree_country_club", help="Course directory")
     parser.add_argument("--num-runs", type=int, default=1, help="Number of runs")
+    parser.add_argument("--run-index-offset", type=int, default=0, help="Number runs from offset+1 (append runs to an existing output dir)")
     parser.add_argument("--output-dir", type=str, default=None, help="Output directory root")
+    parser.add_argument("--run-store", type=str, default=None, help="Append per-run metrics and deliveries to this SQLite run store (one per sweep)")
     parser.add_argument("--log-level", type=str, default="INFO", help="Log level")
     parser.add_argument("--keep-old-outputs", action="store_true", default=False, help="Keep existing simulation outputs (default: clean them up)")
     parser.add_argument("--skip-publish", action="store_true", default=False, help="Do not auto-publish to my-map-animation/public/coordinates after a run")
@@ -166,6 +169,20 @@ def main() -> None:
     parser.add_argument("--runner-speed", type=float, default=None, help="Runner speed in m/s (overrides config)")
     parser.add_argument("--golfer-total-minutes", type=int, default=None, help="Total minutes for golfer round (overrides config)")
     parser.add_argument("--delivery-total-orders", type=int, default=None, help="Total number of delivery orders to generate (overrides config)")
+    parser.add_argument("--random-seed", type=int, default=None, help="Base seed; each run draws from a stream derived from (seed, run index, combo)")
+    parser.add_argument(
+        "--dispatch-policy",
+        type=str,
+        default=None,
+        choices=sorted(DISPATCH_POLICIES),
+        help="How ready orders are assigned to idle runners (default: config value, else fifo)",
+    )
+    parser.add_argument("--batch-max-orders", type=int, default=None, help="Max orders one runner carries per trip (1 = no batching; overrides config)")
+    parser.add_argument("--batch-hole-window", type=int, default=None, help="Batch orders whose holes are within this many holes of the dispatched order (overrides config)")
+    parser.add_argument("--batch-time-window-min", type=int, default=None, help="Batch orders placed within this many minutes of the dispatched order (overrides config)")
+    parser.add_argument("--intercept-lateness-weight", type=float, default=None, help="Intercept-hole score weight per minute the runner arrives after the golfer (overrides config)")
+    parser.add_argument("--intercept-earliness-weight", type=float, default=None, help="Intercept-hole score weight per minute the runner arrives before the golfer (overrides config)")
+    parser.add_argument("--common-random-numbers", action="store_true", default=False, help="Share order streams across runner counts and blocked-hole variants for the same seed and run index")
     
     # Hole restrictions
     parser.add_argument("--block-up-to-hole", type=int, default=0, help="Block ordering for holes ≤ this number (e.g., 5 blocks 1–5)")
@@ -179,6 +196,7 @@ def main() -> None:
 
     # Minimal outputs mode: only write files needed by the map app controls/manifest
     parser.add_argument("--minimal-outputs", action="store_true", default=False, help="Only write coordinates.csv, simulation_metrics.json, and results.json; skip heatmaps, logs, extra metrics, and public copies")
+    parser.add_argument("--binary-tracks", action="store_true", default=False, help="Also write coordinates.bin (compact binary tracks) next to each coordinates.csv for the map apps")
     parser.add_argument("--coordinates-only-for-first-run", action="store_true", default=False, help="Only generate coordinates.csv for the first run in a multi-run simulation")
 
     args = parser.parse_args()
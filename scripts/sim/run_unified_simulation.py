@@ -49,7 +49,7 @@ from golfsim.simulation.services import (
     MultiRunnerDeliveryService,
     DeliveryOrder,
 )
-from golfsim.simulation.phase_simulations import generate_golfer_track
+from golfsim.simulation.golfer_track import GolferTrackTemplate
 from golfsim.simulation.crossings import (
     compute_crossings_from_files,
     serialize_crossings_summary,
@@ -60,7 +60,9 @@ from golfsim.simulation.pass_detection import (
     compute_group_hole_at_time,
 )
 from golfsim.simulation.bev_cart_pass import simulate_beverage_cart_sales
-from golfsim.io.results import write_unified_coordinates_csv, save_results_bundle
+from golfsim.io.coordinate_columns import write_coordinate_columns_csv
+from golfsim.io.track_binary import tracks_path_for
+from golfsim.io.results import save_results_bundle
 from golfsim.viz.matplotlib_viz import (
     render_beverage_cart_plot,
     render_delivery_plot,
@@ -2029,10 +2031,7 @@ def _build_groups_interval(count: int, first_tee_s: int, interval_min: float) ->
 
 def _generate_golfer_points_for_groups(course_dir: str, groups: List[Dict]) -> List[Dict]:
     all_points: List[Dict] = []
-    for g in groups:
-        pts = generate_golfer_track(course_dir, g["tee_time_s"]) or []
-        for p in pts:
-            p["group_id"] = g["group_id"]
+    for _, pts in GolferTrackTemplate.for_course(course_dir).iter_groups(groups, with_hole=False):
         all_points.extend(pts)
     return all_points
 
@@ -2319,7 +2318,7 @@ def _run_mode_simple_nodes(args: argparse.Namespace) -> None:
 
         # Persist unified coordinates for the viewer/tools
         if not getattr(args, "no_coordinates", False):
-            write_unified_coordinates_csv(streams, run_dir / "coordinates.csv")
+            write_coordinate_columns_csv(streams, run_dir / "coordinates.csv")
 
         # Minimal run metadata
         meta = {
@@ -2355,7 +2354,7 @@ def _run_bev_carts_only_once(run_idx: int, course_dir: str, num_carts: int, outp
     run_dir.mkdir(parents=True, exist_ok=True)
 
     # Combined CSV for all carts
-    write_unified_coordinates_csv(
+    write_coordinate_columns_csv(
         {label: svc.coordinates for label, svc in services.items()},
         run_dir / "bev_cart_coordinates.csv",
     )
@@ -2519,7 +2518,7 @@ def _run_bev_with_groups_once(
     baseline_s = int(first_tee_s)
     # Keep absolute timestamps but drop any points prior to first tee time
     tracks_clipped = _clip_streams_at_baseline(tracks, baseline_s)
-    write_unified_coordinates_csv(tracks_clipped, run_dir / "coordinates.csv")
+    write_coordinate_columns_csv(tracks_clipped, run_dir / "coordinates.csv")
 
     # Visualization for cart
     if bev_points and not no_visualization:
@@ -2719,7 +2718,7 @@ def _run_mode_single_golfer(args: argparse.Namespace) -> None:
                             baseline_s = _min_timestamp(points_by_id)
                             streams_clipped = _clip_streams_at_baseline(points_by_id, baseline_s)
                             if not getattr(args, "no_coordinates", False):
-                                write_unified_coordinates_csv(streams_clipped, run_dir / "coordinates.csv")
+                                write_coordinate_columns_csv(streams_clipped, run_dir / "coordinates.csv")
                     except Exception as e:  # noqa: BLE001
                         logger.warning("Failed to write combined coordinates CSV: %s", e)
 
@@ -3408,7 +3407,7 @@ def _run_mode_delivery_runner(args: argparse.Namespace) -> None:
                 {"order_id": getattr(o, "order_id", None), "reason": getattr(o, "failure_reason", None)}
                 for o in service.failed_orders
             ],
-            "activity_log": service.activity_log,
+            "activity_log": service.activity_log.to_records(),
             "metadata": {
                 "prep_time_min": int(args.prep_time),
                 "runner_speed_mps": float(args.runner_speed),
@@ -3642,13 +3641,8 @@ def _run_mode_delivery_runner(args: argparse.Namespace) -> None:
             # Build golfer stream if groups exist
             try:
                 if groups:
-                    gp = _generate_golfer_points_for_groups(args.course_dir, groups)
-                    by_gid: Dict[int, List[Dict[str, Any]]] = {}
-                    for p in gp:
-                        gid = int(p.get("group_id", 0) or 0)
-                        by_gid.setdefault(gid, []).append(p)
-                    for gid, pts in by_gid.items():
-                        golfer_points_csv[f"golfer_group_{gid}"] = pts
+                    for gid, pts in GolferTrackTemplate.for_course(args.course_dir).iter_groups(groups, with_hole=False):
+                        golfer_points_csv.setdefault(f"golfer_group_{int(gid or 0)}", []).extend(pts)
             except Exception:
                 pass
 
@@ -3762,7 +3756,12 @@ def _run_mode_delivery_runner(args: argparse.Namespace) -> None:
                         logger.warning(f"Failed to annotate delivery flags in CLI pipeline: {e}")
 
                     # Write main CSV
-                    write_unified_coordinates_csv(streams_clipped, run_path / "coordinates.csv")
+                    coordinates_csv = run_path / "coordinates.csv"
+                    write_coordinate_columns_csv(
+                        streams_clipped,
+                        coordinates_csv,
+                        tracks_path=tracks_path_for(coordinates_csv) if getattr(args, "binary_tracks", False) else None,
+                    )
 
                     # Write filtered delivery points CSV
                     try:
@@ -3772,7 +3771,7 @@ def _run_mode_delivery_runner(args: argparse.Namespace) -> None:
                             if filtered:
                                 delivery_only[sid] = filtered
                         if delivery_only:
-                            write_unified_coordinates_csv(delivery_only, run_path / "coordinates_delivery_points.csv")
+                            write_coordinate_columns_csv(delivery_only, run_path / "coordinates_delivery_points.csv")
                     except Exception as e:
                         logger.warning(f"Failed to write filtered delivery points CSV (CLI): {e}")
         except Exception as e:  # noqa: BLE001
@@ -4348,6 +4347,7 @@ def main() -> None:
         parser.add_argument("--runner-delay", type=float, default=0.0, metavar="MIN", help="Additional delay before runner departs (busy runner)")
         parser.add_argument("--no-enhanced", action="store_true", help="Don't use enhanced cart network")
         parser.add_argument("--no-coordinates", action="store_true", help="Disable GPS coordinate tracking")
+        parser.add_argument("--binary-tracks", action="store_true", help="Also write coordinates.bin (compact binary tracks) next to coordinates.csv")
         parser.add_argument("--no-visualization", action="store_true", help="Skip creating visualizations")
         # Override probability of order per 9 holes for bev cart sales (0..1)
         parser.add_argument("--bev-order-prob", type=float, default=None, help="Override bev-cart order probability per 9 holes (0..1)")
@@ -14,6 +14,9 @@ from typing import Dict, List, Optional, Tuple
 import logging
 from datetime import datetime
 
+from golfsim.io.run_store import RUN_STORE_FILENAME, RunStore
+from golfsim.io.track_binary import tracks_path_for
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -246,6 +249,11 @@ def scan_course(course_id: str, course_name: str) -> List[Dict]:
         return []
     
     logger.info(f"Using timestamp directory: {ts_dir}")
+
+    # Sweep run store (written by the optimizer); per-run metrics come from it when present
+    store = RunStore(ts_dir / RUN_STORE_FILENAME)
+    if not store.exists():
+        store = None
     
     # Process both first_pass and second_pass directories
     pass_dirs = []
@@ -328,9 +336,30 @@ def scan_course(course_id: str, course_name: str) -> List[Dict]:
                             logger.warning(f"No run directories found in: {variant_dir}")
                             continue
                         
+                        stored_metrics = {}
+                        if store is not None:
+                            try:
+                                stored_metrics = {
+                                    row['run_dir']: row['simulation_metrics']
+                                    for row in store.query_runs(group_dirs=[variant_dir])
+                                    if row['simulation_metrics']
+                                }
+                            except Exception as e:
+                                logger.warning(f"Could not query run store {store.path}: {e}")
+
                         all_metrics = []
                         for run_dir in sorted(run_dirs):
                             metrics_src = run_dir / 'simulation_metrics.json'
+                            stored = stored_metrics.get(str(run_dir.resolve()))
+                            if stored is not None:
+                                all_metrics.append(stored)
+                                if representative_run is None:
+                                    run_01_dir = variant_dir / 'run_01'
+                                    if run_01_dir.exists() and (run_01_dir / 'coordinates.csv').exists():
+                                        representative_run = run_01_dir
+                                    else:
+                                        representative_run = run_dir
+                                continue
                             if not metrics_src.exists():
                                 logger.warning(f"Missing simulation_metrics.json in: {run_dir}")
                                 continue
@@ -371,6 +400,12 @@ def scan_course(course_id: str, course_name: str) -> List[Dict]:
                     try:
                         # Copy coordinate file from representative run
                         shutil.copy2(representative_run / 'coordinates.csv', csv_dst)
+                        # Binary tracks sit next to the CSV when the run wrote them
+                        tracks_src = tracks_path_for(representative_run / 'coordinates.csv')
+                        tracks_dst = tracks_path_for(csv_dst)
+                        has_tracks = tracks_src.exists()
+                        if has_tracks:
+                            shutil.copy2(tracks_src, tracks_dst)
                         
                         # Write the aggregated metrics (either from @aggregate.json or calculated)
                         with open(metrics_dst, 'w') as f:
@@ -402,6 +437,8 @@ def scan_course(course_id: str, course_name: str) -> List[Dict]:
                         
                         if has_geojson:
                             sim_entry['holeDeliveryGeojson'] = geojson_dst.name
+                        if has_tracks:
+                            sim_entry['tracksFilename'] = tracks_dst.name
                         
                         simulations.append(sim_entry)
                         logger.info(f"Successfully processed: {base} (aggregated {run_count} runs)")
@@ -0,0 +1,93 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from golfsim.io.reporting import build_runner_action_segments
+from golfsim.simulation.activity_log import ActivityLog, ActivityType
+
+
+def _runner_day() -> ActivityLog:
+    log = ActivityLog()
+    for runner in ("runner_1", "runner_2"):
+        log.append(ActivityType.SERVICE_CLOSED, 0, "{} waiting {:.0f} minutes until opening", (runner, 60.0), runner_id=runner, location="clubhouse")
+        log.append(ActivityType.SERVICE_OPENED, 3600, "{} started shift", (runner,), runner_id=runner, location="clubhouse")
+    log.append(ActivityType.DELIVERY_START, 4000, "{} departing to Hole {}", ("runner_1", 5), runner_id="runner_1", order_id="001", hole=5)
+    log.append(ActivityType.DELIVERY_COMPLETE, 4300, "{} delivered Order {}", ("runner_1", "001"), runner_id="runner_1", order_id="001", hole=5)
+    log.append(ActivityType.RETURNING, 4300, "{} returning", ("runner_1",), runner_id="runner_1", location="hole_5")
+    log.append(ActivityType.ARRIVED_CLUBHOUSE, 4500, "{} arrived", ("runner_1",), runner_id="runner_1", location="clubhouse")
+    log.append(ActivityType.DELIVERY_START, 5000, "{} departing to Hole {}", ("runner_2", 9), runner_id="runner_2", order_id="002", hole=9)
+    for runner in ("runner_1", "runner_2"):
+        log.append(ActivityType.SERVICE_CLOSED, 7200, "{} shift ended", (runner,), runner_id=runner)
+    return log
+
+
+def test_records_render_descriptions_on_read():
+    log = _runner_day()
+    entry = log[0]
+    assert entry["activity_type"] == "service_closed"
+    assert entry["description"] == "runner_1 waiting 60 minutes until opening"
+    assert entry["time_str"] == "07:00" and entry["runner_id"] == "runner_1"
+    assert log[4]["hole"] == 5 and log[4]["order_id"] == "001"
+    assert "hole" not in log[0]
+    assert json.loads(json.dumps(log.to_records()))[-1]["description"] == "runner_2 shift ended"
+    with pytest.raises(KeyError):
+        log.append("teleported", 0, "")
+
+
+def test_records_keep_timestamps_as_logged():
+    log = ActivityLog()
+    log.append(ActivityType.ORDER_PLACED, 3600, "int clock")
+    log.append(ActivityType.ORDER_READY, 4200.5, "float clock")
+    log.append(ActivityType.IDLE, 4800.0, "whole float clock")
+    assert [type(r["timestamp_s"]) for r in log] == [int, float, float]
+    assert [r["timestamp_s"] for r in json.loads(json.dumps(log.to_records()))] == [3600, 4200.5, 4800.0]
+    assert '"timestamp_s": 3600,' in json.dumps(log[0]) and '"timestamp_s": 4800.0,' in json.dumps(log[2])
+
+
+def test_typed_and_dict_logs_give_the_same_segments():
+    log = _runner_day()
+    segments = build_runner_action_segments(log)
+    assert segments == build_runner_action_segments(log.to_records())
+    runner_1 = [(s["action_type"], s["start_timestamp_s"], s["end_timestamp_s"]) for s in segments if s["runner_id"] == "runner_1"]
+    assert runner_1 == [
+        ("waiting_at_clubhouse", 3600, 4000),
+        ("delivery_drive", 4000, 4300),
+        ("return_drive", 4300, 4500),
+        ("waiting_at_clubhouse", 4500, 7200),
+    ]
+    # runner_2's open delivery is closed at shift end, and runner_1's trips stay out of it
+    runner_2 = [(s["action_type"], s["start_timestamp_s"], s["end_timestamp_s"]) for s in segments if s["runner_id"] == "runner_2"]
+    assert runner_2 == [("waiting_at_clubhouse", 3600, 5000), ("delivery_drive", 5000, 7200)]
+
+
+def test_unified_delivery_results_json_holds_activity_records(tmp_path):
+    """results.json from the unified CLI stores the activity log as records, not the log's repr."""
+    root = Path(__file__).resolve().parents[1]
+    command = [
+        sys.executable,
+        str(root / "scripts/sim/run_unified_simulation.py"),
+        "--course-dir", str(root / "courses/pinetree_country_club"),
+        "--num-runners", "1",
+        "--num-runs", "1",
+        "--groups-count", "2",
+        "--tee-scenario", "none",
+        "--output-dir", str(tmp_path / "out"),
+        "--no-heatmap",
+        "--no-coordinates",
+        "--skip-executive-summary",
+        "--log-level", "ERROR",
+    ]
+    # Run from tmp_path so the CLI's public/ copies stay out of the repo
+    env = dict(os.environ, PYTHONPATH=str(root))
+    result = subprocess.run(command, capture_output=True, text=True, cwd=tmp_path, env=env)
+    assert result.returncode == 0, f"run_unified_simulation.py failed:\n{result.stdout}\n{result.stderr}"
+
+    results = json.loads((tmp_path / "out" / "run_01" / "results.json").read_text(encoding="utf-8"))
+    activity = results["activity_log"]
+    assert isinstance(activity, list) and activity
+    assert all(isinstance(entry, dict) for entry in activity)
+    assert {"timestamp_s", "activity_type", "description"} <= set(activity[0])
@@ -0,0 +1,99 @@
+import argparse
+import dataclasses
+import json
+from pathlib import Path
+
+from golfsim.config.models import SimulationConfig
+from golfsim.simulation.batch import run_batch
+from golfsim.simulation.orchestration import run_delivery_runner_simulation
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+COURSE_DIR = str(REPO_ROOT / "courses" / "pinetree_country_club")
+
+
+def _base_config(tmp_path) -> SimulationConfig:
+    args = argparse.Namespace(
+        course_dir=COURSE_DIR, num_runs=1, output_dir=str(tmp_path / "out"), log_level="WARNING",
+        num_carts=0, num_runners=1, groups_count=0, tee_scenario="real_tee_sheet", first_tee="09:00",
+        random_seed=7, minimal_outputs=True, no_heatmap=True,
+    )
+    cfg = SimulationConfig.from_args(args)
+    cfg.delivery_total_orders = 12
+    return cfg
+
+
+def test_run_batch_returns_metrics_per_run(tmp_path):
+    base = _base_config(tmp_path)
+    configs = [
+        base,
+        dataclasses.replace(base, num_runners=2, blocked_holes=[1, 2, 3], num_runs=2),
+    ]
+    results = run_batch(configs)
+    assert [(r.config_index, r.run_idx) for r in results] == [(0, 1), (1, 1), (1, 2)]
+    assert results[0].variant_key == "none"
+    assert results[1].variant_key == "front" and results[1].blocked_holes == [1, 2, 3]
+    for r in results:
+        assert r.metrics.total_orders > 0
+        assert r.metrics.successful_orders == len(r.delivery_stats)
+        assert r.sim_result is None
+
+
+def test_run_batch_matches_file_based_run(tmp_path):
+    cfg = _base_config(tmp_path)
+    batch = run_batch([cfg], keep_results=True)[0]
+    run_delivery_runner_simulation(cfg)
+    on_disk = json.loads((cfg.output_dir / "run_01" / "results.json").read_text(encoding="utf-8"))
+    keys = ("order_id", "hole_num", "delivered_at_time_s", "runner_id")
+    assert [[s.get(k) for k in keys] for s in batch.delivery_stats] == [
+        [s.get(k) for k in keys] for s in on_disk["delivery_stats"]
+    ]
+
+
+def test_run_batch_honours_run_index_offset(tmp_path):
+    cfg = dataclasses.replace(_base_config(tmp_path), num_runs=2, run_index_offset=1)
+    batch = run_batch([cfg], keep_results=True)
+    assert [r.run_idx for r in batch] == [2, 3]
+
+    run_delivery_runner_simulation(cfg)
+    assert sorted(p.name for p in cfg.output_dir.glob("run_*")) == ["run_02", "run_03"]
+    keys = ("order_id", "golfer_group_id", "placed_hole", "order_time_s")
+    for r in batch:
+        on_disk = json.loads((cfg.output_dir / f"run_{r.run_idx:02d}" / "results.json").read_text(encoding="utf-8"))
+        # Same per-run seed: the same orders are drawn
+        assert [[o.get(k) for k in keys] for o in r.sim_result["orders"]] == [
+            [o.get(k) for k in keys] for o in on_disk["orders"]
+        ]
+    assert r.sim_result["orders"] != batch[0].sim_result["orders"]
+
+
+def test_run_sweep_combo_writes_runs_and_streams_compact_metrics(tmp_path):
+    from golfsim.simulation.batch import SweepCombo, init_sweep_worker, run_sweep_combo
+
+    init_sweep_worker(COURSE_DIR, "real_tee_sheet", "WARNING")
+    out = tmp_path / "combo"
+    combo = SweepCombo(num_runners=2, total_orders=10, num_runs=2, output_dir=str(out), blocked_holes=(1, 2, 3), random_seed=3)
+    compact = run_sweep_combo(combo)
+
+    assert [c["run_idx"] for c in compact] == [1, 2]
+    for c in compact:
+        run_dir = out / f"run_{c['run_idx']:02d}"
+        on_disk = json.loads((run_dir / "results.json").read_text(encoding="utf-8"))
+        assert on_disk["metadata"]["blocked_holes"] == [1, 2, 3]
+        assert c["metrics"]["successful_orders"] == len(on_disk["delivery_stats"])
+        assert [s["hole_num"] for s in c["delivery_stats"]] == [s.get("hole_num") for s in on_disk["delivery_stats"]]
+    # Detailed metrics JSON for the first run, as a run_new.py process would write
+    assert list(out.glob("run_01/delivery_runner_metrics_run_01.json"))
+
+
+def test_run_sweep_combo_appends_runs_after_offset(tmp_path):
+    from golfsim.simulation.batch import SweepCombo, init_sweep_worker, run_sweep_combo
+
+    init_sweep_worker(COURSE_DIR, "real_tee_sheet", "WARNING")
+    out = tmp_path / "combo"
+    run_sweep_combo(SweepCombo(num_runners=1, total_orders=8, num_runs=1, output_dir=str(out), random_seed=1))
+    compact = run_sweep_combo(
+        SweepCombo(num_runners=1, total_orders=8, num_runs=2, output_dir=str(out), random_seed=1, run_index_offset=1)
+    )
+    assert [c["run_idx"] for c in compact] == [2, 3]
+    assert sorted(p.name for p in out.glob("run_*")) == ["run_01", "run_02", "run_03"]
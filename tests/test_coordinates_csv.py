@@ -0,0 +1,61 @@
+import csv
+
+import pytest
+
+from golfsim.io.results import write_unified_coordinates_csv
+
+
+def _read(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return [(r["id"], float(r["timestamp"]), r["type"], r["hole"]) for r in csv.DictReader(f)]
+
+
+def test_merges_streams_by_id_and_time_keeping_first_duplicate(tmp_path):
+    streams = {
+        "runner_1": [
+            {"latitude": 1, "longitude": 2, "timestamp": 60, "type": "runner", "hole": 2},
+            {"latitude": 1, "longitude": 2, "timestamp": 0, "type": "runner", "hole": 1},
+        ],
+        "golfer_1": iter([
+            {"lat": 3, "lon": 4, "timestamp_s": 0, "type": "golfer", "current_hole": 1},
+            {"lat": 3, "lon": 4, "timestamp_s": 0, "type": "golfer", "current_hole": 9},
+            {"lat": 3, "lon": 4, "timestamp_s": 30.5, "type": "golfer"},
+        ]),
+        # Same id as the first stream through an explicit id; the earlier stream wins the tie
+        "other": [{"id": "runner_1", "latitude": 0, "longitude": 0, "timestamp": 60, "type": "runner", "hole": 7}],
+    }
+    path = write_unified_coordinates_csv(streams, tmp_path / "coordinates.csv")
+    assert _read(path) == [
+        ("golfer_1", 0.0, "golfer", "1"),
+        ("golfer_1", 30.5, "golfer", "clubhouse"),
+        ("runner_1", 0.0, "runner", "1"),
+        ("runner_1", 60.0, "runner", "2"),
+    ]
+
+
+def test_unordered_generator_stream_is_rejected(tmp_path):
+    points = iter([{"timestamp": 60, "type": "runner"}, {"timestamp": 0, "type": "runner"}])
+    with pytest.raises(ValueError):
+        write_unified_coordinates_csv({"runner_1": points}, tmp_path / "coordinates.csv")
+
+
+def test_columnar_writer_matches_point_writer(tmp_path):
+    from golfsim.io.coordinate_columns import CoordinateColumns, write_coordinate_columns_csv
+
+    streams = {
+        "golfer_group_1": [
+            {"latitude": 34.1, "longitude": -84.2, "timestamp": 120, "type": "golfer", "hole": 2,
+             "visibility_color": "green", "time_since_last_sighting_min": 3, "pulsing": False},
+            {"lat": 34.0, "lon": -84.0, "timestamp_s": 60, "type": "golfer", "current_hole": 1,
+             "order_id": 7, "is_delivery_event": 1, "fill_color": "#00b894"},
+            {"latitude": 34.0, "longitude": -84.0, "timestamp": 60, "type": "golfer", "hole": 9},
+        ],
+        "bev_cart_1": [{"latitude": 34.2, "longitude": -84.1, "timestamp": 30.25, "type": "bev_cart", "total_orders": 2, "total_revenue": 12.5}],
+        "runner_1": [{"latitude": 1e-5, "longitude": 2.0, "timestamp": 0, "type": "delivery-runner", "hole": ""}],
+        "empty": [],
+    }
+    expected = write_unified_coordinates_csv(streams, tmp_path / "points.csv").read_bytes()
+    assert write_coordinate_columns_csv(streams, tmp_path / "columns.csv").read_bytes() == expected
+
+    columns = {k: CoordinateColumns.from_points(v, k) for k, v in streams.items()}
+    assert write_coordinate_columns_csv(columns, tmp_path / "prebuilt.csv").read_bytes() == expected
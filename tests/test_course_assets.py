@@ -0,0 +1,134 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from golfsim.data.course_assets import clear_course_asset_cache, get_course_assets
+from golfsim.routing.utils import get_hole_for_node
+from golfsim.simulation.tracks import load_holes_connected_points
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PINETREE_DIR = REPO_ROOT / "courses" / "pinetree_country_club"
+
+
+@pytest.fixture
+def course_copy(tmp_path):
+    """Minimal writable copy of the pinetree course assets."""
+    dst = tmp_path / "pinetree"
+    (dst / "pkl").mkdir(parents=True)
+    (dst / "geojson" / "generated").mkdir(parents=True)
+    shutil.copy(PINETREE_DIR / "pkl" / "cart_graph.pkl", dst / "pkl" / "cart_graph.pkl")
+    for name in ("holes_connected.geojson", "holes_geofenced.geojson"):
+        shutil.copy(PINETREE_DIR / "geojson" / "generated" / name, dst / "geojson" / "generated" / name)
+    clear_course_asset_cache()
+    yield dst
+    clear_course_asset_cache()
+
+
+def test_cart_graph_is_shared_and_frozen(course_copy):
+    assets = get_course_assets(course_copy)
+    G1 = assets.cart_graph()
+    G2 = get_course_assets(str(course_copy)).cart_graph()
+    assert G1 is G2
+    assert G1.number_of_nodes() > 0
+    with pytest.raises(Exception):
+        G1.add_node("extra")
+
+
+def test_assets_reload_when_file_changes(course_copy):
+    assets = get_course_assets(course_copy)
+    G1 = assets.cart_graph()
+    pkl = course_copy / "pkl" / "cart_graph.pkl"
+    st = pkl.stat()
+    os.utime(pkl, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    G2 = assets.cart_graph()
+    assert G2 is not G1
+    assert G2.number_of_nodes() == G1.number_of_nodes()
+
+
+def test_loop_points_return_independent_copies(course_copy):
+    pts = load_holes_connected_points(str(course_copy))
+    pts.append((0.0, 0.0))
+    assert len(load_holes_connected_points(str(course_copy))) == len(pts) - 1
+
+
+def test_missing_assets_return_none(tmp_path):
+    assets = get_course_assets(tmp_path)
+    assert assets.cart_graph() is None
+    assert assets.hole_polygons() is None
+    assert get_hole_for_node(0, tmp_path) is None
+    with pytest.raises(FileNotFoundError):
+        assets.loop_points()
+
+
+def test_hole_for_node_matches_polygon_containment(course_copy):
+    from shapely.geometry import Point
+
+    assets = get_course_assets(course_copy)
+    G = assets.cart_graph()
+    holes_gdf = assets.hole_polygons()
+    checked = 0
+    for node in list(G.nodes)[:40]:
+        data = G.nodes[node]
+        expected = None
+        for _, row in holes_gdf.iterrows():
+            if row["geometry"].contains(Point(data["x"], data["y"])):
+                expected = int(row["hole"])
+                break
+        assert get_hole_for_node(node, course_copy) == expected
+        checked += 1
+    assert checked > 0
+
+
+def test_node_hole_sidecar_is_used_until_polygons_change(course_copy):
+    from golfsim.routing.node_holes import NodeHoleIndex, build_and_save_node_holes, node_holes_path
+
+    assets = get_course_assets(course_copy)
+    graph_path = course_copy / "pkl" / "cart_graph.pkl"
+    holes_path = course_copy / "geojson" / "generated" / "holes_geofenced.geojson"
+    built = assets.node_holes()
+    sidecar = build_and_save_node_holes(assets.cart_graph(), graph_path, assets.hole_polygons(), holes_path)
+    assert sidecar == node_holes_path(graph_path)
+
+    # Mark node 0 so the sidecar is distinguishable from a rebuild
+    index = NodeHoleIndex.load(sidecar)
+    assert index.labels() == built.labels()
+    index.holes[0] = 99
+    index.save(sidecar)
+    assert assets.hole_for_node(0) == 99
+    assert assets.hole_for_node(10_000) is None and assets.hole_for_node("clubhouse") is None
+
+    holes_path.write_text(holes_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert assets.node_holes().labels() == built.labels()
+
+
+def test_loop_nodes_cache_tracks_source_content(course_copy, tmp_path, monkeypatch):
+    import json
+
+    from golfsim.data.course_assets import load_loop_nodes
+    from golfsim.data.loop_nodes import LoopNodes, loop_nodes_cache_dir
+
+    cache_root = tmp_path / "cache"
+    monkeypatch.setenv("GOLFSIM_CACHE_DIR", str(cache_root))
+    generated = course_copy / "geojson" / "generated"
+    before = sorted(p.name for p in generated.iterdir())
+    source = generated / "holes_connected.geojson"
+    nodes = get_course_assets(course_copy).loop_nodes()
+    # Loading never writes next to the course files; the parse is cached outside them
+    assert sorted(p.name for p in generated.iterdir()) == before
+    cached = list(loop_nodes_cache_dir().glob("*.npz"))
+    assert len(cached) == 1 and len(LoopNodes.load(cached[0])) == len(nodes)
+    assert not list(loop_nodes_cache_dir().glob("*.tmp"))
+    assert get_course_assets(course_copy).loop_points() == tuple(nodes.lonlat(nodes.by_node_id()))
+
+    # Drop a point; the edited source gets its own cache entry
+    data = json.loads(source.read_text(encoding="utf-8"))
+    first_point = next(i for i, f in enumerate(data["features"]) if f["geometry"]["type"] == "Point")
+    del data["features"][first_point]
+    source.write_text(json.dumps(data), encoding="utf-8")
+    clear_course_asset_cache()
+    assert len(load_loop_nodes(source)) == len(nodes) - 1
+    assert sorted(len(LoopNodes.load(p)) for p in loop_nodes_cache_dir().glob("*.npz")) == [len(nodes) - 1, len(nodes)]
+    assert sorted(p.name for p in generated.iterdir()) == before
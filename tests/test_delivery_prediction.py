@@ -0,0 +1,84 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from golfsim.data.course_assets import get_course_assets
+from golfsim.simulation.delivery_prediction import get_prediction_engine
+from golfsim.simulation.engine import enhanced_delivery_routing, iterative_convergence_prediction_nodes
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+COURSE_DIR = str(REPO_ROOT / "courses" / "pinetree_country_club")
+CLUBHOUSE = (-84.5928, 34.0379)
+
+
+def _route_every_step(departure_time_s, prep_time_s, tee_time_s, speed, total=240, quantum=60):
+    """Reference: the original loop that routes on every refinement step."""
+    coords = list(get_course_assets(COURSE_DIR).loop_points())
+    while len(coords) < total:
+        coords.append(coords[-1])
+    cur = min(int(departure_time_s // quantum), len(coords) - 1)
+    dx = (coords[cur][0] - CLUBHOUSE[0]) * 111139
+    dy = (coords[cur][1] - CLUBHOUSE[1]) * 111139
+    idx = min(cur + int((prep_time_s + math.sqrt(dx**2 + dy**2) * 1.3 / speed) // quantum), len(coords) - 1)
+    prediction = coords[idx]
+    graph = get_course_assets(COURSE_DIR).cart_graph()
+    for _ in range(5):
+        travel = enhanced_delivery_routing(graph, CLUBHOUSE, prediction, speed)["time_s"]
+        new_idx = min(int((departure_time_s + prep_time_s + travel - tee_time_s) / quantum), len(coords) - 1)
+        new_prediction = coords[new_idx]
+        cdx = (new_prediction[0] - prediction[0]) * 111139
+        cdy = (new_prediction[1] - prediction[1]) * 111139
+        if math.sqrt(cdx**2 + cdy**2) < 25.0:
+            return new_prediction
+        prediction = new_prediction
+    return prediction
+
+
+@pytest.mark.parametrize(
+    "departure_time_s,prep_time_min,tee_time_s,speed",
+    [
+        (600.0, 10.0, 0.0, 2.68),
+        (3725.5, 0.0, 1800.0, 2.68),
+        (7300.0, 5.0, 900.0, 6.0),
+        (12000.0, 0.0, 600.0, 2.0),
+        (16000.0, 10.0, 0.0, 2.68),
+    ],
+)
+def test_precomputed_prediction_matches_routing_every_step(departure_time_s, prep_time_min, tee_time_s, speed):
+    expected = _route_every_step(departure_time_s, prep_time_min * 60, tee_time_s, speed)
+    got = iterative_convergence_prediction_nodes(
+        order_node_idx=0,
+        prep_time_min=prep_time_min,
+        runner_speed_mps=speed,
+        departure_time_s=departure_time_s,
+        clubhouse_lonlat=CLUBHOUSE,
+        course_dir=COURSE_DIR,
+        order={"tee_time_s": tee_time_s},
+    )
+    assert got == expected
+
+
+def test_engine_is_shared_and_memoises_predictions():
+    engine = get_prediction_engine(COURSE_DIR, CLUBHOUSE)
+    assert get_prediction_engine(COURSE_DIR, CLUBHOUSE) is engine
+    hits = engine.cache_hits
+    first = engine.predict_node_index(4000.0, 0.0, 1200.0, 2.68)
+    assert engine.predict_node_index(4000.0, 0.0, 1200.0, 2.68) == first
+    assert engine.cache_hits == hits + 1
+    times = engine.travel_times_s(2.0)
+    assert times[5] == pytest.approx(engine.route_lengths_m[5] / 2.0)
+
+
+def test_missing_loop_points_fall_back_to_clubhouse(tmp_path):
+    assert get_prediction_engine(str(tmp_path), CLUBHOUSE) is None
+    got = iterative_convergence_prediction_nodes(
+        order_node_idx=0,
+        prep_time_min=0.0,
+        runner_speed_mps=2.68,
+        departure_time_s=0.0,
+        clubhouse_lonlat=CLUBHOUSE,
+        course_dir=str(tmp_path),
+    )
+    assert got == CLUBHOUSE
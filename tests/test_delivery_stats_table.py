@@ -0,0 +1,72 @@
+import json
+import sys
+
+import numpy as np
+import pytest
+
+from golfsim.simulation.delivery_service_base import DeliveryOrder
+from golfsim.simulation.delivery_stats import DeliveryStatsTable
+
+
+RECORDS = [
+    {
+        "order_id": "001",
+        "hole_num": 4,
+        "queue_delay_s": 12.5,
+        "delivered_at_time_s": 3600,
+        "runner_id": "runner_1",
+        "trip_to_golfer": {"nodes": [0, 5, 9], "length_m": 310.0, "time_s": 52.0, "efficiency": None, "routing_type": "optimal"},
+        "trip_back": {"nodes": [9, 5, 0], "length_m": 310.0, "time_s": 52.0, "efficiency": None, "routing_type": "optimal"},
+        "predicted_delivery_location": [-84.59, 34.03],
+    },
+    {
+        "order_id": "002",
+        "hole_num": 7,
+        "queue_delay_s": 30.0,
+        "delivered_at_time_s": 4100.25,
+        "runner_id": "runner_2",
+        "batch_size": 2,
+    },
+]
+
+
+def test_round_trips_records_of_different_shapes():
+    table = DeliveryStatsTable.from_records(RECORDS)
+    assert len(table) == 2
+    assert table.to_records() == RECORDS
+    assert table[-1] == RECORDS[1]
+    assert json.loads(json.dumps(list(table))) == RECORDS
+    # Exact types too: ints in a mixed int/float column stay ints
+    assert json.dumps(table.to_records()) == json.dumps(RECORDS)
+    assert type(table[0]["delivered_at_time_s"]) is int and type(table[1]["delivered_at_time_s"]) is float
+
+
+def test_mixed_numeric_columns_keep_each_value_type():
+    records = [{"delivery_time_s": 300}, {"delivery_time_s": 300.0}, {"delivery_time_s": 2**60}, {}]
+    table = DeliveryStatsTable.from_records(records[:2] + records[3:])
+    assert [type(r.get("delivery_time_s")) for r in table] == [int, float, type(None)]
+    assert table.column("delivery_time_s").dtype == np.float64
+    # Ints a float64 cannot hold exactly keep the column as objects
+    wide = DeliveryStatsTable.from_records(records)
+    assert wide.to_records() == records and type(wide[2]["delivery_time_s"]) is int
+
+
+def test_columns_and_paths_are_compact_arrays():
+    table = DeliveryStatsTable.from_records(RECORDS)
+    assert table.column("hole_num").dtype == np.int32
+    assert np.isnan(table.column("batch_size")[0]) and table.column("batch_size")[1] == 2
+    assert table.path_nodes.dtype == np.int32
+    assert table.path(1).tolist() == [9, 5, 0]
+    with pytest.raises(KeyError):
+        table.column("missing")
+
+
+def test_empty_table():
+    table = DeliveryStatsTable()
+    assert len(table) == 0 and list(table) == []
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+def test_delivery_order_uses_slots():
+    order = DeliveryOrder(order_id="1", golfer_group_id=1, golfer_id="g", order_time_s=0.0, hole_num=1)
+    assert not hasattr(order, "__dict__")
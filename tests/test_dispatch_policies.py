@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import pytest
+
+from golfsim.simulation.delivery_service_base import DeliveryOrder
+from golfsim.simulation.dispatch_policies import (
+    EarliestDeadlinePolicy,
+    FifoPolicy,
+    NearestHolePolicy,
+    ZonePolicy,
+    get_dispatch_policy,
+)
+
+
+def _service(now=1000.0, num_runners=3):
+    return SimpleNamespace(
+        env=SimpleNamespace(now=now),
+        queue_timeout_s=3600,
+        num_runners=num_runners,
+        # Travel time grows with hole number
+        _calculate_delivery_details=lambda hole: (100.0 * hole, 60.0 * hole),
+    )
+
+
+def _order(order_id, hole, placed):
+    return DeliveryOrder(order_id=order_id, golfer_group_id=1, golfer_id="g", order_time_s=placed, hole_num=hole, order_placed_time=placed)
+
+
+def test_fifo_takes_oldest_order_and_lowest_idle_runner():
+    orders = [_order("a", 9, 100), _order("b", 2, 200)]
+    assert FifoPolicy().select(_service(), orders, [1, 2]) == (0, 1)
+
+
+def test_edf_orders_by_placement_deadline():
+    orders = [_order("a", 9, 300), _order("b", 2, 200)]
+    assert EarliestDeadlinePolicy().select(_service(), orders, [0]) == (1, 0)
+
+
+def test_nearest_hole_prefers_short_trips_until_orders_age_out():
+    orders = [_order("a", 9, 900), _order("b", 2, 950)]
+    assert NearestHolePolicy().select(_service(now=1000), orders, [0]) == (1, 0)
+    # "a" has waited past half the queue timeout
+    assert NearestHolePolicy().select(_service(now=900 + 1800), orders, [0]) == (0, 0)
+
+
+def test_zone_policy_serves_own_zone_then_steals():
+    svc = _service(num_runners=3)
+    orders = [_order("front", 2, 100), _order("back", 17, 200)]
+    assert ZonePolicy().select(svc, orders, [2]) == (1, 2)
+    assert ZonePolicy().select(svc, [orders[0]], [1]) == (0, 1)
+    assert ZonePolicy(allow_steal=False).select(svc, [orders[0]], [1]) is None
+
+
+def test_get_dispatch_policy_by_name():
+    assert isinstance(get_dispatch_policy(None), FifoPolicy)
+    assert get_dispatch_policy("zone").name == "zone"
+    with pytest.raises(ValueError):
+        get_dispatch_policy("round_robin")
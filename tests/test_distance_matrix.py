@@ -0,0 +1,90 @@
+import math
+import pickle
+import shutil
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+from golfsim.data.course_assets import clear_course_asset_cache, get_course_assets
+from golfsim.routing.distance_matrix import (
+    CartPathDistanceMatrix,
+    build_and_save_distance_matrix,
+    distance_matrix_path,
+    get_distance_matrix,
+)
+from golfsim.routing.optimal_routing import find_optimal_route
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PINETREE_PKL = REPO_ROOT / "courses" / "pinetree_country_club" / "pkl" / "cart_graph.pkl"
+
+
+def _load_graph():
+    with PINETREE_PKL.open("rb") as f:
+        return pickle.load(f)
+
+
+def test_matrix_lengths_match_networkx():
+    G = _load_graph()
+    matrix = CartPathDistanceMatrix.build(G)
+    nodes = list(G.nodes())
+    for src in nodes[::25]:
+        expected = nx.single_source_dijkstra_path_length(G, src, weight="length")
+        for dst in nodes[::10]:
+            assert matrix.length_m(src, dst) == pytest.approx(expected.get(dst, math.inf))
+            path = matrix.path(src, dst)
+            assert path[0] == src and path[-1] == dst
+            assert nx.path_weight(G, path, weight="length") == pytest.approx(expected[dst])
+
+
+def test_disconnected_nodes_raise_no_path():
+    G = nx.Graph()
+    G.add_edge(0, 1, length=5.0)
+    G.add_node(2)
+    matrix = CartPathDistanceMatrix.build(G)
+    assert matrix.path(0, 1) == [0, 1]
+    assert math.isinf(matrix.length_m(0, 2))
+    with pytest.raises(nx.NetworkXNoPath):
+        matrix.path(0, 2)
+    with pytest.raises(nx.NodeNotFound):
+        matrix.path(0, 99)
+
+
+def test_sidecar_attached_by_course_assets(tmp_path):
+    course = tmp_path / "course"
+    (course / "pkl").mkdir(parents=True)
+    pkl = course / "pkl" / "cart_graph.pkl"
+    shutil.copy(PINETREE_PKL, pkl)
+    clear_course_asset_cache()
+    try:
+        G_plain = get_course_assets(course).cart_graph()
+        assert get_distance_matrix(G_plain) is None
+
+        build_and_save_distance_matrix(_load_graph(), pkl)
+        assert distance_matrix_path(pkl).exists()
+        G = get_course_assets(course).cart_graph()
+        assert G is not G_plain
+        matrix = get_distance_matrix(G)
+        assert matrix is not None and matrix.matches(G)
+
+        start = (G.nodes[0]["x"], G.nodes[0]["y"])
+        far = max(G.nodes(), key=lambda n: matrix.length_m(0, n))
+        end = (G.nodes[far]["x"], G.nodes[far]["y"])
+        with_matrix = find_optimal_route(G, start, end)
+        without_matrix = find_optimal_route(G_plain, start, end)
+        assert with_matrix["success"] and without_matrix["success"]
+        assert with_matrix["metrics"]["length_m"] == pytest.approx(without_matrix["metrics"]["length_m"])
+        nodes = list(G.nodes())
+        assert with_matrix["path_ids"] == [nodes.index(n) for n in with_matrix["path"]]
+    finally:
+        clear_course_asset_cache()
+
+
+def test_stale_sidecar_is_ignored(tmp_path):
+    G = nx.Graph()
+    G.add_edge(0, 1, length=5.0)
+    pkl = tmp_path / "cart_graph.pkl"
+    build_and_save_distance_matrix(G, pkl)
+    G.add_edge(1, 2, length=3.0)
+    assert not CartPathDistanceMatrix.load(distance_matrix_path(pkl)).matches(G)
@@ -0,0 +1,48 @@
+import json
+
+from golfsim.io.coordinate_columns import write_coordinate_columns_csv
+from golfsim.simulation.golfer_track import GolferTrackTemplate
+from golfsim.simulation.phase_simulations import generate_golfer_track
+from golfsim.simulation.tracks import generate_golfer_points_for_groups
+
+
+def _course(tmp_path, n):
+    generated = tmp_path / "geojson" / "generated"
+    generated.mkdir(parents=True)
+    features = [
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [-78.0 + i * 1e-4, 35.0]}, "properties": {"node_id": i}}
+        for i in reversed(range(n))
+    ]
+    (generated / "holes_connected.geojson").write_text(json.dumps({"type": "FeatureCollection", "features": features}), encoding="utf-8")
+    return str(tmp_path)
+
+
+def test_groups_share_one_template(tmp_path):
+    course_dir = _course(tmp_path, 36)
+    template = GolferTrackTemplate.for_course(course_dir)
+    assert GolferTrackTemplate.for_course(course_dir) is template
+    assert len(template) == 36
+
+    groups = [{"group_id": 1, "tee_time_s": 0}, {"group_id": 2, "tee_time_s": 600}]
+    points = generate_golfer_points_for_groups(course_dir, groups)
+    second = [p for p in points if p["group_id"] == 2]
+    assert [p["timestamp"] for p in second[:3]] == [600, 660, 720]
+    assert second[0]["longitude"] == -78.0
+    # 36 nodes over 18 holes: two minutes per hole
+    assert [p["hole"] for p in second[:5]] == [1, 1, 2, 2, 3]
+    assert second[-1]["hole"] == 18
+
+    track = generate_golfer_track(course_dir, 600)
+    assert track == [{k: p[k] for k in ("latitude", "longitude", "timestamp", "type")} for p in second]
+
+
+def test_columns_match_point_dicts(tmp_path):
+    course_dir = _course(tmp_path, 40)
+    template = GolferTrackTemplate.for_course(course_dir)
+    from_points = write_coordinate_columns_csv(
+        {"golfer_group_1": template.points(300, group_id=1)}, tmp_path / "points.csv"
+    ).read_bytes()
+    from_columns = write_coordinate_columns_csv(
+        {"golfer_group_1": template.columns(300, "golfer_group_1")}, tmp_path / "columns.csv"
+    ).read_bytes()
+    assert from_columns == from_points
@@ -0,0 +1,36 @@
+import numpy as np
+
+from golfsim.routing.hole_locator import NO_HOLE, HoleLocator
+from golfsim.simulation.crossings import locate_hole_for_point
+
+
+def _square(x0: float, y0: float, size: float = 1.0):
+    return [[x0, y0], [x0 + size, y0], [x0 + size, y0 + size], [x0, y0 + size], [x0, y0]]
+
+
+HOLES = [
+    {"hole": 1, "polygons": [[_square(0, 0)]]},
+    # Overlaps hole 1 on x in [0.5, 1]; hole 1 comes first in file order
+    {"hole": 2, "polygons": [[_square(0.5, 0)]]},
+    # Two parts, the second with an interior ring
+    {"hole": 3, "polygons": [[_square(5, 5)], [_square(10, 10, 3), _square(11, 11)]]},
+]
+
+
+def test_matches_ray_casting_lookup():
+    locator = HoleLocator.from_features(HOLES)
+    rng = np.random.default_rng(7)
+    lons = rng.uniform(-1, 14, 2000)
+    lats = rng.uniform(-1, 14, 2000)
+    located = locator.locate(lons, lats)
+    expected = [locate_hole_for_point(lon, lat, HOLES) for lon, lat in zip(lons, lats)]
+    assert [None if h == NO_HOLE else h for h in located.tolist()] == expected
+
+
+def test_overlaps_holes_and_misses():
+    locator = HoleLocator.from_features(HOLES)
+    assert len(locator) == 4
+    assert locator.locate([0.75, 1.25, 11.5, 10.5, 20.0], [0.5, 0.5, 11.5, 10.5, 20.0]).tolist() == [1, 2, NO_HOLE, 3, NO_HOLE]
+    assert locator.locate_point(5.5, 5.5) == 3
+    assert locator.locate_point(-3.0, 0.0) is None
+    assert HoleLocator([]).locate([0.0], [0.0]).tolist() == [NO_HOLE]
@@ -0,0 +1,40 @@
+import json
+
+from golfsim.data.loop_nodes import LoopNodes
+
+
+def _point(lon, lat, **props):
+    return {"type": "Feature", "geometry": {"type": "Point", "coordinates": [lon, lat]}, "properties": props}
+
+
+def _square(x0, y0):
+    return [[x0, y0], [x0 + 1, y0], [x0 + 1, y0 + 1], [x0, y0 + 1], [x0, y0]]
+
+
+def test_parse_orders_and_labels(tmp_path):
+    loop = tmp_path / "holes_connected.geojson"
+    loop.write_text(json.dumps({"type": "FeatureCollection", "features": [
+        _point(0.5, 0.5, node_id=2, hole=1),
+        _point(0.6, 0.6, node_id="pool"),
+        _point(5.0, 5.0, node_id=0, hole=-1),
+        _point(0.2, 0.2, idx=1),
+        {"type": "Feature", "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}, "properties": {}},
+        _point(9.0, 9.0, sequence_position=0.5),
+    ]}), encoding="utf-8")
+    holes = tmp_path / "holes_geofenced.geojson"
+    holes.write_text(json.dumps({"type": "FeatureCollection", "features": [
+        {"type": "Feature", "geometry": {"type": "Polygon", "coordinates": [_square(0, 0)]}, "properties": {"hole": 7}},
+    ]}), encoding="utf-8")
+
+    nodes = LoopNodes.parse(loop, holes)
+    assert len(nodes) == 5
+    # Property labels win (including -1); unlabeled points fall back to the polygons
+    assert nodes.hole_labels() == [1, 7, -1, 7, None]
+    assert nodes.by_node_id().tolist() == [2, 3, 0]
+    assert nodes.by_node_id(max_node_id=1).tolist() == [2, 3]
+    # idx first, then sequence_position, then node_id, then file order
+    assert nodes.path_order().tolist() == [3, 4, 2, 0, 1]
+
+    saved = LoopNodes.load(nodes.save(tmp_path / "nodes.npz"))
+    assert saved.matches(nodes.source_sha1, nodes.polygons_sha1)
+    assert saved.hole_labels() == nodes.hole_labels() and saved.lonlat() == nodes.lonlat()
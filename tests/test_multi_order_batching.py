@@ -0,0 +1,102 @@
+import argparse
+import dataclasses
+from collections import defaultdict
+from pathlib import Path
+
+import simpy
+
+from golfsim.config.models import SimulationConfig
+from golfsim.simulation.batch import run_batch
+from golfsim.simulation.delivery_service_base import DeliveryOrder
+from golfsim.simulation.multi_runner_service import MultiRunnerDeliveryService
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+COURSE_DIR = str(REPO_ROOT / "courses" / "pinetree_country_club")
+
+
+def _config(tmp_path, **overrides) -> SimulationConfig:
+    args = argparse.Namespace(
+        course_dir=COURSE_DIR, num_runs=1, output_dir=str(tmp_path / "out"), log_level="WARNING",
+        num_carts=0, num_runners=1, groups_count=0, tee_scenario="real_tee_sheet", first_tee="09:00",
+        random_seed=11, minimal_outputs=True, no_heatmap=True,
+    )
+    cfg = SimulationConfig.from_args(args)
+    cfg.delivery_total_orders = 40
+    return dataclasses.replace(cfg, **overrides)
+
+
+def test_batched_trips_record_each_order(tmp_path):
+    result = run_batch(
+        [_config(tmp_path, delivery_batch_max_orders=3, delivery_batch_hole_window=3, delivery_batch_time_window_min=20)],
+        keep_results=True,
+    )[0]
+    stats = result.delivery_stats
+    assert result.metrics.successful_orders == len(stats)
+    assert result.sim_result["metadata"]["batch_max_orders"] == 3
+
+    trips = defaultdict(list)
+    for s in stats:
+        if s.get("batch_size", 1) > 1:
+            trips[(s["runner_id"], s["delivered_at_time_s"] - s["delivery_time_s"])].append(s)
+    assert trips, "expected at least one multi-order trip at peak"
+    for legs in trips.values():
+        legs.sort(key=lambda s: s["batch_position"])
+        assert [s["batch_position"] for s in legs] == list(range(1, len(legs) + 1))
+        times = [s["delivered_at_time_s"] for s in legs]
+        assert times == sorted(times)
+        assert "trip_back" in legs[-1] and all("trip_back" not in s for s in legs[:-1])
+
+
+def test_batching_off_keeps_one_order_per_trip(tmp_path):
+    result = run_batch([_config(tmp_path)], keep_results=True)[0]
+    assert all("batch_size" not in s for s in result.delivery_stats)
+
+
+def _service(num_runners):
+    env = simpy.Environment()
+    service = MultiRunnerDeliveryService(
+        env, course_dir=COURSE_DIR, num_runners=num_runners, groups=[{"group_id": 1, "tee_time_s": 0}]
+    )
+    env.run(until=service.service_open_s + 1)
+    return env, service
+
+
+def _orders(placed_s):
+    return [
+        DeliveryOrder(order_id=f"o{i}", golfer_group_id=1, golfer_id="g1", order_time_s=placed_s, hole_num=hole,
+                      order_placed_time=placed_s)
+        for i, hole in enumerate((9, 10), start=1)
+    ]
+
+
+def test_batch_orders_expiring_on_return_trip_are_not_delivered():
+    env, service = _service(1)
+    service.runner_locations[0] = "hole_9"
+    service.runner_busy[0] = True
+    service.queue_timeout_s = 60
+    assert service._calculate_return_time("hole_9") > service.queue_timeout_s
+
+    orders = _orders(env.now)
+    env.process(service._process_batch(orders, 0, "runner_1"))
+    env.run(until=env.now + 3600)
+    assert [o.status for o in orders] == ["failed", "failed"]
+    assert not service.delivery_stats and not service.runner_busy[0]
+
+
+def test_failed_batch_plan_requeues_to_an_idle_runner(monkeypatch):
+    env, service = _service(2)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("no route")
+
+    monkeypatch.setattr(service, "_plan_batch_route", fail)
+    service.runner_busy[0] = True
+    start = env.now
+    env.process(service._process_batch(_orders(start), 0, "runner_1"))
+    env.run(until=start + 60)
+    assigned = [
+        r["runner_id"] for r in service.activity_log.to_records()
+        if r["activity_type"] == "order_assigned" and r["order_id"] == "o2"
+    ]
+    assert assigned == ["runner_2"]
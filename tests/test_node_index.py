@@ -0,0 +1,68 @@
+import math
+import pickle
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+
+from golfsim.routing import node_index
+from golfsim.routing.networks import nearest_node, nearest_nodes
+from golfsim.routing.node_index import NodeIndex, get_node_index
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PINETREE_PKL = REPO_ROOT / "courses" / "pinetree_country_club" / "pkl" / "cart_graph.pkl"
+
+
+def _brute_force_nearest(G, lon, lat):
+    lat0 = math.radians(np.mean([d["y"] for _, d in G.nodes(data=True)]))
+    best, best_d = None, math.inf
+    for node, d in G.nodes(data=True):
+        dx = (d["x"] - lon) * math.cos(lat0)
+        dy = d["y"] - lat
+        dist = dx * dx + dy * dy
+        if dist < best_d:
+            best, best_d = node, dist
+    return best
+
+
+def test_batch_matches_brute_force_and_single_lookup():
+    with PINETREE_PKL.open("rb") as f:
+        G = pickle.load(f)
+    xs = [d["x"] for _, d in G.nodes(data=True)]
+    ys = [d["y"] for _, d in G.nodes(data=True)]
+    rng = np.random.default_rng(0)
+    lons = rng.uniform(min(xs), max(xs), 300)
+    lats = rng.uniform(min(ys), max(ys), 300)
+
+    batch = nearest_nodes(G, lons, lats)
+    assert len(batch) == 300
+    for lon, lat, node in zip(lons, lats, batch):
+        assert node == _brute_force_nearest(G, lon, lat)
+        assert nearest_node(G, lon, lat) == node
+
+
+def test_numpy_fallback_matches_tree(monkeypatch):
+    G = nx.Graph()
+    for i in range(50):
+        G.add_node(i, x=-84.59 + 0.0003 * (i % 7), y=34.03 + 0.0002 * (i // 7))
+    pts_lon = np.linspace(-84.5905, -84.587, 40)
+    pts_lat = np.linspace(34.0295, 34.0318, 40)
+    expected = NodeIndex.from_graph(G).nearest_nodes(pts_lon, pts_lat)
+    monkeypatch.setattr(node_index, "cKDTree", None)
+    assert NodeIndex.from_graph(G).nearest_nodes(pts_lon, pts_lat) == expected
+
+
+def test_frozen_graph_keeps_index_and_mutable_graph_tracks_changes():
+    G = nx.Graph()
+    G.add_node("a", x=0.0, y=0.0)
+    assert nearest_node(G, 1.0, 1.0) == "a"
+    G.add_node("b", x=1.0, y=1.0)
+    assert nearest_node(G, 1.0, 1.0) == "b"
+    nx.freeze(G)
+    assert get_node_index(G) is get_node_index(G)
+    assert get_node_index(nx.Graph()) is None
+    assert nearest_node(nx.Graph(), 0.0, 0.0) is None
+    H = nx.Graph()
+    H.add_node("no_coords")
+    assert nearest_nodes(H, [0.0], [0.0]) == [None]
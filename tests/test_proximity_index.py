@@ -0,0 +1,62 @@
+import math
+
+import numpy as np
+
+from golfsim.simulation.pass_detection import find_proximity_pass_events
+from golfsim.simulation.proximity_index import SpatioTemporalIndex, haversine_m_array, nearest_time_index
+from golfsim.simulation.visibility_tracking import VisibilityTrackingService, create_visibility_service
+
+
+def test_within_matches_brute_force():
+    rng = np.random.default_rng(3)
+    n, m = 400, 300
+    t_pts = rng.integers(0, 5, n)
+    lat = 35.0 + rng.uniform(-0.003, 0.003, n)
+    lon = -78.0 + rng.uniform(-0.003, 0.003, n)
+    lat[7] = np.nan
+    t_q = rng.integers(-1, 5, m)
+    qlat = 35.0 + rng.uniform(-0.003, 0.003, m)
+    qlon = -78.0 + rng.uniform(-0.003, 0.003, m)
+
+    index = SpatioTemporalIndex(t_pts, lat, lon, cell_m=80.0)
+    q, p, dist = index.within(t_q, qlat, qlon, 80.0)
+
+    all_dist = haversine_m_array(qlat[:, None], qlon[:, None], lat[None, :], lon[None, :])
+    hit = (all_dist <= 80.0) & (t_q[:, None] == t_pts[None, :]) & (t_q[:, None] >= 0)
+    expected_q, expected_p = np.nonzero(hit)
+    assert q.tolist() == expected_q.tolist() and p.tolist() == expected_p.tolist()
+    np.testing.assert_allclose(dist, all_dist[hit])
+
+
+def test_nearest_time_index_matches_scalar_search():
+    times = [0, 60, 120, 150, 300, 900]
+    targets = np.arange(-400, 1300, 5)
+    scalar = VisibilityTrackingService()._find_nearest_timestamp
+    expected = [scalar(int(t), times, max_diff_s=300) for t in targets]
+    got = nearest_time_index(np.asarray(times), targets, max_diff_s=300)
+    assert [None if i < 0 else times[i] for i in got.tolist()] == expected
+
+
+def test_visibility_records_sightings_in_point_order():
+    # Cart 1 is ~55 m from the golfer throughout; cart 2 is ~1 km away
+    golfer = [
+        {"id": "golfer_1", "timestamp": t, "latitude": 35.0, "longitude": -78.0, "hole": 1} for t in (60, 120, 0)
+    ]
+    carts = [
+        {"id": "bev_cart_1", "timestamp": t, "latitude": 35.0005, "longitude": -78.0} for t in (0, 60, 120)
+    ] + [{"id": "bev_cart_2", "timestamp": 120, "latitude": 35.01, "longitude": -78.0}]
+    service = create_visibility_service(proximity_threshold_m=100.0)
+    service.process_coordinates_batch(golfer, carts)
+
+    events = service.all_visibility_events
+    assert [(e.timestamp_s, e.cart_id) for e in events] == [(60, "bev_cart_1"), (120, "bev_cart_1"), (0, "bev_cart_1")]
+    assert math.isclose(events[0].distance_m, 55.6, abs_tol=0.1)
+    # The last recorded sighting wins, as before
+    assert service.golfer_trackers["golfer_1"].last_sighting_timestamp_s == 0
+
+
+def test_proximity_passes_respect_interval():
+    golfer = [{"timestamp": t, "latitude": 35.0, "longitude": -78.0, "hole": 3} for t in range(0, 4000, 60)]
+    cart = [{"timestamp": t, "latitude": 35.0 if t % 600 == 0 else 35.01, "longitude": -78.0} for t in range(0, 4000, 60)]
+    events = find_proximity_pass_events(600, cart, golfer, proximity_threshold_m=50.0, min_pass_interval_s=1200)
+    assert [(e["timestamp_s"], e["hole_num"]) for e in events] == [(1200, 3), (2400, 3), (3600, 3)]
@@ -0,0 +1,62 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from golfsim.simulation.order_generation import simulate_golfer_orders
+from golfsim.simulation.orders import generate_delivery_orders_by_hour_distribution
+from golfsim.simulation.rng import run_generator, run_random
+
+
+GROUPS = [{"group_id": i, "tee_time_s": 3600 + 600 * i, "num_golfers": 4} for i in range(1, 13)]
+
+
+def _orders(rng, **kwargs):
+    orders = generate_delivery_orders_by_hour_distribution(
+        groups=GROUPS,
+        hourly_distribution={f"{h:02d}:00": 1.0 for h in range(9, 18)},
+        total_orders=25,
+        service_open_hhmm="09:00",
+        service_close_hhmm="18:00",
+        rng=rng,
+        **kwargs,
+    )
+    return [(o.order_time_s, o.golfer_group_id, o.hole_num) for o in orders]
+
+
+def test_run_streams_are_reproducible_and_distinct():
+    assert run_random(7, 1, (2, 30, ())).random() == run_random(7, 1, (2, 30, ())).random()
+    draws = {run_random(7, run_idx, combo).random() for run_idx in (1, 2) for combo in ((2, 30, ()), (3, 30, ()))}
+    assert len(draws) == 4
+    assert run_generator(7, 3).integers(0, 1 << 30) == run_generator(7, 3).integers(0, 1 << 30)
+
+
+def test_generators_do_not_touch_global_random():
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    _orders(run_random(1, 1))
+    simulate_golfer_orders(GROUPS, 0.5, rng=run_random(1, 2))
+    assert random.random() == expected
+
+
+def test_interleaved_runs_in_threads_match_sequential_runs():
+    sequential = [_orders(run_random(5, idx)) for idx in range(1, 9)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = list(pool.map(lambda idx: _orders(run_random(5, idx)), range(1, 9)))
+    assert threaded == sequential
+    assert len({tuple(o) for o in sequential}) == len(sequential)
+
+
+def test_rng_seed_keeps_legacy_sequence():
+    random.seed(11)
+    legacy = simulate_golfer_orders(GROUPS, 0.5)
+    seeded = simulate_golfer_orders(GROUPS, 0.5, rng_seed=11)
+    assert [(o.order_time_s, o.hole_num) for o in legacy] == [(o.order_time_s, o.hole_num) for o in seeded]
+
+
+def test_common_random_numbers_only_redraws_blocked_slots():
+    base = _orders(run_random(9, 1), common_random_numbers=True)
+    blocked = _orders(run_random(9, 1), common_random_numbers=True, blocked_holes={1, 2, 3})
+    assert len(base) == len(blocked)
+    assert all(hole not in {1, 2, 3} for _, _, hole in blocked)
+    kept = [o for o in base if o[2] not in {1, 2, 3}]
+    assert kept and all(o in blocked for o in kept)
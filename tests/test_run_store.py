@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+
+from golfsim.io.run_store import RunStore
+from golfsim.simulation.batch import SweepCombo, init_sweep_worker, run_sweep_combo
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+COURSE_DIR = str(REPO_ROOT / "courses" / "pinetree_country_club")
+
+
+def _sim_result(n_delivered: int):
+    stats = [
+        {"order_id": f"{i:03d}", "hole_num": i + 1, "delivery_time_s": 100.0 * (i + 1), "runner_id": "runner_1"}
+        for i in range(n_delivered)
+    ]
+    orders = [{"order_id": f"{i:03d}", "golfer_group_id": 1, "status": "processed", "order_time_s": 60 * i} for i in range(n_delivered)]
+    return {"delivery_stats": stats, "orders": orders}
+
+
+def test_append_query_and_replace(tmp_path):
+    store = RunStore.for_sweep(tmp_path)
+    assert store.query_runs() == []
+    group = tmp_path / "first_pass" / "orders_010" / "runners_1" / "none"
+    for idx, n in ((1, 2), (2, 3)):
+        store.append_run(
+            group / f"run_{idx:02d}",
+            run_idx=idx,
+            orders=10,
+            runners=1,
+            variant_key="none",
+            blocked_holes=[],
+            metrics={"on_time_rate": 0.9, "successful_orders": n, "total_orders": 10},
+            sim_result=_sim_result(n),
+            simulation_metrics={"variantKey": "none"},
+        )
+    # Rerunning a run directory replaces its rows
+    store.append_run(
+        group / "run_02",
+        run_idx=2,
+        orders=10,
+        runners=1,
+        variant_key="none",
+        blocked_holes=[],
+        metrics={"on_time_rate": 0.5, "successful_orders": 1, "total_orders": 10},
+        sim_result=_sim_result(1),
+    )
+
+    rows = store.query_runs(group_dirs=[group])
+    assert [(r["run_idx"], r["successful_orders"], r["on_time_rate"]) for r in rows] == [(1, 2, 0.9), (2, 1, 0.5)]
+    assert rows[0]["simulation_metrics"] == {"variantKey": "none"} and rows[1]["simulation_metrics"] is None
+    assert store.query_runs(runners=2) == []
+    assert [r["run_idx"] for r in store.query_runs(run_dirs=[group / "run_01"])] == [1]
+
+    stats = store.delivery_stats([r["id"] for r in rows])
+    assert [len(stats[r["id"]]) for r in rows] == [2, 1]
+    assert stats[rows[0]["id"]][1] == {"order_id": "001", "hole_num": 2, "delivery_time_s": 200.0, "runner_id": "runner_1"}
+    assert store.orders([rows[0]["id"]])[rows[0]["id"]][0]["status"] == "processed"
+
+    with pytest.raises(ValueError):
+        store.query_runs(course="x")
+
+
+def test_sweep_combo_appends_runs_to_store(tmp_path):
+    init_sweep_worker(COURSE_DIR, "real_tee_sheet", "WARNING")
+    store = RunStore.for_sweep(tmp_path)
+    out = tmp_path / "first_pass" / "orders_010" / "runners_2" / "front"
+    combo = SweepCombo(
+        num_runners=2,
+        total_orders=10,
+        num_runs=2,
+        output_dir=str(out),
+        blocked_holes=(1, 2, 3),
+        random_seed=5,
+        run_store=str(store.path),
+    )
+    compact = run_sweep_combo(combo)
+
+    rows = store.query_runs(orders=10, runners=2, variant_key="front")
+    assert [r["run_idx"] for r in rows] == [1, 2]
+    assert rows[0]["blocked_holes"] == [1, 2, 3]
+    stats = store.delivery_stats([r["id"] for r in rows])
+    for row, item in zip(rows, compact):
+        assert row["successful_orders"] == item["metrics"]["successful_orders"]
+        assert row["on_time_rate"] == pytest.approx(item["metrics"]["on_time_rate"])
+        assert [s["delivery_time_s"] for s in stats[row["id"]]] == [s["delivery_time_s"] for s in item["delivery_stats"]]
+        assert row["simulation_metrics"]["variantKey"] == "front"
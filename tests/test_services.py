@@ -40,3 +40,20 @@ def test_run_multi_golfer_simulation_basic():
     assert results["aggregate_metrics"]["orders_processed"] >= 0
 
 
+def test_intercept_scores_match_chosen_hole():
+    from golfsim.simulation.multi_runner_service import MultiRunnerDeliveryService
+
+    env = simpy.Environment()
+    groups = [{"group_id": 1, "tee_time_s": 0, "num_golfers": 4}]
+    service = MultiRunnerDeliveryService(env, course_dir="courses/pinetree_country_club", num_runners=1, groups=groups)
+    env.run(until=50 * 60)
+    order = DeliveryOrder(order_id="o1", golfer_group_id=1, golfer_id="g1", order_time_s=45 * 60, hole_num=3)
+
+    scores = service.intercept_scores(order)
+    assert scores["holes"][0] == 5  # 50 minutes in at 12 minutes per hole
+    assert len(scores["score"]) == len(scores["holes"]) == 14
+    best = int(scores["holes"][scores["score"].argmin()])
+    assert service._choose_intercept_hole(order) == best
+
+    service.intercept_lateness_weight = 0.0
+    assert service._choose_intercept_hole(order) == 5  # only earliness counts
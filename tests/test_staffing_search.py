@@ -0,0 +1,36 @@
+import pytest
+
+from golfsim.analysis.staffing_search import MonotoneRunnerSearch
+
+
+def _run(search, threshold):
+    probes = []
+    while (n := search.next_probe()) is not None:
+        probes.append(n)
+        search.record(n, n >= threshold)
+    return probes
+
+
+@pytest.mark.parametrize("threshold", [1, 2, 3, 5, 8, 12, 99])
+def test_finds_minimal_compliant_runner_count(threshold):
+    values = list(range(1, 13))
+    search = MonotoneRunnerSearch(values)
+    probes = _run(search, threshold)
+    expected = threshold if threshold <= 12 else None
+    assert search.minimal_runners == expected
+    assert len(probes) <= 2 * 4  # gallop + bisect, logarithmic in the range
+    assert search.implied_outcomes() == {v: v >= threshold for v in values}
+    assert set(search.unprobed()) == set(values) - set(probes)
+
+
+def test_small_range_probes_lowest_first():
+    search = MonotoneRunnerSearch([3, 1, 2])
+    assert search.next_probe() == 1
+    search.record(1, True)
+    assert search.done and search.minimal_runners == 1
+    assert search.unprobed() == [2, 3]
+
+
+def test_empty_range_rejected():
+    with pytest.raises(ValueError):
+        MonotoneRunnerSearch([])
@@ -0,0 +1,51 @@
+import csv
+
+import numpy as np
+import pytest
+
+from golfsim.io.coordinate_columns import write_coordinate_columns_csv
+from golfsim.io.track_binary import TRACKS_MAGIC, read_tracks, tracks_path_for, write_tracks
+
+
+def _streams():
+    return {
+        "golfer_group_1": [
+            {"latitude": 34.1 + i * 1e-5, "longitude": -78.2, "timestamp": i * 60.5, "type": "golfer", "hole": i % 18 + 1}
+            for i in range(400)
+        ],
+        "runner_1": [
+            {"latitude": 34.0, "longitude": -78.0, "timestamp": i * 2, "type": "runner", "order_id": f"o{i % 3}",
+             "is_delivery_event": i % 50 == 0}
+            for i in range(300)
+        ],
+    }
+
+
+def test_binary_tracks_match_csv_rows(tmp_path):
+    csv_path = tmp_path / "coordinates.csv"
+    write_coordinate_columns_csv(_streams(), csv_path, tracks_path=tracks_path_for(csv_path))
+    bin_path = tmp_path / "coordinates.bin"
+    assert bin_path.read_bytes()[:8] == TRACKS_MAGIC
+    assert bin_path.stat().st_size < csv_path.stat().st_size
+
+    with csv_path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    tracks = read_tracks(bin_path)
+    assert len(tracks["id"]) == len(rows)
+    for name in rows[0]:
+        if name in ("latitude", "longitude"):
+            np.testing.assert_allclose(tracks[name], [float(r[name]) for r in rows], atol=1e-5)
+        elif name == "timestamp":
+            np.testing.assert_allclose(tracks[name], [float(r[name]) for r in rows], atol=1e-3)
+        else:
+            assert list(tracks[name]) == [r[name] for r in rows], name
+
+
+def test_empty_and_invalid_files(tmp_path):
+    write_tracks({"id": [], "timestamp": []}, tmp_path / "empty.bin")
+    tracks = read_tracks(tmp_path / "empty.bin")
+    assert len(tracks["id"]) == 0 and len(tracks["timestamp"]) == 0
+
+    (tmp_path / "bad.bin").write_bytes(b"id,timestamp\n")
+    with pytest.raises(ValueError):
+        read_tracks(tmp_path / "bad.bin")